@@ -17,6 +17,9 @@ class NetBoxRIRManagerConfig(PluginConfig):
     base_url = "rir-manager"
     min_version = "4.5.0"
     required_settings = []
+    # Created by NetBox as netbox_rir_manager.interactive / netbox_rir_manager.bulk
+    queues = ["interactive", "bulk"]
+    middleware = ["netbox_rir_manager.middleware.BulkPayloadMiddleware"]
     default_settings = {
         "top_level_menu": True,
         "sync_interval_hours": 24,
@@ -25,8 +28,25 @@ class NetBoxRIRManagerConfig(PluginConfig):
         "encryption_key": "",
         "api_retry_count": 3,
         "api_retry_backoff": 2,
+        "api_rate_limit": 0,
         "geocoding_provider": "nominatim",
         "google_geocoding_api_key": "",
+        "geocoding_gazetteer": [],
+        "geocoding_rate_limit": 1,
+        "geocoding_timeouts": {},
+        "geocoding_hedge_delay": 1.0,
+        "geocode_cache_ttl_hours": 720,
+        "geocode_cache_max_entries": 10000,
+        "geocoding_concurrency": 4,
+        "auto_resolve_site_addresses": True,
+        "site_address_delay": 60,
+        "reassign_batch_delay": 30,
+        "reassign_concurrency": 4,
+        "write_max_attempts": 3,
+        "write_retry_delay": 60,
+        "write_idempotency_hours": 24,
+        "interactive_queue": "netbox_rir_manager.interactive",
+        "bulk_queue": "netbox_rir_manager.bulk",
     }
 
     def ready(self):
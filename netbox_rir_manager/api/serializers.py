@@ -8,9 +8,11 @@ from netbox_rir_manager.models import (
     RIRCustomer,
     RIRNetwork,
     RIROrganization,
+    RIRReconciliationReport,
     RIRSyncLog,
     RIRTicket,
     RIRUserKey,
+    RIRWriteOperation,
 )
 
 
@@ -154,6 +156,28 @@ class RIRSyncLogSerializer(NetBoxModelSerializer):
         )
 
 
+class RIRReconciliationReportSerializer(NetBoxModelSerializer):
+    url = serializers.HyperlinkedIdentityField(
+        view_name="plugins-api:netbox_rir_manager-api:rirreconciliationreport-detail"
+    )
+
+    class Meta:
+        model = RIRReconciliationReport
+        fields = (
+            "id",
+            "url",
+            "display",
+            "rir_config",
+            "total_drift",
+            "summary",
+            "drift",
+            "tags",
+            "created",
+            "last_updated",
+        )
+        brief_fields = ("id", "url", "display", "total_drift")
+
+
 class RIRTicketSerializer(NetBoxModelSerializer):
     url = serializers.HyperlinkedIdentityField(view_name="plugins-api:netbox_rir_manager-api:rirticket-detail")
 
@@ -179,6 +203,35 @@ class RIRTicketSerializer(NetBoxModelSerializer):
         )
 
 
+class RIRWriteOperationSerializer(NetBoxModelSerializer):
+    url = serializers.HyperlinkedIdentityField(view_name="plugins-api:netbox_rir_manager-api:rirwriteoperation-detail")
+
+    class Meta:
+        model = RIRWriteOperation
+        fields = (
+            "id",
+            "url",
+            "display",
+            "rir_config",
+            "network",
+            "network_handle",
+            "operation",
+            "status",
+            "user_key",
+            "payload",
+            "result",
+            "message",
+            "attempts",
+            "next_attempt",
+            "completed",
+            "ticket",
+            "tags",
+            "created",
+            "last_updated",
+        )
+        read_only_fields = fields
+
+
 class RIRUserKeySerializer(NetBoxModelSerializer):
     url = serializers.HyperlinkedIdentityField(view_name="plugins-api:netbox_rir_manager-api:riruserkey-detail")
     api_key = serializers.CharField(write_only=True)
@@ -213,6 +266,7 @@ class RIRAddressSerializer(NetBoxModelSerializer):
             "state_province",
             "postal_code",
             "country",
+            "fingerprint",
             "raw_geocode",
             "auto_resolved",
             "last_resolved",
@@ -246,6 +300,10 @@ class NetworkReassignSerializer(serializers.Serializer):
         return data
 
 
+class BulkReassignSerializer(serializers.Serializer):
+    prefixes = serializers.ListField(child=serializers.IntegerField(min_value=1), allow_empty=False, max_length=1000)
+
+
 class NetworkReallocateSerializer(serializers.Serializer):
     org_handle = serializers.CharField(max_length=50)
     net_name = serializers.CharField(max_length=100, required=False, allow_blank=True, default="")
@@ -1,3 +1,4 @@
+from django.urls import path
 from netbox.api.routers import NetBoxRouter
 
 from netbox_rir_manager.api import views
@@ -11,6 +12,11 @@ router.register("networks", views.RIRNetworkViewSet)
 router.register("addresses", views.RIRAddressViewSet)
 router.register("sync-logs", views.RIRSyncLogViewSet)
 router.register("tickets", views.RIRTicketViewSet)
+router.register("reconciliation-reports", views.RIRReconciliationReportViewSet)
 router.register("user-keys", views.RIRUserKeyViewSet)
+router.register("write-operations", views.RIRWriteOperationViewSet)
 
-urlpatterns = router.urls
+urlpatterns = [
+    path("bulk-reassign/", views.BulkReassignView.as_view(), name="bulk_reassign"),
+    *router.urls,
+]
@@ -1,10 +1,13 @@
-from django.utils import timezone
+from django.db import transaction
 from netbox.api.viewsets import NetBoxModelViewSet
 from rest_framework import status
 from rest_framework.decorators import action
+from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.views import APIView
 
 from netbox_rir_manager.api.serializers import (
+    BulkReassignSerializer,
     NetworkReallocateSerializer,
     NetworkReassignSerializer,
     RIRAddressSerializer,
@@ -13,12 +16,12 @@ from netbox_rir_manager.api.serializers import (
     RIRCustomerSerializer,
     RIRNetworkSerializer,
     RIROrganizationSerializer,
+    RIRReconciliationReportSerializer,
     RIRSyncLogSerializer,
     RIRTicketSerializer,
     RIRUserKeySerializer,
+    RIRWriteOperationSerializer,
 )
-from netbox_rir_manager.backends.arin import ARINBackend
-from netbox_rir_manager.choices import normalize_ticket_status
 from netbox_rir_manager.filtersets import (
     RIRAddressFilterSet,
     RIRConfigFilterSet,
@@ -26,9 +29,11 @@ from netbox_rir_manager.filtersets import (
     RIRCustomerFilterSet,
     RIRNetworkFilterSet,
     RIROrganizationFilterSet,
+    RIRReconciliationReportFilterSet,
     RIRSyncLogFilterSet,
     RIRTicketFilterSet,
     RIRUserKeyFilterSet,
+    RIRWriteOperationFilterSet,
 )
 from netbox_rir_manager.models import (
     RIRAddress,
@@ -37,10 +42,13 @@ from netbox_rir_manager.models import (
     RIRCustomer,
     RIRNetwork,
     RIROrganization,
+    RIRReconciliationReport,
     RIRSyncLog,
     RIRTicket,
     RIRUserKey,
+    RIRWriteOperation,
 )
+from netbox_rir_manager.services.outbox import queue_write_operation
 
 
 class RIRConfigViewSet(NetBoxModelViewSet):
@@ -79,6 +87,15 @@ class RIRNetworkViewSet(NetBoxModelViewSet):
             rir_config=network.rir_config,
         ).first()
 
+    def _queue(self, request, network, user_key, operation, payload=None):
+        """Queue an ARIN write operation; clients poll it (and its ticket) for the outcome."""
+        with transaction.atomic():
+            write_operation = queue_write_operation(network, user_key, operation, payload)
+        return Response(
+            RIRWriteOperationSerializer(write_operation, context={"request": request}).data,
+            status=status.HTTP_202_ACCEPTED,
+        )
+
     @action(detail=True, methods=["post"], url_path="reassign")
     def reassign(self, request, pk=None):
         network = self.get_object()
@@ -92,12 +109,16 @@ class RIRNetworkViewSet(NetBoxModelViewSet):
                 status=status.HTTP_403_FORBIDDEN,
             )
 
-        backend = ARINBackend.from_rir_config(network.rir_config, api_key=user_key.api_key)
         data = serializer.validated_data
         rtype = data["reassignment_type"]
-
+        payload = {
+            "reassignment_type": rtype,
+            "net_name": data.get("net_name", ""),
+            "start_address": str(data["start_address"]),
+            "end_address": str(data["end_address"]),
+        }
         if rtype == "simple":
-            customer_data = {
+            payload["customer"] = {
                 "customer_name": data["customer_name"],
                 "street_address": data.get("street_address", ""),
                 "city": data["city"],
@@ -105,68 +126,9 @@ class RIRNetworkViewSet(NetBoxModelViewSet):
                 "postal_code": data.get("postal_code", ""),
                 "country": data["country"],
             }
-            customer_result = backend.create_customer(network.handle, customer_data)
-            if customer_result is None:
-                RIRSyncLog.objects.create(
-                    rir_config=network.rir_config,
-                    operation="create",
-                    object_type="customer",
-                    object_handle=network.handle,
-                    status="error",
-                    message="Failed to create customer",
-                )
-                return Response(
-                    {"detail": "Failed to create customer at ARIN."},
-                    status=status.HTTP_502_BAD_GATEWAY,
-                )
-
-        net_data = {
-            "net_name": data.get("net_name", ""),
-            "start_address": str(data["start_address"]),
-            "end_address": str(data["end_address"]),
-        }
-        if rtype == "simple":
-            net_data["customer_handle"] = customer_result["handle"]
         else:
-            net_data["org_handle"] = data["org_handle"]
-
-        result = backend.reassign_network(network.handle, net_data)
-        if result is None:
-            RIRSyncLog.objects.create(
-                rir_config=network.rir_config,
-                operation="reassign",
-                object_type="network",
-                object_handle=network.handle,
-                status="error",
-                message="Reassignment failed",
-            )
-            return Response(
-                {"detail": "Reassignment failed at ARIN."},
-                status=status.HTTP_502_BAD_GATEWAY,
-            )
-
-        ticket = RIRTicket.objects.create(
-            rir_config=network.rir_config,
-            ticket_number=result.get("ticket_number", ""),
-            ticket_type=result.get("ticket_type", "IPV4_SIMPLE_REASSIGN"),
-            status=normalize_ticket_status(result.get("ticket_status", "")),
-            network=network,
-            submitted_by=user_key,
-            created_date=timezone.now(),
-            raw_data=result.get("raw_data", {}),
-        )
-        RIRSyncLog.objects.create(
-            rir_config=network.rir_config,
-            operation="reassign",
-            object_type="network",
-            object_handle=network.handle,
-            status="success",
-            message=f"Reassignment submitted, ticket {ticket.ticket_number}",
-        )
-        return Response(
-            RIRTicketSerializer(ticket, context={"request": request}).data,
-            status=status.HTTP_201_CREATED,
-        )
+            payload["org_handle"] = data["org_handle"]
+        return self._queue(request, network, user_key, "reassign", payload)
 
     @action(detail=True, methods=["post"], url_path="reallocate")
     def reallocate(self, request, pk=None):
@@ -181,51 +143,14 @@ class RIRNetworkViewSet(NetBoxModelViewSet):
                 status=status.HTTP_403_FORBIDDEN,
             )
 
-        backend = ARINBackend.from_rir_config(network.rir_config, api_key=user_key.api_key)
         data = serializer.validated_data
-        net_data = {
+        payload = {
             "org_handle": data["org_handle"],
             "net_name": data.get("net_name", ""),
             "start_address": str(data["start_address"]),
             "end_address": str(data["end_address"]),
         }
-        result = backend.reallocate_network(network.handle, net_data)
-        if result is None:
-            RIRSyncLog.objects.create(
-                rir_config=network.rir_config,
-                operation="reallocate",
-                object_type="network",
-                object_handle=network.handle,
-                status="error",
-                message="Reallocation failed",
-            )
-            return Response(
-                {"detail": "Reallocation failed at ARIN."},
-                status=status.HTTP_502_BAD_GATEWAY,
-            )
-
-        ticket = RIRTicket.objects.create(
-            rir_config=network.rir_config,
-            ticket_number=result.get("ticket_number", ""),
-            ticket_type=result.get("ticket_type", "IPV4_REALLOCATE"),
-            status=normalize_ticket_status(result.get("ticket_status", "")),
-            network=network,
-            submitted_by=user_key,
-            created_date=timezone.now(),
-            raw_data=result.get("raw_data", {}),
-        )
-        RIRSyncLog.objects.create(
-            rir_config=network.rir_config,
-            operation="reallocate",
-            object_type="network",
-            object_handle=network.handle,
-            status="success",
-            message=f"Reallocation submitted, ticket {ticket.ticket_number}",
-        )
-        return Response(
-            RIRTicketSerializer(ticket, context={"request": request}).data,
-            status=status.HTTP_201_CREATED,
-        )
+        return self._queue(request, network, user_key, "reallocate", payload)
 
     @action(detail=True, methods=["post"], url_path="remove")
     def remove_net(self, request, pk=None):
@@ -237,34 +162,7 @@ class RIRNetworkViewSet(NetBoxModelViewSet):
                 status=status.HTTP_403_FORBIDDEN,
             )
 
-        backend = ARINBackend.from_rir_config(network.rir_config, api_key=user_key.api_key)
-        success = backend.remove_network(network.handle)
-        if success:
-            RIRSyncLog.objects.create(
-                rir_config=network.rir_config,
-                operation="remove",
-                object_type="network",
-                object_handle=network.handle,
-                status="success",
-                message=f"Removed network {network.handle} from ARIN",
-            )
-            return Response(
-                {"detail": f"Network {network.handle} removed."},
-                status=status.HTTP_200_OK,
-            )
-        else:
-            RIRSyncLog.objects.create(
-                rir_config=network.rir_config,
-                operation="remove",
-                object_type="network",
-                object_handle=network.handle,
-                status="error",
-                message="Failed to remove network from ARIN",
-            )
-            return Response(
-                {"detail": "Failed to remove network from ARIN."},
-                status=status.HTTP_502_BAD_GATEWAY,
-            )
+        return self._queue(request, network, user_key, "remove")
 
     @action(detail=True, methods=["post"], url_path="delete-arin")
     def delete_arin(self, request, pk=None):
@@ -276,44 +174,7 @@ class RIRNetworkViewSet(NetBoxModelViewSet):
                 status=status.HTTP_403_FORBIDDEN,
             )
 
-        backend = ARINBackend.from_rir_config(network.rir_config, api_key=user_key.api_key)
-        result = backend.delete_network(network.handle)
-        if result is None:
-            RIRSyncLog.objects.create(
-                rir_config=network.rir_config,
-                operation="delete",
-                object_type="network",
-                object_handle=network.handle,
-                status="error",
-                message="Failed to delete network at ARIN",
-            )
-            return Response(
-                {"detail": "Failed to delete network at ARIN."},
-                status=status.HTTP_502_BAD_GATEWAY,
-            )
-
-        ticket = RIRTicket.objects.create(
-            rir_config=network.rir_config,
-            ticket_number=result.get("ticket_number", ""),
-            ticket_type="NET_DELETE_REQUEST",
-            status=normalize_ticket_status(result.get("ticket_status", "")),
-            network=network,
-            submitted_by=user_key,
-            created_date=timezone.now(),
-            raw_data=result.get("raw_data", {}),
-        )
-        RIRSyncLog.objects.create(
-            rir_config=network.rir_config,
-            operation="delete",
-            object_type="network",
-            object_handle=network.handle,
-            status="success",
-            message=f"Delete request submitted, ticket {ticket.ticket_number}",
-        )
-        return Response(
-            RIRTicketSerializer(ticket, context={"request": request}).data,
-            status=status.HTTP_201_CREATED,
-        )
+        return self._queue(request, network, user_key, "delete")
 
 
 class RIRAddressViewSet(NetBoxModelViewSet):
@@ -328,6 +189,14 @@ class RIRSyncLogViewSet(NetBoxModelViewSet):
     filterset_class = RIRSyncLogFilterSet
 
 
+class RIRReconciliationReportViewSet(NetBoxModelViewSet):
+    queryset = RIRReconciliationReport.objects.prefetch_related("tags")
+    serializer_class = RIRReconciliationReportSerializer
+    filterset_class = RIRReconciliationReportFilterSet
+    # Reports are computed by ReconcileRIRConfigJob only
+    http_method_names = ["get", "head", "options", "delete"]
+
+
 class RIRTicketViewSet(NetBoxModelViewSet):
     queryset = RIRTicket.objects.prefetch_related("tags")
     serializer_class = RIRTicketSerializer
@@ -345,7 +214,75 @@ class RIRTicketViewSet(NetBoxModelViewSet):
         )
 
 
+class RIRWriteOperationViewSet(NetBoxModelViewSet):
+    queryset = RIRWriteOperation.objects.prefetch_related("tags")
+    serializer_class = RIRWriteOperationSerializer
+    filterset_class = RIRWriteOperationFilterSet
+    # Operations are created by the network actions and updated by the dispatcher only
+    http_method_names = ["get", "head", "options", "delete"]
+
+
 class RIRUserKeyViewSet(NetBoxModelViewSet):
     queryset = RIRUserKey.objects.prefetch_related("tags")
     serializer_class = RIRUserKeySerializer
     filterset_class = RIRUserKeyFilterSet
+
+
+class BulkReassignView(APIView):
+    """Validate a list of prefixes and enqueue a BulkReassignJob for the reassignable ones."""
+
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        from core.api.serializers import JobSerializer
+        from ipam.models import Prefix
+
+        from netbox_rir_manager.jobs import BulkReassignJob
+        from netbox_rir_manager.services.bulk_reassign import validate_bulk_reassign
+
+        if request.auth is not None and not getattr(request.auth, "write_enabled", True):
+            return Response(
+                {"detail": "This token does not permit write operations."}, status=status.HTTP_403_FORBIDDEN
+            )
+
+        serializer = BulkReassignSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        prefix_ids = serializer.validated_data["prefixes"]
+
+        # Reassigning writes to ARIN on the prefix's behalf, like editing it
+        prefixes = Prefix.objects.restrict(request.user, "change").filter(pk__in=prefix_ids).select_related("tenant")
+        candidates = validate_bulk_reassign(prefixes, request.user)
+        found = {candidate.prefix.pk for candidate in candidates}
+        viewable = set(
+            Prefix.objects.restrict(request.user, "view").filter(pk__in=prefix_ids).values_list("pk", flat=True)
+        )
+        invalid = [
+            {"prefix_id": candidate.prefix.pk, "prefix": str(candidate.prefix.prefix), "message": candidate.error}
+            for candidate in candidates
+            if not candidate.is_valid
+        ]
+        invalid.extend(
+            {
+                "prefix_id": pk,
+                "message": "You do not have permission to change this prefix" if pk in viewable else "Prefix not found",
+            }
+            for pk in prefix_ids
+            if pk not in found
+        )
+        valid_ids = [candidate.prefix.pk for candidate in candidates if candidate.is_valid]
+
+        if not valid_ids:
+            return Response(
+                {"detail": "None of the prefixes can be reassigned.", "invalid": invalid},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        job = BulkReassignJob.enqueue(user=request.user, prefix_ids=valid_ids, user_id=request.user.pk)
+        return Response(
+            {
+                "job": JobSerializer(job, context={"request": request}).data,
+                "prefixes": valid_ids,
+                "invalid": invalid,
+            },
+            status=status.HTTP_202_ACCEPTED,
+        )
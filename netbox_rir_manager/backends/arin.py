@@ -9,6 +9,7 @@ from tenacity import RetryError, Retrying, retry_if_exception_type, stop_after_a
 
 from netbox_rir_manager.backends import register_backend
 from netbox_rir_manager.backends.base import RIRBackend
+from netbox_rir_manager.ratelimit import RateLimiter
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +28,9 @@ class ARINBackend(RIRBackend):
         if base_url:
             kwargs["base_url"] = base_url
         self.api = Api(**kwargs)
+        # Parent NETs fetched for write operations, reused across calls on this instance
+        self._parent_nets: dict[str, Any] = {}
+        self._rate_limiter = RateLimiter.for_backend(self.name)
 
     @classmethod
     def from_rir_config(cls, rir_config: RIRConfig, api_key: str) -> ARINBackend:
@@ -50,10 +54,25 @@ class ARINBackend(RIRBackend):
                 retry=retry_if_exception_type((ConnectionError, OSError, TimeoutError)),
             ):
                 with attempt:
+                    self._rate_limiter.acquire()
                     return func(*args, **kwargs)
         except RetryError:
             return None
 
+    def _get_parent_net(self, handle: str):
+        """Fetch a parent NET once per backend instance (for reassign/reallocate/customer creation)."""
+        net = self._parent_nets.get(handle)
+        if net is None:
+            net = self._call_with_retry(self.api.net.from_handle, handle)
+            if net is not None and not isinstance(net, Error):
+                self._parent_nets[handle] = net
+        return net
+
+    def prefetch_parent_nets(self, handles) -> None:
+        """Fetch parent NETs ahead of concurrent write operations that share this instance."""
+        for handle in handles:
+            self._get_parent_net(handle)
+
     def authenticate(self, rir_config: RIRConfig) -> bool:
         if not rir_config.org_handle:
             return False
@@ -107,7 +126,7 @@ class ARINBackend(RIRBackend):
         return self._net_to_dict(result)
 
     def reassign_network(self, parent_handle: str, net_data: dict[str, Any]) -> dict[str, Any] | None:
-        parent = self._call_with_retry(self.api.net.from_handle, parent_handle)
+        parent = self._get_parent_net(parent_handle)
         if parent is None or isinstance(parent, Error):
             return None
         from regrws.models import Net
@@ -119,7 +138,7 @@ class ARINBackend(RIRBackend):
         return self._ticket_request_to_dict(result)
 
     def reallocate_network(self, parent_handle: str, net_data: dict[str, Any]) -> dict[str, Any] | None:
-        parent = self._call_with_retry(self.api.net.from_handle, parent_handle)
+        parent = self._get_parent_net(parent_handle)
         if parent is None or isinstance(parent, Error):
             return None
         from regrws.models import Net
@@ -153,7 +172,7 @@ class ARINBackend(RIRBackend):
         return self._customer_to_dict(result)
 
     def create_customer(self, parent_net_handle: str, data: dict[str, Any]) -> dict[str, Any] | None:
-        parent = self._call_with_retry(self.api.net.from_handle, parent_net_handle)
+        parent = self._get_parent_net(parent_net_handle)
         if parent is None or isinstance(parent, Error):
             return None
         result = self._call_with_retry(self.api.customer.create_for_net, parent, **data)
@@ -86,3 +86,50 @@ def normalize_ticket_status(arin_status: str) -> str:
         "APPROVED": "approved",
     }
     return mapping.get(arin_status, "pending_review")
+
+
+class DriftClassChoices(ChoiceSet):
+    key = "RIRReconciliationReport.drift_class"
+
+    CHOICES = [
+        ("missing_net", "Prefix Without NET", "orange"),
+        ("stale_net", "NET Without Active Prefix", "yellow"),
+        ("tenant_mismatch", "Tenant Mismatch", "purple"),
+        ("orphaned_net", "Orphaned NET", "red"),
+    ]
+
+
+class ReassignPlanActionChoices(ChoiceSet):
+    CHOICES = [
+        ("simple", "Simple Reassignment", "green"),
+        ("detailed", "Detailed Reassignment", "blue"),
+        ("existing_net", "Existing NET at ARIN", "cyan"),
+        ("blocked", "Blocked", "red"),
+    ]
+
+
+class WriteOperationChoices(ChoiceSet):
+    key = "RIRWriteOperation.operation"
+
+    CHOICES = [
+        ("reassign", "Reassign", "purple"),
+        ("reallocate", "Reallocate", "indigo"),
+        ("remove", "Remove", "orange"),
+        ("delete", "Delete", "red"),
+    ]
+
+
+class WriteOperationStatusChoices(ChoiceSet):
+    key = "RIRWriteOperation.status"
+
+    STATUS_PENDING = "pending"
+    STATUS_RUNNING = "running"
+    STATUS_COMPLETED = "completed"
+    STATUS_FAILED = "failed"
+
+    CHOICES = [
+        (STATUS_PENDING, "Pending", "cyan"),
+        (STATUS_RUNNING, "Running", "blue"),
+        (STATUS_COMPLETED, "Completed", "green"),
+        (STATUS_FAILED, "Failed", "red"),
+    ]
@@ -12,9 +12,11 @@ from netbox_rir_manager.models import (
     RIRCustomer,
     RIRNetwork,
     RIROrganization,
+    RIRReconciliationReport,
     RIRSyncLog,
     RIRTicket,
     RIRUserKey,
+    RIRWriteOperation,
 )
 
 
@@ -87,6 +89,8 @@ class RIRNetworkFilterSet(NetBoxModelFilterSet):
     )
     net_type = django_filters.CharFilter()
     auto_reassign = django_filters.BooleanFilter()
+    covers = django_filters.CharFilter(method="filter_covers", label="Covers address or prefix")
+    overlaps = django_filters.CharFilter(method="filter_overlaps", label="Overlaps address or prefix")
 
     class Meta:
         model = RIRNetwork
@@ -95,6 +99,22 @@ class RIRNetworkFilterSet(NetBoxModelFilterSet):
     def search(self, queryset, name, value):
         return queryset.filter(handle__icontains=value) | queryset.filter(net_name__icontains=value)
 
+    def filter_covers(self, queryset, name, value):
+        if not value.strip():
+            return queryset
+        try:
+            return queryset.covering(value)
+        except ValueError:
+            return queryset.none()
+
+    def filter_overlaps(self, queryset, name, value):
+        if not value.strip():
+            return queryset
+        try:
+            return queryset.overlapping(value)
+        except ValueError:
+            return queryset.none()
+
 
 class RIRAddressFilterSet(NetBoxModelFilterSet):
     site_id = django_filters.NumberFilter(field_name="site__id")
@@ -122,6 +142,17 @@ class RIRSyncLogFilterSet(NetBoxModelFilterSet):
         return queryset.filter(object_handle__icontains=value) | queryset.filter(message__icontains=value)
 
 
+class RIRReconciliationReportFilterSet(NetBoxModelFilterSet):
+    rir_config_id = django_filters.ModelMultipleChoiceFilter(queryset=RIRConfig.objects.all(), label="RIR Config")
+
+    class Meta:
+        model = RIRReconciliationReport
+        fields = ("id", "rir_config_id", "total_drift")
+
+    def search(self, queryset, name, value):
+        return queryset.filter(rir_config__name__icontains=value)
+
+
 class RIRTicketFilterSet(NetBoxModelFilterSet):
     rir_config_id = django_filters.ModelMultipleChoiceFilter(queryset=RIRConfig.objects.all(), label="RIR Config")
     status = django_filters.CharFilter()
@@ -136,6 +167,20 @@ class RIRTicketFilterSet(NetBoxModelFilterSet):
         return queryset.filter(ticket_number__icontains=value)
 
 
+class RIRWriteOperationFilterSet(NetBoxModelFilterSet):
+    rir_config_id = django_filters.ModelMultipleChoiceFilter(queryset=RIRConfig.objects.all(), label="RIR Config")
+    network_id = django_filters.ModelMultipleChoiceFilter(queryset=RIRNetwork.objects.all(), label="Network")
+    operation = django_filters.CharFilter()
+    status = django_filters.CharFilter()
+
+    class Meta:
+        model = RIRWriteOperation
+        fields = ("id", "rir_config_id", "network_id", "network_handle", "operation", "status")
+
+    def search(self, queryset, name, value):
+        return queryset.filter(network_handle__icontains=value) | queryset.filter(message__icontains=value)
+
+
 class RIRUserKeyFilterSet(NetBoxModelFilterSet):
     user = django_filters.ModelMultipleChoiceFilter(queryset=get_user_model().objects.all(), label="User")
     rir_config_id = django_filters.ModelMultipleChoiceFilter(queryset=RIRConfig.objects.all(), label="RIR Config")
@@ -0,0 +1,97 @@
+"""Normalised fingerprints of postal addresses.
+
+ARIN, geocoders and users spell the same address in different ways: "Suite
+100" and "Ste. 100", "Quebec" and "QC", "h3b 1a1" and "H3B1A1", trailing
+whitespace.  ``address_fingerprint`` reduces the five address fields to a
+canonical form (accents, case, punctuation and spacing dropped, street words
+abbreviated, subdivision names mapped to their ISO-3166-2 code, spaces removed
+from postcodes) and hashes it, so every spelling of an address shares one
+``RIRAddress.fingerprint``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import unicodedata
+
+ADDRESS_FIELDS = ("street_address", "city", "state_province", "postal_code", "country")
+
+# Long forms are reduced to the USPS abbreviation, so either spelling matches
+_STREET_WORDS = {
+    "apartment": "apt",
+    "avenue": "ave",
+    "boulevard": "blvd",
+    "building": "bldg",
+    "center": "ctr",
+    "centre": "ctr",
+    "circle": "cir",
+    "court": "ct",
+    "drive": "dr",
+    "east": "e",
+    "floor": "fl",
+    "highway": "hwy",
+    "lane": "ln",
+    "mount": "mt",
+    "north": "n",
+    "parkway": "pkwy",
+    "place": "pl",
+    "road": "rd",
+    "room": "rm",
+    "route": "rte",
+    "saint": "st",
+    "south": "s",
+    "square": "sq",
+    "street": "st",
+    "suite": "ste",
+    "terrace": "ter",
+    "west": "w",
+}
+
+_CITY_WORDS = {"saint": "st", "sainte": "ste", "mount": "mt", "fort": "ft"}
+
+
+def _words(value: str) -> list[str]:
+    decomposed = unicodedata.normalize("NFKD", value or "")
+    ascii_value = "".join(char for char in decomposed if not unicodedata.combining(char)).casefold()
+    return re.sub(r"[^\w]+", " ", ascii_value).split()
+
+
+def normalize_street(value: str) -> str:
+    return " ".join(_STREET_WORDS.get(word, word) for word in _words(value))
+
+
+def normalize_city(value: str) -> str:
+    return " ".join(_CITY_WORDS.get(word, word) for word in _words(value))
+
+
+def normalize_postal_code(value: str) -> str:
+    return "".join(_words(value)).upper()
+
+
+def normalize_subdivision(country: str, value: str) -> str:
+    from netbox_rir_manager.subdivisions import subdivision_code
+
+    return subdivision_code(country, value) or " ".join(_words(value)).upper()
+
+
+def normalize_address_fields(
+    street_address: str = "", city: str = "", state_province: str = "", postal_code: str = "", country: str = ""
+) -> tuple[str, str, str, str, str]:
+    """The canonical form of an address, in ``ADDRESS_FIELDS`` order."""
+    country = (country or "").strip().upper()
+    return (
+        normalize_street(street_address),
+        normalize_city(city),
+        normalize_subdivision(country, state_province),
+        normalize_postal_code(postal_code),
+        country,
+    )
+
+
+def address_fingerprint(
+    street_address: str = "", city: str = "", state_province: str = "", postal_code: str = "", country: str = ""
+) -> str:
+    """SHA-256 hex digest of the canonical form of an address."""
+    canonical = normalize_address_fields(street_address, city, state_province, postal_code, country)
+    return hashlib.sha256("\x1f".join(canonical).encode()).hexdigest()
@@ -1,7 +1,7 @@
 from dcim.models import Location, Site
 from django import forms
 from django.contrib.auth import get_user_model
-from ipam.models import RIR
+from ipam.models import RIR, Prefix
 from netbox.forms import NetBoxModelBulkEditForm, NetBoxModelFilterSetForm, NetBoxModelForm, NetBoxModelImportForm
 from tenancy.models import Contact, Tenant
 from utilities.forms.fields import CSVModelChoiceField, DynamicModelChoiceField, DynamicModelMultipleChoiceField
@@ -15,8 +15,10 @@ from netbox_rir_manager.models import (
     RIRCustomer,
     RIRNetwork,
     RIROrganization,
+    RIRReconciliationReport,
     RIRTicket,
     RIRUserKey,
+    RIRWriteOperation,
 )
 
 
@@ -183,6 +185,8 @@ class RIRNetworkFilterForm(NetBoxModelFilterSetForm):
         queryset=RIROrganization.objects.all(), required=False, label="Organization"
     )
     auto_reassign = forms.NullBooleanField(required=False)
+    covers = forms.CharField(required=False, label="Covers address or prefix")
+    overlaps = forms.CharField(required=False, label="Overlaps address or prefix")
 
 
 class RIRAddressForm(NetBoxModelForm):
@@ -219,6 +223,13 @@ class RIRAddressFilterForm(NetBoxModelFilterSetForm):
     auto_resolved = forms.NullBooleanField(required=False)
 
 
+class RIRReconciliationReportFilterForm(NetBoxModelFilterSetForm):
+    model = RIRReconciliationReport
+    rir_config_id = DynamicModelMultipleChoiceField(
+        queryset=RIRConfig.objects.all(), required=False, label="RIR Config"
+    )
+
+
 class RIRTicketFilterForm(NetBoxModelFilterSetForm):
     model = RIRTicket
     rir_config_id = DynamicModelMultipleChoiceField(
@@ -228,6 +239,15 @@ class RIRTicketFilterForm(NetBoxModelFilterSetForm):
     ticket_type = forms.CharField(required=False)
 
 
+class RIRWriteOperationFilterForm(NetBoxModelFilterSetForm):
+    model = RIRWriteOperation
+    rir_config_id = DynamicModelMultipleChoiceField(
+        queryset=RIRConfig.objects.all(), required=False, label="RIR Config"
+    )
+    operation = forms.CharField(required=False)
+    status = forms.CharField(required=False)
+
+
 class RIRUserKeyForm(NetBoxModelForm):
     user = DynamicModelChoiceField(queryset=get_user_model().objects.all())
     rir_config = DynamicModelChoiceField(queryset=RIRConfig.objects.all())
@@ -295,3 +315,20 @@ class RIRNetworkReallocateForm(forms.Form):
     net_name = forms.CharField(max_length=100, required=False, help_text="Name for the reallocated subnet")
     start_address = forms.GenericIPAddressField(help_text="Start IP of the subnet to reallocate")
     end_address = forms.GenericIPAddressField(help_text="End IP of the subnet to reallocate")
+
+
+class PrefixBulkReassignForm(forms.Form):
+    """Prefixes posted for bulk reassignment, limited to those ``user`` may change."""
+
+    pk = forms.ModelMultipleChoiceField(queryset=Prefix.objects.none(), required=False)
+
+    def __init__(self, *args, user, max_prefixes, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.max_prefixes = max_prefixes
+        self.fields["pk"].queryset = Prefix.objects.restrict(user, "change")
+
+    def clean_pk(self):
+        prefixes = self.cleaned_data["pk"]
+        if len(prefixes) > self.max_prefixes:
+            raise forms.ValidationError(f"At most {self.max_prefixes} prefixes can be reassigned at once.")
+        return prefixes
@@ -0,0 +1,202 @@
+"""Local gazetteer for offline reverse geocoding.
+
+Reads GeoNames dumps (https://download.geonames.org/export/dump/ and
+.../export/zip/ for postal codes), either as ``.txt`` or as the distributed
+``.zip``.  The format of each row is told apart by its column count, so any
+mix of these files can be configured:
+
+- cities (``cities500.txt``, ``cities15000.txt``, ``allCountries.txt``, 19
+  columns): place name, country and admin1 code;
+- postal codes (``allCountries.txt`` from the postal-code dump, ``CA.txt``,
+  12 columns): postcode, place name, country and admin1 name and code;
+- admin1 names (``admin1CodesASCII.txt``, 4 columns): the names behind the
+  cities' admin1 codes, which are not ISO-3166-2 codes for most countries.
+
+Admin1 names and codes are mapped to ISO-3166-2 subdivision codes once, while
+loading, and places and postcodes are indexed in a ``KDTree`` each.  The
+gazetteer is loaded once per process, on first use.
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import threading
+import time
+import zipfile
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+
+from netbox_rir_manager.kdtree import KDTree
+
+logger = logging.getLogger(__name__)
+
+# Beyond these distances the nearest entry is not taken to describe the point
+MAX_PLACE_DISTANCE_KM = 50.0
+MAX_POSTCODE_DISTANCE_KM = 20.0
+
+_CITY_COLUMNS = 19
+_POSTAL_COLUMNS = 12
+_ADMIN1_COLUMNS = 4
+
+
+@dataclass(frozen=True)
+class Place:
+    name: str
+    country: str  # ISO-3166-1 alpha-2
+    subdivision: str  # ISO-3166-2 code without the country prefix, or the admin1 name
+    postal_code: str
+    latitude: float
+    longitude: float
+    geonameid: str = ""
+
+
+@dataclass(frozen=True)
+class ReverseMatch:
+    place: Place
+    distance_km: float
+    postal_code: str
+
+
+class Gazetteer:
+    """Places and postcodes indexed for nearest-neighbour lookups."""
+
+    def __init__(self, places: Sequence[Place], postcodes: Sequence[Place] = ()):
+        self.places = list(places)
+        self.postcodes = list(postcodes)
+        self._places = KDTree([(place.latitude, place.longitude) for place in self.places])
+        self._postcodes = KDTree([(place.latitude, place.longitude) for place in self.postcodes])
+
+    @classmethod
+    def from_files(cls, paths: Sequence[str]) -> Gazetteer:
+        """Load GeoNames cities, postal-code and admin1 files (see the module docstring)."""
+        from netbox_rir_manager.subdivisions import subdivision_code
+
+        cities: list[list[str]] = []
+        postal: list[list[str]] = []
+        admin1_names: dict[str, str] = {}
+        for path in paths:
+            for row in _read_rows(path):
+                if len(row) == _CITY_COLUMNS:
+                    cities.append(row)
+                elif len(row) == _POSTAL_COLUMNS:
+                    postal.append(row)
+                elif len(row) == _ADMIN1_COLUMNS:
+                    admin1_names[row[0]] = row[2] or row[1]
+
+        subdivisions: dict[tuple[str, str, str], str] = {}
+
+        def subdivision(country: str, name: str, code: str) -> str:
+            key = (country, name, code)
+            if key not in subdivisions:
+                # Numeric admin1 codes are GeoNames' own (FR "11" is Ile-de-France, not ISO FR-11)
+                resolved = subdivision_code(country, name) or (
+                    subdivision_code(country, code) if code and not code.isdigit() else None
+                )
+                subdivisions[key] = resolved or name or code
+            return subdivisions[key]
+
+        places = []
+        for row in cities:
+            try:
+                latitude, longitude = float(row[4]), float(row[5])
+            except ValueError:
+                continue
+            country, admin1 = row[8], row[10]
+            name = admin1_names.get(f"{country}.{admin1}", "")
+            places.append(
+                Place(
+                    name=row[1],
+                    country=country,
+                    subdivision=subdivision(country, name, admin1),
+                    postal_code="",
+                    latitude=latitude,
+                    longitude=longitude,
+                    geonameid=row[0],
+                )
+            )
+        postcodes = []
+        for row in postal:
+            try:
+                latitude, longitude = float(row[9]), float(row[10])
+            except ValueError:
+                continue
+            postcodes.append(
+                Place(
+                    name=row[2],
+                    country=row[0],
+                    subdivision=subdivision(row[0], row[3], row[4]),
+                    postal_code=row[1],
+                    latitude=latitude,
+                    longitude=longitude,
+                )
+            )
+        # Without a cities file the postal-code places stand in for cities
+        return cls(places or postcodes, postcodes)
+
+    def reverse(self, latitude: float, longitude: float, k: int = 1) -> list[ReverseMatch]:
+        """Up to ``k`` nearest places within ``MAX_PLACE_DISTANCE_KM``, closest first.
+
+        Each match carries the postcode nearest to the point, if one within
+        ``MAX_POSTCODE_DISTANCE_KM`` is in the place's country.
+        """
+        matches = []
+        postal_code = None
+        for index, distance in self._places.nearest(latitude, longitude, k):
+            if distance > MAX_PLACE_DISTANCE_KM:
+                break
+            place = self.places[index]
+            if postal_code is None:
+                postal_code = self._nearest_postcode(latitude, longitude, place.country)
+            matches.append(ReverseMatch(place, distance, postal_code))
+        return matches
+
+    def _nearest_postcode(self, latitude: float, longitude: float, country: str) -> str:
+        for index, distance in self._postcodes.nearest(latitude, longitude):
+            postcode = self.postcodes[index]
+            if distance <= MAX_POSTCODE_DISTANCE_KM and postcode.country == country:
+                return postcode.postal_code
+        return ""
+
+
+def _read_rows(path: str) -> Iterator[list[str]]:
+    if path.endswith(".zip"):
+        with zipfile.ZipFile(path) as archive:
+            # GeoNames zips hold the data file plus a readme.txt
+            members = [name for name in archive.namelist() if name.endswith(".txt") and name != "readme.txt"]
+            for member in members:
+                with archive.open(member) as raw:
+                    yield from _parse(io.TextIOWrapper(raw, encoding="utf-8"))
+    else:
+        with open(path, encoding="utf-8") as handle:
+            yield from _parse(handle)
+
+
+def _parse(lines) -> Iterator[list[str]]:
+    for line in lines:
+        if line.startswith("#") or not line.strip():
+            continue
+        yield line.rstrip("\n").split("\t")
+
+
+_gazetteers: dict[tuple[str, ...], Gazetteer] = {}
+_gazetteers_lock = threading.Lock()
+
+
+def get_gazetteer(paths: Sequence[str]) -> Gazetteer:
+    """Return the process-wide gazetteer for ``paths``, loading it on first use."""
+    key = tuple(paths)
+    gazetteer = _gazetteers.get(key)
+    if gazetteer is None:
+        with _gazetteers_lock:
+            gazetteer = _gazetteers.get(key)
+            if gazetteer is None:
+                started = time.monotonic()
+                gazetteer = _gazetteers[key] = Gazetteer.from_files(key)
+                logger.info(
+                    "Loaded gazetteer with %d places and %d postcodes in %.1fs",
+                    len(gazetteer.places),
+                    len(gazetteer.postcodes),
+                    time.monotonic() - started,
+                )
+    return gazetteer
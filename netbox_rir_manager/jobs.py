@@ -13,12 +13,65 @@ from utilities.request import NetBoxFakeRequest, apply_request_processors
 
 from netbox_rir_manager.backends.arin import ARINBackend
 from netbox_rir_manager.models import RIRAddress, RIRContact, RIRCustomer, RIRNetwork, RIROrganization, RIRSyncLog
+from netbox_rir_manager.services.reassign_index import batched_invalidation
 
 if TYPE_CHECKING:
     from netbox_rir_manager.models import RIRConfig, RIRUserKey
 
 logger = logging.getLogger(__name__)
 
+# Job priorities, each routed to an RQ queue by the <priority>_queue setting
+INTERACTIVE = "interactive"
+BULK = "bulk"
+
+
+def job_queue_name(priority: str) -> str | None:
+    """
+    RQ queue for jobs of ``priority``; None for NetBox's default queue.
+
+    Defaults to the plugin's own queues (``PluginConfig.queues``), which NetBox
+    creates as ``netbox_rir_manager.interactive`` and ``netbox_rir_manager.bulk``.
+    """
+    from django.conf import settings
+
+    plugin_config = settings.PLUGINS_CONFIG.get("netbox_rir_manager", {})
+    return plugin_config.get(f"{priority}_queue", f"netbox_rir_manager.{priority}") or None
+
+
+class RIRJobRunner(JobRunner):
+    """JobRunner enqueued on the queue for its ``priority``.
+
+    Jobs a user is waiting on (reassign, remove, write dispatch) are
+    ``INTERACTIVE``; syncs, discovery and batch work are ``BULK``, so a long
+    prefix sweep never sits in front of a reassign that was just clicked.
+    """
+
+    priority = BULK
+
+    @classmethod
+    def enqueue(cls, *args, **kwargs):
+        kwargs.setdefault("queue_name", job_queue_name(cls.priority))
+        return super().enqueue(*args, **kwargs)
+
+    @classmethod
+    def _enqueue_debounced(cls, delay: float = 0, **kwargs):
+        """Enqueue to run after ``delay`` seconds unless a job of this class is already waiting.
+
+        Only pending/scheduled jobs count: a job that is already running may
+        miss work recorded after it started, so a follow-up is scheduled.
+        Distinct from NetBox's ``enqueue_once``, which schedules recurring
+        (system) jobs and is left untouched.
+        """
+        from datetime import timedelta
+
+        from core.choices import JobStatusChoices
+
+        waiting = cls.get_jobs().filter(status__in=(JobStatusChoices.STATUS_PENDING, JobStatusChoices.STATUS_SCHEDULED))
+        if waiting.exists():
+            return None
+        schedule_at = timezone.now() + timedelta(seconds=delay) if delay else None
+        return cls.enqueue(schedule_at=schedule_at, **kwargs)
+
 
 @contextmanager
 def _changelog_context(user):
@@ -61,21 +114,23 @@ def sync_rir_config(
     types_to_sync = resource_types or ["organizations", "contacts", "networks"]
     log.info(f"Starting sync for {rir_config.name} (types: {', '.join(types_to_sync)})")
 
-    org = None
-    if "organizations" in types_to_sync and rir_config.org_handle:
-        log.info(f"Syncing organization {rir_config.org_handle}")
-        org_logs, org = _sync_organization(backend, rir_config, user_key=user_key, log=log)
-        logs.extend(org_logs)
+    # One index rebuild for the whole sync instead of one per network saved
+    with batched_invalidation():
+        org = None
+        if "organizations" in types_to_sync and rir_config.org_handle:
+            log.info(f"Syncing organization {rir_config.org_handle}")
+            org_logs, org = _sync_organization(backend, rir_config, user_key=user_key, log=log)
+            logs.extend(org_logs)
 
-    if "contacts" in types_to_sync and org:
-        poc_links = (org.raw_data or {}).get("poc_links", [])
-        log.info(f"Syncing {len(poc_links)} contacts")
-        logs.extend(_sync_contacts(backend, rir_config, poc_links, org, user_key=user_key, log=log))
+        if "contacts" in types_to_sync and org:
+            poc_links = (org.raw_data or {}).get("poc_links", [])
+            log.info(f"Syncing {len(poc_links)} contacts")
+            logs.extend(_sync_contacts(backend, rir_config, poc_links, org, user_key=user_key, log=log))
 
-    if "networks" in types_to_sync:
-        log.info("Syncing aggregate-level networks")
-        net_logs, agg_nets = _sync_aggregate_nets(backend, rir_config, user_key=user_key, log=log)
-        logs.extend(net_logs)
+        if "networks" in types_to_sync:
+            log.info("Syncing aggregate-level networks")
+            net_logs, agg_nets = _sync_aggregate_nets(backend, rir_config, user_key=user_key, log=log)
+            logs.extend(net_logs)
 
     rir_config.last_sync = timezone.now()
     rir_config.save(update_fields=["last_sync"])
@@ -84,6 +139,20 @@ def sync_rir_config(
     return logs, agg_nets
 
 
+def _link_address(obj, address_data: dict) -> None:
+    """Point ``obj.address`` at the RIRAddress for ``address_data``, creating it if needed.
+
+    Addresses are matched by fingerprint, so re-syncing an unchanged (or
+    respelled) address is one indexed lookup and no write.  A changed address
+    is linked to its own row rather than edited in place, as the old row may be
+    shared with other objects.
+    """
+    address, _ = RIRAddress.objects.get_or_create_address(**address_data)
+    if obj.address_id != address.pk:
+        obj.address = address
+        obj.save(update_fields=["address"])
+
+
 def _sync_organization(
     backend: ARINBackend,
     rir_config: RIRConfig,
@@ -129,16 +198,8 @@ def _sync_organization(
         },
     )
 
-    # Create or update linked address
     if has_address:
-        if org.address:
-            for key, val in address_data.items():
-                setattr(org.address, key, val)
-            org.address.save()
-        else:
-            addr, _ = RIRAddress.objects.get_or_create(**address_data)
-            org.address = addr
-            org.save(update_fields=["address"])
+        _link_address(org, address_data)
 
     log.info(f"{'Created' if created else 'Updated'} organization {org_data['handle']}")
 
@@ -214,16 +275,8 @@ def _sync_contacts(
             },
         )
 
-        # Create or update linked address
         if has_contact_address:
-            if contact.address:
-                for key, val in contact_address_data.items():
-                    setattr(contact.address, key, val)
-                contact.address.save()
-            else:
-                addr, _ = RIRAddress.objects.get_or_create(**contact_address_data)
-                contact.address = addr
-                contact.save(update_fields=["address"])
+            _link_address(contact, contact_address_data)
 
         log.info(f"{'Created' if created else 'Updated'} contact {poc_data['handle']}")
         sync_log = RIRSyncLog.objects.create(
@@ -297,16 +350,8 @@ def _sync_customer_for_net(
         },
     )
 
-    # Create or update linked address
     if has_cust_address:
-        if _customer.address:
-            for key, val in cust_address_data.items():
-                setattr(_customer.address, key, val)
-            _customer.address.save()
-        else:
-            addr, _ = RIRAddress.objects.get_or_create(**cust_address_data)
-            _customer.address = addr
-            _customer.save(update_fields=["address"])
+        _link_address(_customer, cust_address_data)
 
     log.info(f"{'Created' if created else 'Updated'} customer {cust_data['handle']}")
     return RIRSyncLog.objects.create(
@@ -371,7 +416,40 @@ def _sync_aggregate_nets(
     return logs, agg_nets
 
 
-class SyncRIRConfigJob(JobRunner):
+def order_prefix_syncs(agg_nets: list[tuple]) -> list[tuple]:
+    """
+    Order (Aggregate, RIRNetwork) pairs for prefix discovery.
+
+    Aggregates whose child networks were synced least recently (or never) come
+    first, then those with fewer prefixes: SyncPrefixesJob makes one RIR lookup
+    per prefix, so small aggregates finish quickly instead of queueing behind
+    the largest ones.  Both are read in one query for the whole batch.
+    """
+    from django.db.models import F, Func, OuterRef, Subquery
+    from ipam.models import Aggregate, Prefix
+
+    last_synced = (
+        RIRNetwork.objects.filter(prefix__prefix__net_contained=OuterRef("prefix"), last_synced__isnull=False)
+        .order_by("-last_synced")
+        .values("last_synced")[:1]
+    )
+    size = (
+        Prefix.objects.filter(prefix__net_contained=OuterRef("prefix"))
+        .order_by()
+        .annotate(count=Func(F("pk"), function="COUNT"))
+        .values("count")
+    )
+    stats = (
+        Aggregate.objects.filter(pk__in={agg.pk for agg, _net in agg_nets})
+        .annotate(last_synced=Subquery(last_synced), size=Subquery(size))
+        .values_list("pk", "last_synced", "size")
+    )
+    sort_keys = {pk: (last.timestamp() if last else 0, count) for pk, last, count in stats}
+
+    return sorted(agg_nets, key=lambda agg_net: sort_keys[agg_net[0].pk])
+
+
+class SyncRIRConfigJob(RIRJobRunner):
     """Background job for syncing RIR data."""
 
     class Meta:
@@ -392,8 +470,8 @@ class SyncRIRConfigJob(JobRunner):
         with _changelog_context(self.job.user):
             logs, agg_nets = sync_rir_config(rir_config, api_key=user_key.api_key, user_key=user_key, log=self.logger)
 
-        # Enqueue per-aggregate prefix discovery sub-jobs
-        for agg, parent_net in agg_nets:
+        # Enqueue per-aggregate prefix discovery sub-jobs, stalest and smallest first
+        for agg, parent_net in order_prefix_syncs(agg_nets):
             SyncPrefixesJob.enqueue(
                 instance=rir_config,
                 user=user_key.user,
@@ -408,7 +486,7 @@ class SyncRIRConfigJob(JobRunner):
         self.logger.info(f"Sync complete: {len(logs)} log entries")
 
 
-class SyncPrefixesJob(JobRunner):
+class SyncPrefixesJob(RIRJobRunner):
     """Discover and sync child prefix reassignments for a single aggregate."""
 
     class Meta:
@@ -432,7 +510,7 @@ class SyncPrefixesJob(JobRunner):
         prefixes = Prefix.objects.filter(prefix__net_contained=agg.prefix)
         self.logger.info(f"Scanning {prefixes.count()} prefixes under {agg.prefix}")
 
-        with _changelog_context(self.job.user):
+        with _changelog_context(self.job.user), batched_invalidation():
             for pfx in prefixes:
                 pfx_network = pfx.prefix
                 pfx_start = str(pfx_network.network)
@@ -479,7 +557,7 @@ class SyncPrefixesJob(JobRunner):
                 )
 
 
-class ReassignJob(JobRunner):
+class ReassignJob(RIRJobRunner):
     """Background job for reassigning a prefix at ARIN.
 
     Accepts prefix_id and user_key_id via kwargs.
@@ -490,12 +568,13 @@ class ReassignJob(JobRunner):
     class Meta:
         name = "ARIN Reassign"
 
+    priority = INTERACTIVE
+
     def run(self, *args, **kwargs):
         from ipam.models import Aggregate, Prefix
 
-        from netbox_rir_manager.choices import normalize_ticket_status
-        from netbox_rir_manager.models import RIRTicket, RIRUserKey
-        from netbox_rir_manager.services.geocoding import resolve_site_address
+        from netbox_rir_manager.models import RIRUserKey
+        from netbox_rir_manager.services.reassign import reassign_prefix
 
         prefix_id = kwargs.get("prefix_id")
         user_key_id = kwargs.get("user_key_id")
@@ -526,213 +605,224 @@ class ReassignJob(JobRunner):
                 return
 
             self.logger.info(f"Found parent network {parent_network.handle} (aggregate {agg.prefix})")
-            rir_config = parent_network.rir_config
-            backend = ARINBackend.from_rir_config(rir_config, api_key=user_key.api_key)
+            backend = ARINBackend.from_rir_config(parent_network.rir_config, api_key=user_key.api_key)
+            result = reassign_prefix(prefix, parent_network, backend, user_key, log=self.logger)
 
-            # Determine reassignment type
-            tenant = prefix.tenant
-            rir_org = RIROrganization.objects.filter(tenant=tenant).first() if tenant else None
-
-            # Compute subnet range from prefix
-            import ipaddress
-
-            network = ipaddress.ip_network(str(prefix.prefix), strict=False)
-            start_address = str(network.network_address)
-            end_address = str(network.broadcast_address)
-
-            # Pre-flight: check what ARIN actually has for this range
-            self.logger.info(f"Pre-flight: querying ARIN for existing net at {start_address}-{end_address}")
-            actual_net = backend.find_net(start_address, end_address)
-            if actual_net is not None:
-                actual_handle = actual_net.get("handle")
-
-                # Already reassigned at ARIN (different net than parent) -- just sync it
-                if actual_handle and actual_handle != parent_network.handle:
-                    self.logger.warning(f"Pre-flight: prefix already reassigned as {actual_handle}, syncing instead")
-                    RIRNetwork.sync_from_arin(
-                        actual_net,
-                        rir_config,
-                        prefix=prefix,
-                        user_key=user_key,
-                    )
-                    self.job.data["status"] = "synced"
-                    self.job.data["message"] = (
-                        f"Prefix already has ARIN network {actual_handle} "
-                        f"(expected parent {parent_network.handle}). Synced locally."
-                    )
-                    self.job.save()
+        self.job.data.update(result)
+        self.job.save()
 
-                    RIRSyncLog.objects.create(
-                        rir_config=rir_config,
-                        operation="reassign",
-                        object_type="network",
-                        object_handle=actual_handle,
-                        status="skipped",
-                        message=(
-                            f"Prefix {prefix.prefix} already reassigned at ARIN as "
-                            f"{actual_handle}. Synced instead of re-reassigning."
-                        ),
-                    )
-                    return
 
-            self.logger.info("Pre-flight passed")
+class ProcessPendingReassignsJob(RIRJobRunner):
+    """Drain the coalesced auto-reassign queue (RIRPendingReassign).
 
-            self.logger.info(f"Reassignment type: {'detailed' if rir_org else 'simple'}")
+    Prefixes are grouped by parent NET and processed with one backend per API
+    key, so a bulk edit of hundreds of prefixes costs one job and one parent
+    fetch per NET instead of one job per prefix.  The pre-flight ``find_net``
+    checks of the whole batch run concurrently up front; prefixes already
+    reassigned at ARIN are only synced locally.
+    """
 
-            if rir_org:
-                # Detailed reassignment - tenant has a known RIR org
-                self.job.data["reassignment_type"] = "detailed"
-                self.job.data["org_handle"] = rir_org.handle
-                self.job.save()
+    class Meta:
+        name = "ARIN Auto-Reassign Batch"
 
-                net_data = {
-                    "org_handle": rir_org.handle,
-                    "net_name": f"{tenant.name}-{prefix.prefix}",
-                    "start_address": start_address,
-                    "end_address": end_address,
-                }
-            else:
-                # Simple reassignment - create customer from site address
-                self.job.data["reassignment_type"] = "simple"
-                self.job.save()
+    # Prefixes handled per run; the job re-enqueues itself while rows remain
+    batch_size = 200
 
-                # Get the site - use scope for GenericFK
-                site = getattr(prefix, "_site", None) or getattr(prefix, "site", None)
-                if site is None:
-                    # Try scope
-                    scope = getattr(prefix, "scope", None)
-                    from dcim.models import Site
-
-                    if isinstance(scope, Site):
-                        site = scope
-
-                if not site:
-                    self.job.data["status"] = "error"
-                    self.job.data["message"] = "Prefix has no site"
-                    self.job.save()
-                    return
-
-                # Resolve site address
-                site_address = RIRAddress.get_for_site(site)
-                if not site_address:
-                    site_address = resolve_site_address(site)
-
-                if not site_address:
-                    self.job.data["status"] = "error"
-                    self.job.data["message"] = "Could not resolve address for site"
-                    self.job.save()
-                    return
-
-                # Create customer at ARIN
-                customer_data = {
-                    "customer_name": tenant.name,
-                    "street_address": site_address.street_address,
-                    "city": site_address.city,
-                    "state_province": site_address.state_province,
-                    "postal_code": site_address.postal_code,
-                    "country": site_address.country,
-                }
-                customer_result = backend.create_customer(parent_network.handle, customer_data)
-                if customer_result is None:
-                    RIRSyncLog.objects.create(
-                        rir_config=rir_config,
-                        operation="create",
-                        object_type="customer",
-                        object_handle=parent_network.handle,
-                        status="error",
-                        message=f"Failed to create customer for {tenant.name}",
-                    )
-                    self.job.data["status"] = "error"
-                    self.job.data["message"] = "Failed to create customer at ARIN"
-                    self.job.save()
-                    return
-
-                cust_addr, _ = RIRAddress.objects.get_or_create(
-                    street_address=site_address.street_address,
-                    city=site_address.city,
-                    state_province=site_address.state_province,
-                    postal_code=site_address.postal_code,
-                    country=site_address.country,
-                )
-                RIRCustomer.objects.create(
-                    rir_config=rir_config,
-                    handle=customer_result["handle"],
-                    customer_name=tenant.name,
-                    address=cust_addr,
-                    network=parent_network,
-                    tenant=tenant,
-                    raw_data=customer_result,
-                    created_date=timezone.now(),
-                )
+    @classmethod
+    def enqueue_debounced(cls):
+        """Schedule a drain after ``reassign_batch_delay`` seconds unless one is already waiting."""
+        from django.conf import settings
 
-                net_data = {
-                    "customer_handle": customer_result["handle"],
-                    "net_name": f"{tenant.name}-{prefix.prefix}",
-                    "start_address": start_address,
-                    "end_address": end_address,
-                }
+        plugin_config = settings.PLUGINS_CONFIG.get("netbox_rir_manager", {})
+        return cls._enqueue_debounced(delay=plugin_config.get("reassign_batch_delay", 30))
 
-            # Perform the reassignment
-            self.logger.info(f"Submitting reassignment to ARIN for {prefix.prefix}")
-            result = backend.reassign_network(parent_network.handle, net_data)
-            if result is None:
-                self.logger.error(f"Reassignment failed at ARIN for prefix {prefix.prefix}")
-                RIRSyncLog.objects.create(
-                    rir_config=rir_config,
-                    operation="reassign",
-                    object_type="network",
-                    object_handle=parent_network.handle,
-                    status="error",
-                    message=f"Reassignment failed for prefix {prefix.prefix}",
-                )
-                self.job.data["status"] = "error"
-                self.job.data["message"] = "Reassignment failed at ARIN"
-                self.job.save()
-                return
+    def run(self, *args, **kwargs):
+        from django.conf import settings
+
+        from netbox_rir_manager.models import RIRPendingReassign
+        from netbox_rir_manager.services.reassign import (
+            ReassignmentOutcome,
+            ReassignmentPlan,
+            is_existing_reassignment,
+            prefix_site,
+            preflight_find_nets,
+            reassign_prefix,
+            reassignment_range,
+            record_reassignment,
+        )
 
-            # Create ticket record
-            ticket = RIRTicket.objects.create(
-                rir_config=rir_config,
-                ticket_number=result.get("ticket_number", ""),
-                ticket_type=result.get("ticket_type", "IPV4_SIMPLE_REASSIGN"),
-                status=normalize_ticket_status(result.get("ticket_status", "")),
-                network=parent_network,
-                submitted_by=user_key,
-                created_date=timezone.now(),
-                raw_data=result.get("raw_data", {}),
+        plugin_config = settings.PLUGINS_CONFIG.get("netbox_rir_manager", {})
+        concurrency = plugin_config.get("reassign_concurrency", 4)
+
+        pending = list(
+            RIRPendingReassign.objects.select_related(
+                "prefix__tenant", "parent_network__rir_config", "user_key__user"
+            ).order_by("parent_network_id", "created")[: self.batch_size]
+        )
+        self.job.data = {"pending": len(pending), "results": []}
+        self.job.save()
+        if not pending:
+            self.logger.info("No pending reassignments")
+            return
+
+        # Prefixes that gained an RIRNetwork since they were queued are done already
+        linked = set(
+            RIRNetwork.objects.filter(prefix_id__in=[item.prefix_id for item in pending]).values_list(
+                "prefix_id", flat=True
             )
+        )
 
-            # Create child RIRNetwork if net data was returned
-            net_result = result.get("net")
-            if net_result and net_result.get("handle"):
-                RIRNetwork.sync_from_arin(
-                    net_result,
-                    rir_config,
-                    prefix=prefix,
-                    user_key=user_key,
-                )
+        backends = {}
+        # pending item pk -> (backend, start_address, end_address)
+        checks = {}
+        entries = []
+        for item in pending:
+            prefix = item.prefix
+            parent_network = item.parent_network
+            entry = {"prefix": str(prefix.prefix), "parent": parent_network.handle}
+
+            if item.prefix_id in linked:
+                entry["status"] = "skipped"
+                entry["message"] = "Prefix already has an RIR network"
+            elif prefix.status != "active" or not prefix.tenant_id or not prefix_site(prefix):
+                entry["status"] = "skipped"
+                entry["message"] = "Prefix no longer qualifies for auto-reassignment"
+            else:
+                try:
+                    backend = backends.get(item.user_key_id)
+                    if backend is None:
+                        backend = backends[item.user_key_id] = ARINBackend.from_rir_config(
+                            parent_network.rir_config, api_key=item.user_key.api_key
+                        )
+                    checks[item.pk] = (backend, *reassignment_range(prefix))
+                except Exception as exc:
+                    self.logger.error(f"Cannot reassign {prefix.prefix}: {exc}")
+                    entry["status"] = "error"
+                    entry["message"] = str(exc)
+            entries.append((item, entry))
+
+        # One concurrent pre-flight pass for the batch; results are reused by the write path
+        nets = preflight_find_nets(checks.values(), concurrency=concurrency, log=self.logger)
+
+        counts = {}
+        for item, entry in entries:
+            check = checks.get(item.pk)
+            if check is not None:
+                prefix = item.prefix
+                parent_network = item.parent_network
+                net = nets.get(check)
+                try:
+                    with _changelog_context(item.user_key.user):
+                        if is_existing_reassignment(net, parent_network):
+                            self.logger.info(f"{prefix.prefix} already reassigned at ARIN as {net['handle']}, syncing")
+                            _backend, start_address, end_address = check
+                            plan = ReassignmentPlan(
+                                prefix=prefix,
+                                parent_network=parent_network,
+                                start_address=start_address,
+                                end_address=end_address,
+                            )
+                            entry.update(
+                                record_reassignment(
+                                    plan, ReassignmentOutcome(existing_net=net), item.user_key, log=self.logger
+                                )
+                            )
+                        else:
+                            self.logger.info(f"Reassigning {prefix.prefix} under {parent_network.handle}")
+                            entry.update(
+                                reassign_prefix(
+                                    prefix, parent_network, check[0], item.user_key, log=self.logger, preflight=nets
+                                )
+                            )
+                except Exception as exc:
+                    # One prefix must not abort the batch; the next save of the prefix queues it again
+                    self.logger.error(f"Reassignment of {prefix.prefix} raised: {exc}")
+                    entry["status"] = "error"
+                    entry["message"] = str(exc)
+
+            counts[entry["status"]] = counts.get(entry["status"], 0) + 1
+            self.job.data["results"].append(entry)
+            # Removed whatever the outcome, so a failing prefix cannot block later batches
+            item.delete()
+
+        self.job.data["counts"] = counts
+        self.job.save()
+        self.logger.info(
+            f"Processed {len(pending)} pending reassignments across {len(backends)} API keys: "
+            + ", ".join(f"{status}={count}" for status, count in sorted(counts.items()))
+        )
 
-            RIRSyncLog.objects.create(
-                rir_config=rir_config,
-                operation="reassign",
-                object_type="network",
-                object_handle=parent_network.handle,
-                status="success",
-                message=f"Reassignment submitted for {prefix.prefix}, ticket {ticket.ticket_number}",
-            )
+        if RIRPendingReassign.objects.exists():
+            self.logger.info("More pending reassignments remain, scheduling another batch")
+            self.enqueue_debounced()
 
-            self.logger.info(f"Reassignment submitted, ticket {ticket.ticket_number}")
-            self.job.data["status"] = "success"
-            self.job.data["ticket_number"] = ticket.ticket_number
-            self.job.save()
 
+class BulkReassignJob(RIRJobRunner):
+    """Reassign many prefixes at ARIN in one job.
+
+    Accepts prefix_ids and user_id via kwargs; the user's API keys are used.
+    Prefixes are validated up front, parent NETs are fetched once per backend,
+    site addresses are resolved once per site and submissions run with
+    bounded concurrency (``reassign_concurrency``).
+    """
 
-class RemoveNetworkJob(JobRunner):
+    class Meta:
+        name = "ARIN Bulk Reassign"
+
+    def run(self, *args, **kwargs):
+        from django.conf import settings
+        from django.contrib.auth import get_user_model
+        from ipam.models import Prefix
+
+        from netbox_rir_manager.services.bulk_reassign import bulk_reassign, validate_bulk_reassign
+
+        prefix_ids = kwargs.get("prefix_ids") or []
+        user = get_user_model().objects.get(pk=kwargs.get("user_id"))
+        plugin_config = settings.PLUGINS_CONFIG.get("netbox_rir_manager", {})
+        concurrency = plugin_config.get("reassign_concurrency", 4)
+
+        prefixes = Prefix.objects.restrict(user, "change").filter(pk__in=prefix_ids).select_related("tenant")
+        candidates = validate_bulk_reassign(prefixes, user)
+        valid = sum(1 for candidate in candidates if candidate.is_valid)
+
+        self.job.data = {"total": len(prefix_ids), "valid": valid, "status": "running"}
+        self.job.save()
+        self.logger.info(f"Bulk reassignment of {len(prefix_ids)} prefixes: {valid} valid")
+
+        def backend_factory(user_key, parent_network):
+            return ARINBackend.from_rir_config(parent_network.rir_config, api_key=user_key.api_key)
+
+        with _changelog_context(user):
+            results = bulk_reassign(candidates, backend_factory, concurrency=concurrency, log=self.logger)
+
+        missing = set(prefix_ids) - {candidate.prefix.pk for candidate in candidates}
+        results.extend({"prefix_id": pk, "status": "invalid", "message": "Prefix not found"} for pk in sorted(missing))
+
+        counts: dict[str, int] = {}
+        for entry in results:
+            counts[entry["status"]] = counts.get(entry["status"], 0) + 1
+        self.job.data.update(
+            {
+                "status": "completed",
+                "counts": counts,
+                "tickets": [entry["ticket_number"] for entry in results if entry.get("ticket_number")],
+                "results": sorted(results, key=lambda entry: entry["prefix_id"]),
+            }
+        )
+        self.job.save()
+        self.logger.info(
+            "Bulk reassignment finished: " + ", ".join(f"{status}={count}" for status, count in sorted(counts.items()))
+        )
+
+
+class RemoveNetworkJob(RIRJobRunner):
     """Background job for removing a reassigned network at ARIN."""
 
     class Meta:
         name = "ARIN Remove"
 
+    priority = INTERACTIVE
+
     def run(self, *args, **kwargs):
         from netbox_rir_manager.models import RIRUserKey
 
@@ -779,8 +869,366 @@ class RemoveNetworkJob(JobRunner):
         self.job.save()
 
 
+class BatchRemoveNetworkJob(RIRJobRunner):
+    """Background job for removing many reassigned networks at ARIN in one run.
+
+    Networks are grouped by RIRConfig; each group is removed with one backend
+    (the config's first API key, as in RIRNetwork.enqueue_removal), subject to
+    the shared ``api_rate_limit``. Per-network results are stored in job.data.
+    """
+
+    class Meta:
+        name = "ARIN Batch Remove"
+
+    def run(self, *args, **kwargs):
+        from netbox_rir_manager.models import RIRUserKey
+
+        network_ids = kwargs.get("network_ids") or []
+
+        networks = list(
+            RIRNetwork.objects.filter(pk__in=network_ids, aggregate__isnull=True)
+            .select_related("rir_config")
+            .order_by("rir_config_id", "pk")
+        )
+        by_config: dict[int, list[RIRNetwork]] = {}
+        for network in networks:
+            by_config.setdefault(network.rir_config_id, []).append(network)
+
+        user_keys: dict[int, RIRUserKey] = {}
+        for user_key in RIRUserKey.objects.filter(rir_config_id__in=by_config).select_related("user"):
+            user_keys.setdefault(user_key.rir_config_id, user_key)
+
+        self.job.data = {"total": len(network_ids), "results": []}
+        self.job.save()
+        results = self.job.data["results"]
+
+        found = {network.pk for network in networks}
+        for network_id in network_ids:
+            if network_id not in found:
+                results.append(
+                    {"network_id": network_id, "status": "skipped", "message": "Network not found or is an allocation"}
+                )
+
+        for config_networks in by_config.values():
+            rir_config = config_networks[0].rir_config
+            user_key = user_keys.get(rir_config.pk)
+            if user_key is None:
+                self.logger.warning(
+                    f"No API key for config {rir_config.name}, skipping {len(config_networks)} networks"
+                )
+                results.extend(
+                    {
+                        "network_id": network.pk,
+                        "handle": network.handle,
+                        "status": "error",
+                        "message": f"No API key for config {rir_config.name}",
+                    }
+                    for network in config_networks
+                )
+                continue
+
+            self.logger.info(f"Removing {len(config_networks)} networks from ARIN for {rir_config.name}")
+            backend = ARINBackend.from_rir_config(rir_config, api_key=user_key.api_key)
+            with _changelog_context(self.job.user or user_key.user):
+                for network in config_networks:
+                    # One failing network must not cost the results of the others
+                    try:
+                        success = backend.remove_network(network.handle)
+                    except Exception as exc:
+                        self.logger.error(f"Failed to remove network {network.handle}: {exc}")
+                        success = False
+                        message = f"Failed to remove network {network.handle} from ARIN: {exc}"
+                    else:
+                        if success:
+                            self.logger.info(f"Successfully removed network {network.handle}")
+                            message = f"Removed network {network.handle} from ARIN"
+                        else:
+                            self.logger.error(f"Failed to remove network {network.handle}")
+                            message = f"Failed to remove network {network.handle} from ARIN"
+                    status = "success" if success else "error"
+                    RIRSyncLog.objects.create(
+                        rir_config=rir_config,
+                        operation="remove",
+                        object_type="network",
+                        object_handle=network.handle,
+                        status=status,
+                        message=message,
+                    )
+                    results.append(
+                        {"network_id": network.pk, "handle": network.handle, "status": status, "message": message}
+                    )
+
+        counts: dict[str, int] = {}
+        for entry in results:
+            counts[entry["status"]] = counts.get(entry["status"], 0) + 1
+        self.job.data["counts"] = counts
+        self.job.save()
+        self.logger.info(
+            f"Processed {len(network_ids)} network removals across {len(by_config)} configs: "
+            + ", ".join(f"{status}={count}" for status, count in sorted(counts.items()))
+        )
+
+
+class DispatchWriteOperationsJob(RIRJobRunner):
+    """Submit queued ARIN write operations (RIRWriteOperation) to the RIR.
+
+    Operations are claimed with ``SELECT ... FOR UPDATE SKIP LOCKED`` so
+    concurrent dispatchers never submit the same one, and are processed with
+    one backend per API key.  Failed operations are retried after
+    ``write_retry_delay`` seconds, up to ``write_max_attempts`` attempts.
+    Running operations left behind by a dead worker are taken over once their
+    ``WRITE_LEASE`` has expired.
+    """
+
+    class Meta:
+        name = "ARIN Write Dispatcher"
+
+    priority = INTERACTIVE
+
+    # Operations claimed per run; the job re-enqueues itself while more are due
+    batch_size = 100
+
+    @classmethod
+    def enqueue_dispatch(cls, schedule_at=None):
+        """Queue a dispatcher run unless an equivalent one is already waiting."""
+        from core.choices import JobStatusChoices
+
+        waiting_status = JobStatusChoices.STATUS_SCHEDULED if schedule_at else JobStatusChoices.STATUS_PENDING
+        if cls.get_jobs().filter(status=waiting_status).exists():
+            return None
+        return cls.enqueue(schedule_at=schedule_at)
+
+    def run(self, *args, **kwargs):
+        from datetime import timedelta
+
+        from django.conf import settings
+        from django.db import transaction
+        from django.db.models import Min, Q
+
+        from netbox_rir_manager.choices import WriteOperationStatusChoices
+        from netbox_rir_manager.models import RIRWriteOperation
+        from netbox_rir_manager.services.outbox import execute_write_operation, stale_running_q
+
+        plugin_config = settings.PLUGINS_CONFIG.get("netbox_rir_manager", {})
+        max_attempts = plugin_config.get("write_max_attempts", 3)
+        retry_delay = plugin_config.get("write_retry_delay", 60)
+
+        # Pending operations, and running ones whose worker died without finishing them
+        due = RIRWriteOperation.objects.filter(
+            Q(status=WriteOperationStatusChoices.STATUS_PENDING)
+            & (Q(next_attempt__isnull=True) | Q(next_attempt__lte=timezone.now()))
+            | stale_running_q()
+        )
+        with transaction.atomic():
+            claimed = list(
+                due.select_for_update(skip_locked=True)
+                .order_by("created")
+                .values_list("pk", flat=True)[: self.batch_size]
+            )
+            claimed_at = timezone.now()
+            RIRWriteOperation.objects.filter(pk__in=claimed).update(
+                status=WriteOperationStatusChoices.STATUS_RUNNING, last_updated=claimed_at
+            )
+
+        operations = RIRWriteOperation.objects.filter(pk__in=claimed).select_related(
+            "rir_config", "network", "user_key__user"
+        )
+        self.job.data = {"claimed": len(claimed), "results": []}
+        self.job.save()
+
+        backends = {}
+        counts: dict[str, int] = {}
+        for write_operation in operations.order_by("created"):
+            # Renew the lease, unless the batch took so long to get here that another
+            # dispatcher took the operation over: it must not be sent twice
+            if not RIRWriteOperation.objects.filter(
+                pk=write_operation.pk, status=WriteOperationStatusChoices.STATUS_RUNNING, last_updated=claimed_at
+            ).update(last_updated=timezone.now()):
+                self.logger.warning(f"Write operation {write_operation.pk} was taken over by another run; skipped")
+                continue
+            write_operation.attempts += 1
+            user_key = write_operation.user_key
+            succeeded = False
+            if user_key is None:
+                # Retrying cannot help once the key is gone
+                write_operation.message = "The API key for this operation no longer exists."
+                write_operation.attempts = max_attempts
+            else:
+                backend = backends.get(user_key.pk)
+                if backend is None:
+                    backend = backends[user_key.pk] = ARINBackend.from_rir_config(
+                        write_operation.rir_config, api_key=user_key.api_key
+                    )
+                with _changelog_context(user_key.user):
+                    try:
+                        succeeded = execute_write_operation(write_operation, backend, log=self.logger)
+                    except Exception as exc:
+                        self.logger.error(f"Write operation {write_operation.pk} raised: {exc}")
+                        write_operation.message = str(exc)
+
+            if succeeded:
+                write_operation.status = WriteOperationStatusChoices.STATUS_COMPLETED
+                write_operation.completed = timezone.now()
+                write_operation.next_attempt = None
+            elif write_operation.attempts < max_attempts:
+                write_operation.status = WriteOperationStatusChoices.STATUS_PENDING
+                write_operation.next_attempt = timezone.now() + timedelta(seconds=retry_delay)
+            else:
+                write_operation.status = WriteOperationStatusChoices.STATUS_FAILED
+                write_operation.completed = timezone.now()
+                write_operation.next_attempt = None
+            write_operation.save()
+
+            counts[write_operation.status] = counts.get(write_operation.status, 0) + 1
+            self.job.data["results"].append(
+                {
+                    "id": write_operation.pk,
+                    "operation": write_operation.operation,
+                    "network": write_operation.network_handle,
+                    "status": write_operation.status,
+                    "message": write_operation.message,
+                }
+            )
+
+        self.job.data["counts"] = counts
+        self.job.save()
+        self.logger.info(
+            f"Dispatched {len(claimed)} write operations across {len(backends)} API keys: "
+            + ", ".join(f"{status}={count}" for status, count in sorted(counts.items()))
+        )
+
+        pending = RIRWriteOperation.objects.filter(status=WriteOperationStatusChoices.STATUS_PENDING)
+        if due.exists():
+            self.logger.info("More write operations are due, scheduling another run")
+            self.enqueue_dispatch()
+        elif retry_at := pending.aggregate(retry_at=Min("next_attempt"))["retry_at"]:
+            self.enqueue_dispatch(schedule_at=retry_at)
+
+
+class ReconcileRIRConfigJob(RIRJobRunner):
+    """Compute NetBox <-> RIR drift for a config and store it as a reconciliation report."""
+
+    class Meta:
+        name = "RIR Reconciliation"
+
+    def run(self, *args, **kwargs):
+        from netbox_rir_manager.models import RIRConfig, RIRReconciliationReport
+        from netbox_rir_manager.services.reconciliation import reconcile_rir_config
+
+        rir_config = RIRConfig.objects.get(pk=self.job.object_id)
+
+        self.job.data = {"rir_config": rir_config.name}
+        self.job.save()
+
+        result = reconcile_rir_config(rir_config, log=self.logger)
+        summary = result["summary"]
+        total_drift = sum(len(entries) for entries in result["drift"].values())
+
+        with _changelog_context(self.job.user):
+            report = RIRReconciliationReport.objects.create(
+                rir_config=rir_config,
+                total_drift=total_drift,
+                summary=summary,
+                drift=result["drift"],
+            )
+
+        self.job.data.update({"report_id": report.pk, "total_drift": total_drift, **summary})
+        self.job.save()
+        self.logger.info(f"Reconciliation report {report.pk} stored: {total_drift} drift entries")
+
+
+class RelinkNetworksJob(RIRJobRunner):
+    """Link unlinked RIRNetworks to matching Aggregates/Prefixes in one batch."""
+
+    class Meta:
+        name = "RIR Network Relink"
+
+    def run(self, *args, **kwargs):
+        from netbox_rir_manager.models import RIRConfig
+        from netbox_rir_manager.services.relink import relink_networks
+
+        rir_config = RIRConfig.objects.get(pk=self.job.object_id) if self.job.object_id else None
+        summary = relink_networks(rir_config, log=self.logger)
+
+        self.job.data = {"rir_config": rir_config.name if rir_config else None, **summary}
+        self.job.save()
+
+
+class ResolveSiteAddressesJob(RIRJobRunner):
+    """Geocode and store addresses for all Sites without a site-level RIRAddress.
+
+    Accepts optional region_id and tenant_id kwargs to limit the sites, and
+    concurrency (default ``geocoding_concurrency``). Progress and the final
+    summary are stored in job.data.
+    """
+
+    class Meta:
+        name = "RIR Site Address Resolution"
+
+    def run(self, *args, **kwargs):
+        from dcim.models import Region
+        from django.conf import settings
+        from tenancy.models import Tenant
+
+        from netbox_rir_manager.services.site_addresses import resolve_site_addresses
+
+        plugin_config = settings.PLUGINS_CONFIG.get("netbox_rir_manager", {})
+        concurrency = kwargs.get("concurrency") or plugin_config.get("geocoding_concurrency", 4)
+        region = Region.objects.get(pk=kwargs["region_id"]) if kwargs.get("region_id") else None
+        tenant = Tenant.objects.get(pk=kwargs["tenant_id"]) if kwargs.get("tenant_id") else None
+
+        self.job.data = {
+            "region": region.name if region else None,
+            "tenant": tenant.name if tenant else None,
+            "status": "running",
+        }
+        self.job.save()
+
+        def progress(summary):
+            self.job.data.update(summary)
+            self.job.save()
+
+        summary = resolve_site_addresses(region, tenant, concurrency=concurrency, progress=progress, log=self.logger)
+        self.job.data.update({**summary, "status": "completed", "done": summary["sites"]})
+        self.job.save()
+
+
+class RefreshSiteAddressesJob(RIRJobRunner):
+    """Resolve addresses for new Sites and refresh them for Sites whose location changed.
+
+    Queued by the Site signals (signals.queue_site_address_resolution), at most
+    one waiting at a time, so a bulk import of sites costs one job. Geocodes
+    every Site without a site-level RIRAddress and every Site whose
+    auto-resolved address was marked stale, so reassignments find the address
+    ready instead of geocoding it themselves.
+    """
+
+    class Meta:
+        name = "RIR Site Address Refresh"
+
+    @classmethod
+    def enqueue_debounced(cls):
+        """Schedule a run after ``site_address_delay`` seconds unless one is already waiting."""
+        from django.conf import settings
+
+        plugin_config = settings.PLUGINS_CONFIG.get("netbox_rir_manager", {})
+        return cls._enqueue_debounced(delay=plugin_config.get("site_address_delay", 60))
+
+    def run(self, *args, **kwargs):
+        from django.conf import settings
+
+        from netbox_rir_manager.services.site_addresses import resolve_site_addresses
+
+        plugin_config = settings.PLUGINS_CONFIG.get("netbox_rir_manager", {})
+        summary = resolve_site_addresses(
+            concurrency=plugin_config.get("geocoding_concurrency", 4), refresh=True, log=self.logger
+        )
+        self.job.data = summary
+        self.job.save()
+
+
 @system_job(interval=JobIntervalChoices.INTERVAL_DAILY)
-class ScheduledRIRSyncJob(JobRunner):
+class ScheduledRIRSyncJob(RIRJobRunner):
     """Scheduled background job that syncs all active RIR configs."""
 
     class Meta:
@@ -0,0 +1,99 @@
+"""Nearest-neighbour lookup of points on the globe.
+
+``KDTree`` is a static 3-d tree over unit vectors: latitude/longitude pairs are
+mapped onto the unit sphere, where the straight-line (chord) distance orders
+points exactly like the great-circle distance, without special cases at the
+antimeridian or the poles.  The tree is built once by median splits into flat
+lists; a nearest-neighbour query visits O(log n) nodes, so reverse lookups
+among a few hundred thousand places take a few microseconds to a fraction of a
+millisecond in pure Python.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+from collections.abc import Sequence
+
+EARTH_RADIUS_KM = 6371.0088
+
+Vector = tuple[float, float, float]
+
+
+def unit_vector(latitude: float, longitude: float) -> Vector:
+    """Point on the unit sphere for a latitude/longitude in degrees."""
+    lat = math.radians(latitude)
+    lng = math.radians(longitude)
+    return (math.cos(lat) * math.cos(lng), math.cos(lat) * math.sin(lng), math.sin(lat))
+
+
+def chord_to_km(squared_chord: float) -> float:
+    """Great-circle distance in km for a squared chord length between unit vectors."""
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(squared_chord) / 2))
+
+
+class KDTree:
+    """Static k-d tree over latitude/longitude points.
+
+    Nodes are kept in parallel lists (point index, split axis, left and right
+    child), with -1 for a missing child.
+    """
+
+    def __init__(self, coordinates: Sequence[tuple[float, float]]):
+        self._points = [unit_vector(lat, lng) for lat, lng in coordinates]
+        self._index: list[int] = []
+        self._axis: list[int] = []
+        self._left: list[int] = []
+        self._right: list[int] = []
+        self._root = self._build(list(range(len(self._points))), 0)
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def _build(self, indices: list[int], depth: int) -> int:
+        if not indices:
+            return -1
+        axis = depth % 3
+        indices.sort(key=lambda i: self._points[i][axis])
+        middle = len(indices) // 2
+        node = len(self._index)
+        self._index.append(indices[middle])
+        self._axis.append(axis)
+        self._left.append(-1)
+        self._right.append(-1)
+        self._left[node] = self._build(indices[:middle], depth + 1)
+        self._right[node] = self._build(indices[middle + 1 :], depth + 1)
+        return node
+
+    def nearest(self, latitude: float, longitude: float, k: int = 1) -> list[tuple[int, float]]:
+        """The ``k`` points closest to a latitude/longitude, as ``(index, km)`` pairs, closest first.
+
+        Indices refer to the order of the coordinates the tree was built from.
+        """
+        if k <= 0 or self._root < 0:
+            return []
+        target = unit_vector(latitude, longitude)
+        points, index, axes, left, right = self._points, self._index, self._axis, self._left, self._right
+        # Max-heap of the best k so far, as (-squared distance, point index)
+        best: list[tuple[float, int]] = []
+
+        def search(node: int) -> None:
+            while node >= 0:
+                i = index[node]
+                point = points[i]
+                distance = (target[0] - point[0]) ** 2 + (target[1] - point[1]) ** 2 + (target[2] - point[2]) ** 2
+                if len(best) < k:
+                    heapq.heappush(best, (-distance, i))
+                elif distance < -best[0][0]:
+                    heapq.heapreplace(best, (-distance, i))
+                axis = axes[node]
+                diff = target[axis] - point[axis]
+                near, far = (left[node], right[node]) if diff < 0 else (right[node], left[node])
+                search(near)
+                # The far side can only hold a closer point if the splitting plane is within range
+                if len(best) == k and diff * diff >= -best[0][0]:
+                    return
+                node = far
+
+        search(self._root)
+        return [(i, chord_to_km(-negative)) for negative, i in sorted(best, reverse=True)]
@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand
+
+from netbox_rir_manager.services.geocoding import (
+    clear_geocode_cache,
+    geocode_cache_stats,
+    geocoding_provider_stats,
+)
+
+
+class Command(BaseCommand):
+    help = "Show geocode cache and provider statistics, or clear the cache"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--clear", action="store_true", help="Delete all cached geocoding answers and reset the statistics"
+        )
+
+    def handle(self, *args, **options):
+        if options["clear"]:
+            deleted = clear_geocode_cache()
+            self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} geocode cache entries"))
+            return
+
+        stats = geocode_cache_stats()
+        self.stdout.write(
+            f"{stats['entries']} entries, {stats['hits']} hits, {stats['misses']} misses "
+            f"(hit rate {stats['hit_rate']:.1%})"
+        )
+        for name, provider in geocoding_provider_stats().items():
+            self.stdout.write(
+                f"{name}: {provider['calls']} calls, {provider['answers']} answers, {provider['empty']} empty, "
+                f"{provider['errors']} errors, {provider['timeouts']} timeouts, "
+                f"{provider['fallback_wins']} fallback wins, mean {provider['mean_ms']} ms"
+            )
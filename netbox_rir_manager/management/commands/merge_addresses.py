@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+
+from netbox_rir_manager.services.address_dedup import DEFAULT_BATCH_SIZE, merge_duplicate_addresses
+
+
+class Command(BaseCommand):
+    help = "Merge RIR addresses that are spelling variants of one address and repoint their references"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dry-run", action="store_true", help="Report what would be merged without writing")
+        parser.add_argument(
+            "--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Rows per bulk update and delete"
+        )
+
+    def handle(self, *args, **options):
+        summary = merge_duplicate_addresses(batch_size=options["batch_size"], dry_run=options["dry_run"])
+        verb = "Would merge" if options["dry_run"] else "Merged"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{verb} {summary['merged']} of {summary['addresses']} addresses in {summary['groups']} groups "
+                f"({summary['repointed']} references repointed, "
+                f"{summary['fingerprints_updated']} fingerprints refreshed)"
+            )
+        )
+        if summary["detached"]:
+            self.stdout.write(
+                self.style.WARNING(
+                    "Site or location links dropped with merged addresses: "
+                    + ", ".join(str(pk) for pk in summary["detached"])
+                )
+            )
@@ -0,0 +1,59 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from netbox_rir_manager.models import RIRConfig, RIRUserKey
+from netbox_rir_manager.services.reassign_planner import plan_reassignments, plan_to_csv
+
+
+class Command(BaseCommand):
+    help = "Write a dry-run reassignment plan (CSV) for an aggregate or an RIR config without changing anything"
+
+    def add_arguments(self, parser):
+        scope = parser.add_mutually_exclusive_group(required=True)
+        scope.add_argument("--aggregate", help="Prefix or ID of the aggregate to plan")
+        scope.add_argument("--config", help="Name or ID of the RIR config whose aggregates to plan")
+        parser.add_argument(
+            "--check-arin",
+            action="store_true",
+            help="Look up each candidate range at ARIN (read-only, cached) to find existing NETs",
+        )
+        parser.add_argument("--output", help="File to write the CSV plan to (default: stdout)")
+
+    def handle(self, *args, **options):
+        from ipam.models import Aggregate
+
+        from netbox_rir_manager.backends.arin import ARINBackend
+
+        aggregate = rir_config = None
+        if options["aggregate"]:
+            value = options["aggregate"]
+            lookup = {"pk": value} if value.isdigit() else {"prefix": value}
+            try:
+                aggregate = Aggregate.objects.get(**lookup)
+            except (Aggregate.DoesNotExist, ValueError) as exc:
+                raise CommandError(f"Aggregate {value!r} not found") from exc
+        else:
+            value = options["config"]
+            lookup = {"pk": value} if value.isdigit() else {"name": value}
+            try:
+                rir_config = RIRConfig.objects.get(**lookup)
+            except RIRConfig.DoesNotExist as exc:
+                raise CommandError(f"RIR config {value!r} not found") from exc
+
+        backend = None
+        if options["check_arin"]:
+            key_config = rir_config or RIRConfig.objects.filter(networks__aggregate=aggregate).first()
+            user_key = RIRUserKey.objects.filter(rir_config=key_config).first() if key_config else None
+            if user_key is None:
+                raise CommandError("--check-arin needs an RIR config with at least one API key")
+            backend = ARINBackend.from_rir_config(key_config, api_key=user_key.api_key)
+
+        plan = plan_reassignments(aggregate=aggregate, rir_config=rir_config, backend=backend)
+        content = plan_to_csv(plan["rows"])
+        if options["output"]:
+            with open(options["output"], "w", newline="") as fh:
+                fh.write(content)
+        else:
+            self.stdout.write(content, ending="")
+
+        summary = ", ".join(f"{action}={count}" for action, count in plan["summary"].items())
+        self.stderr.write(self.style.SUCCESS(f"Planned {len(plan['rows'])} prefixes: {summary}"))
@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from netbox_rir_manager.models import RIRConfig
+from netbox_rir_manager.services.relink import relink_networks
+
+
+class Command(BaseCommand):
+    help = "Link unlinked RIR networks to matching NetBox aggregates and prefixes in one batch"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--config",
+            help="Name or ID of the RIR config to relink (default: all active configs)",
+        )
+
+    def handle(self, *args, **options):
+        rir_config = None
+        if options["config"]:
+            lookup = {"pk": options["config"]} if options["config"].isdigit() else {"name": options["config"]}
+            try:
+                rir_config = RIRConfig.objects.get(**lookup)
+            except RIRConfig.DoesNotExist as exc:
+                raise CommandError(f"RIR config {options['config']!r} not found") from exc
+
+        summary = relink_networks(rir_config)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Linked {summary['linked']} of {summary['candidates']} unlinked networks "
+                f"({summary['aggregates']} aggregates, {summary['prefixes']} prefixes loaded)"
+            )
+        )
@@ -0,0 +1,57 @@
+from dcim.models import Region
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from tenancy.models import Tenant
+
+from netbox_rir_manager.jobs import ResolveSiteAddressesJob
+from netbox_rir_manager.services.site_addresses import resolve_site_addresses
+
+
+class Command(BaseCommand):
+    help = "Geocode and store addresses for all sites without a site-level RIR address"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--region", help="Slug or ID of a region; only sites in it or its child regions")
+        parser.add_argument("--tenant", help="Slug or ID of a tenant; only its sites")
+        parser.add_argument(
+            "--concurrency", type=int, help="Sites geocoded in parallel (default: geocoding_concurrency)"
+        )
+        parser.add_argument(
+            "--enqueue", action="store_true", help="Enqueue a ResolveSiteAddressesJob instead of running here"
+        )
+
+    def handle(self, *args, **options):
+        region = self._lookup(Region, options["region"])
+        tenant = self._lookup(Tenant, options["tenant"])
+
+        if options["enqueue"]:
+            job = ResolveSiteAddressesJob.enqueue(
+                region_id=region.pk if region else None,
+                tenant_id=tenant.pk if tenant else None,
+                concurrency=options["concurrency"],
+            )
+            self.stdout.write(self.style.SUCCESS(f"Enqueued job {job.pk}"))
+            return
+
+        plugin_config = settings.PLUGINS_CONFIG.get("netbox_rir_manager", {})
+        concurrency = options["concurrency"] or plugin_config.get("geocoding_concurrency", 4)
+        summary = resolve_site_addresses(region, tenant, concurrency=concurrency)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Created {summary['created']} and linked {summary['linked']} of {summary['sites']} site addresses "
+                f"({len(summary['unresolved'])} unresolved, {len(summary['duplicate'])} duplicate, "
+                f"{summary['skipped']} skipped from earlier runs)"
+            )
+        )
+        for name in summary["unresolved"]:
+            self.stdout.write(f"Unresolved: {name}")
+
+    @staticmethod
+    def _lookup(model, value):
+        if not value:
+            return None
+        lookup = {"pk": value} if value.isdigit() else {"slug": value}
+        try:
+            return model.objects.get(**lookup)
+        except model.DoesNotExist as exc:
+            raise CommandError(f"{model._meta.verbose_name.capitalize()} {value!r} not found") from exc
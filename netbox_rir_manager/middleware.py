@@ -0,0 +1,38 @@
+import re
+
+from django.core.exceptions import RequestDataTooBig
+from django.http.request import RawPostDataException
+
+# List endpoints whose creates the Prefix signals defer when they are bulk creates
+BULK_PAYLOAD_VIEWS = ("ipam-api:prefix-list", "ipam-api:aggregate-list")
+
+_LIST_PAYLOAD = re.compile(rb"\s*\[")
+
+
+class BulkPayloadMiddleware:
+    """Note whether a POST to the Prefix or Aggregate REST API list endpoint creates several objects.
+
+    The endpoint creates one object from a JSON object and many from a JSON
+    list.  The body is read before the view parses it (Django keeps it for the
+    parser) and only its first non-space byte is looked at, so the Prefix
+    signals can tell a bulk create from a single one.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        return self.get_response(request)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if request.method != "POST" or request.resolver_match.view_name not in BULK_PAYLOAD_VIEWS:
+            return None
+        try:
+            request._rir_manager_list_payload = _LIST_PAYLOAD.match(request.body) is not None
+        except RequestDataTooBig:
+            # Too large to read up front; only a bulk create gets this big
+            request._rir_manager_list_payload = True
+        except RawPostDataException:
+            # Another middleware consumed the stream already
+            pass
+        return None
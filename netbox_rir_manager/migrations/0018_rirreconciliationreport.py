@@ -0,0 +1,49 @@
+import django.db.models.deletion
+import netbox.models.deletion
+import taggit.managers
+import utilities.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("extras", "0134_owner"),
+        ("netbox_rir_manager", "0017_site_fk_location_onetoone"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RIRReconciliationReport",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False)),
+                ("created", models.DateTimeField(auto_now_add=True, null=True)),
+                ("last_updated", models.DateTimeField(auto_now=True, null=True)),
+                (
+                    "custom_field_data",
+                    models.JSONField(blank=True, default=dict, encoder=utilities.json.CustomFieldJSONEncoder),
+                ),
+                ("total_drift", models.PositiveIntegerField(default=0)),
+                ("summary", models.JSONField(blank=True, default=dict)),
+                (
+                    "drift",
+                    models.JSONField(blank=True, default=dict, help_text="Drift entries keyed by drift class"),
+                ),
+                (
+                    "rir_config",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="reconciliation_reports",
+                        to="netbox_rir_manager.rirconfig",
+                        verbose_name="RIR config",
+                    ),
+                ),
+                ("tags", taggit.managers.TaggableManager(through="extras.TaggedItem", to="extras.Tag")),
+            ],
+            options={
+                "verbose_name": "RIR reconciliation report",
+                "verbose_name_plural": "RIR reconciliation reports",
+                "ordering": ["-created"],
+            },
+            bases=(netbox.models.deletion.DeleteMixin, models.Model),
+        ),
+    ]
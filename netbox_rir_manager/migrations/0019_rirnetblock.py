@@ -0,0 +1,81 @@
+"""Add RIRNetBlock: indexed numeric address ranges denormalized from RIRNetwork.raw_data."""
+
+import ipaddress
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_net_blocks(apps, schema_editor):
+    """Create RIRNetBlock rows from the net_blocks already stored in raw_data."""
+    RIRNetwork = apps.get_model("netbox_rir_manager", "RIRNetwork")
+    RIRNetBlock = apps.get_model("netbox_rir_manager", "RIRNetBlock")
+
+    blocks = []
+    for network_id, raw_data in RIRNetwork.objects.values_list("pk", "raw_data").iterator(chunk_size=2000):
+        for block in (raw_data or {}).get("net_blocks") or []:
+            start = block.get("start_address")
+            cidr_length = block.get("cidr_length")
+            try:
+                start_ip = ipaddress.ip_address(start)
+                if cidr_length is not None:
+                    cidr_length = int(cidr_length)
+                    end_ip = ipaddress.ip_network(f"{start}/{cidr_length}", strict=False).broadcast_address
+                elif block.get("end_address"):
+                    end_ip = ipaddress.ip_address(block["end_address"])
+                else:
+                    continue
+            except (TypeError, ValueError):
+                continue
+            if end_ip.version != start_ip.version or int(end_ip) < int(start_ip):
+                continue
+            blocks.append(
+                RIRNetBlock(
+                    network_id=network_id,
+                    family=start_ip.version,
+                    start_address=int(start_ip),
+                    end_address=int(end_ip),
+                    cidr_length=cidr_length,
+                    block_type=block.get("type") or "",
+                )
+            )
+    RIRNetBlock.objects.bulk_create(blocks, batch_size=2000)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("netbox_rir_manager", "0018_rirreconciliationreport"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RIRNetBlock",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False)),
+                ("family", models.PositiveSmallIntegerField()),
+                ("start_address", models.DecimalField(decimal_places=0, max_digits=39)),
+                ("end_address", models.DecimalField(decimal_places=0, max_digits=39)),
+                ("cidr_length", models.PositiveSmallIntegerField(blank=True, null=True)),
+                ("block_type", models.CharField(blank=True, default="", max_length=10)),
+                (
+                    "network",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="net_blocks",
+                        to="netbox_rir_manager.rirnetwork",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "RIR net block",
+                "verbose_name_plural": "RIR net blocks",
+                "ordering": ["family", "start_address"],
+                "indexes": [
+                    models.Index(
+                        fields=["family", "start_address", "end_address"], name="netbox_rir_netblock_range"
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_net_blocks, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,57 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("ipam", "0086_gfk_indexes"),
+        ("netbox_rir_manager", "0019_rirnetblock"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RIRPendingReassign",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False)),
+                ("created", models.DateTimeField(auto_now_add=True)),
+                (
+                    "prefix",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="rir_pending_reassign",
+                        to="ipam.prefix",
+                    ),
+                ),
+                (
+                    "rir_config",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="pending_reassigns",
+                        to="netbox_rir_manager.rirconfig",
+                        verbose_name="RIR config",
+                    ),
+                ),
+                (
+                    "parent_network",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="pending_reassigns",
+                        to="netbox_rir_manager.rirnetwork",
+                    ),
+                ),
+                (
+                    "user_key",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="pending_reassigns",
+                        to="netbox_rir_manager.riruserkey",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "RIR pending reassignment",
+                "verbose_name_plural": "RIR pending reassignments",
+                "ordering": ["created"],
+            },
+        ),
+    ]
@@ -0,0 +1,83 @@
+import django.db.models.deletion
+import netbox.models.deletion
+import taggit.managers
+import utilities.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("extras", "0134_owner"),
+        ("netbox_rir_manager", "0020_rirpendingreassign"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RIRWriteOperation",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False)),
+                ("created", models.DateTimeField(auto_now_add=True, null=True)),
+                ("last_updated", models.DateTimeField(auto_now=True, null=True)),
+                (
+                    "custom_field_data",
+                    models.JSONField(blank=True, default=dict, encoder=utilities.json.CustomFieldJSONEncoder),
+                ),
+                ("network_handle", models.CharField(max_length=100)),
+                ("operation", models.CharField(max_length=20)),
+                ("status", models.CharField(default="pending", max_length=20)),
+                ("payload", models.JSONField(blank=True, default=dict, help_text="Request data sent to the RIR")),
+                ("result", models.JSONField(blank=True, default=dict, help_text="RIR responses recorded so far")),
+                ("message", models.TextField(blank=True, default="")),
+                ("attempts", models.PositiveSmallIntegerField(default=0)),
+                ("next_attempt", models.DateTimeField(blank=True, null=True)),
+                ("completed", models.DateTimeField(blank=True, null=True)),
+                (
+                    "rir_config",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="write_operations",
+                        to="netbox_rir_manager.rirconfig",
+                        verbose_name="RIR config",
+                    ),
+                ),
+                (
+                    "network",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="write_operations",
+                        to="netbox_rir_manager.rirnetwork",
+                    ),
+                ),
+                (
+                    "user_key",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="write_operations",
+                        to="netbox_rir_manager.riruserkey",
+                    ),
+                ),
+                (
+                    "ticket",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="write_operations",
+                        to="netbox_rir_manager.rirticket",
+                    ),
+                ),
+                ("tags", taggit.managers.TaggableManager(through="extras.TaggedItem", to="extras.Tag")),
+            ],
+            options={
+                "verbose_name": "RIR write operation",
+                "verbose_name_plural": "RIR write operations",
+                "ordering": ["-created"],
+                "indexes": [models.Index(fields=["status", "next_attempt"], name="rir_writeop_status_idx")],
+            },
+            bases=(netbox.models.deletion.DeleteMixin, models.Model),
+        ),
+    ]
@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("netbox_rir_manager", "0021_rirwriteoperation"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="rirwriteoperation",
+            name="idempotency_key",
+            field=models.CharField(blank=True, editable=False, max_length=64, null=True, unique=True),
+        ),
+    ]
@@ -0,0 +1,29 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("netbox_rir_manager", "0022_rirwriteoperation_idempotency_key"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RIRGeocodeCacheEntry",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False)),
+                ("key", models.CharField(max_length=64, unique=True)),
+                ("provider", models.CharField(max_length=50)),
+                ("lookup", models.CharField(max_length=30)),
+                ("query", models.CharField(max_length=500)),
+                ("results", models.JSONField(default=list)),
+                ("hits", models.PositiveIntegerField(default=0)),
+                ("created", models.DateTimeField()),
+                ("last_used", models.DateTimeField(db_index=True)),
+            ],
+            options={
+                "verbose_name": "RIR geocode cache entry",
+                "verbose_name_plural": "RIR geocode cache entries",
+                "ordering": ["-last_used"],
+            },
+        ),
+    ]
@@ -0,0 +1,229 @@
+"""Replace the five-column RIRAddress uniqueness with a unique normalised fingerprint.
+
+The normaliser and the merge are frozen copies of ``netbox_rir_manager.fingerprint``,
+``netbox_rir_manager.subdivisions`` and ``services.address_dedup`` as of this
+migration, so later changes to them do not change what it computes.  Only the
+subdivision names shipped with pycountry are read from outside.
+"""
+
+import hashlib
+import logging
+import re
+import unicodedata
+from collections import defaultdict
+
+from django.db import migrations, models, transaction
+
+logger = logging.getLogger("netbox_rir_manager.migrations")
+
+BATCH_SIZE = 1000
+
+ADDRESS_FIELDS = ("street_address", "city", "state_province", "postal_code", "country")
+ADDRESS_REFERENCES = ("RIROrganization", "RIRContact", "RIRCustomer")
+
+STREET_WORDS = {
+    "apartment": "apt",
+    "avenue": "ave",
+    "boulevard": "blvd",
+    "building": "bldg",
+    "center": "ctr",
+    "centre": "ctr",
+    "circle": "cir",
+    "court": "ct",
+    "drive": "dr",
+    "east": "e",
+    "floor": "fl",
+    "highway": "hwy",
+    "lane": "ln",
+    "mount": "mt",
+    "north": "n",
+    "parkway": "pkwy",
+    "place": "pl",
+    "road": "rd",
+    "room": "rm",
+    "route": "rte",
+    "saint": "st",
+    "south": "s",
+    "square": "sq",
+    "street": "st",
+    "suite": "ste",
+    "terrace": "ter",
+    "west": "w",
+}
+CITY_WORDS = {"saint": "st", "sainte": "ste", "mount": "mt", "fort": "ft"}
+
+SUBDIVISION_ABBREVIATIONS = {"st": "saint", "ste": "sainte", "mt": "mount", "ft": "fort", "&": "and"}
+SUBDIVISION_GENERIC_WORDS = frozenset(
+    {"the", "of", "de", "state", "province", "provincia", "region", "estado", "prefecture", "oblast"}
+)
+SUBDIVISION_ALIASES = {
+    "DE": {
+        "Lower Saxony": "NI",
+        "North Rhine-Westphalia": "NW",
+        "Rhineland-Palatinate": "RP",
+        "Saxony": "SN",
+        "Saxony-Anhalt": "ST",
+        "Thuringia": "TH",
+        "Hesse": "HE",
+        "Mecklenburg-Western Pomerania": "MV",
+        "Mecklenburg-Vorpommern": "MV",
+    },
+    "IT": {"Lombardy": "25", "Piedmont": "21", "Tuscany": "52", "Sardinia": "88", "Sicily": "82", "Apulia": "75"},
+    "ES": {"Catalonia": "CT", "Andalusia": "AN", "Basque Country": "PV", "Balearic Islands": "IB"},
+    "MX": {"Mexico City": "CMX"},
+}
+
+
+def _words(value):
+    decomposed = unicodedata.normalize("NFKD", value or "")
+    ascii_value = "".join(char for char in decomposed if not unicodedata.combining(char)).casefold()
+    return re.sub(r"[^\w]+", " ", ascii_value).split()
+
+
+def _subdivision_key(name):
+    decomposed = unicodedata.normalize("NFKD", name)
+    ascii_name = "".join(char for char in decomposed if not unicodedata.combining(char)).casefold()
+    words = re.sub(r"[^\w&]+", " ", ascii_name.replace("&", " & ")).split()
+    words = [SUBDIVISION_ABBREVIATIONS.get(word, word) for word in words]
+    kept = [word for word in words if word not in SUBDIVISION_GENERIC_WORDS]
+    return " ".join(kept or words)
+
+
+def _subdivision_index():
+    import gettext
+
+    import pycountry
+
+    try:
+        english = gettext.translation("iso3166-2", pycountry.LOCALES_DIR, languages=["en"])
+    except OSError:
+        english = gettext.NullTranslations()
+
+    index = {}
+
+    def add(country, name, code):
+        variants = [name]
+        if ", " in name:
+            head, _, tail = name.partition(", ")
+            variants.append(f"{tail} {head}")
+        match = re.fullmatch(r"(.+?)\s*[\[(](.+)[\])]", name)
+        if match:
+            variants.extend(match.groups())
+        for variant in variants:
+            key = _subdivision_key(variant)
+            if key:
+                index.setdefault((country, key), code)
+
+    for sub in sorted(pycountry.subdivisions, key=lambda sub: sub.parent_code is not None):
+        code = sub.code.split("-", 1)[-1]
+        add(sub.country_code, code, code)
+        add(sub.country_code, sub.name, code)
+        add(sub.country_code, english.gettext(sub.name), code)
+    for country, aliases in SUBDIVISION_ALIASES.items():
+        for name, code in aliases.items():
+            add(country, name, code)
+    return index
+
+
+def _fingerprint(row, subdivisions):
+    country = (row["country"] or "").strip().upper()
+    state = row["state_province"]
+    subdivision = None
+    if country and state:
+        subdivision = subdivisions.get((country, _subdivision_key(state)))
+    canonical = (
+        " ".join(STREET_WORDS.get(word, word) for word in _words(row["street_address"])),
+        " ".join(CITY_WORDS.get(word, word) for word in _words(row["city"])),
+        subdivision or " ".join(_words(state)).upper(),
+        "".join(_words(row["postal_code"])).upper(),
+        country,
+    )
+    return hashlib.sha256("\x1f".join(canonical).encode()).hexdigest()
+
+
+def fingerprint_addresses(apps, schema_editor):
+    """Fingerprint every address and merge the rows that turn out to be spelling variants."""
+    address_model = apps.get_model("netbox_rir_manager", "RIRAddress")
+    subdivisions = _subdivision_index()
+
+    groups = defaultdict(list)
+    rows = address_model.objects.order_by("pk").values("pk", "site_id", "location_id", *ADDRESS_FIELDS)
+    for row in rows.iterator(chunk_size=BATCH_SIZE):
+        row["fingerprint"] = _fingerprint(row, subdivisions)
+        groups[row["fingerprint"]].append(row)
+
+    survivors = {}  # merged pk -> surviving pk
+    fingerprints = []
+    for fingerprint, members in groups.items():
+        # Keep a site-level address if the group has one, then any site-linked one, then the oldest
+        members.sort(key=lambda row: (row["site_id"] is None, row["location_id"] is not None, row["pk"]))
+        keeper, *merged = members
+        fingerprints.append(address_model(pk=keeper["pk"], fingerprint=fingerprint))
+        for row in merged:
+            survivors[row["pk"]] = keeper["pk"]
+            if (row["site_id"], row["location_id"]) not in ((None, None), (keeper["site_id"], keeper["location_id"])):
+                # One row per fingerprint can hold only one site/location link
+                logger.warning(
+                    "RIRAddress %s (site %s, location %s) merged into %s (site %s, location %s); "
+                    "its site/location link is dropped",
+                    row["pk"],
+                    row["site_id"],
+                    row["location_id"],
+                    keeper["pk"],
+                    keeper["site_id"],
+                    keeper["location_id"],
+                )
+
+    merged_pks = list(survivors)
+    with transaction.atomic():
+        for model_name in ADDRESS_REFERENCES:
+            model = apps.get_model("netbox_rir_manager", model_name)
+            for start in range(0, len(merged_pks), BATCH_SIZE):
+                objects = list(
+                    model.objects.filter(address_id__in=merged_pks[start : start + BATCH_SIZE]).only("pk", "address")
+                )
+                for obj in objects:
+                    obj.address_id = survivors[obj.address_id]
+                model.objects.bulk_update(objects, ["address"], batch_size=BATCH_SIZE)
+        for start in range(0, len(merged_pks), BATCH_SIZE):
+            address_model.objects.filter(pk__in=merged_pks[start : start + BATCH_SIZE]).delete()
+        address_model.objects.bulk_update(fingerprints, ["fingerprint"], batch_size=BATCH_SIZE)
+    if merged_pks:
+        logger.info("Merged %d duplicate RIR addresses", len(merged_pks))
+
+
+class Migration(migrations.Migration):
+    # The merge deletes referenced rows; the unique index is added in its own transaction
+    atomic = False
+
+    dependencies = [
+        ("netbox_rir_manager", "0023_rirgeocodecacheentry"),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name="riraddress",
+            name="unique_rir_address",
+        ),
+        migrations.AddField(
+            model_name="riraddress",
+            name="fingerprint",
+            field=models.CharField(
+                editable=False,
+                help_text="Hash of the normalised address; spelling variants of one address share it",
+                max_length=64,
+                null=True,
+            ),
+        ),
+        migrations.RunPython(fingerprint_addresses, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="riraddress",
+            name="fingerprint",
+            field=models.CharField(
+                editable=False,
+                help_text="Hash of the normalised address; spelling variants of one address share it",
+                max_length=64,
+                unique=True,
+            ),
+        ),
+    ]
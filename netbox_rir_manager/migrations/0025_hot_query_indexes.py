@@ -0,0 +1,38 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("netbox_rir_manager", "0024_riraddress_fingerprint"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="rirnetwork",
+            index=models.Index(
+                condition=models.Q(auto_reassign=True), fields=["aggregate"], name="rir_network_auto_reassign_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="rirnetwork",
+            index=models.Index(
+                condition=models.Q(aggregate__isnull=True), fields=["prefix"], name="rir_network_reassigned_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="rirsynclog",
+            index=models.Index(fields=["-created"], name="rir_synclog_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="rirsynclog",
+            index=models.Index(fields=["rir_config", "-created"], name="rir_synclog_config_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="rirsynclog",
+            index=models.Index(fields=["status", "-created"], name="rir_synclog_status_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="riruserkey",
+            index=models.Index(fields=["rir_config", "user"], name="rir_userkey_config_idx"),
+        ),
+    ]
@@ -0,0 +1,57 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("dcim", "0225_gfk_indexes"),
+        ("netbox_rir_manager", "0025_hot_query_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RIRSiteAddressSkip",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False)),
+                (
+                    "reason",
+                    models.CharField(
+                        choices=[
+                            ("unresolved", "No geocoding result"),
+                            ("duplicate", "Address belongs to another site"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "source",
+                    models.CharField(help_text="Hash of the coordinates and physical address geocoded", max_length=64),
+                ),
+                ("created", models.DateTimeField(auto_now=True)),
+                (
+                    "site",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="rir_address_skip",
+                        to="dcim.site",
+                    ),
+                ),
+                (
+                    "address",
+                    models.ForeignKey(
+                        blank=True,
+                        help_text="The existing address the site resolved to",
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="netbox_rir_manager.riraddress",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "RIR site address skip",
+                "verbose_name_plural": "RIR site address skips",
+                "ordering": ["site"],
+            },
+        ),
+    ]
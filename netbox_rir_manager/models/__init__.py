@@ -1,8 +1,12 @@
 from netbox_rir_manager.models.accounts import RIRConfig
-from netbox_rir_manager.models.addresses import RIRAddress
+from netbox_rir_manager.models.addresses import RIRAddress, RIRSiteAddressSkip
 from netbox_rir_manager.models.credentials import RIRUserKey
 from netbox_rir_manager.models.customers import RIRCustomer
-from netbox_rir_manager.models.resources import RIRContact, RIRNetwork, RIROrganization
+from netbox_rir_manager.models.geocoding import RIRGeocodeCacheEntry
+from netbox_rir_manager.models.outbox import RIRWriteOperation
+from netbox_rir_manager.models.pending import RIRPendingReassign
+from netbox_rir_manager.models.reconciliation import RIRReconciliationReport
+from netbox_rir_manager.models.resources import RIRContact, RIRNetBlock, RIRNetwork, RIROrganization
 from netbox_rir_manager.models.sync import RIRSyncLog
 from netbox_rir_manager.models.tickets import RIRTicket
 
@@ -11,9 +15,15 @@ __all__ = [
     "RIRConfig",
     "RIRContact",
     "RIRCustomer",
+    "RIRGeocodeCacheEntry",
+    "RIRNetBlock",
     "RIRNetwork",
     "RIROrganization",
+    "RIRPendingReassign",
+    "RIRReconciliationReport",
+    "RIRSiteAddressSkip",
     "RIRSyncLog",
     "RIRTicket",
     "RIRUserKey",
+    "RIRWriteOperation",
 ]
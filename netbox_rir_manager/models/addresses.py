@@ -2,6 +2,20 @@ from django.core.exceptions import ValidationError
 from django.db import models
 from django.urls import reverse
 from netbox.models import NetBoxModel
+from utilities.querysets import RestrictedQuerySet
+
+from netbox_rir_manager.fingerprint import ADDRESS_FIELDS, address_fingerprint
+
+
+class RIRAddressQuerySet(RestrictedQuerySet):
+    def get_or_create_address(self, defaults=None, **fields):
+        """``get_or_create`` matching on the address fingerprint rather than the raw field values.
+
+        ``fields`` are the address fields (see ``ADDRESS_FIELDS``); they and
+        ``defaults`` are only used when a new address is created.
+        """
+        fingerprint = address_fingerprint(**fields)
+        return self.get_or_create(fingerprint=fingerprint, defaults={**fields, **(defaults or {})})
 
 
 class RIRAddress(NetBoxModel):
@@ -39,16 +53,20 @@ class RIRAddress(NetBoxModel):
     raw_geocode = models.JSONField(default=dict, blank=True, help_text="Full geocoder response for debugging")
     auto_resolved = models.BooleanField(default=False, help_text="True if geocoded, False if manually entered")
     last_resolved = models.DateTimeField(null=True, blank=True)
+    fingerprint = models.CharField(
+        max_length=64,
+        unique=True,
+        editable=False,
+        help_text="Hash of the normalised address; spelling variants of one address share it",
+    )
+
+    objects = RIRAddressQuerySet.as_manager()
 
     class Meta:
         ordering = ["city", "country"]
         verbose_name = "RIR address"
         verbose_name_plural = "RIR addresses"
         constraints = [
-            models.UniqueConstraint(
-                fields=["street_address", "city", "state_province", "postal_code", "country"],
-                name="unique_rir_address",
-            ),
             models.UniqueConstraint(
                 fields=["site"],
                 condition=models.Q(location__isnull=True, site__isnull=False),
@@ -75,6 +93,59 @@ class RIRAddress(NetBoxModel):
             raise ValidationError({"location": "Location must belong to the selected site."})
         if self.location and not self.site:
             raise ValidationError({"location": "A site must be selected when specifying a location."})
+        duplicate = RIRAddress.objects.filter(fingerprint=self.compute_fingerprint()).exclude(pk=self.pk).first()
+        if duplicate is not None:
+            raise ValidationError(f"This address already exists: {duplicate}")
+
+    def compute_fingerprint(self) -> str:
+        return address_fingerprint(**{field: getattr(self, field) for field in ADDRESS_FIELDS})
+
+    def save(self, *args, **kwargs):
+        self.fingerprint = self.compute_fingerprint()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and set(update_fields) & set(ADDRESS_FIELDS):
+            kwargs["update_fields"] = {*update_fields, "fingerprint"}
+        super().save(*args, **kwargs)
 
     def get_absolute_url(self):
         return reverse("plugins:netbox_rir_manager:riraddress", args=[self.pk])
+
+
+class RIRSiteAddressSkip(models.Model):
+    """Why ``resolve_site_addresses`` left a Site without an address.
+
+    Sites with a record are not geocoded again until their coordinates or
+    physical address change (``source`` no longer matches).
+    """
+
+    REASON_UNRESOLVED = "unresolved"
+    REASON_DUPLICATE = "duplicate"
+    REASON_CHOICES = [
+        (REASON_UNRESOLVED, "No geocoding result"),
+        (REASON_DUPLICATE, "Address belongs to another site"),
+    ]
+
+    site = models.OneToOneField(
+        "dcim.Site",
+        on_delete=models.CASCADE,
+        related_name="rir_address_skip",
+    )
+    reason = models.CharField(max_length=20, choices=REASON_CHOICES)
+    source = models.CharField(max_length=64, help_text="Hash of the coordinates and physical address geocoded")
+    address = models.ForeignKey(
+        RIRAddress,
+        on_delete=models.CASCADE,
+        related_name="+",
+        null=True,
+        blank=True,
+        help_text="The existing address the site resolved to",
+    )
+    created = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["site"]
+        verbose_name = "RIR site address skip"
+        verbose_name_plural = "RIR site address skips"
+
+    def __str__(self):
+        return f"{self.site}: {self.get_reason_display()}"
@@ -29,6 +29,9 @@ class RIRUserKey(NetBoxModel):
         constraints = [
             models.UniqueConstraint(fields=["user", "rir_config"], name="unique_user_rir_config"),
         ]
+        # filter(rir_config=...) lookups; the unique constraint leads with user. The "user" ordering
+        # sorts by username through a join, so the index serves the filter, not the ordering
+        indexes = [models.Index(fields=["rir_config", "user"], name="rir_userkey_config_idx")]
 
     def __str__(self):
         return f"{self.user.username} - {self.rir_config.name}"
@@ -0,0 +1,28 @@
+from django.db import models
+
+
+class RIRGeocodeCacheEntry(models.Model):
+    """Geocoding provider answer cached by normalised query (see services.geocoding.CachedGeocoder).
+
+    ``key`` is a hash of provider, lookup and normalised query; ``results``
+    holds the structured candidates.  Entries expire after
+    ``geocode_cache_ttl_hours`` and the least recently used are evicted beyond
+    ``geocode_cache_max_entries``.
+    """
+
+    key = models.CharField(max_length=64, unique=True)
+    provider = models.CharField(max_length=50)
+    lookup = models.CharField(max_length=30)
+    query = models.CharField(max_length=500)
+    results = models.JSONField(default=list)
+    hits = models.PositiveIntegerField(default=0)
+    created = models.DateTimeField()
+    last_used = models.DateTimeField(db_index=True)
+
+    class Meta:
+        ordering = ["-last_used"]
+        verbose_name = "RIR geocode cache entry"
+        verbose_name_plural = "RIR geocode cache entries"
+
+    def __str__(self):
+        return f"{self.provider} {self.lookup}: {self.query}"
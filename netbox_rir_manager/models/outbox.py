@@ -0,0 +1,72 @@
+from django.db import models
+from django.urls import reverse
+from netbox.models import NetBoxModel
+
+from netbox_rir_manager.choices import WriteOperationChoices, WriteOperationStatusChoices
+
+
+class RIRWriteOperation(NetBoxModel):
+    """ARIN write operation queued by a view or API call (transactional outbox).
+
+    The row is written in the request's transaction and the request returns at
+    once; DispatchWriteOperationsJob submits it to the RIR and records the
+    outcome here, so clients follow ``status`` and ``ticket``.
+
+    Reassignments and reallocations carry an ``idempotency_key`` for their
+    parent NET and range, so a duplicate request finds this row instead of
+    writing to the RIR a second time.
+    """
+
+    rir_config = models.ForeignKey(
+        "netbox_rir_manager.RIRConfig",
+        on_delete=models.CASCADE,
+        related_name="write_operations",
+        verbose_name="RIR config",
+    )
+    network = models.ForeignKey(
+        "netbox_rir_manager.RIRNetwork",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="write_operations",
+    )
+    # Kept so the operation stays meaningful if the local network is deleted
+    network_handle = models.CharField(max_length=100)
+    operation = models.CharField(max_length=20, choices=WriteOperationChoices)
+    # Released (set to NULL) once a completed operation is older than write_idempotency_hours
+    idempotency_key = models.CharField(max_length=64, unique=True, null=True, blank=True, editable=False)
+    status = models.CharField(
+        max_length=20, choices=WriteOperationStatusChoices, default=WriteOperationStatusChoices.STATUS_PENDING
+    )
+    user_key = models.ForeignKey(
+        "netbox_rir_manager.RIRUserKey",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="write_operations",
+    )
+    payload = models.JSONField(default=dict, blank=True, help_text="Request data sent to the RIR")
+    result = models.JSONField(default=dict, blank=True, help_text="RIR responses recorded so far")
+    message = models.TextField(blank=True, default="")
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt = models.DateTimeField(null=True, blank=True)
+    completed = models.DateTimeField(null=True, blank=True)
+    ticket = models.ForeignKey(
+        "netbox_rir_manager.RIRTicket",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="write_operations",
+    )
+
+    class Meta:
+        ordering = ["-created"]
+        indexes = [models.Index(fields=["status", "next_attempt"], name="rir_writeop_status_idx")]
+        verbose_name = "RIR write operation"
+        verbose_name_plural = "RIR write operations"
+
+    def __str__(self):
+        return f"{self.get_operation_display()} {self.network_handle} ({self.status})"
+
+    def get_absolute_url(self):
+        return reverse("plugins:netbox_rir_manager:rirwriteoperation", args=[self.pk])
@@ -0,0 +1,40 @@
+from django.db import models
+
+
+class RIRPendingReassign(models.Model):
+    """Prefix queued for automatic reassignment, drained in batches by ProcessPendingReassignsJob.
+
+    One row per prefix: repeated saves of the same prefix before the batch
+    runs coalesce into a single entry.
+    """
+
+    prefix = models.OneToOneField(
+        "ipam.Prefix",
+        on_delete=models.CASCADE,
+        related_name="rir_pending_reassign",
+    )
+    rir_config = models.ForeignKey(
+        "netbox_rir_manager.RIRConfig",
+        on_delete=models.CASCADE,
+        related_name="pending_reassigns",
+        verbose_name="RIR config",
+    )
+    parent_network = models.ForeignKey(
+        "netbox_rir_manager.RIRNetwork",
+        on_delete=models.CASCADE,
+        related_name="pending_reassigns",
+    )
+    user_key = models.ForeignKey(
+        "netbox_rir_manager.RIRUserKey",
+        on_delete=models.CASCADE,
+        related_name="pending_reassigns",
+    )
+    created = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["created"]
+        verbose_name = "RIR pending reassignment"
+        verbose_name_plural = "RIR pending reassignments"
+
+    def __str__(self):
+        return f"{self.prefix} via {self.parent_network}"
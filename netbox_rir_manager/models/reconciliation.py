@@ -0,0 +1,48 @@
+from django.db import models
+from django.urls import reverse
+from netbox.models import NetBoxModel
+
+from netbox_rir_manager.choices import DriftClassChoices
+
+
+class RIRReconciliationReport(NetBoxModel):
+    """Snapshot of drift between NetBox IPAM and the synced RIR records of a config."""
+
+    rir_config = models.ForeignKey(
+        "netbox_rir_manager.RIRConfig",
+        on_delete=models.CASCADE,
+        related_name="reconciliation_reports",
+        verbose_name="RIR config",
+    )
+    total_drift = models.PositiveIntegerField(default=0)
+    summary = models.JSONField(default=dict, blank=True)
+    drift = models.JSONField(default=dict, blank=True, help_text="Drift entries keyed by drift class")
+
+    class Meta:
+        ordering = ["-created"]
+        verbose_name = "RIR reconciliation report"
+        verbose_name_plural = "RIR reconciliation reports"
+
+    def __str__(self):
+        if self.created:
+            return f"{self.rir_config.name} reconciliation ({self.created:%Y-%m-%d %H:%M})"
+        return f"{self.rir_config.name} reconciliation"
+
+    def get_absolute_url(self):
+        return reverse("plugins:netbox_rir_manager:rirreconciliationreport", args=[self.pk])
+
+    def get_drift_sections(self, limit: int | None = None) -> list[dict]:
+        """Return drift entries grouped per class, in display order, for templates."""
+        sections = []
+        for value, label, color in DriftClassChoices.CHOICES:
+            entries = (self.drift or {}).get(value, [])
+            sections.append(
+                {
+                    "drift_class": value,
+                    "label": label,
+                    "color": color,
+                    "count": len(entries),
+                    "entries": entries[:limit] if limit else entries,
+                }
+            )
+        return sections
@@ -1,8 +1,60 @@
+import ipaddress
+
 from django.db import models
 from django.urls import reverse
 from django.utils import timezone
 from ipam.models import Aggregate, Prefix
 from netbox.models import NetBoxModel
+from utilities.querysets import RestrictedQuerySet
+
+
+def parse_net_block(block: dict) -> dict | None:
+    """Parse an ARIN ``net_blocks`` entry into numeric range fields, or None if malformed.
+
+    Blocks carry a start address plus either a CIDR length or an end address.
+    """
+    start = block.get("start_address")
+    if not start:
+        return None
+    cidr_length = block.get("cidr_length")
+    try:
+        start_ip = ipaddress.ip_address(start)
+        if cidr_length is not None:
+            cidr_length = int(cidr_length)
+            end_ip = ipaddress.ip_network(f"{start}/{cidr_length}", strict=False).broadcast_address
+        elif block.get("end_address"):
+            end_ip = ipaddress.ip_address(block["end_address"])
+        else:
+            return None
+    except (TypeError, ValueError):
+        return None
+    if end_ip.version != start_ip.version or int(end_ip) < int(start_ip):
+        return None
+    return {
+        "family": start_ip.version,
+        "start_address": int(start_ip),
+        "end_address": int(end_ip),
+        "cidr_length": cidr_length,
+        "block_type": block.get("type") or "",
+    }
+
+
+def address_range(value) -> tuple[int, int, int]:
+    """Return ``(family, first, last)`` for an address or prefix (str, netaddr or ipaddress).
+
+    Raises ValueError for unparseable input.
+    """
+    if hasattr(value, "first") and hasattr(value, "last"):
+        # netaddr.IPNetwork
+        return value.version, value.first, value.last
+    if isinstance(value, (ipaddress.IPv4Network, ipaddress.IPv6Network)):
+        return value.version, int(value.network_address), int(value.broadcast_address)
+    value = str(value).strip()
+    if "/" in value:
+        network = ipaddress.ip_network(value, strict=False)
+        return network.version, int(network.network_address), int(network.broadcast_address)
+    address = ipaddress.ip_address(value)
+    return address.version, int(address), int(address)
 
 
 class RIROrganization(NetBoxModel):
@@ -114,6 +166,26 @@ class RIRContact(NetBoxModel):
         return reverse("plugins:netbox_rir_manager:rircontact", args=[self.pk])
 
 
+class RIRNetworkQuerySet(RestrictedQuerySet):
+    def covering(self, value):
+        """Networks with a net block containing the given address or prefix."""
+        family, first, last = address_range(value)
+        return self.filter(
+            pk__in=RIRNetBlock.objects.filter(family=family, start_address__lte=first, end_address__gte=last).values(
+                "network_id"
+            )
+        )
+
+    def overlapping(self, value):
+        """Networks with a net block overlapping the given address or prefix."""
+        family, first, last = address_range(value)
+        return self.filter(
+            pk__in=RIRNetBlock.objects.filter(family=family, start_address__lte=last, end_address__gte=first).values(
+                "network_id"
+            )
+        )
+
+
 class RIRNetwork(NetBoxModel):
     """Network allocation record from RIR, linked to NetBox Aggregates/Prefixes."""
 
@@ -162,10 +234,22 @@ class RIRNetwork(NetBoxModel):
         editable=False,
     )
 
+    objects = RIRNetworkQuerySet.as_manager()
+
     class Meta:
         ordering = ["handle"]
         verbose_name = "RIR network"
         verbose_name_plural = "RIR networks"
+        indexes = [
+            # Auto-reassign parents of an aggregate (jobs, reassign index)
+            models.Index(
+                fields=["aggregate"], condition=models.Q(auto_reassign=True), name="rir_network_auto_reassign_idx"
+            ),
+            # Reassigned networks of a prefix (prefix signals)
+            models.Index(
+                fields=["prefix"], condition=models.Q(aggregate__isnull=True), name="rir_network_reassigned_idx"
+            ),
+        ]
 
     def __str__(self):
         return self.handle
@@ -203,6 +287,30 @@ class RIRNetwork(NetBoxModel):
             defaults=defaults,
         )
 
+    def sync_net_blocks(self) -> bool:
+        """Rebuild the indexed RIRNetBlock rows from ``raw_data["net_blocks"]``.
+
+        Rows already matching the parsed blocks are left alone; returns True
+        if they were rewritten.
+        """
+        parsed_blocks = [
+            parsed
+            for parsed in map(parse_net_block, (self.raw_data or {}).get("net_blocks") or [])
+            if parsed is not None
+        ]
+        fields = ("family", "start_address", "end_address", "cidr_length", "block_type")
+
+        def order(block):
+            # cidr_length may be None
+            return tuple(-1 if value is None else value for value in block)
+
+        wanted = sorted((tuple(parsed[field] for field in fields) for parsed in parsed_blocks), key=order)
+        if wanted == sorted(self.net_blocks.values_list(*fields), key=order):
+            return False
+        self.net_blocks.all().delete()
+        RIRNetBlock.objects.bulk_create([RIRNetBlock(network=self, **parsed) for parsed in parsed_blocks])
+        return True
+
     @classmethod
     def find_for_prefix(cls, prefix):
         """Find the parent RIRNetwork for a prefix via its containing Aggregate."""
@@ -231,3 +339,54 @@ class RIRNetwork(NetBoxModel):
             user_key_id=user_key.pk,
         )
         return True
+
+
+class RIRNetBlock(models.Model):
+    """Address range of an RIRNetwork, denormalized from raw_data for indexed range lookups.
+
+    Addresses are stored as integers (wide enough for IPv6) so containment and
+    overlap become plain range comparisons on the composite index.
+    """
+
+    network = models.ForeignKey(
+        RIRNetwork,
+        on_delete=models.CASCADE,
+        related_name="net_blocks",
+    )
+    family = models.PositiveSmallIntegerField()
+    start_address = models.DecimalField(max_digits=39, decimal_places=0)
+    end_address = models.DecimalField(max_digits=39, decimal_places=0)
+    cidr_length = models.PositiveSmallIntegerField(null=True, blank=True)
+    block_type = models.CharField(max_length=10, blank=True, default="")
+
+    class Meta:
+        ordering = ["family", "start_address"]
+        indexes = [
+            models.Index(fields=["family", "start_address", "end_address"], name="netbox_rir_netblock_range"),
+        ]
+        verbose_name = "RIR net block"
+        verbose_name_plural = "RIR net blocks"
+
+    def __str__(self):
+        if self.prefix:
+            return self.prefix
+        return f"{self.start_ip}-{self.end_ip}"
+
+    def _to_ip(self, value):
+        address_class = ipaddress.IPv4Address if self.family == 4 else ipaddress.IPv6Address
+        return address_class(int(value))
+
+    @property
+    def start_ip(self):
+        return self._to_ip(self.start_address)
+
+    @property
+    def end_ip(self):
+        return self._to_ip(self.end_address)
+
+    @property
+    def prefix(self):
+        if self.cidr_length is None:
+            return None
+        # ARIN start addresses need not be aligned to the length
+        return str(ipaddress.ip_network(f"{self.start_ip}/{self.cidr_length}", strict=False))
@@ -24,6 +24,11 @@ class RIRSyncLog(NetBoxModel):
         ordering = ["-created"]
         verbose_name = "RIR sync log"
         verbose_name_plural = "RIR sync logs"
+        indexes = [
+            models.Index(fields=["-created"], name="rir_synclog_created_idx"),
+            models.Index(fields=["rir_config", "-created"], name="rir_synclog_config_idx"),
+            models.Index(fields=["status", "-created"], name="rir_synclog_status_idx"),
+        ]
 
     def __str__(self):
         return f"{self.operation} {self.object_handle} ({self.status})"
@@ -109,6 +109,16 @@ menu = PluginMenu(
                     link_text="Tickets",
                     permissions=["netbox_rir_manager.view_rirticket"],
                 ),
+                PluginMenuItem(
+                    link="plugins:netbox_rir_manager:rirwriteoperation_list",
+                    link_text="Write Operations",
+                    permissions=["netbox_rir_manager.view_rirwriteoperation"],
+                ),
+                PluginMenuItem(
+                    link="plugins:netbox_rir_manager:rirreconciliationreport_list",
+                    link_text="Reconciliation",
+                    permissions=["netbox_rir_manager.view_rirreconciliationreport"],
+                ),
             ),
         ),
     ),
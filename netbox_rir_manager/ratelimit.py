@@ -0,0 +1,67 @@
+"""Rate limiting of RIR API calls shared by every worker process.
+
+Each second is a slot with a counter in the Django cache (Redis in NetBox),
+so all RQ workers and web processes calling the same RIR draw from one budget.
+A caller that finds the current slot full sleeps until the next one.  Rates
+below one call per second use longer slots holding a single call.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import time
+
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY_PREFIX = "netbox_rir_manager:ratelimit"
+
+
+class RateLimiter:
+    """Fixed-window limiter allowing ``rate`` calls per second for ``name``.
+
+    A ``rate`` of 0 (or less) disables limiting.  Below 1, each window lasts
+    ``ceil(1 / rate)`` seconds and allows one call.
+    """
+
+    def __init__(self, name: str, rate: float):
+        self.name = name
+        self.rate = rate
+        # Seconds per slot, and calls allowed in each
+        self.window = 1 if rate >= 1 or rate <= 0 else math.ceil(1 / rate)
+        self.calls_per_window = max(1, int(rate * self.window))
+
+    @classmethod
+    def for_backend(cls, name: str) -> RateLimiter:
+        """Return the limiter for a backend, configured by the ``api_rate_limit`` setting."""
+        from django.conf import settings
+
+        plugin_config = settings.PLUGINS_CONFIG.get("netbox_rir_manager", {})
+        return cls(name, plugin_config.get("api_rate_limit", 0))
+
+    def acquire(self) -> float:
+        """Block until a call is allowed; return the seconds spent waiting."""
+        if self.rate <= 0:
+            return 0.0
+
+        waited = 0.0
+        while True:
+            now = time.time()
+            slot = int(now // self.window)
+            key = f"{CACHE_KEY_PREFIX}:{self.name}:{self.window}:{slot}"
+            # add() is a no-op if another process created the slot first
+            cache.add(key, 0, timeout=self.window + 1)
+            try:
+                count = cache.incr(key)
+            except ValueError:
+                # Slot expired between add() and incr(); start over in the next one
+                count = self.calls_per_window + 1
+            if count <= self.calls_per_window:
+                if waited:
+                    logger.debug(f"Rate limit for {self.name}: waited {waited:.2f}s")
+                return waited
+            delay = (slot + 1) * self.window - now
+            time.sleep(delay)
+            waited += delay
@@ -0,0 +1,131 @@
+"""Concurrent geocoding-candidate searches for the site address modal.
+
+``start_candidate_search`` starts every applicable lookup for a site at once
+(the typed query, reverse geocoding of the coordinates, forward geocoding of
+the physical address) on a small thread pool and returns a search id straight
+away.  Each lookup stores its answer under its own key in the Django cache,
+so the modal's polling requests, served by any web worker, see candidates as
+each source answers.  ``get_candidate_search`` merges the finished sources in
+priority order and deduplicates them with ``_deduplicate_results``.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from typing import TYPE_CHECKING
+
+from django.core.cache import cache
+from django.db import connection
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from dcim.models import Site
+
+    from netbox_rir_manager.services.geocoding import GeocodingResult
+
+logger = logging.getLogger(__name__)
+
+CANDIDATE_SEARCH_KEY = "netbox_rir_manager:candidate_search"
+# Long enough for a slow provider; the modal stops polling once every source answered
+CANDIDATE_SEARCH_TIMEOUT = 300
+MAX_WORKERS = 4
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="rir-geocode-candidates")
+    return _executor
+
+
+def candidate_sources(site: Site, query: str | None = None) -> list[tuple[str, str, tuple]]:
+    """The lookups to run for ``site``, in the order their candidates are listed: ``(label, method, args)``."""
+    sources = []
+    if query:
+        sources.append(("Search", "geocode_many", (query,)))
+    if site.latitude and site.longitude:
+        sources.append(("Coordinates", "reverse_geocode_many", (float(site.latitude), float(site.longitude))))
+    if site.physical_address and site.physical_address != query:
+        sources.append(("Physical address", "geocode_many", (site.physical_address,)))
+    return sources
+
+
+def start_candidate_search(site: Site, query: str | None = None, limit: int = 5) -> str:
+    """Start the candidate lookups for ``site`` in the background and return the search id."""
+    from netbox_rir_manager.services.geocoding import _get_geocoding_service
+
+    search_id = uuid.uuid4().hex
+    sources = candidate_sources(site, query)
+    cache.set(
+        f"{CANDIDATE_SEARCH_KEY}:{search_id}",
+        {"site_id": site.pk, "sources": [label for label, _method, _args in sources]},
+        CANDIDATE_SEARCH_TIMEOUT,
+    )
+    geocoder = _get_geocoding_service()
+    for index, (label, method, args) in enumerate(sources):
+        _get_executor().submit(_run_source, search_id, index, label, getattr(geocoder, method), args, limit)
+    return search_id
+
+
+def _run_source(
+    search_id: str, index: int, label: str, lookup: Callable[..., list[GeocodingResult]], args: tuple, limit: int
+) -> None:
+    try:
+        results = lookup(*args, limit=limit)
+        error = ""
+    except Exception as exc:
+        logger.exception("Geocoding candidate lookup %r failed", label)
+        results, error = [], str(exc)
+    finally:
+        # The geocode cache opens a connection in this pool thread; don't leave it behind
+        connection.close()
+    cache.set(
+        f"{CANDIDATE_SEARCH_KEY}:{search_id}:{index}",
+        {"results": [asdict(result) for result in results], "error": error},
+        CANDIDATE_SEARCH_TIMEOUT,
+    )
+
+
+def get_candidate_search(search_id: str, site: Site) -> dict | None:
+    """
+    The state of a candidate search: None if unknown, expired or started for another site.
+
+    Returns ``{"sources": [{"label", "done", "count", "error"}], "candidates": [...], "done": bool}``
+    with the deduplicated candidates of the sources that have answered so far.
+    """
+    from netbox_rir_manager.services.geocoding import GeocodingResult, _deduplicate_results
+
+    search = cache.get(f"{CANDIDATE_SEARCH_KEY}:{search_id}")
+    if search is None or search["site_id"] != site.pk:
+        return None
+    keys = [f"{CANDIDATE_SEARCH_KEY}:{search_id}:{index}" for index in range(len(search["sources"]))]
+    answers = cache.get_many(keys)
+
+    sources = []
+    results = []
+    for label, key in zip(search["sources"], keys, strict=True):
+        answer = answers.get(key)
+        if answer is not None:
+            results.extend(GeocodingResult(**result) for result in answer["results"])
+        sources.append(
+            {
+                "label": label,
+                "done": answer is not None,
+                "count": len(answer["results"]) if answer else 0,
+                "error": answer["error"] if answer else "",
+            }
+        )
+    return {
+        "sources": sources,
+        "candidates": _deduplicate_results(results),
+        "done": all(source["done"] for source in sources),
+    }
@@ -0,0 +1,108 @@
+"""Merging of RIRAddress rows that are spelling variants of one address (merge_addresses command).
+
+Every address is fingerprinted in memory (``netbox_rir_manager.fingerprint``)
+and grouped by fingerprint.  In each group with more than one row the address
+linked to a site survives (else the oldest); organizations, contacts and
+customers pointing at the others are repointed with ``bulk_update`` and the
+others are deleted in batches.  Stored fingerprints that no longer match the
+normaliser are refreshed.  Migration 0024 runs a frozen copy of this merge.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+
+from django.db import transaction
+
+from netbox_rir_manager.fingerprint import ADDRESS_FIELDS, address_fingerprint
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 1000
+
+# Models with an ``address`` foreign key to RIRAddress
+ADDRESS_REFERENCES = ("RIROrganization", "RIRContact", "RIRCustomer")
+
+
+def merge_duplicate_addresses(
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    dry_run: bool = False,
+    log: logging.Logger = logger,
+) -> dict:
+    """
+    Collapse RIRAddress rows sharing a fingerprint into one and repoint their references.
+
+    With ``dry_run`` nothing is written.
+
+    Returns a summary with the number of addresses, duplicate groups, merged
+    (deleted) rows, repointed references and refreshed fingerprints, and the
+    pks of merged addresses that were linked to a site or location other than
+    the survivor's (those links are dropped with them).
+    """
+    from django.apps import apps
+
+    address_model = apps.get_model("netbox_rir_manager", "RIRAddress")
+
+    groups: dict[str, list[dict]] = defaultdict(list)
+    rows = address_model.objects.order_by("pk").values("pk", "fingerprint", "site_id", "location_id", *ADDRESS_FIELDS)
+    for row in rows.iterator(chunk_size=batch_size):
+        row["new_fingerprint"] = address_fingerprint(**{field: row[field] for field in ADDRESS_FIELDS})
+        groups[row["new_fingerprint"]].append(row)
+
+    survivors: dict[int, int] = {}  # merged pk -> surviving pk
+    refresh = []
+    detached = []
+    for members in groups.values():
+        # Keep a site-level address if the group has one, then any site-linked one, then the oldest
+        members.sort(key=lambda row: (row["site_id"] is None, row["location_id"] is not None, row["pk"]))
+        keeper, *merged = members
+        if keeper["fingerprint"] != keeper["new_fingerprint"]:
+            refresh.append(address_model(pk=keeper["pk"], fingerprint=keeper["new_fingerprint"]))
+        for row in merged:
+            survivors[row["pk"]] = keeper["pk"]
+            if (row["site_id"], row["location_id"]) not in ((None, None), (keeper["site_id"], keeper["location_id"])):
+                detached.append(row["pk"])
+                log.warning(
+                    f"Address {row['pk']} (site {row['site_id']}, location {row['location_id']}) merges into "
+                    f"{keeper['pk']}; its site/location link is dropped"
+                )
+
+    summary = {
+        "addresses": sum(len(members) for members in groups.values()),
+        "groups": sum(1 for members in groups.values() if len(members) > 1),
+        "merged": len(survivors),
+        "repointed": 0,
+        "fingerprints_updated": len(refresh),
+        "detached": detached,
+    }
+    log.info(
+        f"{summary['addresses']} addresses: {summary['groups']} duplicate groups, "
+        f"{summary['merged']} to merge, {summary['fingerprints_updated']} fingerprints to refresh"
+    )
+    if dry_run:
+        return summary
+
+    merged_pks = list(survivors)
+    with transaction.atomic():
+        for model_name in ADDRESS_REFERENCES:
+            model = apps.get_model("netbox_rir_manager", model_name)
+            for start in range(0, len(merged_pks), batch_size):
+                objects = list(
+                    model.objects.filter(address_id__in=merged_pks[start : start + batch_size]).only("pk", "address")
+                )
+                for obj in objects:
+                    obj.address_id = survivors[obj.address_id]
+                model.objects.bulk_update(objects, ["address"], batch_size=batch_size)
+                summary["repointed"] += len(objects)
+        for start in range(0, len(merged_pks), batch_size):
+            address_model.objects.filter(pk__in=merged_pks[start : start + batch_size]).delete()
+        # After the deletes, so a refreshed fingerprint never collides with a merged row's stale one
+        address_model.objects.bulk_update(refresh, ["fingerprint"], batch_size=batch_size)
+    from netbox_rir_manager.services.panels import invalidate_panels
+
+    # Site panels may show a merged address; bulk writes bypass the signal that invalidates them
+    invalidate_panels()
+
+    log.info(f"Merged {summary['merged']} addresses and repointed {summary['repointed']} references")
+    return summary
@@ -0,0 +1,194 @@
+"""Reassignment of many prefixes at once (BulkReassignJob, bulk UI action and REST endpoint).
+
+All prefixes are validated before any RIR call: each needs a tenant, no
+existing RIRNetwork, an ``auto_reassign`` parent NET (looked up in the
+in-process reassign index) and an API key of the requesting user for the
+parent's config.  Site addresses are then resolved once per site, and the
+submissions run in a bounded thread pool while the results are written to the
+database from the calling thread.  Each prefix's write operation is claimed
+before submitting, so a prefix already reassigned (or in progress elsewhere)
+is skipped.
+"""
+
+from __future__ import annotations
+
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from django.db import connection
+
+from netbox_rir_manager.services.reassign import (
+    ReassignmentOutcome,
+    claim_reassignment,
+    plan_reassignment,
+    prefix_site,
+    record_reassignment,
+    submit_reassignment,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from ipam.models import Prefix
+
+    from netbox_rir_manager.backends.base import RIRBackend
+    from netbox_rir_manager.models import RIRNetwork, RIRUserKey
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONCURRENCY = 4
+
+
+@dataclass
+class BulkReassignCandidate:
+    prefix: Prefix
+    parent_network: RIRNetwork | None = None
+    user_key: RIRUserKey | None = None
+    error: str = ""
+
+    @property
+    def is_valid(self) -> bool:
+        return not self.error
+
+
+def validate_bulk_reassign(prefixes: Iterable[Prefix], user) -> list[BulkReassignCandidate]:
+    """Check which prefixes ``user`` can reassign, in a fixed number of queries."""
+    from netbox_rir_manager.models import RIRNetwork, RIRUserKey
+    from netbox_rir_manager.services.reassign_index import get_reassign_index
+
+    index = get_reassign_index()
+    candidates = [BulkReassignCandidate(prefix=prefix) for prefix in prefixes]
+    prefix_ids = [candidate.prefix.pk for candidate in candidates]
+    linked = set(RIRNetwork.objects.filter(prefix_id__in=prefix_ids).values_list("prefix_id", flat=True))
+
+    parent_ids = {}
+    for candidate in candidates:
+        prefix = candidate.prefix
+        if prefix.pk in linked:
+            candidate.error = "Prefix already has an RIR network"
+        elif not prefix.tenant_id:
+            candidate.error = "Prefix has no tenant"
+        else:
+            parent = index.find_parent(prefix.prefix)
+            if parent is None:
+                candidate.error = "No parent RIRNetwork with auto_reassign=True"
+            else:
+                parent_ids[prefix.pk] = parent.network_id
+
+    # Confirm the index's answers and fetch the parents in one query
+    parents = RIRNetwork.objects.filter(pk__in=set(parent_ids.values()), auto_reassign=True).select_related(
+        "rir_config"
+    )
+    parents = {network.pk: network for network in parents}
+    user_keys = {}
+    for user_key in RIRUserKey.objects.filter(
+        user=user, rir_config_id__in={network.rir_config_id for network in parents.values()}
+    ).select_related("user"):
+        user_keys.setdefault(user_key.rir_config_id, user_key)
+
+    for candidate in candidates:
+        if candidate.error:
+            continue
+        parent_network = parents.get(parent_ids[candidate.prefix.pk])
+        if parent_network is None:
+            candidate.error = "No parent RIRNetwork with auto_reassign=True"
+            continue
+        candidate.parent_network = parent_network
+        candidate.user_key = user_keys.get(parent_network.rir_config_id)
+        if candidate.user_key is None:
+            candidate.error = f"No API key configured for RIR config {parent_network.rir_config.name}"
+    return candidates
+
+
+def bulk_reassign(
+    candidates: list[BulkReassignCandidate],
+    backend_factory: Callable[[RIRUserKey, RIRNetwork], RIRBackend],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    log: logging.Logger = logger,
+) -> list[dict]:
+    """
+    Reassign every valid candidate and return one result dict per candidate.
+
+    ``backend_factory`` builds the backend for an API key; one backend is made
+    per key and every parent NET is fetched once on it before submitting.
+    Invalid candidates are reported as ``invalid`` without any RIR call.
+    """
+    from netbox_rir_manager.models import RIROrganization
+    from netbox_rir_manager.services.geocoding import resolve_site_address
+
+    results = []
+    valid = []
+    for candidate in candidates:
+        if candidate.is_valid:
+            valid.append(candidate)
+        else:
+            results.append(_result(candidate, {"status": "invalid", "message": candidate.error}))
+
+    # Site addresses, once per site, only where a customer must be created
+    detailed_tenants = set(
+        RIROrganization.objects.filter(tenant_id__in={c.prefix.tenant_id for c in valid}).values_list(
+            "tenant_id", flat=True
+        )
+    )
+    addresses = {}
+    for candidate in valid:
+        site = prefix_site(candidate.prefix)
+        if candidate.prefix.tenant_id not in detailed_tenants and site is not None and site.pk not in addresses:
+            addresses[site.pk] = resolve_site_address(site)
+    log.info(f"Resolved {sum(1 for a in addresses.values() if a)} of {len(addresses)} site addresses")
+
+    plans = []
+    for candidate in valid:
+        site = prefix_site(candidate.prefix)
+        plan = plan_reassignment(
+            candidate.prefix,
+            candidate.parent_network,
+            site_address=addresses.get(site.pk) if site else None,
+            resolve_address=False,
+        )
+        skipped = claim_reassignment(plan, candidate.user_key)
+        if skipped is not None:
+            results.append(_result(candidate, skipped))
+        else:
+            plans.append((candidate, plan))
+
+    backends = {}
+    parent_handles: dict[int, set[str]] = {}
+    for candidate, _plan in plans:
+        if candidate.user_key.pk not in backends:
+            backends[candidate.user_key.pk] = backend_factory(candidate.user_key, candidate.parent_network)
+        parent_handles.setdefault(candidate.user_key.pk, set()).add(candidate.parent_network.handle)
+    # Fetch each parent NET once up front rather than racing for it from several threads
+    for key_id, handles in parent_handles.items():
+        backends[key_id].prefetch_parent_nets(sorted(handles))
+
+    log.info(f"Submitting {len(plans)} reassignments with concurrency {concurrency}")
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        futures = {
+            executor.submit(_submit, plan, backends[candidate.user_key.pk], log): (candidate, plan)
+            for candidate, plan in plans
+        }
+        # Results are recorded here, on the calling thread, as submissions complete
+        for future in as_completed(futures):
+            candidate, plan = futures[future]
+            try:
+                outcome = future.result()
+            except Exception as exc:
+                log.error(f"Reassignment of {candidate.prefix.prefix} raised: {exc}")
+                outcome = ReassignmentOutcome(failed="reassign")
+            results.append(_result(candidate, record_reassignment(plan, outcome, candidate.user_key, log=log)))
+    return results
+
+
+def _submit(plan, backend: RIRBackend, log: logging.Logger) -> ReassignmentOutcome:
+    try:
+        return submit_reassignment(plan, backend, log)
+    finally:
+        # Checkpoints open a connection in this pool thread; don't leave it behind
+        connection.close()
+
+
+def _result(candidate: BulkReassignCandidate, result: dict) -> dict:
+    return {"prefix_id": candidate.prefix.pk, "prefix": str(candidate.prefix.prefix), **result}
@@ -1,19 +1,50 @@
 from __future__ import annotations
 
+import hashlib
 import logging
+import re
+import threading
+import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass
+from datetime import timedelta
 from typing import TYPE_CHECKING
 
+from django.core.cache import cache
+from django.db.models import F
 from django.utils import timezone
 
+from netbox_rir_manager.ratelimit import RateLimiter
+
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from dcim.models import Site
 
     from netbox_rir_manager.models import RIRAddress
 
 logger = logging.getLogger(__name__)
 
+GEOCODE_CACHE_STATS_KEY = "netbox_rir_manager:geocode_cache"
+GEOCODE_CACHE_EVICT_KEY = "netbox_rir_manager:geocode_cache:evicted"
+# Seconds between evictions; the table may exceed geocode_cache_max_entries by the misses in between
+GEOCODE_CACHE_EVICT_INTERVAL = 60
+GEOCODING_LATENCY_KEY = "netbox_rir_manager:geocoding_latency"
+DEFAULT_PROVIDER_TIMEOUT = 10.0
+DEFAULT_HEDGE_DELAY = 1.0
+GEOCODING_PROVIDERS = ("nominatim", "google", "offline")
+
+# One geopy client per user agent, per process; with requests installed (it ships
+# with NetBox) geopy's adapter keeps a pooled HTTP session per client
+_nominatim_clients: dict[str, object] = {}
+_google_clients: dict[str, object] = {}
+_geopy_clients_lock = threading.Lock()
+
+# Shared by all HedgedGeocoders; a call abandoned at its timeout finishes here in the background
+_hedge_executor: ThreadPoolExecutor | None = None
+_hedge_executor_lock = threading.Lock()
+
 
 @dataclass
 class GeocodingResult:
@@ -45,6 +76,9 @@ class GeocodingResult:
 class GeocodingService(ABC):
     """Abstract base class for geocoding providers."""
 
+    # Failed lookups are logged and answer nothing, unless a HedgedGeocoder wants them raised
+    raise_errors = False
+
     @abstractmethod
     def geocode(self, address: str) -> GeocodingResult | None:
         """Forward geocode an address string to structured components."""
@@ -63,59 +97,83 @@ class GeocodingService(ABC):
 
 
 class NominatimGeocoder(GeocodingService):
-    """Geocoding via OpenStreetMap Nominatim (using geopy)."""
+    """Geocoding via OpenStreetMap Nominatim (using geopy).
+
+    Requests go through a long-lived client per process and a RateLimiter
+    shared by all workers (``geocoding_rate_limit``, 1 per second by Nominatim's
+    usage policy); callers over the limit wait for their turn.
+    """
 
-    def __init__(self, user_agent: str = "netbox-rir-manager"):
+    def __init__(self, user_agent: str = "netbox-rir-manager", rate_limit: float = 1, timeout: float | None = None):
         self._user_agent = user_agent
+        self._limiter = RateLimiter("geocoding:nominatim", rate_limit)
+        self._timeout = timeout
 
     def _get_geocoder(self):
-        from geopy.geocoders import Nominatim
+        with _geopy_clients_lock:
+            geocoder = _nominatim_clients.get(self._user_agent)
+            if geocoder is None:
+                from geopy.geocoders import Nominatim
 
-        return Nominatim(user_agent=self._user_agent)
+                geocoder = _nominatim_clients[self._user_agent] = Nominatim(user_agent=self._user_agent)
+        return geocoder
+
+    def _request(self, method: str, *args, **kwargs):
+        """Call ``method`` on the geopy client once the rate limiter allows it."""
+        self._limiter.acquire()
+        if self._timeout is not None:
+            kwargs["timeout"] = self._timeout
+        return getattr(self._get_geocoder(), method)(*args, **kwargs)
 
     def geocode(self, address: str) -> GeocodingResult | None:
         try:
-            geocoder = self._get_geocoder()
-            location = geocoder.geocode(address, addressdetails=True, language="en")
+            location = self._request("geocode", address, addressdetails=True, language="en")
             if location is None:
                 return None
             return self._parse_location(location)
         except Exception:
+            if self.raise_errors:
+                raise
             logger.exception("Nominatim forward geocode failed for: %s", address)
             return None
 
     def reverse_geocode(self, lat: float, lng: float) -> GeocodingResult | None:
         try:
-            geocoder = self._get_geocoder()
-            location = geocoder.reverse((lat, lng), addressdetails=True, language="en")
+            location = self._request("reverse", (lat, lng), addressdetails=True, language="en")
             if location is None:
                 return None
             return self._parse_location(location)
         except Exception:
+            if self.raise_errors:
+                raise
             logger.exception("Nominatim reverse geocode failed for: %s, %s", lat, lng)
             return None
 
     def geocode_many(self, address: str, limit: int = 5) -> list[GeocodingResult]:
         try:
-            geocoder = self._get_geocoder()
-            locations = geocoder.geocode(address, addressdetails=True, language="en", exactly_one=False, limit=limit)
+            locations = self._request(
+                "geocode", address, addressdetails=True, language="en", exactly_one=False, limit=limit
+            )
             if not locations:
                 return []
             return [self._parse_location(loc) for loc in locations]
         except Exception:
+            if self.raise_errors:
+                raise
             logger.exception("Nominatim forward geocode_many failed for: %s", address)
             return []
 
     def reverse_geocode_many(self, lat: float, lng: float, limit: int = 5) -> list[GeocodingResult]:
         try:
-            geocoder = self._get_geocoder()
             # Nominatim reverse geocode doesn't support multiple results natively,
             # so we get one result and return it as a list
-            location = geocoder.reverse((lat, lng), addressdetails=True, language="en")
+            location = self._request("reverse", (lat, lng), addressdetails=True, language="en")
             if location is None:
                 return []
             return [self._parse_location(location)]
         except Exception:
+            if self.raise_errors:
+                raise
             logger.exception("Nominatim reverse geocode_many failed for: %s, %s", lat, lng)
             return []
 
@@ -125,7 +183,7 @@ class NominatimGeocoder(GeocodingService):
 
         country_code = (addr.get("country_code") or "").upper()
         state = addr.get("state") or addr.get("province") or ""
-        state_code = self._resolve_state_code(country_code, state)
+        state_code = _resolve_state_code(country_code, state)
 
         street_parts = []
         if addr.get("house_number"):
@@ -142,44 +200,454 @@ class NominatimGeocoder(GeocodingService):
             raw=raw,
         )
 
-    @staticmethod
-    def _resolve_state_code(country_code: str, state_name: str) -> str:
-        """Map a state/province name to its ISO-3166-2 subdivision code."""
-        if not state_name or not country_code:
-            return state_name
 
+class GoogleGeocoder(GeocodingService):
+    """Geocoding via the Google Maps Geocoding API (geopy's GoogleV3), with ``google_geocoding_api_key``."""
+
+    def __init__(self, api_key: str, timeout: float | None = None):
+        self._api_key = api_key
+        self._timeout = timeout
+
+    def _get_geocoder(self):
+        with _geopy_clients_lock:
+            geocoder = _google_clients.get(self._api_key)
+            if geocoder is None:
+                from geopy.geocoders import GoogleV3
+
+                geocoder = _google_clients[self._api_key] = GoogleV3(api_key=self._api_key)
+        return geocoder
+
+    def _request(self, method: str, *args, **kwargs):
+        if self._timeout is not None:
+            kwargs["timeout"] = self._timeout
+        return getattr(self._get_geocoder(), method)(*args, **kwargs)
+
+    def geocode(self, address: str) -> GeocodingResult | None:
+        return next(iter(self.geocode_many(address, limit=1)), None)
+
+    def reverse_geocode(self, lat: float, lng: float) -> GeocodingResult | None:
+        return next(iter(self.reverse_geocode_many(lat, lng, limit=1)), None)
+
+    def geocode_many(self, address: str, limit: int = 5) -> list[GeocodingResult]:
         try:
-            import pycountry
+            locations = self._request("geocode", address, exactly_one=False, language="en")
+            return [self._parse_location(location) for location in (locations or [])[:limit]]
+        except Exception:
+            if self.raise_errors:
+                raise
+            logger.exception("Google forward geocode failed for: %s", address)
+            return []
 
-            # Search for subdivision by name within the country
-            subdivisions = pycountry.subdivisions.get(country_code=country_code)
-            if not subdivisions:
-                return state_name
+    def reverse_geocode_many(self, lat: float, lng: float, limit: int = 5) -> list[GeocodingResult]:
+        try:
+            locations = self._request("reverse", (lat, lng), exactly_one=False, language="en")
+            return [self._parse_location(location) for location in (locations or [])[:limit]]
+        except Exception:
+            if self.raise_errors:
+                raise
+            logger.exception("Google reverse geocode failed for: %s, %s", lat, lng)
+            return []
+
+    def _parse_location(self, location) -> GeocodingResult:
+        raw = dict(location.raw or {})
+        components: dict[str, dict] = {}
+        for component in raw.get("address_components", []):
+            for component_type in component.get("types", []):
+                components.setdefault(component_type, component)
+
+        def name(component_type: str, short: bool = False) -> str:
+            return components.get(component_type, {}).get("short_name" if short else "long_name", "")
+
+        country_code = name("country", short=True).upper()
+        state_code = _resolve_state_code(country_code, name("administrative_area_level_1", short=True))
+        # display_name is what the address modal shows, as for Nominatim results
+        raw.setdefault("display_name", raw.get("formatted_address", ""))
+        return GeocodingResult(
+            street_address=" ".join(part for part in (name("street_number"), name("route")) if part),
+            city=name("locality") or name("postal_town") or name("sublocality"),
+            state_province=state_code,
+            postal_code=name("postal_code"),
+            country=country_code,
+            raw=raw,
+        )
+
+
+def _resolve_state_code(country_code: str, state_name: str) -> str:
+    """Map a state/province name to its ISO-3166-2 subdivision code, or return it unchanged."""
+    from netbox_rir_manager.subdivisions import subdivision_code
+
+    try:
+        return subdivision_code(country_code, state_name) or state_name
+    except Exception:
+        logger.debug("Subdivision lookup failed for %s/%s", country_code, state_name)
+        return state_name
 
-            state_lower = state_name.lower()
-            for sub in subdivisions:
-                if sub.name.lower() == state_lower:
-                    # Return just the subdivision part (e.g. "US-NY" -> "NY")
-                    return sub.code.split("-", 1)[-1]
 
-            return state_name
+class OfflineGeocoder(GeocodingService):
+    """Reverse geocoding against a local GeoNames gazetteer (``geocoding_gazetteer``), without network.
+
+    Coordinates resolve to the nearest place's city, subdivision and country
+    and the nearest postcode; the street is left empty.  Free-text addresses
+    cannot be resolved offline, so forward lookups find nothing.
+    """
+
+    def __init__(self, paths: str | list[str]):
+        self._paths = [paths] if isinstance(paths, str) else list(paths)
+
+    def _reverse(self, lat: float, lng: float, limit: int) -> list[GeocodingResult]:
+        from netbox_rir_manager.gazetteer import get_gazetteer
+
+        if not self._paths:
+            logger.error("geocoding_provider is 'offline' but no geocoding_gazetteer files are configured")
+            return []
+        try:
+            matches = get_gazetteer(self._paths).reverse(lat, lng, k=limit)
         except Exception:
-            logger.debug("pycountry lookup failed for %s/%s", country_code, state_name)
-            return state_name
+            if self.raise_errors:
+                raise
+            logger.exception("Offline reverse geocode failed for: %s, %s", lat, lng)
+            return []
+        return [
+            GeocodingResult(
+                street_address="",
+                city=match.place.name,
+                state_province=match.place.subdivision,
+                postal_code=match.postal_code,
+                country=match.place.country,
+                raw={
+                    "display_name": ", ".join(
+                        part for part in (match.place.name, match.place.subdivision, match.place.country) if part
+                    ),
+                    "geonameid": match.place.geonameid,
+                    "distance_km": round(match.distance_km, 3),
+                },
+            )
+            for match in matches
+        ]
+
+    def geocode(self, address: str) -> GeocodingResult | None:
+        return None
+
+    def reverse_geocode(self, lat: float, lng: float) -> GeocodingResult | None:
+        return next(iter(self._reverse(lat, lng, 1)), None)
+
+    def geocode_many(self, address: str, limit: int = 5) -> list[GeocodingResult]:
+        return []
+
+    def reverse_geocode_many(self, lat: float, lng: float, limit: int = 5) -> list[GeocodingResult]:
+        return self._reverse(lat, lng, limit)
+
+
+def _get_hedge_executor() -> ThreadPoolExecutor:
+    global _hedge_executor
+    with _hedge_executor_lock:
+        if _hedge_executor is None:
+            _hedge_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="rir-geocoding")
+    return _hedge_executor
+
+
+class HedgedGeocoder(GeocodingService):
+    """Ordered chain of geocoding providers with hedged requests.
+
+    Each lookup starts on the first provider.  If it has not answered after
+    ``hedge_delay`` seconds the next provider is asked as well, and one that
+    fails, finds nothing or exceeds its own timeout hands over to the next one
+    at once.  The first non-empty answer wins; calls still running are left to
+    finish in the background.  Latency and outcome of every provider call are
+    counted (``geocoding_provider_stats``).
+    """
+
+    def __init__(self, providers: list[tuple[str, GeocodingService, float]], hedge_delay: float = DEFAULT_HEDGE_DELAY):
+        self.providers = providers
+        self.hedge_delay = hedge_delay
+        # Provider failures reach _timed_call, which logs and counts them as errors
+        for _name, provider, _timeout in providers:
+            provider.raise_errors = True
+
+    def geocode(self, address: str) -> GeocodingResult | None:
+        return next(iter(self._first("geocode", address)), None)
+
+    def reverse_geocode(self, lat: float, lng: float) -> GeocodingResult | None:
+        return next(iter(self._first("reverse_geocode", lat, lng)), None)
+
+    def geocode_many(self, address: str, limit: int = 5) -> list[GeocodingResult]:
+        return self._first("geocode_many", address, limit=limit)
+
+    def reverse_geocode_many(self, lat: float, lng: float, limit: int = 5) -> list[GeocodingResult]:
+        return self._first("reverse_geocode_many", lat, lng, limit=limit)
+
+    def _first(self, method: str, *args, **kwargs) -> list[GeocodingResult]:
+        """The first non-empty answer of the chain, as a list (empty if no provider had one)."""
+        executor = _get_hedge_executor()
+        waiting = list(self.providers)
+        running: dict[Future, tuple[str, float]] = {}  # future -> (provider name, deadline)
+        next_hedge = 0.0
+
+        def start_next() -> None:
+            nonlocal next_hedge
+            name, provider, timeout = waiting.pop(0)
+            running[executor.submit(_timed_call, name, getattr(provider, method), args, kwargs)] = (
+                name,
+                time.monotonic() + timeout,
+            )
+            next_hedge = time.monotonic() + self.hedge_delay
+
+        start_next()
+        while running:
+            now = time.monotonic()
+            wake = min(deadline for _name, deadline in running.values())
+            if waiting:
+                wake = min(wake, next_hedge)
+            done, _ = wait(running, timeout=max(0.0, wake - now), return_when=FIRST_COMPLETED)
+            for future in done:
+                name, _deadline = running.pop(future)
+                results = future.result()
+                if results:
+                    if name != self.providers[0][0]:
+                        _incr(f"{GEOCODING_LATENCY_KEY}:{name}:fallback_wins")
+                    return results
+            now = time.monotonic()
+            for future, (name, deadline) in list(running.items()):
+                if now >= deadline:
+                    del running[future]
+                    _incr(f"{GEOCODING_LATENCY_KEY}:{name}:timeouts")
+                    logger.warning("Geocoding provider %s timed out", name)
+            # Hand over when the last call came back empty or timed out, or hedge a slow one
+            if waiting and (done or not running or now >= next_hedge):
+                start_next()
+        return []
+
+
+def _timed_call(name: str, call: Callable, args: tuple, kwargs: dict) -> list[GeocodingResult]:
+    started = time.monotonic()
+    outcome = "errors"
+    try:
+        result = call(*args, **kwargs)
+        results = result if isinstance(result, list) else _as_list(result)
+        outcome = "answers" if results else "empty"
+        return results
+    except Exception:
+        logger.exception("Geocoding provider %s failed", name)
+        return []
+    finally:
+        _incr(f"{GEOCODING_LATENCY_KEY}:{name}:calls")
+        _incr(f"{GEOCODING_LATENCY_KEY}:{name}:{outcome}")
+        _incr(f"{GEOCODING_LATENCY_KEY}:{name}:total_ms", round((time.monotonic() - started) * 1000))
+
+
+def normalize_address(address: str) -> str:
+    """Case-fold and collapse punctuation and whitespace, so trivially different spellings share a cache entry."""
+    return " ".join(re.sub(r"[^\w\s]", " ", address.casefold()).split())
+
+
+def _coordinates(lat: float, lng: float) -> str:
+    # Five decimal places is about one metre
+    return f"{lat:.5f},{lng:.5f}"
+
+
+class CachedGeocoder(GeocodingService):
+    """Read-through cache (RIRGeocodeCacheEntry) in front of another GeocodingService.
+
+    Forward lookups are keyed by the normalised address, reverse lookups by the
+    coordinates rounded to five decimals, both per provider.  Hits are answered
+    from the database without calling the provider.  Empty answers are not
+    cached, as providers also return nothing when a request fails.  Expired
+    and excess entries are evicted at most every ``GEOCODE_CACHE_EVICT_INTERVAL``
+    seconds.
+    """
+
+    def __init__(self, geocoder: GeocodingService, provider: str, ttl: timedelta, max_entries: int):
+        self._geocoder = geocoder
+        self.provider = provider
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+    def geocode(self, address: str) -> GeocodingResult | None:
+        results = self._cached("geocode", normalize_address(address), lambda: _as_list(self._geocoder.geocode(address)))
+        return results[0] if results else None
+
+    def reverse_geocode(self, lat: float, lng: float) -> GeocodingResult | None:
+        results = self._cached(
+            "reverse", _coordinates(lat, lng), lambda: _as_list(self._geocoder.reverse_geocode(lat, lng))
+        )
+        return results[0] if results else None
+
+    def geocode_many(self, address: str, limit: int = 5) -> list[GeocodingResult]:
+        return self._cached(
+            f"geocode_many:{limit}",
+            normalize_address(address),
+            lambda: self._geocoder.geocode_many(address, limit=limit),
+        )
+
+    def reverse_geocode_many(self, lat: float, lng: float, limit: int = 5) -> list[GeocodingResult]:
+        return self._cached(
+            f"reverse_many:{limit}",
+            _coordinates(lat, lng),
+            lambda: self._geocoder.reverse_geocode_many(lat, lng, limit=limit),
+        )
+
+    def _cached(self, lookup: str, query: str, fetch: Callable[[], list[GeocodingResult]]) -> list[GeocodingResult]:
+        from netbox_rir_manager.models import RIRGeocodeCacheEntry
+
+        if not query:
+            return fetch()
+
+        key = hashlib.sha256(f"{self.provider}:{lookup}:{query}".encode()).hexdigest()
+        now = timezone.now()
+        entries = RIRGeocodeCacheEntry.objects.filter(key=key, created__gte=now - self.ttl)
+        cached = entries.values_list("results", flat=True).first()
+        if cached is not None:
+            entries.update(hits=F("hits") + 1, last_used=now)
+            _incr(f"{GEOCODE_CACHE_STATS_KEY}:hits")
+            return [GeocodingResult(**result) for result in cached]
+
+        _incr(f"{GEOCODE_CACHE_STATS_KEY}:misses")
+        results = fetch()
+        if results:
+            RIRGeocodeCacheEntry.objects.update_or_create(
+                key=key,
+                defaults={
+                    "provider": self.provider,
+                    "lookup": lookup,
+                    "query": query[:500],
+                    "results": [asdict(result) for result in results],
+                    "hits": 0,
+                    "created": now,
+                    "last_used": now,
+                },
+            )
+            # One worker evicts per interval, so misses do not each count the table
+            if cache.add(GEOCODE_CACHE_EVICT_KEY, 1, timeout=GEOCODE_CACHE_EVICT_INTERVAL):
+                self._evict(now)
+        return results
+
+    def _evict(self, now) -> None:
+        """Drop expired entries, then the least recently used beyond ``max_entries``."""
+        from netbox_rir_manager.models import RIRGeocodeCacheEntry
+
+        RIRGeocodeCacheEntry.objects.filter(created__lt=now - self.ttl).delete()
+        excess = RIRGeocodeCacheEntry.objects.count() - self.max_entries
+        if excess > 0:
+            oldest = list(RIRGeocodeCacheEntry.objects.order_by("last_used").values_list("pk", flat=True)[:excess])
+            RIRGeocodeCacheEntry.objects.filter(pk__in=oldest).delete()
+
+
+def _as_list(result: GeocodingResult | None) -> list[GeocodingResult]:
+    return [result] if result is not None else []
+
+
+def _incr(key: str, amount: int = 1) -> None:
+    # add() is a no-op if the counter exists already
+    cache.add(key, 0, timeout=None)
+    try:
+        cache.incr(key, amount)
+    except ValueError:
+        cache.set(key, amount, timeout=None)
+
+
+def geocode_cache_stats() -> dict:
+    """Entries in the geocode cache and hits/misses counted since the last clear."""
+    from netbox_rir_manager.models import RIRGeocodeCacheEntry
+
+    hits = cache.get(f"{GEOCODE_CACHE_STATS_KEY}:hits", 0)
+    misses = cache.get(f"{GEOCODE_CACHE_STATS_KEY}:misses", 0)
+    return {
+        "entries": RIRGeocodeCacheEntry.objects.count(),
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": round(hits / (hits + misses), 3) if hits + misses else 0.0,
+    }
+
+
+def clear_geocode_cache() -> int:
+    """Delete every cached geocoding answer and reset the counters; return the number of entries deleted."""
+    from netbox_rir_manager.models import RIRGeocodeCacheEntry
+
+    deleted, _ = RIRGeocodeCacheEntry.objects.all().delete()
+    cache.delete_many([f"{GEOCODE_CACHE_STATS_KEY}:hits", f"{GEOCODE_CACHE_STATS_KEY}:misses"])
+    cache.delete_many(
+        [f"{GEOCODING_LATENCY_KEY}:{name}:{field}" for name in GEOCODING_PROVIDERS for field in _PROVIDER_STATS]
+    )
+    return deleted
+
+
+_PROVIDER_STATS = ("calls", "answers", "empty", "errors", "timeouts", "fallback_wins", "total_ms")
+
+
+def geocoding_provider_stats() -> dict:
+    """Calls, outcomes and mean latency per provider of a provider chain, for providers called so far."""
+    stats = {}
+    for name in GEOCODING_PROVIDERS:
+        values = cache.get_many([f"{GEOCODING_LATENCY_KEY}:{name}:{field}" for field in _PROVIDER_STATS])
+        counts = {field: values.get(f"{GEOCODING_LATENCY_KEY}:{name}:{field}", 0) for field in _PROVIDER_STATS}
+        if not counts["calls"] and not counts["timeouts"]:
+            continue
+        total_ms = counts.pop("total_ms")
+        counts["mean_ms"] = round(total_ms / counts["calls"]) if counts["calls"] else 0
+        stats[name] = counts
+    return stats
+
+
+def _build_provider(name: str, plugin_config: dict, timeout: float | None) -> GeocodingService | None:
+    if name == "nominatim":
+        return NominatimGeocoder(rate_limit=plugin_config.get("geocoding_rate_limit", 1), timeout=timeout)
+    if name == "google":
+        api_key = plugin_config.get("google_geocoding_api_key")
+        if not api_key:
+            logger.warning("Geocoding provider 'google' needs google_geocoding_api_key; skipped")
+            return None
+        return GoogleGeocoder(api_key, timeout=timeout)
+    if name == "offline":
+        return OfflineGeocoder(plugin_config.get("geocoding_gazetteer") or [])
+    logger.warning("Unknown geocoding provider %r; skipped", name)
+    return None
 
 
 def _get_geocoding_service() -> GeocodingService:
-    """Get the configured geocoding service."""
+    """
+    Get the configured geocoding service, behind the geocode cache unless it is disabled.
+
+    ``geocoding_provider`` names one provider or an ordered list of them; a
+    list is served by a HedgedGeocoder.
+    """
     from django.conf import settings
 
     plugin_config = settings.PLUGINS_CONFIG.get("netbox_rir_manager", {})
-    provider = plugin_config.get("geocoding_provider", "nominatim")
-
-    if provider == "nominatim":
-        return NominatimGeocoder()
+    names = plugin_config.get("geocoding_provider", "nominatim")
+    if isinstance(names, str):
+        names = [names]
+    timeouts = plugin_config.get("geocoding_timeouts") or {}
+
+    providers = []
+    for name in names:
+        # Unset timeouts keep geopy's default for the request; the chain still gives up on it eventually
+        provider = _build_provider(name, plugin_config, timeouts.get(name))
+        if provider is not None:
+            providers.append((name, provider, timeouts.get(name, DEFAULT_PROVIDER_TIMEOUT)))
+    if not providers:
+        # Default fallback
+        providers = [("nominatim", _build_provider("nominatim", plugin_config, None), DEFAULT_PROVIDER_TIMEOUT)]
+
+    if len(providers) == 1:
+        name, geocoder, _timeout = providers[0]
+        if name == "offline":
+            # A local KD-tree lookup is faster than the cache in front of it
+            return geocoder
+    else:
+        name = ",".join(provider_name for provider_name, _provider, _timeout in providers)
+        geocoder = HedgedGeocoder(
+            providers, hedge_delay=plugin_config.get("geocoding_hedge_delay", DEFAULT_HEDGE_DELAY)
+        )
 
-    # Default fallback
-    return NominatimGeocoder()
+    ttl_hours = plugin_config.get("geocode_cache_ttl_hours", 720)
+    if ttl_hours <= 0:
+        return geocoder
+    return CachedGeocoder(
+        geocoder,
+        name,
+        ttl=timedelta(hours=ttl_hours),
+        max_entries=plugin_config.get("geocode_cache_max_entries", 10000),
+    )
 
 
 def _deduplicate_results(results: list[GeocodingResult]) -> list[GeocodingResult]:
@@ -193,35 +661,6 @@ def _deduplicate_results(results: list[GeocodingResult]) -> list[GeocodingResult
     return unique
 
 
-def resolve_site_address_candidates(site: Site, query: str | None = None, limit: int = 5) -> list[GeocodingResult]:
-    """
-    Return multiple geocoding candidates for a Site.
-
-    If query is provided, forward geocode that query (with fallback to site data if empty).
-    Otherwise try reverse geocode from coords, fallback to forward geocode from physical_address.
-    Returns empty list if nothing works. Duplicates are removed.
-    """
-    geocoder = _get_geocoding_service()
-
-    if query:
-        results = geocoder.geocode_many(query, limit=limit)
-        if results:
-            return _deduplicate_results(results)
-        # Query failed — fall through to site-based resolution
-
-    # Try reverse geocode from coordinates
-    if site.latitude and site.longitude:
-        results = geocoder.reverse_geocode_many(float(site.latitude), float(site.longitude), limit=limit)
-        if results:
-            return _deduplicate_results(results)
-
-    # Fallback to forward geocode from physical address
-    if site.physical_address:
-        return _deduplicate_results(geocoder.geocode_many(site.physical_address, limit=limit))
-
-    return []
-
-
 def resolve_site_address(site: Site) -> RIRAddress | None:
     """
     Resolve or return cached structured address for a Site.
@@ -254,16 +693,17 @@ def resolve_site_address(site: Site) -> RIRAddress | None:
         logger.warning("Could not resolve address for site %s (pk=%s)", site.name, site.pk)
         return None
 
-    address = RIRAddress.objects.create(
-        site=site,
+    address, created = RIRAddress.objects.get_or_create_address(
         street_address=result.street_address,
         city=result.city,
         state_province=result.state_province,
         postal_code=result.postal_code,
         country=result.country,
-        raw_geocode=result.raw,
-        auto_resolved=True,
-        last_resolved=timezone.now(),
+        defaults={"site": site, "raw_geocode": result.raw, "auto_resolved": True, "last_resolved": timezone.now()},
     )
+    if not created and address.site_id is None:
+        # The address was already known (e.g. from an ARIN sync); it now also serves this site
+        address.site = site
+        address.save(update_fields=["site"])
     logger.info("Resolved address for site %s: %s, %s", site.name, result.city, result.country)
     return address
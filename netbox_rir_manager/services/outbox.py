@@ -0,0 +1,394 @@
+"""Transactional outbox for ARIN write operations.
+
+Views and API actions no longer call the RIR inside the web request:
+``queue_write_operation`` stores an RIRWriteOperation in the request's
+transaction and, once that commits, queues DispatchWriteOperationsJob.  The
+dispatcher submits each operation with ``execute_write_operation``, which makes
+the RIR calls and records tickets, customers and sync logs exactly as the
+synchronous views used to.
+
+Reassignments, reallocations and the customers created for them carry an
+idempotency key derived from the operation, parent NET and address range
+(``idempotency_key``).  The operation row is stored before the first RIR call
+and each RIR response is checkpointed into ``result`` as soon as it arrives,
+so a retry or a duplicate enqueue finds the work already done and resumes
+without calling the RIR again.  ReassignJob and the batch jobs use the same
+rows through ``claim_write_operation``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from netbox_rir_manager.choices import WriteOperationStatusChoices, normalize_ticket_status
+
+if TYPE_CHECKING:
+    from netbox_rir_manager.backends.base import RIRBackend
+    from netbox_rir_manager.models import RIRNetwork, RIRTicket, RIRUserKey, RIRWriteOperation
+
+logger = logging.getLogger(__name__)
+
+# A running operation whose worker has not checkpointed for this long is taken over
+WRITE_LEASE = timedelta(minutes=15)
+
+# Operations writing an address range under a parent NET; the others act on the NET itself
+IDEMPOTENT_OPERATIONS = ("reassign", "reallocate")
+
+
+def idempotency_key(operation: str, parent_handle: str, start_address: str, end_address: str) -> str:
+    """Key for writing one address range under a parent NET, stable across retries and re-enqueues."""
+    return hashlib.sha256(f"{operation}:{parent_handle}:{start_address}-{end_address}".encode()).hexdigest()
+
+
+def stale_running_q(now=None) -> Q:
+    """Running operations whose worker has not checkpointed within ``WRITE_LEASE`` and is presumed dead."""
+    now = now or timezone.now()
+    return Q(status=WriteOperationStatusChoices.STATUS_RUNNING) & (
+        Q(last_updated__isnull=True) | Q(last_updated__lt=now - WRITE_LEASE)
+    )
+
+
+def is_held(write_operation: RIRWriteOperation, now=None) -> bool:
+    """Whether a live worker holds ``write_operation``: running and checkpointed within ``WRITE_LEASE``."""
+    if write_operation.status != WriteOperationStatusChoices.STATUS_RUNNING:
+        return False
+    now = now or timezone.now()
+    return write_operation.last_updated is not None and write_operation.last_updated >= now - WRITE_LEASE
+
+
+def _get_or_create_by_key(key: str, **fields) -> tuple[RIRWriteOperation, bool]:
+    """
+    Return the live operation for ``key``, or create one with ``fields``.
+
+    A completed operation keeps its key for ``write_idempotency_hours``; after
+    that the key is released so the same range can be written again.
+    """
+    from django.conf import settings
+
+    from netbox_rir_manager.models import RIRWriteOperation
+
+    plugin_config = settings.PLUGINS_CONFIG.get("netbox_rir_manager", {})
+    window = timedelta(hours=plugin_config.get("write_idempotency_hours", 24))
+
+    existing = RIRWriteOperation.objects.filter(idempotency_key=key).first()
+    if existing is not None:
+        expired = existing.status == WriteOperationStatusChoices.STATUS_COMPLETED and (
+            existing.completed is None or existing.completed < timezone.now() - window
+        )
+        if not expired:
+            return existing, False
+        RIRWriteOperation.objects.filter(pk=existing.pk).update(idempotency_key=None)
+
+    try:
+        with transaction.atomic():
+            return RIRWriteOperation.objects.create(idempotency_key=key, **fields), True
+    except IntegrityError:
+        # Another worker created it first
+        return RIRWriteOperation.objects.get(idempotency_key=key), False
+
+
+def queue_write_operation(
+    network: RIRNetwork,
+    user_key: RIRUserKey,
+    operation: str,
+    payload: dict[str, Any] | None = None,
+) -> RIRWriteOperation:
+    """
+    Record a write operation against ``network`` and dispatch it after the transaction commits.
+
+    Reassignments and reallocations are keyed with ``idempotency_key``: a
+    duplicate request returns the operation already queued, held by a worker
+    (``is_held``) or completed for the range; a failed one, or a running one
+    whose worker died, is queued again and resumes from its checkpoints.
+    """
+    from netbox_rir_manager.jobs import DispatchWriteOperationsJob
+    from netbox_rir_manager.models import RIRWriteOperation
+
+    fields = {
+        "rir_config": network.rir_config,
+        "network": network,
+        "network_handle": network.handle,
+        "operation": operation,
+        "user_key": user_key,
+        "payload": payload or {},
+    }
+    if operation not in IDEMPOTENT_OPERATIONS:
+        write_operation = RIRWriteOperation.objects.create(**fields)
+    else:
+        key = idempotency_key(operation, network.handle, payload["start_address"], payload["end_address"])
+        write_operation, created = _get_or_create_by_key(key, **fields)
+        if not created:
+            if write_operation.status in (
+                WriteOperationStatusChoices.STATUS_PENDING,
+                WriteOperationStatusChoices.STATUS_COMPLETED,
+            ) or is_held(write_operation):
+                return write_operation
+            write_operation.status = WriteOperationStatusChoices.STATUS_PENDING
+            write_operation.attempts = 0
+            write_operation.next_attempt = None
+            write_operation.completed = None
+            write_operation.user_key = user_key
+            write_operation.save()
+    transaction.on_commit(DispatchWriteOperationsJob.enqueue_dispatch)
+    return write_operation
+
+
+def claim_write_operation(
+    network: RIRNetwork, user_key: RIRUserKey, operation: str, payload: dict[str, Any], key: str
+) -> tuple[RIRWriteOperation, bool]:
+    """
+    Get or create the operation for ``key`` and mark it running for the calling worker.
+
+    Returns ``(operation, claimed)``.  ``claimed`` is False when the operation
+    has already completed or another worker holds it (``is_held``); the caller
+    must not call the RIR then.  ``queue_write_operation`` applies the same
+    check, so a request retried from the UI or API takes over the same way.
+    """
+    from netbox_rir_manager.models import RIRWriteOperation
+
+    write_operation, created = _get_or_create_by_key(
+        key,
+        rir_config=network.rir_config,
+        network=network,
+        network_handle=network.handle,
+        operation=operation,
+        user_key=user_key,
+        payload=payload,
+        # Never pending, so the dispatcher leaves it to the calling worker
+        status=WriteOperationStatusChoices.STATUS_RUNNING,
+        attempts=1,
+    )
+    if created:
+        return write_operation, True
+
+    now = timezone.now()
+    claimed = (
+        RIRWriteOperation.objects.filter(pk=write_operation.pk)
+        .exclude(status=WriteOperationStatusChoices.STATUS_COMPLETED)
+        .filter(~Q(status=WriteOperationStatusChoices.STATUS_RUNNING) | stale_running_q(now))
+        .update(status=WriteOperationStatusChoices.STATUS_RUNNING, last_updated=now, user_key=user_key)
+    )
+    write_operation.refresh_from_db()
+    if claimed:
+        write_operation.attempts += 1
+        write_operation.save(update_fields=["attempts"])
+    return write_operation, bool(claimed)
+
+
+def checkpoint_write_operation(write_operation: RIRWriteOperation, step: str, response: Any) -> None:
+    """Persist an RIR response in ``result[step]`` immediately, before anything else can fail."""
+    from netbox_rir_manager.models import RIRWriteOperation
+
+    write_operation.result[step] = response
+    RIRWriteOperation.objects.filter(pk=write_operation.pk).update(
+        result=write_operation.result, last_updated=timezone.now()
+    )
+
+
+def finish_write_operation(
+    write_operation: RIRWriteOperation, succeeded: bool, message: str = "", ticket: RIRTicket | None = None
+) -> None:
+    """Mark a claimed operation completed or failed."""
+    write_operation.status = (
+        WriteOperationStatusChoices.STATUS_COMPLETED if succeeded else WriteOperationStatusChoices.STATUS_FAILED
+    )
+    write_operation.completed = timezone.now()
+    write_operation.message = message
+    if ticket is not None:
+        write_operation.ticket = ticket
+        write_operation.result["ticket_number"] = ticket.ticket_number
+    write_operation.save()
+
+
+def execute_write_operation(
+    write_operation: RIRWriteOperation, backend: RIRBackend, log: logging.Logger = logger
+) -> bool:
+    """
+    Submit ``write_operation`` to the RIR and record the outcome locally.
+
+    Sets ``message``, ``result`` and ``ticket`` on the operation (the caller
+    saves it and sets the status).  Returns False if the RIR rejected the call
+    or did not answer.
+    """
+    handler = _HANDLERS[write_operation.operation]
+    return handler(write_operation, backend, log)
+
+
+def _reassign(write_operation: RIRWriteOperation, backend: RIRBackend, log: logging.Logger) -> bool:
+    from netbox_rir_manager.models import RIRAddress, RIRCustomer
+
+    payload = write_operation.payload
+    handle = write_operation.network_handle
+    net_data = {
+        "net_name": payload.get("net_name", ""),
+        "start_address": payload["start_address"],
+        "end_address": payload["end_address"],
+    }
+
+    if payload["reassignment_type"] == "simple":
+        customer_data = payload["customer"]
+        customer_result = {}
+        customer_handle = write_operation.result.get("customer_handle")
+        if customer_handle is None:
+            customer_result = backend.create_customer(handle, customer_data)
+            if customer_result is None:
+                _log_error(write_operation, "create", "customer", "Failed to create customer")
+                write_operation.message = "Failed to create customer at ARIN."
+                return False
+            customer_handle = customer_result["handle"]
+            # Checkpointed first so a retry never creates a second customer at ARIN
+            checkpoint_write_operation(write_operation, "customer_handle", customer_handle)
+
+        # Also on a retry: the worker may have died between the checkpoint and this
+        if not RIRCustomer.objects.filter(handle=customer_handle).exists():
+            addr, _ = RIRAddress.objects.get_or_create_address(
+                street_address=customer_data.get("street_address", ""),
+                city=customer_data.get("city", ""),
+                state_province=customer_data.get("state_province", ""),
+                postal_code=customer_data.get("postal_code", ""),
+                country=customer_data.get("country", ""),
+            )
+            RIRCustomer.objects.create(
+                rir_config=write_operation.rir_config,
+                handle=customer_handle,
+                customer_name=customer_data["customer_name"],
+                address=addr,
+                network=write_operation.network,
+                raw_data=customer_result,
+                created_date=timezone.now(),
+            )
+        net_data["customer_handle"] = customer_handle
+    else:
+        net_data["org_handle"] = payload["org_handle"]
+
+    result = write_operation.result.get("reassignment")
+    if result is None:
+        log.info(f"Submitting reassignment under {handle}")
+        result = backend.reassign_network(handle, net_data)
+        if result is None:
+            _log_error(write_operation, "reassign", "network", "Reassignment failed")
+            write_operation.message = "Reassignment failed at ARIN."
+            return False
+        checkpoint_write_operation(write_operation, "reassignment", result)
+    else:
+        log.info(f"Reassignment under {handle} was already accepted by ARIN, recording it")
+
+    ticket = _record_ticket(write_operation, result, result.get("ticket_type", "IPV4_SIMPLE_REASSIGN"))
+    _log_success(write_operation, "reassign", f"Reassignment submitted, ticket {ticket.ticket_number}")
+    write_operation.message = f"Reassignment submitted. Ticket: {ticket.ticket_number}"
+    return True
+
+
+def _reallocate(write_operation: RIRWriteOperation, backend: RIRBackend, log: logging.Logger) -> bool:
+    payload = write_operation.payload
+    net_data = {
+        "org_handle": payload["org_handle"],
+        "net_name": payload.get("net_name", ""),
+        "start_address": payload["start_address"],
+        "end_address": payload["end_address"],
+    }
+    result = write_operation.result.get("reallocation")
+    if result is None:
+        log.info(f"Submitting reallocation under {write_operation.network_handle}")
+        result = backend.reallocate_network(write_operation.network_handle, net_data)
+        if result is None:
+            _log_error(write_operation, "reallocate", "network", "Reallocation failed")
+            write_operation.message = "Reallocation failed at ARIN."
+            return False
+        checkpoint_write_operation(write_operation, "reallocation", result)
+    else:
+        log.info(f"Reallocation under {write_operation.network_handle} was already accepted by ARIN, recording it")
+
+    ticket = _record_ticket(write_operation, result, result.get("ticket_type", "IPV4_REALLOCATE"))
+    _log_success(write_operation, "reallocate", f"Reallocation submitted, ticket {ticket.ticket_number}")
+    write_operation.message = f"Reallocation submitted. Ticket: {ticket.ticket_number}"
+    return True
+
+
+def _remove(write_operation: RIRWriteOperation, backend: RIRBackend, log: logging.Logger) -> bool:
+    handle = write_operation.network_handle
+    log.info(f"Removing network {handle}")
+    if not backend.remove_network(handle):
+        _log_error(write_operation, "remove", "network", "Failed to remove network from ARIN")
+        write_operation.message = "Failed to remove network from ARIN."
+        return False
+
+    _log_success(write_operation, "remove", f"Removed network {handle} from ARIN")
+    write_operation.message = f"Network {handle} removed from ARIN."
+    return True
+
+
+def _delete(write_operation: RIRWriteOperation, backend: RIRBackend, log: logging.Logger) -> bool:
+    log.info(f"Submitting delete request for {write_operation.network_handle}")
+    result = backend.delete_network(write_operation.network_handle)
+    if result is None:
+        _log_error(write_operation, "delete", "network", "Failed to delete network at ARIN")
+        write_operation.message = "Failed to delete network at ARIN."
+        return False
+
+    ticket = _record_ticket(write_operation, result, "NET_DELETE_REQUEST")
+    _log_success(write_operation, "delete", f"Delete request submitted, ticket {ticket.ticket_number}")
+    write_operation.message = f"Delete request submitted. Ticket: {ticket.ticket_number}"
+    return True
+
+
+_HANDLERS = {
+    "reassign": _reassign,
+    "reallocate": _reallocate,
+    "remove": _remove,
+    "delete": _delete,
+}
+
+
+def _record_ticket(write_operation: RIRWriteOperation, result: dict[str, Any], ticket_type: str) -> RIRTicket:
+    from netbox_rir_manager.models import RIRTicket
+
+    # get_or_create: a resumed operation may have recorded the ticket before it was interrupted
+    ticket, _ = RIRTicket.objects.get_or_create(
+        ticket_number=result.get("ticket_number", ""),
+        defaults={
+            "rir_config": write_operation.rir_config,
+            "ticket_type": ticket_type,
+            "status": normalize_ticket_status(result.get("ticket_status", "")),
+            "network": write_operation.network,
+            "submitted_by": write_operation.user_key,
+            "created_date": timezone.now(),
+            "raw_data": result.get("raw_data", {}),
+        },
+    )
+    write_operation.ticket = ticket
+    write_operation.result["ticket_number"] = ticket.ticket_number
+    return ticket
+
+
+def _log_success(write_operation: RIRWriteOperation, operation: str, message: str) -> None:
+    from netbox_rir_manager.models import RIRSyncLog
+
+    RIRSyncLog.objects.create(
+        rir_config=write_operation.rir_config,
+        operation=operation,
+        object_type="network",
+        object_handle=write_operation.network_handle,
+        status="success",
+        message=message,
+    )
+
+
+def _log_error(write_operation: RIRWriteOperation, operation: str, object_type: str, message: str) -> None:
+    from netbox_rir_manager.models import RIRSyncLog
+
+    RIRSyncLog.objects.create(
+        rir_config=write_operation.rir_config,
+        operation=operation,
+        object_type=object_type,
+        object_handle=write_operation.network_handle,
+        status="error",
+        message=message,
+    )
@@ -0,0 +1,45 @@
+"""Versioning of the lazily loaded RIR panels on Aggregate, Prefix and Site pages.
+
+The template extensions render a placeholder whose HTMX request fetches the
+panel from ``ObjectPanelView``.  The panel URL carries a version made of the
+object's ``last_updated`` and a generation counter in the Django cache, and
+the response carries it as its ETag, so browsers reuse a cached panel until
+either changes.  post_save/post_delete of RIRNetwork, RIRAddress, RIRConfig,
+RIROrganization and Aggregate bump the counter (see signals.py), as must code
+writing those tables with ``bulk_create``/``bulk_update``/``update()``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+
+from django.core.cache import cache
+
+GENERATION_CACHE_KEY = "netbox_rir_manager:panels:generation"
+
+# Seconds a browser may reuse a panel without asking; a new version changes the URL anyway
+PANEL_MAX_AGE = 300
+
+
+def current_generation() -> int:
+    return cache.get(GENERATION_CACHE_KEY, 0)
+
+
+def invalidate_panels() -> None:
+    """Make every panel's version change."""
+    try:
+        cache.incr(GENERATION_CACHE_KEY)
+    except ValueError:
+        # Key missing (first write or cache flushed)
+        cache.set(GENERATION_CACHE_KEY, 1, None)
+
+
+def panel_version(obj) -> str:
+    """Version of ``obj``'s panel: changes with the object and with every invalidation."""
+    last_updated = obj.last_updated.isoformat() if obj.last_updated else ""
+    key = f"{obj._meta.label_lower}:{obj.pk}:{last_updated}:{current_generation()}"
+    return hashlib.sha256(key.encode()).hexdigest()[:16]
+
+
+def panel_etag(obj) -> str:
+    return f'"{panel_version(obj)}"'
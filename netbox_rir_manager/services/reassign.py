@@ -0,0 +1,511 @@
+"""Reassignment of prefixes at the RIR under an already-resolved parent NET.
+
+A reassignment runs in three phases so that batches can overlap the slow part:
+
+* ``plan_reassignment`` reads the database (tenant organization, site address),
+* ``submit_reassignment`` talks only to the RIR and is safe to run in a worker thread,
+* ``record_reassignment`` writes tickets, networks and sync logs.
+
+``reassign_prefix`` runs the three in sequence and is shared by ReassignJob and
+ProcessPendingReassignsJob; BulkReassignJob runs the submit phase concurrently.
+The pre-flight ``find_net`` check of a whole batch can be run up front with
+``preflight_find_nets`` and its results handed to the submit phase.
+
+Before submitting, ``claim_reassignment`` claims the RIRWriteOperation keyed
+by parent NET and range (see ``services.outbox``).  The submit phase
+checkpoints each RIR response into it, so a duplicate job skips the prefix and
+a retry resumes from the last response instead of calling the RIR again.
+"""
+
+from __future__ import annotations
+
+import ipaddress
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from django.utils import timezone
+
+from netbox_rir_manager.choices import WriteOperationStatusChoices
+from netbox_rir_manager.services.outbox import (
+    checkpoint_write_operation,
+    claim_write_operation,
+    finish_write_operation,
+    idempotency_key,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from ipam.models import Prefix
+
+    from netbox_rir_manager.backends.base import RIRBackend
+    from netbox_rir_manager.models import RIRAddress, RIRNetwork, RIROrganization, RIRUserKey, RIRWriteOperation
+
+logger = logging.getLogger(__name__)
+
+
+def prefix_site(prefix: Prefix):
+    """Return the Site a prefix is scoped to, or None."""
+    from dcim.models import Site
+
+    site = getattr(prefix, "_site", None) or getattr(prefix, "site", None)
+    if site is None:
+        scope = getattr(prefix, "scope", None)
+        if isinstance(scope, Site):
+            site = scope
+    return site
+
+
+def reassignment_range(prefix: Prefix) -> tuple[str, str]:
+    """Return the (start, end) addresses of ``prefix`` as sent to the RIR."""
+    network = ipaddress.ip_network(str(prefix.prefix), strict=False)
+    return str(network.network_address), str(network.broadcast_address)
+
+
+def is_existing_reassignment(net: dict[str, Any] | None, parent_network: RIRNetwork) -> bool:
+    """True if ``net`` (a ``find_net`` result) is a NET other than the parent, i.e. already reassigned."""
+    handle = net.get("handle") if net else None
+    return bool(handle) and handle != parent_network.handle
+
+
+def preflight_find_nets(
+    checks: Iterable[tuple[RIRBackend, str, str]],
+    concurrency: int = 1,
+    log: logging.Logger = logger,
+) -> dict[tuple[RIRBackend, str, str], dict[str, Any] | None]:
+    """
+    Run the pre-flight ``find_net`` for a batch of ranges concurrently.
+
+    ``checks`` holds ``(backend, start_address, end_address)`` tuples; each
+    distinct one is looked up once, on its own backend instance.  Returns the
+    NET found (or None) per tuple, to be passed to ``submit_reassignment`` as
+    ``preflight``.  Lookups that raise are left out, so the submit phase
+    repeats them itself.
+    """
+    checks = list(dict.fromkeys(checks))
+    results: dict[tuple[RIRBackend, str, str], dict[str, Any] | None] = {}
+    if not checks:
+        return results
+
+    def lookup(check):
+        backend, start_address, end_address = check
+        return backend.find_net(start_address, end_address)
+
+    log.info(f"Pre-flight: querying ARIN for {len(checks)} ranges with concurrency {concurrency}")
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        futures = {check: executor.submit(lookup, check) for check in checks}
+    for check, future in futures.items():
+        try:
+            results[check] = future.result()
+        except Exception as exc:
+            log.warning(f"Pre-flight lookup for {check[1]}-{check[2]} raised: {exc}")
+    return results
+
+
+@dataclass
+class ReassignmentPlan:
+    """Everything needed to submit one reassignment, read from the database up front."""
+
+    prefix: Prefix
+    parent_network: RIRNetwork
+    start_address: str
+    end_address: str
+    rir_org: RIROrganization | None = None
+    site_address: RIRAddress | None = None
+    # Set when the prefix cannot be reassigned; reported after the pre-flight check
+    error: str = ""
+    # Claimed by claim_reassignment; holds the RIR responses of earlier attempts
+    write_operation: RIRWriteOperation | None = None
+
+    @property
+    def reassignment_type(self) -> str:
+        return "detailed" if self.rir_org else "simple"
+
+    @property
+    def net_name(self) -> str:
+        return f"{self.prefix.tenant.name}-{self.prefix.prefix}"
+
+    def customer_data(self) -> dict[str, Any]:
+        address = self.site_address
+        return {
+            "customer_name": self.prefix.tenant.name,
+            "street_address": address.street_address,
+            "city": address.city,
+            "state_province": address.state_province,
+            "postal_code": address.postal_code,
+            "country": address.country,
+        }
+
+    def write_payload(self) -> dict[str, Any]:
+        """The plan in the payload format of a queued ``reassign`` write operation."""
+        payload = {
+            "reassignment_type": self.reassignment_type,
+            "net_name": self.net_name,
+            "start_address": self.start_address,
+            "end_address": self.end_address,
+        }
+        if self.rir_org:
+            payload["org_handle"] = self.rir_org.handle
+        else:
+            payload["customer"] = self.customer_data()
+        return payload
+
+
+@dataclass
+class ReassignmentOutcome:
+    """RIR responses for one plan, collected without touching the database."""
+
+    # Pre-flight found the range already reassigned as a different NET
+    existing_net: dict[str, Any] | None = None
+    customer: dict[str, Any] | None = None
+    reassignment: dict[str, Any] | None = None
+    # "plan", "customer" or "reassign" when that step failed
+    failed: str = ""
+
+
+def plan_reassignment(
+    prefix: Prefix,
+    parent_network: RIRNetwork,
+    site_address: RIRAddress | None = None,
+    resolve_address: bool = True,
+) -> ReassignmentPlan:
+    """
+    Build the plan for reassigning ``prefix`` out of ``parent_network``.
+
+    Detailed reassignment is used when the tenant has an RIROrganization;
+    otherwise the site address is needed to create a customer.  Pass
+    ``site_address`` when it has already been resolved for the prefix's site,
+    and ``resolve_address=False`` to skip geocoding when it is missing.
+    """
+    from netbox_rir_manager.models import RIRAddress, RIROrganization
+    from netbox_rir_manager.services.geocoding import resolve_site_address
+
+    tenant = prefix.tenant
+    start_address, end_address = reassignment_range(prefix)
+    plan = ReassignmentPlan(
+        prefix=prefix,
+        parent_network=parent_network,
+        start_address=start_address,
+        end_address=end_address,
+        rir_org=RIROrganization.objects.filter(tenant=tenant).first() if tenant else None,
+    )
+
+    if plan.rir_org is None:
+        site = prefix_site(prefix)
+        if not site:
+            plan.error = "Prefix has no site"
+        else:
+            if site_address is None:
+                site_address = RIRAddress.get_for_site(site)
+            if site_address is None and resolve_address:
+                site_address = resolve_site_address(site)
+            if site_address:
+                plan.site_address = site_address
+            else:
+                plan.error = "Could not resolve address for site"
+    return plan
+
+
+def claim_reassignment(plan: ReassignmentPlan, user_key: RIRUserKey) -> dict | None:
+    """
+    Claim the write operation for ``plan`` before anything is sent to the RIR.
+
+    Returns None when the caller may go on to ``submit_reassignment`` (the
+    operation is then on ``plan.write_operation``), or the result to report
+    instead when the range was already reassigned or another worker is
+    submitting it.  Plans with an error are not claimed.
+    """
+    if plan.error:
+        return None
+    key = idempotency_key("reassign", plan.parent_network.handle, plan.start_address, plan.end_address)
+    write_operation, claimed = claim_write_operation(
+        plan.parent_network, user_key, "reassign", plan.write_payload(), key
+    )
+    if claimed:
+        plan.write_operation = write_operation
+        return None
+
+    if write_operation.status == WriteOperationStatusChoices.STATUS_COMPLETED:
+        message = f"Already submitted by write operation {write_operation.pk}: {write_operation.message}"
+    else:
+        message = f"Being submitted by another worker (write operation {write_operation.pk})"
+    return {"status": "skipped", "message": message, "reassignment_type": plan.reassignment_type}
+
+
+def _checkpoint(plan: ReassignmentPlan, step: str, response: Any) -> None:
+    if plan.write_operation is not None:
+        checkpoint_write_operation(plan.write_operation, step, response)
+
+
+def submit_reassignment(
+    plan: ReassignmentPlan,
+    backend: RIRBackend,
+    log: logging.Logger = logger,
+    preflight: dict | None = None,
+) -> ReassignmentOutcome:
+    """
+    Run the pre-flight check and submit ``plan`` to the RIR.
+
+    The check is taken from ``preflight`` (see ``preflight_find_nets``) when it
+    has this backend and range.  Steps recorded on ``plan.write_operation`` by
+    an earlier attempt are not repeated, and each new RIR response is
+    checkpointed there.  Makes RIR API calls and those single-row updates
+    only, so it may run in a worker thread.
+    """
+    outcome = ReassignmentOutcome()
+    parent_handle = plan.parent_network.handle
+    resumed = plan.write_operation.result if plan.write_operation is not None else {}
+
+    if resumed.get("reassignment") is not None:
+        log.info(f"Reassignment of {plan.prefix.prefix} was already accepted by ARIN, recording it")
+        if resumed.get("customer_handle"):
+            outcome.customer = {"handle": resumed["customer_handle"]}
+        outcome.reassignment = resumed["reassignment"]
+        return outcome
+
+    # Pre-flight: check what ARIN actually has for this range
+    check = (backend, plan.start_address, plan.end_address)
+    if preflight is not None and check in preflight:
+        actual_net = preflight[check]
+    else:
+        log.info(f"Pre-flight: querying ARIN for existing net at {plan.start_address}-{plan.end_address}")
+        actual_net = backend.find_net(plan.start_address, plan.end_address)
+
+    # Already reassigned at ARIN (different net than parent) -- just sync it
+    if is_existing_reassignment(actual_net, plan.parent_network):
+        log.warning(f"Pre-flight: prefix already reassigned as {actual_net['handle']}, syncing instead")
+        outcome.existing_net = actual_net
+        return outcome
+
+    log.info("Pre-flight passed")
+    log.info(f"Reassignment type: {plan.reassignment_type}")
+
+    if plan.error:
+        outcome.failed = "plan"
+        return outcome
+
+    net_data = {
+        "net_name": plan.net_name,
+        "start_address": plan.start_address,
+        "end_address": plan.end_address,
+    }
+    if plan.rir_org:
+        # Detailed reassignment - tenant has a known RIR org
+        net_data["org_handle"] = plan.rir_org.handle
+    else:
+        # Simple reassignment - create customer from site address, unless an earlier attempt did
+        if resumed.get("customer_handle"):
+            log.info(f"Reusing customer {resumed['customer_handle']} created by an earlier attempt")
+            outcome.customer = {"handle": resumed["customer_handle"]}
+        else:
+            outcome.customer = backend.create_customer(parent_handle, plan.customer_data())
+            if outcome.customer is None:
+                outcome.failed = "customer"
+                return outcome
+            _checkpoint(plan, "customer_handle", outcome.customer["handle"])
+        net_data["customer_handle"] = outcome.customer["handle"]
+
+    # Perform the reassignment
+    log.info(f"Submitting reassignment to ARIN for {plan.prefix.prefix}")
+    outcome.reassignment = backend.reassign_network(parent_handle, net_data)
+    if outcome.reassignment is None:
+        log.error(f"Reassignment failed at ARIN for prefix {plan.prefix.prefix}")
+        outcome.failed = "reassign"
+    else:
+        _checkpoint(plan, "reassignment", outcome.reassignment)
+    return outcome
+
+
+def record_reassignment(
+    plan: ReassignmentPlan,
+    outcome: ReassignmentOutcome,
+    user_key: RIRUserKey,
+    log: logging.Logger = logger,
+) -> dict:
+    """
+    Store the result of a submitted reassignment: ticket, child network, customer and sync log.
+
+    Completes (or fails) ``plan.write_operation`` when it was claimed.
+
+    Returns a dict with ``status`` (``success``, ``synced`` or ``error``) plus
+    ``message``/``reassignment_type``/``org_handle``/``ticket_number`` as applicable.
+    """
+    from netbox_rir_manager.models import RIRTicket
+
+    result = _record_reassignment(plan, outcome, user_key, log)
+    if plan.write_operation is not None:
+        ticket = None
+        if result.get("ticket_number"):
+            ticket = RIRTicket.objects.filter(ticket_number=result["ticket_number"]).first()
+        message = result.get("message") or f"Reassignment submitted. Ticket: {result.get('ticket_number', '')}"
+        finish_write_operation(plan.write_operation, result["status"] != "error", message, ticket=ticket)
+    return result
+
+
+def _record_reassignment(
+    plan: ReassignmentPlan,
+    outcome: ReassignmentOutcome,
+    user_key: RIRUserKey,
+    log: logging.Logger,
+) -> dict:
+    from netbox_rir_manager.choices import normalize_ticket_status
+    from netbox_rir_manager.models import RIRAddress, RIRCustomer, RIRNetwork, RIRSyncLog, RIRTicket
+
+    prefix = plan.prefix
+    parent_network = plan.parent_network
+    rir_config = parent_network.rir_config
+    result: dict = {}
+
+    if outcome.existing_net is not None:
+        actual_handle = outcome.existing_net["handle"]
+        RIRNetwork.sync_from_arin(
+            outcome.existing_net,
+            rir_config,
+            prefix=prefix,
+            user_key=user_key,
+        )
+        RIRSyncLog.objects.create(
+            rir_config=rir_config,
+            operation="reassign",
+            object_type="network",
+            object_handle=actual_handle,
+            status="skipped",
+            message=(
+                f"Prefix {prefix.prefix} already reassigned at ARIN as "
+                f"{actual_handle}. Synced instead of re-reassigning."
+            ),
+        )
+        result["status"] = "synced"
+        result["message"] = (
+            f"Prefix already has ARIN network {actual_handle} (expected parent {parent_network.handle}). Synced locally."
+        )
+        return result
+
+    result["reassignment_type"] = plan.reassignment_type
+    if plan.rir_org:
+        result["org_handle"] = plan.rir_org.handle
+
+    if outcome.failed == "plan":
+        result["status"] = "error"
+        result["message"] = plan.error
+        return result
+
+    if outcome.failed == "customer":
+        RIRSyncLog.objects.create(
+            rir_config=rir_config,
+            operation="create",
+            object_type="customer",
+            object_handle=parent_network.handle,
+            status="error",
+            message=f"Failed to create customer for {prefix.tenant.name}",
+        )
+        result["status"] = "error"
+        result["message"] = "Failed to create customer at ARIN"
+        return result
+
+    # A resumed attempt may have recorded the customer already
+    if outcome.customer is not None and not RIRCustomer.objects.filter(handle=outcome.customer["handle"]).exists():
+        site_address = plan.site_address
+        cust_addr, _ = RIRAddress.objects.get_or_create_address(
+            street_address=site_address.street_address,
+            city=site_address.city,
+            state_province=site_address.state_province,
+            postal_code=site_address.postal_code,
+            country=site_address.country,
+        )
+        RIRCustomer.objects.create(
+            rir_config=rir_config,
+            handle=outcome.customer["handle"],
+            customer_name=prefix.tenant.name,
+            address=cust_addr,
+            network=parent_network,
+            tenant=prefix.tenant,
+            raw_data=outcome.customer,
+            created_date=timezone.now(),
+        )
+
+    if outcome.failed == "reassign":
+        RIRSyncLog.objects.create(
+            rir_config=rir_config,
+            operation="reassign",
+            object_type="network",
+            object_handle=parent_network.handle,
+            status="error",
+            message=f"Reassignment failed for prefix {prefix.prefix}",
+        )
+        result["status"] = "error"
+        result["message"] = "Reassignment failed at ARIN"
+        return result
+
+    reassign_result = outcome.reassignment
+
+    # Create ticket record (get_or_create, as a resumed attempt may have recorded it)
+    ticket, _ = RIRTicket.objects.get_or_create(
+        ticket_number=reassign_result.get("ticket_number", ""),
+        defaults={
+            "rir_config": rir_config,
+            "ticket_type": reassign_result.get("ticket_type", "IPV4_SIMPLE_REASSIGN"),
+            "status": normalize_ticket_status(reassign_result.get("ticket_status", "")),
+            "network": parent_network,
+            "submitted_by": user_key,
+            "created_date": timezone.now(),
+            "raw_data": reassign_result.get("raw_data", {}),
+        },
+    )
+
+    # Create child RIRNetwork if net data was returned
+    net_result = reassign_result.get("net")
+    if net_result and net_result.get("handle"):
+        RIRNetwork.sync_from_arin(
+            net_result,
+            rir_config,
+            prefix=prefix,
+            user_key=user_key,
+        )
+
+    RIRSyncLog.objects.create(
+        rir_config=rir_config,
+        operation="reassign",
+        object_type="network",
+        object_handle=parent_network.handle,
+        status="success",
+        message=f"Reassignment submitted for {prefix.prefix}, ticket {ticket.ticket_number}",
+    )
+
+    log.info(f"Reassignment submitted, ticket {ticket.ticket_number}")
+    result["status"] = "success"
+    result["ticket_number"] = ticket.ticket_number
+    return result
+
+
+def reassign_prefix(
+    prefix: Prefix,
+    parent_network: RIRNetwork,
+    backend: RIRBackend,
+    user_key: RIRUserKey,
+    log: logging.Logger = logger,
+    preflight: dict | None = None,
+) -> dict:
+    """
+    Reassign ``prefix`` at the RIR out of ``parent_network``.
+
+    Performs the pre-flight ``find_net`` check, picks detailed (tenant has an
+    RIROrganization) or simple (customer created from the site address)
+    reassignment, submits it and records the ticket, child network and sync log.
+    ``preflight`` is passed on to ``submit_reassignment``.  A range already
+    reassigned through its write operation, or being reassigned by another
+    worker, is skipped without calling the RIR.
+
+    Returns a dict with ``status`` (``success``, ``synced``, ``skipped`` or
+    ``error``) plus ``message``/``reassignment_type``/``org_handle``/``ticket_number``
+    as applicable.
+    """
+    plan = plan_reassignment(prefix, parent_network)
+    skipped = claim_reassignment(plan, user_key)
+    if skipped is not None:
+        log.info(f"Skipping {prefix.prefix}: {skipped['message']}")
+        return skipped
+    outcome = submit_reassignment(plan, backend, log=log, preflight=preflight)
+    return record_reassignment(plan, outcome, user_key, log=log)
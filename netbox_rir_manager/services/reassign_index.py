@@ -0,0 +1,169 @@
+"""In-process index answering "does this prefix concern the plugin?" without queries.
+
+The Prefix post_save/pre_delete handlers run for every prefix NetBox saves,
+most of which are nowhere near an ARIN-managed aggregate.  This index keeps:
+
+* a PrefixTrie of aggregates that have an ``auto_reassign`` parent NET, with
+  the parent network, config and first API key for each, and
+* the ids of prefixes linked to an RIRNetwork (and the child NETs per prefix).
+
+It is rebuilt lazily in each process when a generation counter in the Django
+cache changes; post_save/post_delete of RIRNetwork, Aggregate and RIRUserKey
+bump the counter (see signals.py), as must any code writing those tables with
+``bulk_update``/``update()``.  Syncs write many networks inside
+``batched_invalidation()``, which bumps it once at the end.
+
+Positive answers are confirmed against the database by callers.  A stale
+negative ``has_network()`` answer can queue an RIRPendingReassign for a prefix
+that already has a network; ProcessPendingReassignsJob checks the database
+again and skips it.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from django.core.cache import cache
+from django.db import transaction
+
+from netbox_rir_manager.trie import PrefixTrie
+
+logger = logging.getLogger(__name__)
+
+GENERATION_CACHE_KEY = "netbox_rir_manager:reassign_index:generation"
+
+
+@dataclass(frozen=True)
+class AutoReassignParent:
+    aggregate_id: int
+    network_id: int
+    rir_config_id: int
+    rir_config_name: str
+    user_key_id: int | None
+
+
+@dataclass
+class ReassignIndex:
+    generation: int
+    parents: PrefixTrie = field(default_factory=PrefixTrie)
+    # prefix_id -> ids of child (non-aggregate) RIRNetworks linked to it
+    child_networks: dict[int, list[int]] = field(default_factory=dict)
+    # prefix ids linked to any RIRNetwork
+    linked_prefix_ids: set[int] = field(default_factory=set)
+
+    def find_parent(self, prefix) -> AutoReassignParent | None:
+        """Return the auto-reassign parent covering ``prefix``, or None."""
+        return self.parents.longest_match(prefix)
+
+    def has_network(self, prefix_id: int) -> bool:
+        return prefix_id in self.linked_prefix_ids
+
+    def has_child_networks(self, prefix_id: int) -> bool:
+        return prefix_id in self.child_networks
+
+
+_lock = threading.Lock()
+_index: ReassignIndex | None = None
+
+
+def current_generation() -> int:
+    return cache.get(GENERATION_CACHE_KEY, 0)
+
+
+# Set inside batched_invalidation(): whether a write asked for an invalidation
+_batched: ContextVar[list[bool] | None] = ContextVar("reassign_index_batched", default=None)
+
+
+def invalidation_batched() -> bool:
+    return _batched.get() is not None
+
+
+@contextmanager
+def batched_invalidation():
+    """Collapse the invalidations of the writes inside the block into one at its end.
+
+    Without it every RIRNetwork saved by a sync would make each process rebuild
+    the whole index on its next lookup.  Nested blocks join the outermost one.
+    """
+    if invalidation_batched():
+        yield
+        return
+
+    requested: list[bool] = []
+    token = _batched.set(requested)
+    try:
+        yield
+    finally:
+        _batched.reset(token)
+        if requested:
+            invalidate_reassign_index()
+            transaction.on_commit(invalidate_reassign_index)
+
+
+def invalidate_reassign_index() -> None:
+    """Mark every process's index stale, or at the end of the current ``batched_invalidation()`` block."""
+    requested = _batched.get()
+    if requested is not None:
+        requested.append(True)
+        return
+    try:
+        cache.incr(GENERATION_CACHE_KEY)
+    except ValueError:
+        # Key missing (first write or cache flushed)
+        cache.set(GENERATION_CACHE_KEY, 1, None)
+
+
+def get_reassign_index() -> ReassignIndex:
+    """Return the index for the current generation, rebuilding it if stale."""
+    global _index
+
+    generation = current_generation()
+    index = _index
+    if index is not None and index.generation == generation:
+        return index
+    with _lock:
+        if _index is None or _index.generation != generation:
+            _index = build_reassign_index(generation)
+        return _index
+
+
+def build_reassign_index(generation: int = 0) -> ReassignIndex:
+    from netbox_rir_manager.models import RIRNetwork, RIRUserKey
+
+    index = ReassignIndex(generation=generation)
+
+    # First key per config, matching RIRUserKey.objects.filter(rir_config=...).first()
+    user_keys: dict[int, int] = {}
+    for rir_config_id, pk in RIRUserKey.objects.values_list("rir_config_id", "pk"):
+        user_keys.setdefault(rir_config_id, pk)
+
+    for network_id, aggregate_id, aggregate_prefix, rir_config_id, rir_config_name in RIRNetwork.objects.filter(
+        auto_reassign=True, aggregate__isnull=False
+    ).values_list("pk", "aggregate_id", "aggregate__prefix", "rir_config_id", "rir_config__name"):
+        index.parents.setdefault(
+            aggregate_prefix,
+            AutoReassignParent(
+                aggregate_id=aggregate_id,
+                network_id=network_id,
+                rir_config_id=rir_config_id,
+                rir_config_name=rir_config_name,
+                user_key_id=user_keys.get(rir_config_id),
+            ),
+        )
+
+    for prefix_id, network_id, aggregate_id in RIRNetwork.objects.filter(prefix__isnull=False).values_list(
+        "prefix_id", "pk", "aggregate_id"
+    ):
+        index.linked_prefix_ids.add(prefix_id)
+        if aggregate_id is None:
+            index.child_networks.setdefault(prefix_id, []).append(network_id)
+
+    logger.debug(
+        f"Built auto-reassign index (generation {generation}): {len(index.parents)} parents, "
+        f"{len(index.linked_prefix_ids)} linked prefixes"
+    )
+    return index
@@ -0,0 +1,204 @@
+"""Dry-run planning of reassignments for an aggregate or a whole RIR config.
+
+Answers "what would auto-reassignment do here?" without writing anything,
+locally or at the RIR.  Prefixes, their RIR links, tenant organizations and
+site addresses are loaded with a handful of set-based queries and classified
+in memory with the same rules ReassignJob applies.  Optionally each candidate
+range is checked at the RIR with ``find_net``; those read-only lookups are
+cached in the Django cache so repeated plans do not hit the API again.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import ipaddress
+import logging
+import time
+from typing import TYPE_CHECKING
+
+from django.core.cache import cache
+from django.db.models import Q
+
+from netbox_rir_manager.choices import ReassignPlanActionChoices
+from netbox_rir_manager.trie import PrefixTrie
+
+if TYPE_CHECKING:
+    from django.db.models import QuerySet
+    from ipam.models import Aggregate
+
+    from netbox_rir_manager.backends.base import RIRBackend
+    from netbox_rir_manager.models import RIRConfig
+
+logger = logging.getLogger(__name__)
+
+PLAN_FIELDS = (
+    "prefix",
+    "prefix_id",
+    "vrf",
+    "status",
+    "tenant",
+    "site",
+    "aggregate",
+    "parent_network",
+    "action",
+    "reason",
+    "existing_net",
+)
+
+FIND_NET_CACHE_TIMEOUT = 3600
+
+
+def cached_find_net(backend: RIRBackend, rir_config_id: int, start_address: str, end_address: str):
+    """``backend.find_net`` with results (including misses) cached per config and range."""
+    key = f"netbox_rir_manager:find_net:{rir_config_id}:{start_address}-{end_address}"
+    cached = cache.get(key)
+    if cached is not None:
+        return cached["net"]
+    net = backend.find_net(start_address, end_address)
+    cache.set(key, {"net": net}, FIND_NET_CACHE_TIMEOUT)
+    return net
+
+
+def plan_reassignments(
+    aggregate: Aggregate | None = None,
+    rir_config: RIRConfig | None = None,
+    backend: RIRBackend | None = None,
+    log: logging.Logger = logger,
+    prefixes: QuerySet | None = None,
+) -> dict:
+    """
+    Classify every prefix inside ``aggregate`` (or inside the aggregates of ``rir_config``).
+
+    ``prefixes`` limits the plan to a Prefix queryset, e.g. the prefixes a
+    user may view; all prefixes by default.
+
+    Each prefix is planned as a ``simple`` or ``detailed`` reassignment,
+    ``existing_net`` (the RIR already has another NET for the range; only
+    checked when ``backend`` is given) or ``blocked`` with the reason.
+
+    Returns ``{"rows": [...], "summary": {action: count, ...}}``.
+    """
+    from ipam.models import Aggregate, Prefix
+
+    from netbox_rir_manager.models import RIRAddress, RIRNetwork, RIROrganization
+
+    started = time.monotonic()
+
+    # Parent NET per aggregate: the first RIRNetwork linked to it
+    if aggregate is not None:
+        aggregates = [aggregate]
+    else:
+        aggregates = list(Aggregate.objects.filter(rir_networks__rir_config=rir_config).distinct())
+    networks = RIRNetwork.objects.filter(aggregate__in=aggregates)
+    if rir_config is not None:
+        networks = networks.filter(rir_config=rir_config)
+    parent_networks = {}
+    for network in networks.order_by("pk"):
+        parent_networks.setdefault(network.aggregate_id, network)
+
+    parents = PrefixTrie()
+    within = Q()
+    for agg in aggregates:
+        parents.setdefault(agg.prefix, agg)
+        within |= Q(prefix__net_contained=agg.prefix)
+
+    summary = dict.fromkeys(ReassignPlanActionChoices.values(), 0)
+    if not aggregates:
+        return {"rows": [], "summary": summary}
+
+    prefixes = (Prefix.objects.all() if prefixes is None else prefixes).filter(within)
+    rows = list(
+        prefixes.values(
+            "pk",
+            "prefix",
+            "status",
+            "vrf__name",
+            "tenant_id",
+            "tenant__name",
+            "_site_id",
+            "_site__name",
+            "_site__latitude",
+            "_site__longitude",
+            "_site__physical_address",
+        ).order_by("vrf__name", "prefix")
+    )
+    linked = dict(RIRNetwork.objects.filter(prefix__in=prefixes).values_list("prefix_id", "handle"))
+    detailed_tenants = set(
+        RIROrganization.objects.filter(tenant__prefixes__in=prefixes).values_list("tenant_id", flat=True)
+    )
+    sites_with_address = set(
+        RIRAddress.objects.filter(site__in=prefixes.values("_site"), location__isnull=True).values_list(
+            "site_id", flat=True
+        )
+    )
+    log.info(f"Planning {len(rows)} prefixes in {len(aggregates)} aggregates")
+
+    plan = []
+    for row in rows:
+        agg = parents.longest_match(row["prefix"])
+        parent_network = parent_networks.get(agg.pk)
+        entry = {
+            "prefix": str(row["prefix"]),
+            "prefix_id": row["pk"],
+            "vrf": row["vrf__name"] or "",
+            "status": row["status"],
+            "tenant": row["tenant__name"] or "",
+            "site": row["_site__name"] or "",
+            "aggregate": str(agg.prefix),
+            "parent_network": parent_network.handle if parent_network else "",
+            "existing_net": linked.get(row["pk"], ""),
+        }
+        entry["action"], entry["reason"] = _classify(row, parent_network, linked, detailed_tenants, sites_with_address)
+
+        if backend is not None and entry["action"] in ("simple", "detailed"):
+            network = ipaddress.ip_network(str(row["prefix"]), strict=False)
+            net = cached_find_net(
+                backend, parent_network.rir_config_id, str(network.network_address), str(network.broadcast_address)
+            )
+            handle = (net or {}).get("handle")
+            if handle and handle != parent_network.handle:
+                entry["action"] = "existing_net"
+                entry["reason"] = "Already reassigned at ARIN; would be synced instead"
+                entry["existing_net"] = handle
+
+        summary[entry["action"]] += 1
+        plan.append(entry)
+
+    duration = round(time.monotonic() - started, 3)
+    log.info(
+        f"Planned {len(plan)} prefixes in {duration}s: "
+        + ", ".join(f"{action}={count}" for action, count in summary.items())
+    )
+    return {"rows": plan, "summary": summary}
+
+
+def _classify(row, parent_network, linked, detailed_tenants, sites_with_address) -> tuple[str, str]:
+    if parent_network is None:
+        return "blocked", "Aggregate has no RIR network"
+    if row["pk"] in linked:
+        return "blocked", "Already reassigned"
+    if row["status"] != "active":
+        return "blocked", f"Prefix status is {row['status']}"
+    if not row["tenant_id"]:
+        return "blocked", "No tenant"
+    # Auto-reassign skips prefixes without a site, detailed ones included
+    if not row["_site_id"]:
+        return "blocked", "No site"
+    if row["tenant_id"] in detailed_tenants:
+        return "detailed", ""
+    if row["_site_id"] not in sites_with_address:
+        # Same inputs resolve_site_address geocodes from
+        if not ((row["_site__latitude"] and row["_site__longitude"]) or row["_site__physical_address"]):
+            return "blocked", "No address for site"
+        return "simple", "Site address will be geocoded"
+    return "simple", ""
+
+
+def plan_to_csv(rows: list[dict]) -> str:
+    """Render plan rows as CSV with a header line."""
+    output = io.StringIO()
+    writer = csv.DictWriter(output, fieldnames=PLAN_FIELDS)
+    writer.writeheader()
+    writer.writerows(rows)
+    return output.getvalue()
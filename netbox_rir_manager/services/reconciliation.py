@@ -0,0 +1,216 @@
+"""Set-based drift detection between NetBox IPAM and synced RIR records.
+
+Everything needed for one RIRConfig is loaded with a handful of queries and
+compared in memory: address ranges are reduced to ``(family, first, last)``
+integer tuples, exact matches use set/dict membership and containment in the
+(non-overlapping) managed aggregates uses a sorted interval list with bisect.
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from django.db.models import Q
+
+from netbox_rir_manager.choices import DriftClassChoices
+
+if TYPE_CHECKING:
+    from netbox_rir_manager.models import RIRConfig
+
+logger = logging.getLogger(__name__)
+
+# (IP version, first address as int, last address as int)
+AddressRange = tuple[int, int, int]
+
+
+@dataclass(frozen=True)
+class _PrefixRow:
+    pk: int
+    prefix: str
+    tenant_id: int | None
+    tenant_name: str
+    site_id: int | None
+
+
+class IntervalIndex:
+    """Sorted, non-overlapping address ranges supporting O(log n) containment lookups."""
+
+    def __init__(self, items):
+        ordered = sorted(items, key=lambda item: item[0])
+        self._starts = [(rng[0], rng[1]) for rng, _value in ordered]
+        self._items = ordered
+
+    def __len__(self):
+        return len(self._items)
+
+    def find(self, rng: AddressRange):
+        """Return the value of the interval containing ``rng``, or None."""
+        idx = bisect.bisect_right(self._starts, (rng[0], rng[1])) - 1
+        if idx < 0:
+            return None
+        (family, first, last), value = self._items[idx]
+        if family == rng[0] and first <= rng[1] and rng[2] <= last:
+            return value
+        return None
+
+
+def network_range(network) -> AddressRange:
+    """Return the integer range of a netaddr/ipaddress network."""
+    if hasattr(network, "first"):
+        return (network.version, network.first, network.last)
+    return (network.version, int(network.network_address), int(network.broadcast_address))
+
+
+def _normalize_name(value: str | None) -> str:
+    return " ".join((value or "").casefold().split())
+
+
+def _entry(prefix=None, prefix_id=None, network=None, network_id=None, detail=""):
+    return {
+        "prefix": prefix,
+        "prefix_id": prefix_id,
+        "network": network,
+        "network_id": network_id,
+        "detail": detail,
+    }
+
+
+def reconcile_rir_config(rir_config: RIRConfig, log: logging.Logger = logger) -> dict:
+    """
+    Compute NetBox <-> RIR drift for a config.
+
+    Returns a dict with ``summary`` (counts per drift class plus input sizes)
+    and ``drift`` (entries per drift class, see DriftClassChoices).
+    """
+    from ipam.models import Prefix
+
+    from netbox_rir_manager.models import RIRCustomer, RIRNetBlock, RIRNetwork
+
+    started = time.monotonic()
+    drift: dict[str, list[dict]] = {value: [] for value, _label, _color in DriftClassChoices.CHOICES}
+
+    # Aggregate-level NETs define which address space this config manages
+    parents = list(
+        RIRNetwork.objects.filter(rir_config=rir_config, aggregate__isnull=False).values_list(
+            "handle", "aggregate__prefix"
+        )
+    )
+    managed = IntervalIndex((network_range(agg_prefix), handle) for handle, agg_prefix in parents)
+    aggregate_ranges = {network_range(agg_prefix) for _handle, agg_prefix in parents}
+    log.info(f"Reconciling {rir_config.name}: {len(managed)} managed aggregates")
+
+    # Active prefixes under the managed aggregates, keyed by range and by pk
+    active_by_range: dict[AddressRange, _PrefixRow] = {}
+    active_by_id: dict[int, _PrefixRow] = {}
+    if parents:
+        within_managed = Q()
+        for _handle, agg_prefix in parents:
+            within_managed |= Q(prefix__net_contained_or_equal=agg_prefix)
+        rows = (
+            Prefix.objects.filter(within_managed, status="active")
+            .values_list("pk", "prefix", "tenant_id", "tenant__name", "_site_id")
+            .iterator(chunk_size=5000)
+        )
+        for pk, prefix, tenant_id, tenant_name, site_id in rows:
+            rng = network_range(prefix)
+            if rng in aggregate_ranges:
+                # The aggregate itself is covered by the parent allocation
+                continue
+            row = _PrefixRow(pk, str(prefix), tenant_id, tenant_name or "", site_id)
+            active_by_id[pk] = row
+            active_by_range.setdefault(rng, row)
+
+    customers = {
+        handle: (customer_name, tenant_id)
+        for handle, customer_name, tenant_id in RIRCustomer.objects.filter(rir_config=rir_config).values_list(
+            "handle", "customer_name", "tenant_id"
+        )
+    }
+
+    children = RIRNetwork.objects.filter(rir_config=rir_config, aggregate__isnull=True)
+    child_ranges: dict[int, list[AddressRange]] = {}
+    for net_id, family, start, end in (
+        RIRNetBlock.objects.filter(network__in=children)
+        .values_list("network_id", "family", "start_address", "end_address")
+        .iterator(chunk_size=5000)
+    ):
+        child_ranges.setdefault(net_id, []).append((family, int(start), int(end)))
+
+    covered_prefix_ids: set[int] = set()
+    network_count = 0
+    for net_id, handle, prefix_id, org_tenant_id, customer_handle in children.values_list(
+        "pk", "handle", "prefix_id", "organization__tenant_id", "raw_data__customer_handle"
+    ).iterator(chunk_size=5000):
+        network_count += 1
+        ranges = child_ranges.get(net_id, [])
+
+        row = active_by_id.get(prefix_id) if prefix_id else None
+        if row is None:
+            row = next((active_by_range[rng] for rng in ranges if rng in active_by_range), None)
+
+        if row is None:
+            if ranges and any(managed.find(rng) for rng in ranges):
+                drift["stale_net"].append(
+                    _entry(network=handle, network_id=net_id, detail="No active prefix matches this NET")
+                )
+            else:
+                drift["orphaned_net"].append(
+                    _entry(
+                        network=handle,
+                        network_id=net_id,
+                        detail="NET is outside every aggregate managed by this config",
+                    )
+                )
+            continue
+
+        covered_prefix_ids.add(row.pk)
+        if not row.tenant_id:
+            continue
+
+        if customer_handle and customer_handle in customers:
+            customer_name, customer_tenant_id = customers[customer_handle]
+            if customer_tenant_id:
+                mismatch = customer_tenant_id != row.tenant_id
+            else:
+                mismatch = _normalize_name(customer_name) != _normalize_name(row.tenant_name)
+            if mismatch:
+                drift["tenant_mismatch"].append(
+                    _entry(
+                        prefix=row.prefix,
+                        prefix_id=row.pk,
+                        network=handle,
+                        network_id=net_id,
+                        detail=f"Customer {customer_name!r} does not match tenant {row.tenant_name!r}",
+                    )
+                )
+        elif org_tenant_id and org_tenant_id != row.tenant_id:
+            drift["tenant_mismatch"].append(
+                _entry(
+                    prefix=row.prefix,
+                    prefix_id=row.pk,
+                    network=handle,
+                    network_id=net_id,
+                    detail=f"Organization is linked to a different tenant than {row.tenant_name!r}",
+                )
+            )
+
+    for row in active_by_id.values():
+        if row.pk in covered_prefix_ids or not row.site_id or not row.tenant_id:
+            continue
+        drift["missing_net"].append(
+            _entry(prefix=row.prefix, prefix_id=row.pk, detail=f"Active with site and tenant {row.tenant_name!r}")
+        )
+
+    summary = {value: len(entries) for value, entries in drift.items()}
+    summary["prefixes"] = len(active_by_id)
+    summary["networks"] = network_count
+    summary["duration"] = round(time.monotonic() - started, 3)
+    log.info(
+        f"Reconciliation of {rir_config.name} complete in {summary['duration']}s: "
+        + ", ".join(f"{value}={summary[value]}" for value in drift)
+    )
+    return {"summary": summary, "drift": drift}
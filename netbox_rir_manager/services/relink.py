@@ -0,0 +1,112 @@
+"""Batch relinking of RIRNetworks to NetBox Aggregates/Prefixes.
+
+``signals.auto_link_network`` does the same matching one network at a time
+with two queries per net block.  After a bulk import or an upgrade this
+service loads the candidate aggregates and prefixes into a PrefixTrie once,
+matches every unlinked network's CIDR blocks in memory and writes the links
+with a single ``bulk_update``.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import TYPE_CHECKING
+
+from django.db.models import Q
+
+from netbox_rir_manager.trie import PrefixTrie
+
+if TYPE_CHECKING:
+    from netbox_rir_manager.models import RIRConfig
+
+logger = logging.getLogger(__name__)
+
+BULK_UPDATE_BATCH_SIZE = 500
+
+
+def relink_networks(rir_config: RIRConfig | None = None, log: logging.Logger = logger) -> dict:
+    """
+    Link unlinked RIRNetworks to the Aggregate or Prefix matching one of their net blocks.
+
+    Matching follows auto_link_network: blocks are tried in order, an exact
+    Aggregate match wins over a Prefix match, and existing links are never
+    overwritten.  Only aggregates of the config's RIR (or of the RIRs of all
+    active configs) and the prefixes inside them are considered.
+
+    Returns a summary dict with counts of candidates and links written.
+    """
+    from ipam.models import Aggregate, Prefix
+
+    from netbox_rir_manager.models import RIRConfig, RIRNetBlock, RIRNetwork
+
+    started = time.monotonic()
+
+    networks = RIRNetwork.objects.filter(aggregate__isnull=True, prefix__isnull=True)
+    if rir_config is not None:
+        networks = networks.filter(rir_config=rir_config)
+        rir_ids = [rir_config.rir_id]
+    else:
+        rir_ids = list(RIRConfig.objects.filter(is_active=True).values_list("rir_id", flat=True).distinct())
+
+    # network_id -> [(family, start, cidr_length)] in raw_data order
+    blocks: dict[int, list[tuple[int, int, int]]] = {}
+    for network_id, family, start, cidr_length in (
+        RIRNetBlock.objects.filter(network__in=networks, cidr_length__isnull=False)
+        .order_by("pk")
+        .values_list("network_id", "family", "start_address", "cidr_length")
+        .iterator(chunk_size=5000)
+    ):
+        blocks.setdefault(network_id, []).append((family, int(start), cidr_length))
+
+    summary = {"candidates": len(blocks), "aggregates": 0, "prefixes": 0, "linked": 0}
+    if not blocks:
+        log.info("No unlinked networks with net blocks to relink")
+        return summary
+
+    aggregate_rows = list(Aggregate.objects.filter(rir_id__in=rir_ids).values_list("pk", "prefix"))
+    aggregates = PrefixTrie()
+    for pk, prefix in aggregate_rows:
+        aggregates.setdefault(prefix, pk)
+
+    prefixes = PrefixTrie()
+    if aggregate_rows:
+        within_aggregates = Q()
+        for _pk, prefix in aggregate_rows:
+            within_aggregates |= Q(prefix__net_contained_or_equal=prefix)
+        # Default Prefix ordering, so the first duplicate (e.g. across VRFs) wins as with .first()
+        for pk, prefix in (
+            Prefix.objects.filter(within_aggregates).values_list("pk", "prefix").iterator(chunk_size=5000)
+        ):
+            prefixes.setdefault(prefix, pk)
+    summary["aggregates"] = len(aggregates)
+    summary["prefixes"] = len(prefixes)
+    log.info(
+        f"Matching {len(blocks)} unlinked networks against {len(aggregates)} aggregates and {len(prefixes)} prefixes"
+    )
+
+    updates = []
+    for network_id, network_blocks in blocks.items():
+        for family, start, cidr_length in network_blocks:
+            key = (family, start, cidr_length)
+            aggregate_id = aggregates.get(key)
+            if aggregate_id is not None:
+                updates.append(RIRNetwork(pk=network_id, aggregate_id=aggregate_id, prefix_id=None))
+                break
+            prefix_id = prefixes.get(key)
+            if prefix_id is not None:
+                updates.append(RIRNetwork(pk=network_id, aggregate_id=None, prefix_id=prefix_id))
+                break
+
+    if updates:
+        from netbox_rir_manager.services.panels import invalidate_panels
+        from netbox_rir_manager.services.reassign_index import invalidate_reassign_index
+
+        RIRNetwork.objects.bulk_update(updates, ["aggregate", "prefix"], batch_size=BULK_UPDATE_BATCH_SIZE)
+        # bulk_update bypasses post_save, so the auto-reassign index and panels must be told explicitly
+        invalidate_reassign_index()
+        invalidate_panels()
+    summary["linked"] = len(updates)
+    summary["duration"] = round(time.monotonic() - started, 3)
+    log.info(f"Linked {len(updates)} of {len(blocks)} networks in {summary['duration']}s")
+    return summary
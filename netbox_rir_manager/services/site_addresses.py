@@ -0,0 +1,297 @@
+"""Resolution of site-level RIRAddresses for many Sites at once (ResolveSiteAddressesJob).
+
+Simple reassignments need an RIRAddress for the prefix's site, which
+``resolve_site_address`` otherwise geocodes in the middle of a reassignment.
+This service finds every Site without a site-level address in one query,
+geocodes them in a bounded thread pool through the configured (cached,
+rate-limited) geocoding service and writes the addresses with one
+``bulk_create``.
+
+A geocoded address that is already stored without a site or location (e.g.
+synced from ARIN) is linked to the site, as ``resolve_site_address`` does.
+Sites left without an address get an RIRSiteAddressSkip recording why, and
+are not geocoded again until their coordinates or physical address change.
+
+With ``refresh`` (RefreshSiteAddressesJob, queued by the Site signals) it also
+re-geocodes Sites whose auto-resolved address was marked stale because their
+physical address or coordinates changed.  A refreshed address that differs is
+linked to the site in place of the old one, which stays for the records that
+still point at it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING
+
+from django.db import connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from netbox_rir_manager.fingerprint import address_fingerprint
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from dcim.models import Region, Site
+    from tenancy.models import Tenant
+
+    from netbox_rir_manager.services.geocoding import GeocodingResult, GeocodingService
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONCURRENCY = 4
+PROGRESS_INTERVAL = 50
+
+
+def sites_without_address(region: Region | None = None, tenant: Tenant | None = None):
+    """Sites with coordinates or a physical address but no site-level RIRAddress."""
+    from dcim.models import Site
+
+    from netbox_rir_manager.models import RIRAddress
+
+    sites = Site.objects.exclude(
+        pk__in=RIRAddress.objects.filter(site__isnull=False, location__isnull=True).values("site_id")
+    ).filter(Q(latitude__isnull=False, longitude__isnull=False) | ~Q(physical_address=""))
+    if region is not None:
+        sites = sites.filter(region__in=region.get_descendants(include_self=True))
+    if tenant is not None:
+        sites = sites.filter(tenant=tenant)
+    return sites.order_by("pk")
+
+
+def site_source(site: Site) -> str:
+    """Hash of what is geocoded for ``site``; a skip recorded for another value is stale."""
+    key = f"{site.latitude}|{site.longitude}|{site.physical_address}"
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def stale_site_addresses():
+    """Auto-resolved site-level RIRAddresses marked stale (``last_resolved`` cleared) by a change to their Site."""
+    from netbox_rir_manager.models import RIRAddress
+
+    return RIRAddress.objects.filter(
+        site__isnull=False, location__isnull=True, auto_resolved=True, last_resolved__isnull=True
+    ).select_related("site")
+
+
+def resolve_site_addresses(
+    region: Region | None = None,
+    tenant: Tenant | None = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    progress: Callable[[dict], None] | None = None,
+    log: logging.Logger = logger,
+    refresh: bool = False,
+) -> dict:
+    """
+    Geocode every Site lacking a site-level RIRAddress and bulk-create the addresses.
+
+    Coordinates are reverse geocoded, otherwise the physical address is
+    forward geocoded, as in ``resolve_site_address``.  ``progress`` is called
+    with the running summary every ``PROGRESS_INTERVAL`` sites.
+
+    With ``refresh``, Sites with a stale address (``stale_site_addresses``)
+    are geocoded as well and counted under ``refreshed``.
+
+    Returns a summary dict with counts and the names of the sites left
+    unresolved.  A site whose geocoded address is already stored without a
+    site or location is linked to it (``linked``); one whose address belongs
+    to another site or location (addresses are unique) is reported under
+    ``duplicate``.  Unresolved and duplicate sites are recorded as
+    RIRSiteAddressSkip and counted under ``skipped`` by later runs until the
+    site's coordinates or physical address change.
+    """
+    from netbox_rir_manager.models import RIRAddress, RIRSiteAddressSkip
+    from netbox_rir_manager.services.geocoding import _get_geocoding_service
+
+    started = time.monotonic()
+    skips = dict(RIRSiteAddressSkip.objects.values_list("site_id", "source"))
+    sites = []
+    skipped = 0
+    for site in sites_without_address(region, tenant):
+        if skips.get(site.pk) == site_source(site):
+            skipped += 1
+        else:
+            sites.append(site)
+    stale = {address.site_id: address for address in stale_site_addresses()} if refresh else {}
+    sites.extend(address.site for address in stale.values())
+    summary = {
+        "sites": len(sites),
+        "geocoded": 0,
+        "created": 0,
+        "linked": 0,
+        "skipped": skipped,
+        "unresolved": [],
+        "duplicate": [],
+    }
+    if refresh:
+        summary["refreshed"] = 0
+    if not sites:
+        log.info("All sites already have an address")
+        return summary
+    log.info(f"Resolving addresses for {len(sites)} sites with concurrency {concurrency}")
+
+    geocoder = _get_geocoding_service()
+    results: dict[int, GeocodingResult] = {}
+    # site pk -> (reason, existing address pk) of the sites left without an address
+    skip_reasons: dict[int, tuple[str, int | None]] = {}
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        futures = {executor.submit(_geocode, geocoder, site): site for site in sites}
+        for done, future in enumerate(as_completed(futures), start=1):
+            site = futures[future]
+            try:
+                result = future.result()
+                failed = False
+            except Exception as exc:
+                log.warning(f"Geocoding site {site.name} raised: {exc}")
+                result = None
+                failed = True
+            if result is None:
+                summary["unresolved"].append(site.name)
+                # A provider error is not recorded: the next run tries again
+                if not failed and site.pk not in stale:
+                    skip_reasons[site.pk] = (RIRSiteAddressSkip.REASON_UNRESOLVED, None)
+            else:
+                results[site.pk] = result
+                summary["geocoded"] += 1
+            if progress is not None and done % PROGRESS_INTERVAL == 0:
+                progress({**summary, "done": done})
+
+    # Addresses are unique by fingerprint: link or skip those already stored, and skip repeats within the batch
+    fingerprints = {site_pk: address_fingerprint(*result.address_key) for site_pk, result in results.items()}
+    existing = {
+        fingerprint: (pk, site_id is None and location_id is None)
+        for fingerprint, pk, site_id, location_id in RIRAddress.objects.filter(
+            fingerprint__in=fingerprints.values()
+        ).values_list("fingerprint", "pk", "site_id", "location_id")
+    }
+    now = timezone.now()
+    addresses = []
+    linked_sites = []
+    sites_by_pk = {site.pk: site for site in sites}
+    for site_pk, result in sorted(results.items()):
+        if site_pk in stale:
+            outcome = _refresh_address(stale[site_pk], result, fingerprints[site_pk], now)
+            if outcome == "duplicate":
+                summary["duplicate"].append(sites_by_pk[site_pk].name)
+            elif outcome == "refreshed":
+                summary["refreshed"] += 1
+            continue
+        if fingerprints[site_pk] in existing:
+            address_pk, unowned = existing[fingerprints[site_pk]]
+            # The site_id check guards against another writer having linked it meanwhile
+            if unowned and RIRAddress.objects.filter(pk=address_pk, site__isnull=True).update(site_id=site_pk):
+                existing[fingerprints[site_pk]] = (address_pk, False)
+                linked_sites.append(site_pk)
+                summary["linked"] += 1
+            else:
+                summary["duplicate"].append(sites_by_pk[site_pk].name)
+                skip_reasons[site_pk] = (RIRSiteAddressSkip.REASON_DUPLICATE, address_pk)
+            continue
+        existing[fingerprints[site_pk]] = (None, False)
+        addresses.append(
+            RIRAddress(
+                site_id=site_pk,
+                fingerprint=fingerprints[site_pk],
+                street_address=result.street_address,
+                city=result.city,
+                state_province=result.state_province,
+                postal_code=result.postal_code,
+                country=result.country,
+                raw_geocode=result.raw,
+                auto_resolved=True,
+                last_resolved=now,
+            )
+        )
+    RIRAddress.objects.bulk_create(addresses, ignore_conflicts=True)
+    _record_skips(skip_reasons, sites_by_pk, resolved=[address.site_id for address in addresses] + linked_sites)
+    if addresses or linked_sites or summary.get("refreshed"):
+        from netbox_rir_manager.services.panels import invalidate_panels
+
+        # bulk_create and update() bypass post_save
+        invalidate_panels()
+    summary["created"] = RIRAddress.objects.filter(
+        site_id__in=[address.site_id for address in addresses], location__isnull=True
+    ).count()
+    summary["duration"] = round(time.monotonic() - started, 3)
+    log.info(
+        f"Created {summary['created']} and linked {summary['linked']} of {len(sites)} site addresses "
+        f"in {summary['duration']}s "
+        + (f"and refreshed {summary['refreshed']} " if refresh else "")
+        + f"({len(summary['unresolved'])} unresolved, {len(summary['duplicate'])} duplicate, "
+        f"{skipped} skipped from earlier runs)"
+    )
+    return summary
+
+
+def _record_skips(skip_reasons: dict[int, tuple[str, int | None]], sites_by_pk: dict, resolved: list[int]) -> None:
+    """Record why sites were left without an address, and forget the skips of sites that now have one."""
+    from netbox_rir_manager.models import RIRSiteAddressSkip
+
+    RIRSiteAddressSkip.objects.filter(site_id__in=resolved).delete()
+    RIRSiteAddressSkip.objects.bulk_create(
+        [
+            RIRSiteAddressSkip(
+                site_id=site_pk, reason=reason, source=site_source(sites_by_pk[site_pk]), address_id=address_pk
+            )
+            for site_pk, (reason, address_pk) in skip_reasons.items()
+        ],
+        update_conflicts=True,
+        unique_fields=["site"],
+        update_fields=["reason", "source", "address", "created"],
+    )
+
+
+def _refresh_address(address, result: GeocodingResult, fingerprint: str, now) -> str:
+    """
+    Bring a stale site address up to date with a new geocoding result.
+
+    Returns ``unchanged`` if the site still resolves to the same address,
+    ``refreshed`` if another address now serves the site, or ``duplicate`` if
+    the new address is linked to another site or location (the old one is kept).
+    """
+    from netbox_rir_manager.models import RIRAddress
+
+    if fingerprint == address.fingerprint:
+        RIRAddress.objects.filter(pk=address.pk).update(raw_geocode=result.raw, last_resolved=now)
+        return "unchanged"
+
+    with transaction.atomic():
+        current = RIRAddress.objects.select_for_update().filter(fingerprint=fingerprint).first()
+        if current is not None and (current.site_id is not None or current.location_id is not None):
+            # Keep the old address rather than leave the site without one; retried on the next change
+            RIRAddress.objects.filter(pk=address.pk).update(last_resolved=now)
+            return "duplicate"
+        # The old address stays for the organizations, contacts and customers still pointing at it
+        RIRAddress.objects.filter(pk=address.pk).update(site=None, last_resolved=now)
+        if current is not None:
+            RIRAddress.objects.filter(pk=current.pk).update(site_id=address.site_id)
+        else:
+            RIRAddress.objects.create(
+                site_id=address.site_id,
+                street_address=result.street_address,
+                city=result.city,
+                state_province=result.state_province,
+                postal_code=result.postal_code,
+                country=result.country,
+                raw_geocode=result.raw,
+                auto_resolved=True,
+                last_resolved=now,
+            )
+    return "refreshed"
+
+
+def _geocode(geocoder: GeocodingService, site: Site) -> GeocodingResult | None:
+    try:
+        result = None
+        if site.latitude and site.longitude:
+            result = geocoder.reverse_geocode(float(site.latitude), float(site.longitude))
+        if result is None and site.physical_address:
+            result = geocoder.geocode(site.physical_address)
+        return result
+    finally:
+        # The geocode cache opens a connection in this pool thread; don't leave it behind
+        connection.close()
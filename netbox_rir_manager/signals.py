@@ -1,16 +1,124 @@
-import ipaddress
 import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 
 from django.conf import settings
-from django.db.models.signals import post_save, pre_delete
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
 from django.dispatch import receiver
 
 logger = logging.getLogger(__name__)
 
+# URL name suffixes of NetBox's bulk UI views
+BULK_VIEW_SUFFIXES = ("_bulk_import", "_bulk_edit", "_bulk_delete", "_bulk_rename")
+# REST API list endpoints update and delete in bulk; a POST creates in bulk only with a list payload
+BULK_API_METHODS = ("PUT", "PATCH", "DELETE")
+# Site fields a site-level RIRAddress is geocoded from
+SITE_ADDRESS_FIELDS = ("physical_address", "latitude", "longitude")
+
+
+@dataclass
+class DeferredPrefixWork:
+    """Prefix changes recorded while signal work is deferred, flushed once on commit."""
+
+    saved_prefix_ids: set[int] = field(default_factory=set)
+    removed_network_ids: set[int] = field(default_factory=set)
+    scheduled: bool = False
+
+    def __bool__(self):
+        return bool(self.saved_prefix_ids or self.removed_network_ids)
+
+    def schedule(self):
+        """Register a single on_commit flush for everything recorded so far."""
+        if not self.scheduled:
+            self.scheduled = True
+            transaction.on_commit(self.flush)
+
+    def flush(self):
+        saved, removed = self.saved_prefix_ids, self.removed_network_ids
+        self.saved_prefix_ids, self.removed_network_ids = set(), set()
+        self.scheduled = False
+        if saved or removed:
+            flush_deferred_prefix_work(saved, removed)
+
+
+_deferred_work: ContextVar[DeferredPrefixWork | None] = ContextVar("netbox_rir_manager_deferred_work", default=None)
+
+
+@contextmanager
+def defer_prefix_signals():
+    """Defer the plugin's Prefix signal work until the surrounding transaction commits.
+
+    Inside the block, Prefix post_save/pre_delete handlers only record the
+    affected ids; one set-based pass then evaluates reassignment and removal
+    eligibility. Nested uses join the outermost block. Nothing is flushed if
+    the block raises.
+    """
+    if _deferred_work.get() is not None:
+        yield _deferred_work.get()
+        return
+
+    work = DeferredPrefixWork()
+    token = _deferred_work.set(work)
+    try:
+        yield work
+    finally:
+        _deferred_work.reset(token)
+    if work:
+        work.schedule()
+
+
+def _is_bulk_request(request) -> bool:
+    match = getattr(request, "resolver_match", None)
+    if match is None or not match.url_name:
+        return False
+    if match.url_name.endswith(BULK_VIEW_SUFFIXES):
+        return True
+    if not match.url_name.endswith("-list"):
+        return False
+    if request.method == "POST":
+        # Set by BulkPayloadMiddleware
+        return getattr(request, "_rir_manager_list_payload", False)
+    return request.method in BULK_API_METHODS
+
+
+def _active_deferred_work() -> DeferredPrefixWork | None:
+    """Return the work collector for the explicit deferral block or the current bulk request."""
+    work = _deferred_work.get()
+    if work is not None:
+        return work
+
+    from netbox.context import current_request
+
+    request = current_request.get()
+    # Deferring needs a transaction to flush on; outside one, handle objects inline
+    if request is None or not transaction.get_connection().in_atomic_block or not _is_bulk_request(request):
+        return None
+    work = getattr(request, "_rir_manager_deferred_work", None)
+    if work is None:
+        work = request._rir_manager_deferred_work = DeferredPrefixWork()
+    work.schedule()
+    return work
+
+
+@receiver(post_save, sender="netbox_rir_manager.RIRNetwork")
+def sync_network_net_blocks(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    """Keep the indexed RIRNetBlock rows in step with raw_data["net_blocks"].
+
+    Registered before auto_link_network so the blocks are current when it
+    runs.  The rows are only rewritten when the blocks changed.
+    """
+    if raw:
+        return
+    if update_fields is not None and "raw_data" not in update_fields:
+        return
+    instance.sync_net_blocks()
+
 
 @receiver(post_save, sender="netbox_rir_manager.RIRNetwork")
 def auto_link_network(sender, instance, created, raw=False, **kwargs):
-    """Auto-link RIRNetwork to matching Aggregate/Prefix based on net_blocks in raw_data."""
+    """Auto-link RIRNetwork to matching Aggregate/Prefix based on its net blocks."""
     if raw:
         return
 
@@ -22,24 +130,13 @@ def auto_link_network(sender, instance, created, raw=False, **kwargs):
     if instance.aggregate is not None or instance.prefix is not None:
         return
 
-    net_blocks = (instance.raw_data or {}).get("net_blocks", [])
-    if not net_blocks:
+    prefixes = [block.prefix for block in instance.net_blocks.filter(cidr_length__isnull=False).order_by("pk")]
+    if not prefixes:
         return
 
     from ipam.models import Aggregate, Prefix
 
-    for block in net_blocks:
-        start = block.get("start_address")
-        cidr = block.get("cidr_length")
-        if not start or cidr is None:
-            continue
-
-        try:
-            network = ipaddress.ip_network(f"{start}/{cidr}", strict=False)
-            prefix_str = str(network)
-        except ValueError:
-            continue
-
+    for prefix_str in prefixes:
         # Try matching Aggregate first
         agg = Aggregate.objects.filter(prefix=prefix_str).first()
         if agg:
@@ -55,6 +152,92 @@ def auto_link_network(sender, instance, created, raw=False, **kwargs):
             return
 
 
+def _auto_resolve_site_addresses() -> bool:
+    plugin_config = settings.PLUGINS_CONFIG.get("netbox_rir_manager", {})
+    return plugin_config.get("auto_resolve_site_addresses", True)
+
+
+@receiver(pre_save, sender="dcim.Site")
+def track_site_address_change(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Note on the instance whether a saved Site's physical address or coordinates changed."""
+    instance._rir_address_changed = False
+    if raw or instance._state.adding or not _auto_resolve_site_addresses():
+        return
+    if update_fields is not None and not set(SITE_ADDRESS_FIELDS) & set(update_fields):
+        return
+    previous = sender.objects.filter(pk=instance.pk).values_list(*SITE_ADDRESS_FIELDS).first()
+    if previous is None:
+        return
+    # Compare as stored: forms and the API may hand over coordinates as str or float
+    current = tuple(instance._meta.get_field(name).to_python(getattr(instance, name)) for name in SITE_ADDRESS_FIELDS)
+    instance._rir_address_changed = previous != current
+
+
+@receiver(post_save, sender="dcim.Site")
+def queue_site_address_resolution(sender, instance, created=False, raw=False, **kwargs):
+    """
+    Resolve a Site's address in the background when it is created or moved.
+
+    A changed physical address or coordinates marks the site's auto-resolved
+    RIRAddress stale; either way a RefreshSiteAddressesJob is queued on
+    commit, debounced by ``site_address_delay``, so reassignments find the
+    address ready instead of geocoding it in the middle of the job.
+    """
+    if raw or not (created or getattr(instance, "_rir_address_changed", False)):
+        return
+    instance._rir_address_changed = False
+    if not _auto_resolve_site_addresses():
+        return
+    if not (instance.latitude is not None and instance.longitude is not None) and not instance.physical_address:
+        return
+
+    if not created:
+        from netbox_rir_manager.models import RIRAddress
+
+        # Marker only; the refresh job geocodes and records the change
+        RIRAddress.objects.filter(site=instance, location__isnull=True, auto_resolved=True).update(last_resolved=None)
+
+    from netbox_rir_manager.jobs import RefreshSiteAddressesJob
+
+    transaction.on_commit(RefreshSiteAddressesJob.enqueue_debounced)
+
+
+@receiver([post_save, post_delete], sender="netbox_rir_manager.RIRNetwork")
+@receiver([post_save, post_delete], sender="netbox_rir_manager.RIRUserKey")
+@receiver([post_save, post_delete], sender="ipam.Aggregate")
+def invalidate_prefix_index(sender, raw=False, **kwargs):
+    """Mark the in-process auto-reassign index stale in every process.
+
+    Bumped immediately (so this process sees its own writes inside a
+    transaction) and again on commit (so other processes cannot rebuild from
+    pre-commit data and keep it).  Inside ``batched_invalidation()`` both
+    happen once, at the end of the block.
+    """
+    from netbox_rir_manager.services.reassign_index import invalidate_reassign_index, invalidation_batched
+
+    invalidate_reassign_index()
+    # A batch bumps it on commit itself, once
+    if not invalidation_batched():
+        transaction.on_commit(invalidate_reassign_index)
+
+
+@receiver([post_save, post_delete], sender="netbox_rir_manager.RIRNetwork")
+@receiver([post_save, post_delete], sender="netbox_rir_manager.RIRAddress")
+@receiver([post_save, post_delete], sender="netbox_rir_manager.RIRConfig")
+@receiver([post_save, post_delete], sender="netbox_rir_manager.RIROrganization")
+@receiver([post_save, post_delete], sender="ipam.Aggregate")
+def invalidate_rir_panels(sender, raw=False, **kwargs):
+    """Change the version of every lazily loaded RIR panel, so browsers fetch them afresh.
+
+    Bumped immediately and again on commit, like the auto-reassign index, so
+    a panel fetched before the commit is not cached under the new version.
+    """
+    from netbox_rir_manager.services.panels import invalidate_panels
+
+    invalidate_panels()
+    transaction.on_commit(invalidate_panels)
+
+
 @receiver(post_save, sender="ipam.Prefix")
 def auto_reassign_prefix(sender, instance, created=False, raw=False, **kwargs):
     """
@@ -67,70 +250,78 @@ def auto_reassign_prefix(sender, instance, created=False, raw=False, **kwargs):
     3. No existing RIRNetwork linked to this prefix
     4. Parent aggregate has a linked RIRNetwork with auto_reassign=True
     5. At least one RIRUserKey exists for the RIRConfig
+
+    Conditions 1-5 are evaluated from in-memory state (the prefix's cached FK
+    ids and the auto-reassign index), so prefixes outside managed aggregates
+    cost no queries. Qualifying prefixes are recorded in RIRPendingReassign and
+    processed in batches by ProcessPendingReassignsJob rather than one job per
+    prefix.
     """
     if raw:
         return
 
-    if instance.status != "active":
+    work = _active_deferred_work()
+    if work is not None:
+        work.saved_prefix_ids.add(instance.pk)
         return
 
-    from dcim.models import Site
-    from ipam.models import Aggregate
-
-    from netbox_rir_manager.models import RIRNetwork, RIRUserKey
-
-    # 1. Check for site - Prefix.scope is a GenericFK via CachedScopeMixin
-    site = getattr(instance, "_site", None)
-    if site is None:
-        scope = getattr(instance, "scope", None)
-        if isinstance(scope, Site):
-            site = scope
-    if not site:
+    if instance.status != "active":
         return
 
-    # 2. Check for tenant
-    if not instance.tenant:
+    # 1-2. Site and tenant; CachedScopeMixin keeps _site in step with scope
+    if not getattr(instance, "_site_id", None) or not instance.tenant_id:
         return
 
+    from netbox_rir_manager.services.reassign_index import get_reassign_index
+
+    index = get_reassign_index()
+
     # 3. Check no existing RIRNetwork for this prefix
-    if RIRNetwork.objects.filter(prefix=instance).exists():
+    if index.has_network(instance.pk):
         return
 
     # 4. Find parent aggregate with auto_reassign RIRNetwork
-    agg = Aggregate.objects.filter(prefix__net_contains_or_equals=instance.prefix).first()
-    if not agg:
-        return
-
-    parent_network = RIRNetwork.objects.filter(aggregate=agg, auto_reassign=True).first()
-    if not parent_network:
+    parent = index.find_parent(instance.prefix)
+    if parent is None:
         return
 
     # 5. Find a user key for the RIR config
-    user_key = RIRUserKey.objects.filter(rir_config=parent_network.rir_config).first()
-    if not user_key:
+    if parent.user_key_id is None:
         logger.warning(
             "Auto-reassign skipped for prefix %s: no API key for config %s",
             instance.prefix,
-            parent_network.rir_config.name,
+            parent.rir_config_name,
         )
         return
 
-    # Enqueue the reassign job
-    from netbox_rir_manager.jobs import ReassignJob
+    from netbox_rir_manager.models import RIRNetwork
+
+    # Confirm against the database; the index may miss writes that bypassed signals
+    if not RIRNetwork.objects.filter(
+        pk=parent.network_id, aggregate_id=parent.aggregate_id, auto_reassign=True
+    ).exists():
+        return
+
+    # Queue the prefix; repeated saves before the batch runs coalesce into one row
+    from netbox_rir_manager.jobs import ProcessPendingReassignsJob
+    from netbox_rir_manager.models import RIRPendingReassign
 
     logger.info(
-        "Auto-reassign triggered for prefix %s (tenant=%s, site=%s)",
+        "Auto-reassign queued for prefix %s (tenant=%s, site=%s)",
         instance.prefix,
         instance.tenant.name,
-        site.name,
+        instance._site.name,
     )
 
-    ReassignJob.enqueue(
-        instance=parent_network.rir_config,
-        user=user_key.user,
-        prefix_id=instance.pk,
-        user_key_id=user_key.pk,
+    RIRPendingReassign.objects.update_or_create(
+        prefix=instance,
+        defaults={
+            "rir_config_id": parent.rir_config_id,
+            "parent_network_id": parent.network_id,
+            "user_key_id": parent.user_key_id,
+        },
     )
+    transaction.on_commit(ProcessPendingReassignsJob.enqueue_debounced)
 
 
 @receiver(post_save, sender="ipam.Prefix")
@@ -139,9 +330,20 @@ def remove_network_on_prefix_deactivate(sender, instance, created=False, raw=Fal
     if raw or created:
         return
 
+    work = _active_deferred_work()
+    if work is not None:
+        # Evaluated together with reassignment when the work is flushed
+        work.saved_prefix_ids.add(instance.pk)
+        return
+
     if instance.status == "active":
         return
 
+    from netbox_rir_manager.services.reassign_index import get_reassign_index
+
+    if not get_reassign_index().has_child_networks(instance.pk):
+        return
+
     from netbox_rir_manager.models import RIRNetwork
 
     rir_networks = RIRNetwork.objects.filter(prefix=instance, aggregate__isnull=True)
@@ -162,6 +364,18 @@ def remove_rir_network_on_prefix_delete(sender, instance, **kwargs):
     Uses pre_delete because after deletion SET_NULL clears the FK link.
     Only removes child reassignments (prefix-only, no aggregate).
     """
+    from netbox_rir_manager.services.reassign_index import get_reassign_index
+
+    index = get_reassign_index()
+    if not index.has_child_networks(instance.pk):
+        return
+
+    work = _active_deferred_work()
+    if work is not None:
+        # The FK is cleared on delete, so remember the networks themselves
+        work.removed_network_ids.update(index.child_networks[instance.pk])
+        return
+
     from netbox_rir_manager.models import RIRNetwork
 
     rir_networks = RIRNetwork.objects.filter(prefix=instance, aggregate__isnull=True)
@@ -172,3 +386,102 @@ def remove_rir_network_on_prefix_delete(sender, instance, **kwargs):
                 network.handle,
                 network.rir_config.name,
             )
+
+
+def flush_deferred_prefix_work(prefix_ids: set[int], removed_network_ids: set[int]) -> None:
+    """Evaluate deferred Prefix changes with set-based queries.
+
+    Mirrors auto_reassign_prefix, remove_network_on_prefix_deactivate and
+    remove_rir_network_on_prefix_delete for many prefixes at once.
+    """
+    from ipam.models import Prefix
+
+    from netbox_rir_manager.models import RIRNetwork, RIRPendingReassign, RIRUserKey
+    from netbox_rir_manager.services.reassign_index import get_reassign_index
+
+    # Removals: child NETs of deleted prefixes and of saved prefixes that are no longer active
+    removals = set(removed_network_ids)
+    if prefix_ids:
+        removals.update(
+            RIRNetwork.objects.filter(prefix_id__in=prefix_ids, aggregate__isnull=True)
+            .exclude(prefix__status="active")
+            .values_list("pk", flat=True)
+        )
+    if removals:
+        networks = list(
+            RIRNetwork.objects.filter(pk__in=removals, aggregate__isnull=True).values_list(
+                "pk", "handle", "rir_config_id", "rir_config__name"
+            )
+        )
+        keyed_configs = set(
+            RIRUserKey.objects.filter(rir_config_id__in={network[2] for network in networks}).values_list(
+                "rir_config_id", flat=True
+            )
+        )
+        network_ids = []
+        for pk, handle, rir_config_id, rir_config_name in networks:
+            if rir_config_id not in keyed_configs:
+                logger.warning("Cannot remove ARIN network %s: no API key for config %s", handle, rir_config_name)
+                continue
+            network_ids.append(pk)
+        if network_ids:
+            from netbox_rir_manager.jobs import BatchRemoveNetworkJob
+
+            # One job for all removals; it groups them by config with one backend each
+            BatchRemoveNetworkJob.enqueue(network_ids=network_ids)
+        logger.info("Deferred prefix changes: %d ARIN removals queued", len(network_ids))
+
+    if not prefix_ids:
+        return
+
+    # Reassignments: active prefixes with site and tenant, no RIRNetwork, under an auto-reassign parent
+    index = get_reassign_index()
+    candidates = {}
+    for pk, prefix in (
+        Prefix.objects.filter(pk__in=prefix_ids, status="active", tenant__isnull=False, _site__isnull=False)
+        .exclude(rir_networks__isnull=False)
+        .values_list("pk", "prefix")
+    ):
+        parent = index.find_parent(prefix)
+        if parent is None:
+            continue
+        if parent.user_key_id is None:
+            logger.warning(
+                "Auto-reassign skipped for prefix %s: no API key for config %s",
+                prefix,
+                parent.rir_config_name,
+            )
+            continue
+        candidates[pk] = parent
+    if not candidates:
+        return
+
+    valid_parents = set(
+        RIRNetwork.objects.filter(
+            pk__in={parent.network_id for parent in candidates.values()}, auto_reassign=True
+        ).values_list("pk", flat=True)
+    )
+    pending = [
+        RIRPendingReassign(
+            prefix_id=pk,
+            rir_config_id=parent.rir_config_id,
+            parent_network_id=parent.network_id,
+            user_key_id=parent.user_key_id,
+        )
+        for pk, parent in candidates.items()
+        if parent.network_id in valid_parents
+    ]
+    if not pending:
+        return
+
+    RIRPendingReassign.objects.bulk_create(
+        pending,
+        update_conflicts=True,
+        unique_fields=["prefix"],
+        update_fields=["rir_config", "parent_network", "user_key"],
+    )
+    logger.info("Deferred prefix changes: %d prefixes queued for auto-reassignment", len(pending))
+
+    from netbox_rir_manager.jobs import ProcessPendingReassignsJob
+
+    ProcessPendingReassignsJob.enqueue_debounced()
@@ -0,0 +1,122 @@
+"""ISO-3166-2 subdivision codes by name.
+
+Geocoders return state and province names ("Québec", "Bavaria", "Région
+wallonne"), while RIR addresses need the subdivision code ("QC", "BY", "WAL").
+The index maps ``(country, normalised name)`` to the code for every name a
+subdivision is known by: its ISO name, the English translation shipped with
+pycountry, the un-inverted form of names like "wallonne, Région", its code and
+a few common English exonyms.  Names are normalised by stripping accents,
+case and punctuation, expanding abbreviations and dropping generic words such
+as "Province", so each lookup is one dict probe.
+
+pycountry's database is loaded and indexed once per process, on first use.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import threading
+import unicodedata
+
+logger = logging.getLogger(__name__)
+
+_ABBREVIATIONS = {"st": "saint", "ste": "sainte", "mt": "mount", "ft": "fort", "&": "and"}
+_GENERIC_WORDS = frozenset(
+    {"the", "of", "de", "state", "province", "provincia", "region", "estado", "prefecture", "oblast"}
+)
+
+# English names Nominatim returns that neither the ISO name nor pycountry's translations cover
+_ALIASES = {
+    "DE": {
+        "Lower Saxony": "NI",
+        "North Rhine-Westphalia": "NW",
+        "Rhineland-Palatinate": "RP",
+        "Saxony": "SN",
+        "Saxony-Anhalt": "ST",
+        "Thuringia": "TH",
+        "Hesse": "HE",
+        "Mecklenburg-Western Pomerania": "MV",
+        "Mecklenburg-Vorpommern": "MV",
+    },
+    "IT": {"Lombardy": "25", "Piedmont": "21", "Tuscany": "52", "Sardinia": "88", "Sicily": "82", "Apulia": "75"},
+    "ES": {"Catalonia": "CT", "Andalusia": "AN", "Basque Country": "PV", "Balearic Islands": "IB"},
+    "MX": {"Mexico City": "CMX"},
+}
+
+_index: dict[tuple[str, str], str] | None = None
+_index_lock = threading.Lock()
+
+
+def normalize_subdivision_name(name: str) -> str:
+    """Accent-, case- and punctuation-insensitive form of a subdivision name."""
+    decomposed = unicodedata.normalize("NFKD", name)
+    ascii_name = "".join(char for char in decomposed if not unicodedata.combining(char)).casefold()
+    words = re.sub(r"[^\w&]+", " ", ascii_name.replace("&", " & ")).split()
+    words = [_ABBREVIATIONS.get(word, word) for word in words]
+    kept = [word for word in words if word not in _GENERIC_WORDS]
+    # A name made only of generic words ("State") keeps them
+    return " ".join(kept or words)
+
+
+def _name_variants(name: str) -> list[str]:
+    variants = [name]
+    # ISO 3166-2 inverts some names: "wallonne, Région" is "Région wallonne"
+    if ", " in name:
+        head, _, tail = name.partition(", ")
+        variants.append(f"{tail} {head}")
+    # "Catalunya [Cataluña]", "Distrito Federal (Ciudad de México)": index both parts
+    match = re.fullmatch(r"(.+?)\s*[\[(](.+)[\])]", name)
+    if match:
+        variants.extend(match.groups())
+    return variants
+
+
+def _build_index() -> dict[tuple[str, str], str]:
+    import gettext
+
+    import pycountry
+
+    try:
+        english = gettext.translation("iso3166-2", pycountry.LOCALES_DIR, languages=["en"])
+    except OSError:
+        english = gettext.NullTranslations()
+
+    index: dict[tuple[str, str], str] = {}
+
+    def add(country: str, name: str, code: str) -> None:
+        for variant in _name_variants(name):
+            key = normalize_subdivision_name(variant)
+            if key:
+                index.setdefault((country, key), code)
+
+    # Top-level subdivisions first, so they win when a name is shared with a child
+    subdivisions = sorted(pycountry.subdivisions, key=lambda sub: sub.parent_code is not None)
+    for sub in subdivisions:
+        code = sub.code.split("-", 1)[-1]
+        add(sub.country_code, code, code)
+        add(sub.country_code, sub.name, code)
+        add(sub.country_code, english.gettext(sub.name), code)
+    for country, aliases in _ALIASES.items():
+        for name, code in aliases.items():
+            add(country, name, code)
+
+    logger.debug("Built subdivision index with %d names", len(index))
+    return index
+
+
+def get_subdivision_index() -> dict[tuple[str, str], str]:
+    """Return the process-wide subdivision index, building it on first use."""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = _build_index()
+    return _index
+
+
+def subdivision_code(country_code: str, name: str) -> str | None:
+    """ISO-3166-2 code without the country prefix (``"QC"``) for a subdivision name, or None."""
+    if not country_code or not name:
+        return None
+    return get_subdivision_index().get((country_code.upper(), normalize_subdivision_name(name)))
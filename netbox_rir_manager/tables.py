@@ -8,9 +8,11 @@ from netbox_rir_manager.models import (
     RIRCustomer,
     RIRNetwork,
     RIROrganization,
+    RIRReconciliationReport,
     RIRSyncLog,
     RIRTicket,
     RIRUserKey,
+    RIRWriteOperation,
 )
 
 RIRCONFIG_SYNC_BUTTON = """
@@ -193,6 +195,42 @@ class RIRSyncLogTable(NetBoxTable):
         default_columns = ("rir_config", "operation", "object_type", "object_handle", "status", "created")
 
 
+class RIRReconciliationReportTable(NetBoxTable):
+    id = tables.Column(linkify=True, verbose_name="ID")
+    rir_config = tables.Column(linkify=True)
+    total_drift = tables.Column()
+    missing_net = tables.Column(accessor="summary__missing_net", verbose_name="Prefixes Without NET")
+    stale_net = tables.Column(accessor="summary__stale_net", verbose_name="NETs Without Prefix")
+    tenant_mismatch = tables.Column(accessor="summary__tenant_mismatch", verbose_name="Tenant Mismatches")
+    orphaned_net = tables.Column(accessor="summary__orphaned_net", verbose_name="Orphaned NETs")
+    created = columns.DateTimeColumn()
+    actions = columns.ActionsColumn(actions=("delete", "changelog"))
+
+    class Meta(NetBoxTable.Meta):
+        model = RIRReconciliationReport
+        fields = (
+            "pk",
+            "id",
+            "rir_config",
+            "total_drift",
+            "missing_net",
+            "stale_net",
+            "tenant_mismatch",
+            "orphaned_net",
+            "created",
+        )
+        default_columns = (
+            "id",
+            "rir_config",
+            "total_drift",
+            "missing_net",
+            "stale_net",
+            "tenant_mismatch",
+            "orphaned_net",
+            "created",
+        )
+
+
 class RIRTicketTable(NetBoxTable):
     ticket_number = tables.Column(linkify=True)
     ticket_type = tables.Column()
@@ -226,6 +264,45 @@ class RIRTicketTable(NetBoxTable):
         )
 
 
+class RIRWriteOperationTable(NetBoxTable):
+    id = tables.Column(linkify=True, verbose_name="ID")
+    operation = tables.Column()
+    network_handle = tables.Column(verbose_name="Network")
+    status = tables.Column()
+    rir_config = tables.Column(linkify=True)
+    ticket = tables.Column(linkify=True)
+    attempts = tables.Column()
+    message = tables.Column()
+    created = columns.DateTimeColumn()
+    completed = columns.DateTimeColumn()
+    actions = columns.ActionsColumn(actions=("delete", "changelog"))
+
+    class Meta(NetBoxTable.Meta):
+        model = RIRWriteOperation
+        fields = (
+            "pk",
+            "id",
+            "operation",
+            "network_handle",
+            "status",
+            "rir_config",
+            "ticket",
+            "attempts",
+            "message",
+            "created",
+            "completed",
+        )
+        default_columns = (
+            "id",
+            "operation",
+            "network_handle",
+            "status",
+            "ticket",
+            "created",
+            "completed",
+        )
+
+
 class RIRUserKeyTable(NetBoxTable):
     user = tables.Column(linkify=True)
     rir_config = tables.Column(linkify=True)
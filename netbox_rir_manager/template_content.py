@@ -1,90 +1,169 @@
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from django.db.models import Exists, OuterRef
+from django.urls import reverse
 from netbox.plugins import PluginTemplateExtension
 
-from netbox_rir_manager.models import RIRAddress, RIRNetwork
+from netbox_rir_manager.models import RIRAddress, RIRConfig, RIRNetwork
 
 
-class RIRAggregateExtension(PluginTemplateExtension):
-    """Show RIR network info with sync button on Aggregate detail page."""
+class PageResolver:
+    """Memoised lookups shared by the template extensions and panels rendered for one request.
 
-    models = ["ipam.aggregate"]
+    Extension methods and panels need the same parent aggregate, RIR networks
+    and configs; each lookup runs at most once per request, so they add a
+    constant number of queries.  Obtain it with ``get_page_resolver``.
+    """
 
-    def right_page(self):
-        obj = self.context["object"]
-        rir_networks = RIRNetwork.objects.filter(aggregate=obj)
-        from netbox_rir_manager.models import RIRConfig
+    def __init__(self):
+        self._memo = {}
 
-        has_rir_config = RIRConfig.objects.filter(rir=obj.rir, is_active=True).exists()
-        return self.render(
-            "netbox_rir_manager/inc/rir_network_panel.html",
-            extra_context={
-                "rir_networks": rir_networks,
-                "show_sync_button": has_rir_config,
-                "aggregate_pk": obj.pk,
-            },
+    def _cached(self, key, fetch):
+        if key not in self._memo:
+            self._memo[key] = fetch()
+        return self._memo[key]
+
+    def active_config_rir_ids(self) -> set[int]:
+        """RIRs with an active RIRConfig."""
+        return self._cached(
+            "active_config_rir_ids",
+            lambda: set(RIRConfig.objects.filter(is_active=True).values_list("rir_id", flat=True)),
         )
 
+    def parent_aggregate(self, prefix):
+        """The Aggregate containing ``prefix``, annotated with ``has_rir_networks``, or None."""
+        from ipam.models import Aggregate
 
-class RIRPrefixExtension(PluginTemplateExtension):
-    """Show RIR network info and reassign button on Prefix detail page."""
+        return self._cached(
+            ("parent_aggregate", prefix.pk),
+            lambda: (
+                Aggregate.objects.filter(prefix__net_contains_or_equals=prefix.prefix)
+                .annotate(has_rir_networks=Exists(RIRNetwork.objects.filter(aggregate=OuterRef("pk"))))
+                .first()
+            ),
+        )
 
-    models = ["ipam.prefix"]
+    def prefix_networks(self, prefix) -> list[RIRNetwork]:
+        return self._cached(
+            ("prefix_networks", prefix.pk),
+            lambda: list(RIRNetwork.objects.filter(prefix=prefix).select_related("organization")),
+        )
+
+    def aggregate_networks(self, aggregate) -> list[RIRNetwork]:
+        return self._cached(
+            ("aggregate_networks", aggregate.pk),
+            lambda: list(RIRNetwork.objects.filter(aggregate=aggregate).select_related("organization")),
+        )
+
+    def site_address(self, site) -> RIRAddress | None:
+        return self._cached(("site_address", site.pk), lambda: RIRAddress.get_for_site(site))
+
+
+def get_page_resolver(request) -> PageResolver:
+    """The PageResolver of ``request``, created on first use (a fresh one without a request)."""
+    if request is None:
+        return PageResolver()
+    resolver = getattr(request, "_rir_manager_page_resolver", None)
+    if resolver is None:
+        resolver = request._rir_manager_page_resolver = PageResolver()
+    return resolver
+
+
+def aggregate_panel_context(obj, resolver: PageResolver) -> dict:
+    return {
+        "rir_networks": resolver.aggregate_networks(obj),
+        "show_sync_button": obj.rir_id in resolver.active_config_rir_ids(),
+        "aggregate_pk": obj.pk,
+    }
+
+
+def prefix_panel_context(obj, resolver: PageResolver) -> dict:
+    # Show the sync button if the parent aggregate has an active RIR config
+    agg = resolver.parent_aggregate(obj)
+    return {
+        "rir_networks": resolver.prefix_networks(obj),
+        "show_sync_button": agg is not None and agg.rir_id in resolver.active_config_rir_ids(),
+        "prefix_pk": obj.pk,
+    }
+
+
+def site_panel_context(obj, resolver: PageResolver) -> dict:
+    return {"site_address": resolver.site_address(obj)}
 
-    def right_page(self):
-        obj = self.context["object"]
-        from ipam.models import Aggregate
 
-        from netbox_rir_manager.models import RIRConfig
+@dataclass(frozen=True)
+class Panel:
+    """An RIR panel served by ObjectPanelView for objects of ``model`` (app_label.model)."""
 
-        rir_networks = RIRNetwork.objects.filter(prefix=obj)
+    model: str
+    title: str
+    template_name: str
+    context: Callable[..., dict]
 
-        # Determine if sync button should be shown:
-        # Parent aggregate must have an active RIR config
-        show_sync_button = False
-        agg = Aggregate.objects.filter(prefix__net_contains_or_equals=obj.prefix).first()
-        if agg and RIRConfig.objects.filter(rir=agg.rir, is_active=True).exists():
-            show_sync_button = True
 
+# Keyed by model name, as in the panel URL
+PANELS = {
+    "aggregate": Panel(
+        "ipam.aggregate", "RIR Networks", "netbox_rir_manager/inc/rir_network_panel.html", aggregate_panel_context
+    ),
+    "prefix": Panel(
+        "ipam.prefix", "RIR Networks", "netbox_rir_manager/inc/rir_network_panel.html", prefix_panel_context
+    ),
+    "site": Panel("dcim.site", "RIR Address", "netbox_rir_manager/inc/rir_site_address_panel.html", site_panel_context),
+}
+
+
+class LazyPanelMixin:
+    """Render the object's RIR panel as a placeholder that HTMX replaces once the page has loaded."""
+
+    def right_page(self):
+        from netbox_rir_manager.services.panels import panel_version
+
+        obj = self.context["object"]
+        panel = PANELS[obj._meta.model_name]
+        url = reverse("plugins:netbox_rir_manager:object_panel", kwargs={"model": obj._meta.model_name, "pk": obj.pk})
         return self.render(
-            "netbox_rir_manager/inc/rir_network_panel.html",
-            extra_context={
-                "rir_networks": rir_networks,
-                "show_sync_button": show_sync_button,
-                "prefix_pk": obj.pk,
-            },
+            "netbox_rir_manager/inc/rir_lazy_panel.html",
+            extra_context={"panel_title": panel.title, "panel_url": f"{url}?v={panel_version(obj)}"},
         )
 
+
+class RIRAggregateExtension(LazyPanelMixin, PluginTemplateExtension):
+    """Show RIR network info with sync button on Aggregate detail page."""
+
+    models = ["ipam.aggregate"]
+
+
+class RIRPrefixExtension(LazyPanelMixin, PluginTemplateExtension):
+    """Show RIR network info and reassign button on Prefix detail page."""
+
+    models = ["ipam.prefix"]
+
     def buttons(self):
         obj = self.context["object"]
+        resolver = get_page_resolver(self.context.get("request"))
         # Show reassign button if:
         # - Parent aggregate has a linked RIRNetwork
         # - This prefix doesn't already have a linked RIRNetwork
-        from ipam.models import Aggregate
-
         can_reassign = False
-        if not RIRNetwork.objects.filter(prefix=obj).exists():
-            agg = Aggregate.objects.filter(prefix__net_contains_or_equals=obj.prefix).first()
-            if agg and RIRNetwork.objects.filter(aggregate=agg).exists():
-                can_reassign = True
+        if not resolver.prefix_networks(obj):
+            agg = resolver.parent_aggregate(obj)
+            can_reassign = agg is not None and agg.has_rir_networks
 
         return self.render(
             "netbox_rir_manager/inc/rir_prefix_buttons.html",
             extra_context={"can_reassign": can_reassign},
         )
 
+    def list_buttons(self):
+        return self.render("netbox_rir_manager/inc/rir_prefix_list_buttons.html")
+
 
-class RIRSiteExtension(PluginTemplateExtension):
+class RIRSiteExtension(LazyPanelMixin, PluginTemplateExtension):
     """Show structured RIR address on Site detail page."""
 
     models = ["dcim.site"]
 
-    def right_page(self):
-        obj = self.context["object"]
-        site_address = RIRAddress.get_for_site(obj)
-
-        return self.render(
-            "netbox_rir_manager/inc/rir_site_address_panel.html",
-            extra_context={"site_address": site_address},
-        )
-
 
 template_extensions = [RIRAggregateExtension, RIRPrefixExtension, RIRSiteExtension]
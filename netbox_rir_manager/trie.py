@@ -0,0 +1,103 @@
+"""In-memory prefix lookup structure for matching RIR net blocks against IPAM.
+
+``PrefixTrie`` keeps one hash table per populated prefix length and family,
+i.e. a level-compressed trie in which each level is a dict.  Exact lookups are
+a single dict probe; longest-prefix matches probe only the lengths that are
+actually present (at most 33 for IPv4, 129 for IPv6, far fewer in practice).
+"""
+
+from __future__ import annotations
+
+import bisect
+import ipaddress
+from collections.abc import Iterator
+from typing import Any
+
+# (IP version, network address as int, prefix length)
+PrefixKey = tuple[int, int, int]
+
+_BITS = {4: 32, 6: 128}
+
+
+def prefix_key(prefix) -> PrefixKey:
+    """Normalise a prefix to ``(family, network_int, prefixlen)``.
+
+    Accepts a string, a netaddr or ipaddress network, or an already normalised
+    key tuple.  Host bits are masked off.  Raises ValueError for bad input.
+    """
+    if isinstance(prefix, tuple):
+        family, network, length = prefix
+    elif isinstance(prefix, (ipaddress.IPv4Network, ipaddress.IPv6Network)):
+        family, network, length = prefix.version, int(prefix.network_address), prefix.prefixlen
+    elif hasattr(prefix, "prefixlen") and hasattr(prefix, "first"):
+        # netaddr.IPNetwork
+        family, network, length = prefix.version, prefix.first, prefix.prefixlen
+    else:
+        parsed = ipaddress.ip_network(str(prefix).strip(), strict=False)
+        family, network, length = parsed.version, int(parsed.network_address), parsed.prefixlen
+    bits = _BITS.get(family)
+    if bits is None or not 0 <= length <= bits:
+        raise ValueError(f"Invalid prefix {prefix!r}")
+    host_bits = bits - length
+    return family, (network >> host_bits) << host_bits, length
+
+
+class PrefixTrie:
+    """Map of IP prefixes to (non-None) values with exact and longest-prefix-match lookups."""
+
+    def __init__(self):
+        self._tables: dict[int, dict[int, dict[int, Any]]] = {4: {}, 6: {}}
+        self._lengths: dict[int, list[int]] = {4: [], 6: []}
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, prefix) -> bool:
+        return self.get(prefix) is not None
+
+    def __iter__(self) -> Iterator[tuple[PrefixKey, Any]]:
+        for family, tables in self._tables.items():
+            for length, table in tables.items():
+                for network, value in table.items():
+                    yield (family, network, length), value
+
+    def insert(self, prefix, value) -> None:
+        """Store ``value`` under ``prefix``, replacing any existing value."""
+        family, network, length = prefix_key(prefix)
+        table = self._tables[family].get(length)
+        if table is None:
+            table = self._tables[family][length] = {}
+            bisect.insort(self._lengths[family], length)
+        if network not in table:
+            self._size += 1
+        table[network] = value
+
+    def setdefault(self, prefix, value):
+        """Store ``value`` under ``prefix`` unless present; return the stored value."""
+        existing = self.get(prefix)
+        if existing is not None:
+            return existing
+        self.insert(prefix, value)
+        return value
+
+    def get(self, prefix, default=None):
+        """Return the value stored for exactly ``prefix``."""
+        family, network, length = prefix_key(prefix)
+        table = self._tables[family].get(length)
+        if table is None:
+            return default
+        return table.get(network, default)
+
+    def longest_match(self, prefix, default=None):
+        """Return the value of the most specific stored prefix containing (or equal to) ``prefix``."""
+        family, network, length = prefix_key(prefix)
+        bits = _BITS[family]
+        lengths = self._lengths[family]
+        tables = self._tables[family]
+        for candidate in reversed(lengths[: bisect.bisect_right(lengths, length)]):
+            host_bits = bits - candidate
+            value = tables[candidate].get((network >> host_bits) << host_bits)
+            if value is not None:
+                return value
+        return default
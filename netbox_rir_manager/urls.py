@@ -9,9 +9,11 @@ from netbox_rir_manager.models import (
     RIRCustomer,
     RIRNetwork,
     RIROrganization,
+    RIRReconciliationReport,
     RIRSyncLog,
     RIRTicket,
     RIRUserKey,
+    RIRWriteOperation,
 )
 
 urlpatterns = [
@@ -26,6 +28,8 @@ urlpatterns = [
     path("configs/<int:pk>/edit/", views.RIRConfigEditView.as_view(), name="rirconfig_edit"),
     path("configs/<int:pk>/delete/", views.RIRConfigDeleteView.as_view(), name="rirconfig_delete"),
     path("configs/<int:pk>/sync/", views.RIRConfigSyncView.as_view(), name="rirconfig_sync"),
+    path("configs/<int:pk>/reconcile/", views.RIRConfigReconcileView.as_view(), name="rirconfig_reconcile"),
+    path("configs/<int:pk>/reassign-plan/", views.RIRConfigReassignPlanView.as_view(), name="rirconfig_reassign_plan"),
     path(
         "configs/<int:pk>/changelog/",
         ObjectChangeLogView.as_view(),
@@ -111,6 +115,52 @@ urlpatterns = [
         name="rirsynclog_changelog",
         kwargs={"model": RIRSyncLog},
     ),
+    # RIRReconciliationReport
+    path(
+        "reconciliation-reports/",
+        views.RIRReconciliationReportListView.as_view(),
+        name="rirreconciliationreport_list",
+    ),
+    path(
+        "reconciliation-reports/delete/",
+        views.RIRReconciliationReportBulkDeleteView.as_view(),
+        name="rirreconciliationreport_bulk_delete",
+    ),
+    path(
+        "reconciliation-reports/<int:pk>/",
+        views.RIRReconciliationReportView.as_view(),
+        name="rirreconciliationreport",
+    ),
+    path(
+        "reconciliation-reports/<int:pk>/delete/",
+        views.RIRReconciliationReportDeleteView.as_view(),
+        name="rirreconciliationreport_delete",
+    ),
+    path(
+        "reconciliation-reports/<int:pk>/changelog/",
+        ObjectChangeLogView.as_view(),
+        name="rirreconciliationreport_changelog",
+        kwargs={"model": RIRReconciliationReport},
+    ),
+    # RIRWriteOperation
+    path("write-operations/", views.RIRWriteOperationListView.as_view(), name="rirwriteoperation_list"),
+    path(
+        "write-operations/delete/",
+        views.RIRWriteOperationBulkDeleteView.as_view(),
+        name="rirwriteoperation_bulk_delete",
+    ),
+    path("write-operations/<int:pk>/", views.RIRWriteOperationView.as_view(), name="rirwriteoperation"),
+    path(
+        "write-operations/<int:pk>/delete/",
+        views.RIRWriteOperationDeleteView.as_view(),
+        name="rirwriteoperation_delete",
+    ),
+    path(
+        "write-operations/<int:pk>/changelog/",
+        ObjectChangeLogView.as_view(),
+        name="rirwriteoperation_changelog",
+        kwargs={"model": RIRWriteOperation},
+    ),
     # RIRTicket
     path("tickets/", views.RIRTicketListView.as_view(), name="rirticket_list"),
     path("tickets/<int:pk>/", views.RIRTicketView.as_view(), name="rirticket"),
@@ -136,9 +186,22 @@ urlpatterns = [
     ),
     # Aggregate/Prefix action views (used from NetBox detail pages)
     path("aggregates/<int:pk>/sync/", views.AggregateSyncView.as_view(), name="aggregate_sync"),
+    path(
+        "aggregates/<int:pk>/reassign-plan/",
+        views.AggregateReassignPlanView.as_view(),
+        name="aggregate_reassign_plan",
+    ),
     path("prefixes/<int:pk>/sync/", views.PrefixSyncView.as_view(), name="prefix_sync"),
     path("prefixes/<int:pk>/reassign/", views.PrefixReassignView.as_view(), name="prefix_reassign"),
+    path("prefixes/bulk-reassign/", views.PrefixBulkReassignView.as_view(), name="prefix_bulk_reassign"),
+    # Lazily loaded RIR panels of Aggregate, Prefix and Site detail pages
+    path("panels/<str:model>/<int:pk>/", views.ObjectPanelView.as_view(), name="object_panel"),
     # Site address resolve
     path("sites/<int:pk>/resolve-address/", views.SiteAddressResolveModalView.as_view(), name="site_resolve_address"),
+    path(
+        "sites/<int:pk>/resolve-address/<str:search_id>/",
+        views.SiteAddressCandidatesView.as_view(),
+        name="site_address_candidates",
+    ),
     path("sites/<int:pk>/select-address/", views.SiteAddressSelectView.as_view(), name="site_select_address"),
 ]
@@ -3,10 +3,12 @@ import json
 
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.http import HttpResponse
+from django.db import transaction
+from django.http import Http404, HttpResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse
 from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control
 from django.views import View
 from netbox.object_actions import (
     AddObject,
@@ -20,7 +22,6 @@ from netbox.object_actions import (
 from netbox.views import generic
 
 from netbox_rir_manager.backends.arin import ARINBackend
-from netbox_rir_manager.choices import normalize_ticket_status
 from netbox_rir_manager.filtersets import (
     RIRAddressFilterSet,
     RIRConfigFilterSet,
@@ -28,11 +29,14 @@ from netbox_rir_manager.filtersets import (
     RIRCustomerFilterSet,
     RIRNetworkFilterSet,
     RIROrganizationFilterSet,
+    RIRReconciliationReportFilterSet,
     RIRSyncLogFilterSet,
     RIRTicketFilterSet,
     RIRUserKeyFilterSet,
+    RIRWriteOperationFilterSet,
 )
 from netbox_rir_manager.forms import (
+    PrefixBulkReassignForm,
     RIRAddressFilterForm,
     RIRAddressForm,
     RIRConfigBulkEditForm,
@@ -48,9 +52,11 @@ from netbox_rir_manager.forms import (
     RIRNetworkReassignForm,
     RIROrganizationFilterForm,
     RIROrganizationForm,
+    RIRReconciliationReportFilterForm,
     RIRTicketFilterForm,
     RIRUserKeyFilterForm,
     RIRUserKeyForm,
+    RIRWriteOperationFilterForm,
 )
 from netbox_rir_manager.models import (
     RIRAddress,
@@ -59,10 +65,13 @@ from netbox_rir_manager.models import (
     RIRCustomer,
     RIRNetwork,
     RIROrganization,
+    RIRReconciliationReport,
     RIRSyncLog,
     RIRTicket,
     RIRUserKey,
+    RIRWriteOperation,
 )
+from netbox_rir_manager.services.outbox import queue_write_operation
 from netbox_rir_manager.tables import (
     RIRAddressTable,
     RIRConfigTable,
@@ -70,9 +79,11 @@ from netbox_rir_manager.tables import (
     RIRCustomerTable,
     RIRNetworkTable,
     RIROrganizationTable,
+    RIRReconciliationReportTable,
     RIRSyncLogTable,
     RIRTicketTable,
     RIRUserKeyTable,
+    RIRWriteOperationTable,
 )
 
 
@@ -285,6 +296,39 @@ class RIRSyncLogDeleteView(generic.ObjectDeleteView):
     queryset = RIRSyncLog.objects.all()
 
 
+# --- RIRReconciliationReport Views ---
+class RIRReconciliationReportListView(generic.ObjectListView):
+    queryset = RIRReconciliationReport.objects.select_related("rir_config")
+    table = RIRReconciliationReportTable
+    filterset = RIRReconciliationReportFilterSet
+    filterset_form = RIRReconciliationReportFilterForm
+    actions = (BulkExport, BulkDelete)
+
+
+class RIRReconciliationReportView(generic.ObjectView):
+    queryset = RIRReconciliationReport.objects.select_related("rir_config")
+    actions = (DeleteObject,)
+
+    # Entries rendered per drift class; the full report is available via the REST API
+    entries_per_section = 500
+
+    def get_extra_context(self, request, instance):
+        return {
+            "sections": instance.get_drift_sections(limit=self.entries_per_section),
+            "entries_per_section": self.entries_per_section,
+        }
+
+
+class RIRReconciliationReportDeleteView(generic.ObjectDeleteView):
+    queryset = RIRReconciliationReport.objects.all()
+
+
+class RIRReconciliationReportBulkDeleteView(generic.BulkDeleteView):
+    queryset = RIRReconciliationReport.objects.all()
+    filterset = RIRReconciliationReportFilterSet
+    table = RIRReconciliationReportTable
+
+
 # --- RIRUserKey Views ---
 class RIRUserKeyListView(generic.ObjectListView):
     queryset = RIRUserKey.objects.all()
@@ -346,6 +390,68 @@ class RIRConfigSyncView(LoginRequiredMixin, View):
         return redirect(return_url or rir_config.get_absolute_url())
 
 
+class RIRConfigReconcileView(LoginRequiredMixin, View):
+    """Trigger a background reconciliation job for an RIRConfig."""
+
+    def post(self, request, pk):
+        from netbox_rir_manager.jobs import ReconcileRIRConfigJob
+        from netbox_rir_manager.models import RIRUserKey as RIRUserKeyModel
+
+        rir_config = get_object_or_404(RIRConfig.objects.restrict(request.user, "change"), pk=pk)
+
+        if not RIRUserKeyModel.objects.filter(user=request.user, rir_config=rir_config).exists():
+            messages.error(request, "You don't have an API key configured for this RIR config.")
+            return redirect(rir_config.get_absolute_url())
+
+        ReconcileRIRConfigJob.enqueue(instance=rir_config, user=request.user)
+        messages.success(request, f"Reconciliation job queued for {rir_config.name}.")
+        return redirect(rir_config.get_absolute_url())
+
+
+def _reassign_plan_response(request, filename, **scope):
+    """Render a dry-run reassignment plan of the prefixes the user may view as a CSV download (no RIR calls)."""
+    from ipam.models import Prefix
+
+    from netbox_rir_manager.services.reassign_planner import plan_reassignments, plan_to_csv
+
+    plan = plan_reassignments(prefixes=Prefix.objects.restrict(request.user, "view"), **scope)
+    response = HttpResponse(plan_to_csv(plan["rows"]), content_type="text/csv")
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
+
+
+class RIRConfigReassignPlanView(LoginRequiredMixin, View):
+    """Download the reassignment plan for every aggregate of an RIRConfig."""
+
+    def get(self, request, pk):
+        rir_config = get_object_or_404(RIRConfig, pk=pk)
+        return _reassign_plan_response(request, f"reassign-plan-{rir_config.name}.csv", rir_config=rir_config)
+
+
+# --- RIRWriteOperation Views ---
+class RIRWriteOperationListView(generic.ObjectListView):
+    queryset = RIRWriteOperation.objects.select_related("rir_config", "ticket")
+    table = RIRWriteOperationTable
+    filterset = RIRWriteOperationFilterSet
+    filterset_form = RIRWriteOperationFilterForm
+    actions = (BulkExport, BulkDelete)
+
+
+class RIRWriteOperationView(generic.ObjectView):
+    queryset = RIRWriteOperation.objects.select_related("rir_config", "network", "ticket", "user_key__user")
+    actions = (DeleteObject,)
+
+
+class RIRWriteOperationDeleteView(generic.ObjectDeleteView):
+    queryset = RIRWriteOperation.objects.all()
+
+
+class RIRWriteOperationBulkDeleteView(generic.BulkDeleteView):
+    queryset = RIRWriteOperation.objects.all()
+    filterset = RIRWriteOperationFilterSet
+    table = RIRWriteOperationTable
+
+
 class RIRTicketRefreshView(LoginRequiredMixin, View):
     """Refresh ticket status from ARIN (placeholder)."""
 
@@ -391,11 +497,15 @@ class RIRNetworkReassignView(LoginRequiredMixin, View):
             messages.error(request, "No API key configured for this RIR config.")
             return redirect(network.get_absolute_url())
 
-        backend = ARINBackend.from_rir_config(network.rir_config, api_key=user_key.api_key)
-
         rtype = form.cleaned_data["reassignment_type"]
+        payload = {
+            "reassignment_type": rtype,
+            "net_name": form.cleaned_data.get("net_name", ""),
+            "start_address": str(form.cleaned_data["start_address"]),
+            "end_address": str(form.cleaned_data["end_address"]),
+        }
         if rtype == "simple":
-            customer_data = {
+            payload["customer"] = {
                 "customer_name": form.cleaned_data["customer_name"],
                 "street_address": form.cleaned_data.get("street_address", ""),
                 "city": form.cleaned_data["city"],
@@ -403,79 +513,13 @@ class RIRNetworkReassignView(LoginRequiredMixin, View):
                 "postal_code": form.cleaned_data.get("postal_code", ""),
                 "country": form.cleaned_data["country"],
             }
-            customer_result = backend.create_customer(network.handle, customer_data)
-            if customer_result is None:
-                messages.error(request, "Failed to create customer at ARIN.")
-                RIRSyncLog.objects.create(
-                    rir_config=network.rir_config,
-                    operation="create",
-                    object_type="customer",
-                    object_handle=network.handle,
-                    status="error",
-                    message="Failed to create customer",
-                )
-                return redirect(network.get_absolute_url())
-
-            addr = RIRAddress.objects.create(
-                street_address=customer_data.get("street_address", ""),
-                city=customer_data.get("city", ""),
-                state_province=customer_data.get("state_province", ""),
-                postal_code=customer_data.get("postal_code", ""),
-                country=customer_data.get("country", ""),
-            )
-            RIRCustomer.objects.create(
-                rir_config=network.rir_config,
-                handle=customer_result["handle"],
-                customer_name=customer_data["customer_name"],
-                address=addr,
-                network=network,
-                raw_data=customer_result,
-                created_date=timezone.now(),
-            )
-
-        net_data = {
-            "net_name": form.cleaned_data.get("net_name", ""),
-            "start_address": str(form.cleaned_data["start_address"]),
-            "end_address": str(form.cleaned_data["end_address"]),
-        }
-        if rtype == "simple":
-            net_data["customer_handle"] = customer_result["handle"]
         else:
-            net_data["org_handle"] = form.cleaned_data["org_handle"]
-
-        result = backend.reassign_network(network.handle, net_data)
-        if result is None:
-            messages.error(request, "Reassignment failed at ARIN.")
-            RIRSyncLog.objects.create(
-                rir_config=network.rir_config,
-                operation="reassign",
-                object_type="network",
-                object_handle=network.handle,
-                status="error",
-                message="Reassignment failed",
-            )
-            return redirect(network.get_absolute_url())
+            payload["org_handle"] = form.cleaned_data["org_handle"]
 
-        ticket = RIRTicket.objects.create(
-            rir_config=network.rir_config,
-            ticket_number=result.get("ticket_number", ""),
-            ticket_type=result.get("ticket_type", "IPV4_SIMPLE_REASSIGN"),
-            status=normalize_ticket_status(result.get("ticket_status", "")),
-            network=network,
-            submitted_by=user_key,
-            created_date=timezone.now(),
-            raw_data=result.get("raw_data", {}),
-        )
-        RIRSyncLog.objects.create(
-            rir_config=network.rir_config,
-            operation="reassign",
-            object_type="network",
-            object_handle=network.handle,
-            status="success",
-            message=f"Reassignment submitted, ticket {ticket.ticket_number}",
-        )
-        messages.success(request, f"Reassignment submitted. Ticket: {ticket.ticket_number}")
-        return redirect(ticket.get_absolute_url())
+        with transaction.atomic():
+            write_operation = queue_write_operation(network, user_key, "reassign", payload)
+        messages.info(request, f"Reassignment of {payload['start_address']} queued for submission to ARIN.")
+        return redirect(write_operation.get_absolute_url())
 
 
 class RIRNetworkReallocateView(LoginRequiredMixin, View):
@@ -514,46 +558,16 @@ class RIRNetworkReallocateView(LoginRequiredMixin, View):
             messages.error(request, "No API key configured for this RIR config.")
             return redirect(network.get_absolute_url())
 
-        backend = ARINBackend.from_rir_config(network.rir_config, api_key=user_key.api_key)
-        net_data = {
+        payload = {
             "org_handle": form.cleaned_data["org_handle"],
             "net_name": form.cleaned_data.get("net_name", ""),
             "start_address": str(form.cleaned_data["start_address"]),
             "end_address": str(form.cleaned_data["end_address"]),
         }
-        result = backend.reallocate_network(network.handle, net_data)
-        if result is None:
-            messages.error(request, "Reallocation failed at ARIN.")
-            RIRSyncLog.objects.create(
-                rir_config=network.rir_config,
-                operation="reallocate",
-                object_type="network",
-                object_handle=network.handle,
-                status="error",
-                message="Reallocation failed",
-            )
-            return redirect(network.get_absolute_url())
-
-        ticket = RIRTicket.objects.create(
-            rir_config=network.rir_config,
-            ticket_number=result.get("ticket_number", ""),
-            ticket_type=result.get("ticket_type", "IPV4_REALLOCATE"),
-            status=normalize_ticket_status(result.get("ticket_status", "")),
-            network=network,
-            submitted_by=user_key,
-            created_date=timezone.now(),
-            raw_data=result.get("raw_data", {}),
-        )
-        RIRSyncLog.objects.create(
-            rir_config=network.rir_config,
-            operation="reallocate",
-            object_type="network",
-            object_handle=network.handle,
-            status="success",
-            message=f"Reallocation submitted, ticket {ticket.ticket_number}",
-        )
-        messages.success(request, f"Reallocation submitted. Ticket: {ticket.ticket_number}")
-        return redirect(ticket.get_absolute_url())
+        with transaction.atomic():
+            write_operation = queue_write_operation(network, user_key, "reallocate", payload)
+        messages.info(request, f"Reallocation of {payload['start_address']} queued for submission to ARIN.")
+        return redirect(write_operation.get_absolute_url())
 
 
 class RIRNetworkRemoveView(LoginRequiredMixin, View):
@@ -577,29 +591,10 @@ class RIRNetworkRemoveView(LoginRequiredMixin, View):
             messages.error(request, "No API key configured for this RIR config.")
             return redirect(network.get_absolute_url())
 
-        backend = ARINBackend.from_rir_config(network.rir_config, api_key=user_key.api_key)
-        success = backend.remove_network(network.handle)
-        if success:
-            RIRSyncLog.objects.create(
-                rir_config=network.rir_config,
-                operation="remove",
-                object_type="network",
-                object_handle=network.handle,
-                status="success",
-                message=f"Removed network {network.handle} from ARIN",
-            )
-            messages.success(request, f"Network {network.handle} removed from ARIN.")
-        else:
-            RIRSyncLog.objects.create(
-                rir_config=network.rir_config,
-                operation="remove",
-                object_type="network",
-                object_handle=network.handle,
-                status="error",
-                message="Failed to remove network from ARIN",
-            )
-            messages.error(request, "Failed to remove network from ARIN.")
-        return redirect(network.get_absolute_url())
+        with transaction.atomic():
+            write_operation = queue_write_operation(network, user_key, "remove")
+        messages.info(request, f"Removal of {network.handle} queued for submission to ARIN.")
+        return redirect(write_operation.get_absolute_url())
 
 
 class RIRNetworkDeleteARINView(LoginRequiredMixin, View):
@@ -623,40 +618,10 @@ class RIRNetworkDeleteARINView(LoginRequiredMixin, View):
             messages.error(request, "No API key configured for this RIR config.")
             return redirect(network.get_absolute_url())
 
-        backend = ARINBackend.from_rir_config(network.rir_config, api_key=user_key.api_key)
-        result = backend.delete_network(network.handle)
-        if result is None:
-            RIRSyncLog.objects.create(
-                rir_config=network.rir_config,
-                operation="delete",
-                object_type="network",
-                object_handle=network.handle,
-                status="error",
-                message="Failed to delete network at ARIN",
-            )
-            messages.error(request, "Failed to delete network at ARIN.")
-            return redirect(network.get_absolute_url())
-
-        ticket = RIRTicket.objects.create(
-            rir_config=network.rir_config,
-            ticket_number=result.get("ticket_number", ""),
-            ticket_type="NET_DELETE_REQUEST",
-            status=normalize_ticket_status(result.get("ticket_status", "")),
-            network=network,
-            submitted_by=user_key,
-            created_date=timezone.now(),
-            raw_data=result.get("raw_data", {}),
-        )
-        RIRSyncLog.objects.create(
-            rir_config=network.rir_config,
-            operation="delete",
-            object_type="network",
-            object_handle=network.handle,
-            status="success",
-            message=f"Delete request submitted, ticket {ticket.ticket_number}",
-        )
-        messages.success(request, f"Delete request submitted. Ticket: {ticket.ticket_number}")
-        return redirect(ticket.get_absolute_url())
+        with transaction.atomic():
+            write_operation = queue_write_operation(network, user_key, "delete")
+        messages.info(request, f"Delete request for {network.handle} queued for submission to ARIN.")
+        return redirect(write_operation.get_absolute_url())
 
 
 # --- Aggregate Sync View (from Aggregate detail page) ---
@@ -721,6 +686,17 @@ class AggregateSyncView(LoginRequiredMixin, View):
         return redirect(aggregate.get_absolute_url())
 
 
+class AggregateReassignPlanView(LoginRequiredMixin, View):
+    """Download the reassignment plan for the prefixes inside an Aggregate."""
+
+    def get(self, request, pk):
+        from ipam.models import Aggregate
+
+        aggregate = get_object_or_404(Aggregate.objects.restrict(request.user, "view"), pk=pk)
+        filename = f"reassign-plan-{aggregate.prefix}.csv".replace("/", "_")
+        return _reassign_plan_response(request, filename, aggregate=aggregate)
+
+
 # --- Prefix Sync View (from Prefix detail page) ---
 class PrefixSyncView(LoginRequiredMixin, View):
     """Sync a single prefix from ARIN using mostSpecificNet."""
@@ -906,56 +882,158 @@ class PrefixReassignView(LoginRequiredMixin, View):
         return redirect(prefix.get_absolute_url())
 
 
+# --- Prefix Bulk Reassign View (from the Prefix list) ---
+class PrefixBulkReassignView(LoginRequiredMixin, View):
+    """Reassign the selected or filtered prefixes at ARIN with a single BulkReassignJob."""
+
+    # Upper bound on prefixes validated and submitted per request
+    max_prefixes = 1000
+
+    def get(self, request):
+        from ipam.filtersets import PrefixFilterSet
+        from ipam.models import Prefix
+
+        prefixes = PrefixFilterSet(request.GET, queryset=Prefix.objects.restrict(request.user, "view")).qs
+        return self._confirm(request, prefixes)
+
+    def post(self, request):
+        from netbox_rir_manager.jobs import BulkReassignJob
+        from netbox_rir_manager.services.bulk_reassign import validate_bulk_reassign
+
+        form = PrefixBulkReassignForm(request.POST, user=request.user, max_prefixes=self.max_prefixes)
+        if not form.is_valid():
+            for error in form.errors.get("pk", []):
+                messages.error(request, error)
+            return redirect(reverse("ipam:prefix_list"))
+        prefixes = form.cleaned_data["pk"]
+
+        if "_confirm" in request.POST:
+            # Validated again: the selection may have changed since the confirmation page
+            candidates = validate_bulk_reassign(prefixes.select_related("tenant"), request.user)
+            prefix_ids = [candidate.prefix.pk for candidate in candidates if candidate.is_valid]
+            if not prefix_ids:
+                messages.warning(request, "None of the selected prefixes can be reassigned.")
+                return redirect(reverse("ipam:prefix_list"))
+            job = BulkReassignJob.enqueue(user=request.user, prefix_ids=prefix_ids, user_id=request.user.pk)
+            messages.success(request, f"Bulk reassignment job queued for {len(prefix_ids)} prefixes.")
+            return redirect(job.get_absolute_url())
+
+        return self._confirm(request, prefixes)
+
+    def _confirm(self, request, prefixes):
+        from netbox_rir_manager.services.bulk_reassign import validate_bulk_reassign
+
+        prefixes = list(prefixes.select_related("tenant", "vrf")[: self.max_prefixes + 1])
+        if not prefixes:
+            messages.warning(request, "No prefixes were selected.")
+            return redirect(reverse("ipam:prefix_list"))
+        if len(prefixes) > self.max_prefixes:
+            messages.warning(request, f"Only the first {self.max_prefixes} prefixes are shown.")
+            prefixes = prefixes[: self.max_prefixes]
+
+        candidates = validate_bulk_reassign(prefixes, request.user)
+        return render(
+            request,
+            "netbox_rir_manager/prefix_bulk_reassign.html",
+            {
+                "candidates": candidates,
+                "valid_count": sum(1 for candidate in candidates if candidate.is_valid),
+                "return_url": reverse("ipam:prefix_list"),
+            },
+        )
+
+
+# --- Lazily loaded panels of NetBox detail pages ---
+class ObjectPanelView(LoginRequiredMixin, View):
+    """Return the RIR panel of an Aggregate, Prefix or Site; loaded by HTMX after the detail page.
+
+    The response is cacheable by the browser and carries the panel version
+    (services/panels.py) as its ETag, so unchanged panels are answered with
+    304 Not Modified without running the panel's queries.
+    """
+
+    def get(self, request, model, pk):
+        from django.apps import apps
+
+        from netbox_rir_manager.services.panels import PANEL_MAX_AGE, panel_etag
+        from netbox_rir_manager.template_content import PANELS, get_page_resolver
+
+        panel = PANELS.get(model)
+        if panel is None:
+            raise Http404
+        obj = get_object_or_404(apps.get_model(panel.model).objects.restrict(request.user, "view"), pk=pk)
+
+        etag = panel_etag(obj)
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = render(
+                request, panel.template_name, {"object": obj, **panel.context(obj, get_page_resolver(request))}
+            )
+        response["ETag"] = etag
+        patch_cache_control(response, private=True, max_age=PANEL_MAX_AGE)
+        return response
+
+
 # --- Site Address Resolve Views ---
 class SiteAddressResolveModalView(LoginRequiredMixin, View):
-    """Return HTMX modal content with geocoding candidates for a Site."""
+    """Return the HTMX modal for a Site at once; geocoding candidates stream in as each lookup answers."""
 
     template_name = "netbox_rir_manager/htmx/site_address_resolve_modal.html"
 
     def get(self, request, pk):
         from dcim.models import Site
 
-        from netbox_rir_manager.services.geocoding import resolve_site_address_candidates
-
         site = get_object_or_404(Site, pk=pk)
-        candidates = resolve_site_address_candidates(site)
 
-        # Pre-fill search field based on which source produced results:
-        # reverse geocode from coords → show coords, forward geocode → show address
+        # Pre-fill search field with the site data the lookups start from:
+        # coordinates (reverse geocode) first, else the physical address
         if site.latitude and site.longitude:
             search_query = f"{site.latitude}, {site.longitude}"
         elif site.physical_address:
             search_query = site.physical_address
         else:
             search_query = ""
+        return self._render(request, site, search_query)
+
+    def post(self, request, pk):
+        from dcim.models import Site
+
+        site = get_object_or_404(Site, pk=pk)
+        query = request.POST.get("query", "").strip()
+        return self._render(request, site, query, query=query or None)
+
+    def _render(self, request, site, search_query, query=None):
+        from netbox_rir_manager.services.address_candidates import get_candidate_search, start_candidate_search
 
+        # The typed query, the coordinates and the physical address are looked up concurrently
+        search_id = start_candidate_search(site, query=query)
         return render(
             request,
             self.template_name,
             {
                 "site": site,
-                "candidates": candidates,
+                "search_id": search_id,
+                "search": get_candidate_search(search_id, site),
                 "search_query": search_query,
             },
         )
 
-    def post(self, request, pk):
+
+class SiteAddressCandidatesView(LoginRequiredMixin, View):
+    """Return the candidates a site address search has found so far; polled by the modal until done."""
+
+    template_name = "netbox_rir_manager/htmx/site_address_candidates.html"
+
+    def get(self, request, pk, search_id):
         from dcim.models import Site
 
-        from netbox_rir_manager.services.geocoding import resolve_site_address_candidates
+        from netbox_rir_manager.services.address_candidates import get_candidate_search
 
         site = get_object_or_404(Site, pk=pk)
-        query = request.POST.get("query", "").strip()
-        candidates = resolve_site_address_candidates(site, query=query or None)
-
         return render(
             request,
             self.template_name,
-            {
-                "site": site,
-                "candidates": candidates,
-                "search_query": query,
-            },
+            {"site": site, "search_id": search_id, "search": get_candidate_search(search_id, site)},
         )
 
 
@@ -982,8 +1060,8 @@ class SiteAddressSelectView(LoginRequiredMixin, View):
         # Delete existing site-level address (not location-specific ones)
         RIRAddress.objects.filter(site=site, location__isnull=True).delete()
 
-        # Use get_or_create on address fields to handle unique constraint
-        address, created = RIRAddress.objects.get_or_create(
+        # Match on the address fingerprint to handle the unique constraint
+        address, created = RIRAddress.objects.get_or_create_address(
             street_address=street_address,
             city=city,
             state_province=state_province,
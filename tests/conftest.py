@@ -33,6 +33,16 @@ if "regrws" not in sys.modules:
         sys.modules["regrws.api.core"] = regrws_api_core
         sys.modules["regrws.models"] = regrws_models
 
+
+def make_runner(cls):
+    """Create a job runner with mocked job and logger (bypasses __init__)."""
+    runner = cls.__new__(cls)
+    runner.job = MagicMock()
+    runner.job.data = {}
+    runner.logger = MagicMock()
+    return runner
+
+
 if _netbox_available:
     # Full Django setup for integration tests
     import pytest
@@ -0,0 +1,171 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from netbox_rir_manager.fingerprint import address_fingerprint, normalize_address_fields
+
+
+class TestAddressFingerprint:
+    def test_spelling_variants_share_a_fingerprint(self):
+        assert address_fingerprint("123 Main Street, Suite 100", "Montréal", "Quebec", "h3b 1a1", "ca") == (
+            address_fingerprint("123 main st ste. 100 ", "MONTREAL", "QC", "H3B1A1", "CA")
+        )
+
+    def test_different_addresses_differ(self):
+        assert address_fingerprint("123 Main St", "Montreal", "QC", "H3B1A1", "CA") != address_fingerprint(
+            "125 Main St", "Montreal", "QC", "H3B1A1", "CA"
+        )
+
+    def test_normalized_fields(self):
+        assert normalize_address_fields("1 Saint-Laurent Boulevard", "Saint-Jérôme", "Québec", "J7Z 1A1", "ca") == (
+            "1 st laurent blvd",
+            "st jerome",
+            "QC",
+            "J7Z1A1",
+            "CA",
+        )
+
+    def test_unknown_subdivision_is_kept(self):
+        assert normalize_address_fields(state_province="Nowhere Land", country="CA")[2] == "NOWHERE LAND"
+
+
+@pytest.mark.django_db
+class TestRIRAddressFingerprint:
+    def test_set_on_save(self):
+        from netbox_rir_manager.models import RIRAddress
+
+        address = RIRAddress.objects.create(street_address="1 Main St", city="Montreal", country="CA")
+        assert address.fingerprint == address_fingerprint("1 Main St", "Montreal", "", "", "CA")
+
+        address.street_address = "2 Main St"
+        address.save(update_fields=["street_address"])
+        address.refresh_from_db()
+        assert address.fingerprint == address_fingerprint("2 Main St", "Montreal", "", "", "CA")
+
+    def test_get_or_create_address_matches_variants(self):
+        from netbox_rir_manager.models import RIRAddress
+
+        first, created = RIRAddress.objects.get_or_create_address(
+            street_address="1 Main Street", city="Montreal", state_province="Quebec", country="CA"
+        )
+        second, created_again = RIRAddress.objects.get_or_create_address(
+            street_address="1 main st ", city="MONTREAL", state_province="QC", country="CA"
+        )
+
+        assert created and not created_again
+        assert second.pk == first.pk
+        assert second.street_address == "1 Main Street"
+
+    def test_variant_fails_validation(self):
+        from django.core.exceptions import ValidationError
+
+        from netbox_rir_manager.models import RIRAddress
+
+        RIRAddress.objects.create(street_address="1 Main Street", city="Montreal", country="CA")
+        with pytest.raises(ValidationError, match="already exists"):
+            RIRAddress(street_address="1 Main St.", city="montreal", country="CA").clean()
+
+    def test_sync_reuses_a_respelled_address(self, rir_organization):
+        from netbox_rir_manager.jobs import _link_address
+        from netbox_rir_manager.models import RIRAddress
+
+        address_data = {
+            "street_address": "1 Main Street",
+            "city": "Montreal",
+            "state_province": "QC",
+            "postal_code": "",
+            "country": "CA",
+        }
+        _link_address(rir_organization, address_data)
+        _link_address(rir_organization, {**address_data, "street_address": "1 MAIN ST"})
+
+        assert RIRAddress.objects.count() == 1
+        assert rir_organization.address.street_address == "1 Main Street"
+
+
+@pytest.mark.django_db
+class TestMergeDuplicateAddresses:
+    @pytest.fixture
+    def duplicates(self, rir_config, rir_organization):
+        """Three spellings of one address, stored with stale fingerprints as before normalisation."""
+        from dcim.models import Site
+
+        from netbox_rir_manager.models import RIRAddress, RIRContact
+
+        site = Site.objects.create(name="Site 1", slug="site-1")
+        oldest, site_address, variant = RIRAddress.objects.bulk_create(
+            [
+                RIRAddress(street_address="1 Main Street", city="Montreal", country="CA", fingerprint="stale-0"),
+                RIRAddress(site=site, street_address="1 Main St", city="Montreal", country="CA", fingerprint="stale-1"),
+                RIRAddress(street_address="1 MAIN ST.", city="montreal", country="CA", fingerprint="stale-2"),
+            ]
+        )
+        other = RIRAddress.objects.create(street_address="2 Main St", city="Montreal", country="CA")
+
+        rir_organization.address = oldest
+        rir_organization.save()
+        contact = RIRContact.objects.create(
+            rir_config=rir_config,
+            handle="DUP-ARIN",
+            contact_type="PERSON",
+            first_name="Dup",
+            organization=rir_organization,
+            address=variant,
+        )
+        return {"site_address": site_address, "other": other, "contact": contact}
+
+    def test_merges_into_the_site_address_and_repoints(self, duplicates, rir_organization):
+        from netbox_rir_manager.models import RIRAddress
+        from netbox_rir_manager.services.address_dedup import merge_duplicate_addresses
+
+        summary = merge_duplicate_addresses(batch_size=1)
+
+        keeper = duplicates["site_address"]
+        assert summary["groups"] == 1
+        assert summary["merged"] == 2
+        assert summary["repointed"] == 2
+        assert summary["detached"] == []
+        assert set(RIRAddress.objects.values_list("pk", flat=True)) == {keeper.pk, duplicates["other"].pk}
+        rir_organization.refresh_from_db()
+        duplicates["contact"].refresh_from_db()
+        assert rir_organization.address_id == keeper.pk
+        assert duplicates["contact"].address_id == keeper.pk
+        keeper.refresh_from_db()
+        assert keeper.fingerprint == keeper.compute_fingerprint()
+
+    def test_dry_run_writes_nothing(self, duplicates):
+        from netbox_rir_manager.models import RIRAddress
+        from netbox_rir_manager.services.address_dedup import merge_duplicate_addresses
+
+        summary = merge_duplicate_addresses(dry_run=True)
+
+        assert summary["merged"] == 2
+        assert RIRAddress.objects.count() == 4
+
+    def test_command(self, duplicates):
+        out = StringIO()
+        call_command("merge_addresses", stdout=out)
+
+        assert "Merged 2 of 4 addresses in 1 groups" in out.getvalue()
+
+    def test_dropped_site_link_is_reported(self, caplog):
+        from dcim.models import Site
+
+        from netbox_rir_manager.models import RIRAddress
+
+        first, second = Site.objects.bulk_create(
+            [Site(name="Site A", slug="site-a"), Site(name="Site B", slug="site-b")]
+        )
+        _keeper, merged = RIRAddress.objects.bulk_create(
+            [
+                RIRAddress(site=first, street_address="1 Main St", city="Montreal", country="CA", fingerprint="a"),
+                RIRAddress(site=second, street_address="1 Main Street", city="Montreal", country="CA", fingerprint="b"),
+            ]
+        )
+        out = StringIO()
+
+        call_command("merge_addresses", stdout=out)
+
+        assert f"Site or location links dropped with merged addresses: {merged.pk}" in out.getvalue()
+        assert f"Address {merged.pk} (site {second.pk}" in caplog.text
@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 from django.urls import reverse
@@ -263,36 +263,37 @@ class TestAPIAuthentication:
 
 @pytest.mark.django_db
 class TestRIRNetworkAPIActions:
-    @patch("netbox_rir_manager.api.views.ARINBackend")
-    def test_reassign_api_simple(self, mock_backend_cls, admin_api_client, rir_network, rir_user_key):
-        mock_backend = MagicMock()
-        mock_backend.create_customer.return_value = {"handle": "C-TEST"}
-        mock_backend.reassign_network.return_value = {
-            "ticket_number": "TKT-API-001",
-            "ticket_type": "IPV4_SIMPLE_REASSIGN",
-            "ticket_status": "PENDING_REVIEW",
-            "raw_data": {},
-        }
-        mock_backend_cls.from_rir_config.return_value = mock_backend
-
+    @patch("netbox_rir_manager.jobs.DispatchWriteOperationsJob.enqueue_dispatch")
+    def test_reassign_api_simple(
+        self, mock_dispatch, admin_api_client, rir_network, rir_user_key, django_capture_on_commit_callbacks
+    ):
         url = reverse("plugins-api:netbox_rir_manager-api:rirnetwork-reassign", args=[rir_network.pk])
-        response = admin_api_client.post(
-            url,
-            {
-                "reassignment_type": "simple",
-                "customer_name": "Test Customer",
-                "city": "Testville",
-                "country": "US",
-                "start_address": "10.0.0.0",
-                "end_address": "10.0.0.255",
-            },
-            format="json",
-        )
-        assert response.status_code == status.HTTP_201_CREATED
-        assert "ticket_number" in response.json()
+        with django_capture_on_commit_callbacks(execute=True):
+            response = admin_api_client.post(
+                url,
+                {
+                    "reassignment_type": "simple",
+                    "customer_name": "Test Customer",
+                    "city": "Testville",
+                    "country": "US",
+                    "start_address": "10.0.0.0",
+                    "end_address": "10.0.0.255",
+                },
+                format="json",
+            )
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        data = response.json()
+        assert data["operation"] == "reassign"
+        assert data["status"] == "pending"
+        assert data["payload"]["customer"]["city"] == "Testville"
+        mock_dispatch.assert_called_once()
+
+        # Clients poll the operation for the outcome
+        response = admin_api_client.get(data["url"])
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["id"] == data["id"]
 
-    @patch("netbox_rir_manager.api.views.ARINBackend")
-    def test_reassign_api_no_key(self, mock_backend_cls, admin_api_client, rir_network):
+    def test_reassign_api_no_key(self, admin_api_client, rir_network):
         url = reverse("plugins-api:netbox_rir_manager-api:rirnetwork-reassign", args=[rir_network.pk])
         response = admin_api_client.post(
             url,
@@ -318,17 +319,8 @@ class TestRIRNetworkAPIActions:
         )
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
-    @patch("netbox_rir_manager.api.views.ARINBackend")
-    def test_reallocate_api(self, mock_backend_cls, admin_api_client, rir_network, rir_user_key):
-        mock_backend = MagicMock()
-        mock_backend.reallocate_network.return_value = {
-            "ticket_number": "TKT-API-REALLOC",
-            "ticket_type": "IPV4_REALLOCATE",
-            "ticket_status": "PENDING_REVIEW",
-            "raw_data": {},
-        }
-        mock_backend_cls.from_rir_config.return_value = mock_backend
-
+    @patch("netbox_rir_manager.jobs.DispatchWriteOperationsJob.enqueue_dispatch")
+    def test_reallocate_api(self, mock_dispatch, admin_api_client, rir_network, rir_user_key):
         url = reverse("plugins-api:netbox_rir_manager-api:rirnetwork-reallocate", args=[rir_network.pk])
         response = admin_api_client.post(
             url,
@@ -339,34 +331,147 @@ class TestRIRNetworkAPIActions:
             },
             format="json",
         )
-        assert response.status_code == status.HTTP_201_CREATED
-
-    @patch("netbox_rir_manager.api.views.ARINBackend")
-    def test_remove_api(self, mock_backend_cls, admin_api_client, rir_network, rir_user_key):
-        mock_backend = MagicMock()
-        mock_backend.remove_network.return_value = True
-        mock_backend_cls.from_rir_config.return_value = mock_backend
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        assert response.json()["operation"] == "reallocate"
 
+    @patch("netbox_rir_manager.jobs.DispatchWriteOperationsJob.enqueue_dispatch")
+    def test_remove_api(self, mock_dispatch, admin_api_client, rir_network, rir_user_key):
         url = reverse("plugins-api:netbox_rir_manager-api:rirnetwork-remove-net", args=[rir_network.pk])
         response = admin_api_client.post(url, format="json")
-        assert response.status_code == status.HTTP_200_OK
-
-    @patch("netbox_rir_manager.api.views.ARINBackend")
-    def test_delete_arin_api(self, mock_backend_cls, admin_api_client, rir_network, rir_user_key):
-        mock_backend = MagicMock()
-        mock_backend.delete_network.return_value = {
-            "ticket_number": "TKT-API-DELETE",
-            "ticket_type": "NET_DELETE_REQUEST",
-            "ticket_status": "PENDING_REVIEW",
-            "raw_data": {},
-        }
-        mock_backend_cls.from_rir_config.return_value = mock_backend
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        assert response.json()["operation"] == "remove"
 
+    @patch("netbox_rir_manager.jobs.DispatchWriteOperationsJob.enqueue_dispatch")
+    def test_delete_arin_api(self, mock_dispatch, admin_api_client, rir_network, rir_user_key):
         url = reverse("plugins-api:netbox_rir_manager-api:rirnetwork-delete-arin", args=[rir_network.pk])
         response = admin_api_client.post(url, format="json")
-        assert response.status_code == status.HTTP_201_CREATED
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        assert response.json()["operation"] == "delete"
+
+    def test_write_operations_are_read_only(self, admin_api_client, rir_network, rir_user_key):
+        url = reverse("plugins-api:netbox_rir_manager-api:rirwriteoperation-list")
+        response = admin_api_client.post(
+            url, {"rir_config": rir_network.rir_config.pk, "operation": "remove"}, format="json"
+        )
+        assert response.status_code == status.HTTP_405_METHOD_NOT_ALLOWED
 
     def test_ticket_refresh_api(self, admin_api_client, rir_ticket):
         url = reverse("plugins-api:netbox_rir_manager-api:rirticket-refresh", args=[rir_ticket.pk])
         response = admin_api_client.post(url, format="json")
         assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.django_db
+class TestRIRReconciliationReportAPI:
+    def test_list_reports(self, admin_api_client, rir_config):
+        from netbox_rir_manager.models import RIRReconciliationReport
+
+        RIRReconciliationReport.objects.create(rir_config=rir_config, total_drift=0)
+        url = reverse("plugins-api:netbox_rir_manager-api:rirreconciliationreport-list")
+        response = admin_api_client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["count"] == 1
+
+    def test_get_report(self, admin_api_client, rir_config):
+        from netbox_rir_manager.models import RIRReconciliationReport
+
+        report = RIRReconciliationReport.objects.create(
+            rir_config=rir_config, total_drift=1, drift={"stale_net": [{"network": "NET-1"}]}
+        )
+        url = reverse("plugins-api:netbox_rir_manager-api:rirreconciliationreport-detail", args=[report.pk])
+        response = admin_api_client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["drift"]["stale_net"][0]["network"] == "NET-1"
+
+    def test_reports_are_read_only(self, admin_api_client, rir_config):
+        from netbox_rir_manager.models import RIRReconciliationReport
+
+        report = RIRReconciliationReport.objects.create(rir_config=rir_config, total_drift=0)
+        list_url = reverse("plugins-api:netbox_rir_manager-api:rirreconciliationreport-list")
+        detail_url = reverse("plugins-api:netbox_rir_manager-api:rirreconciliationreport-detail", args=[report.pk])
+
+        payload = {"rir_config": rir_config.pk, "total_drift": 5}
+        assert admin_api_client.post(list_url, payload, format="json").status_code == status.HTTP_405_METHOD_NOT_ALLOWED
+        assert (
+            admin_api_client.patch(detail_url, payload, format="json").status_code == status.HTTP_405_METHOD_NOT_ALLOWED
+        )
+        assert admin_api_client.delete(detail_url).status_code == status.HTTP_204_NO_CONTENT
+
+
+@pytest.mark.django_db
+class TestBulkReassignAPI:
+    @pytest.fixture
+    def bulk_setup(self, rir_config, rir_user_key, rir):
+        """Parent NET with auto_reassign plus two reassignable prefixes and one without a tenant."""
+        from dcim.models import Site
+        from ipam.models import Aggregate, Prefix
+        from tenancy.models import Tenant
+
+        from netbox_rir_manager.models import RIRAddress, RIRNetwork
+
+        agg = Aggregate.objects.create(prefix="10.70.0.0/16", rir=rir)
+        parent = RIRNetwork.objects.create(
+            rir_config=rir_config,
+            handle="NET-10-70-0-0-1",
+            net_name="PARENT-NET",
+            aggregate=agg,
+            auto_reassign=True,
+        )
+        site = Site.objects.create(name="Bulk Site", slug="bulk-site")
+        RIRAddress.objects.create(site=site, street_address="1 Main St", city="Montreal", country="CA")
+        tenant = Tenant.objects.create(name="Bulk Tenant", slug="bulk-tenant")
+        prefixes = [
+            Prefix.objects.create(prefix=f"10.70.{i}.0/29", status="active", scope=site, tenant=tenant) for i in (1, 2)
+        ]
+        no_tenant = Prefix.objects.create(prefix="10.70.9.0/29", status="active", scope=site)
+        return parent, prefixes, no_tenant
+
+    def test_enqueues_job_for_valid_prefixes(self, admin_api_client, bulk_setup):
+        _parent, prefixes, no_tenant = bulk_setup
+        url = reverse("plugins-api:netbox_rir_manager-api:bulk_reassign")
+        with (
+            patch("netbox_rir_manager.jobs.BulkReassignJob.enqueue") as mock_enqueue,
+            patch("core.api.serializers.JobSerializer") as mock_serializer,
+        ):
+            mock_serializer.return_value.data = {"id": 1}
+            response = admin_api_client.post(url, {"prefixes": [p.pk for p in (*prefixes, no_tenant)]}, format="json")
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        assert mock_enqueue.call_args.kwargs["prefix_ids"] == [p.pk for p in prefixes]
+        body = response.json()
+        assert body["prefixes"] == [p.pk for p in prefixes]
+        assert body["invalid"][0]["prefix_id"] == no_tenant.pk
+
+    def test_rejects_when_nothing_reassignable(self, admin_api_client, bulk_setup):
+        _parent, _prefixes, no_tenant = bulk_setup
+        url = reverse("plugins-api:netbox_rir_manager-api:bulk_reassign")
+        with patch("netbox_rir_manager.jobs.BulkReassignJob.enqueue") as mock_enqueue:
+            response = admin_api_client.post(url, {"prefixes": [no_tenant.pk]}, format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        mock_enqueue.assert_not_called()
+
+    def test_rejects_prefixes_the_user_cannot_change(self, bulk_setup, rir_config):
+        from core.models import ObjectType
+        from django.contrib.auth import get_user_model
+        from ipam.models import Prefix
+        from rest_framework.test import APIClient
+        from users.models import ObjectPermission
+
+        from netbox_rir_manager.models import RIRUserKey
+
+        _parent, prefixes, _no_tenant = bulk_setup
+        viewer = get_user_model().objects.create_user("viewer", password="password")
+        RIRUserKey.objects.create(user=viewer, rir_config=rir_config, api_key="viewer-key")
+        permission = ObjectPermission.objects.create(name="View prefixes", actions=["view"])
+        permission.object_types.add(ObjectType.objects.get_for_model(Prefix))
+        permission.users.add(viewer)
+        client = APIClient()
+        client.force_authenticate(user=viewer)
+
+        url = reverse("plugins-api:netbox_rir_manager-api:bulk_reassign")
+        with patch("netbox_rir_manager.jobs.BulkReassignJob.enqueue") as mock_enqueue:
+            response = client.post(url, {"prefixes": [p.pk for p in prefixes]}, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        mock_enqueue.assert_not_called()
+        messages = {entry["message"] for entry in response.json()["invalid"]}
+        assert messages == {"You do not have permission to change this prefix"}
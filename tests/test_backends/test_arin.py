@@ -612,6 +612,24 @@ def test_reassign_network_with_net_in_response(mock_api_class, mock_net_class):
     assert result["net"]["handle"] == "NET-CHILD"
 
 
+@patch("regrws.models.Net", new_callable=MagicMock)
+@patch("netbox_rir_manager.backends.arin.Api")
+def test_parent_net_fetched_once_per_backend(mock_api_class, mock_net_class):
+    """Repeated writes under the same parent reuse the fetched parent NET."""
+    mock_api = MagicMock()
+    mock_api_class.return_value = mock_api
+
+    mock_api.net.from_handle.return_value = _make_mock_net(handle="NET-PARENT")
+    mock_api.net.reassign.return_value = _make_mock_ticket_request(ticket_no="TKT-001")
+
+    backend = ARINBackend(api_key="test-key")
+    backend.reassign_network("NET-PARENT", {"net_name": "child-1"})
+    backend.reassign_network("NET-PARENT", {"net_name": "child-2"})
+
+    mock_api.net.from_handle.assert_called_once_with("NET-PARENT")
+    assert mock_api.net.reassign.call_count == 2
+
+
 @patch("netbox_rir_manager.backends.arin.Api")
 def test_reassign_network_error_on_parent_fetch(mock_api_class):
     """reassign_network should return None when parent fetch fails."""
@@ -110,6 +110,22 @@ class TestRIRNetworkFilterSet:
         fs = RIRNetworkFilterSet({"q": "EXAMPLE"}, queryset=qs)
         assert fs.qs.count() == 1
 
+    def test_filter_covers(self, rir_config):
+        from netbox_rir_manager.filtersets import RIRNetworkFilterSet
+        from netbox_rir_manager.models import RIRNetwork
+
+        RIRNetwork.objects.create(
+            rir_config=rir_config,
+            handle="NET-203-0-113-0-1",
+            net_name="DOC-NET",
+            raw_data={"net_blocks": [{"start_address": "203.0.113.0", "cidr_length": 24}]},
+        )
+        qs = RIRNetwork.objects.all()
+        assert RIRNetworkFilterSet({"covers": "203.0.113.7"}, queryset=qs).qs.count() == 1
+        assert RIRNetworkFilterSet({"covers": "198.51.100.1"}, queryset=qs).qs.count() == 0
+        assert RIRNetworkFilterSet({"overlaps": "203.0.112.0/23"}, queryset=qs).qs.count() == 1
+        assert RIRNetworkFilterSet({"covers": "not-an-ip"}, queryset=qs).qs.count() == 0
+
 
 @pytest.mark.django_db
 class TestRIRSyncLogFilterSet:
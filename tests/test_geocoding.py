@@ -0,0 +1,501 @@
+from datetime import timedelta
+
+import pytest
+
+from netbox_rir_manager.services.geocoding import (
+    CachedGeocoder,
+    GeocodingResult,
+    GeocodingService,
+    geocode_cache_stats,
+    normalize_address,
+)
+
+
+class FakeGeocoder(GeocodingService):
+    """Counts provider calls and answers every lookup with one fixed result."""
+
+    def __init__(self, result=True):
+        self.calls = 0
+        self.result = result
+
+    def _answer(self):
+        self.calls += 1
+        if not self.result:
+            return []
+        return [
+            GeocodingResult(
+                street_address="1 Main St",
+                city="Montreal",
+                state_province="QC",
+                postal_code="H1A 1A1",
+                country="CA",
+                raw={"display_name": "1 Main St, Montreal"},
+            )
+        ]
+
+    def geocode(self, address):
+        return next(iter(self._answer()), None)
+
+    def reverse_geocode(self, lat, lng):
+        return next(iter(self._answer()), None)
+
+    def geocode_many(self, address, limit=5):
+        return self._answer()
+
+    def reverse_geocode_many(self, lat, lng, limit=5):
+        return self._answer()
+
+
+def make_cached(provider=None, **kwargs):
+    options = {"ttl": timedelta(hours=1), "max_entries": 100, **kwargs}
+    return CachedGeocoder(provider or FakeGeocoder(), "fake", **options)
+
+
+def test_normalize_address():
+    assert normalize_address("  1 Main St.,\nMontreal ") == normalize_address("1 main st montreal")
+
+
+@pytest.mark.django_db
+class TestCachedGeocoder:
+    def test_hit_is_served_without_provider_call(self):
+        provider = FakeGeocoder()
+        geocoder = make_cached(provider)
+
+        first = geocoder.geocode_many("1 Main St, Montreal")
+        second = geocoder.geocode_many("1 MAIN ST  Montreal.")
+
+        assert provider.calls == 1
+        assert second == first
+        assert second[0].display_name == "1 Main St, Montreal"
+
+    def test_coordinates_are_rounded(self):
+        provider = FakeGeocoder()
+        geocoder = make_cached(provider)
+
+        geocoder.reverse_geocode(45.5017001, -73.5673001)
+        assert geocoder.reverse_geocode(45.5017002, -73.5673002).city == "Montreal"
+        assert provider.calls == 1
+
+    def test_lookups_are_cached_separately(self):
+        provider = FakeGeocoder()
+        geocoder = make_cached(provider)
+
+        geocoder.geocode("1 Main St")
+        geocoder.geocode_many("1 Main St", limit=5)
+        geocoder.geocode_many("1 Main St", limit=3)
+
+        assert provider.calls == 3
+
+    def test_empty_answer_is_not_cached(self):
+        from netbox_rir_manager.models import RIRGeocodeCacheEntry
+
+        provider = FakeGeocoder(result=False)
+        geocoder = make_cached(provider)
+
+        assert geocoder.geocode("Nowhere") is None
+        assert geocoder.geocode("Nowhere") is None
+        assert provider.calls == 2
+        assert not RIRGeocodeCacheEntry.objects.exists()
+
+    def test_expired_entry_is_refreshed(self):
+        from django.utils import timezone
+
+        from netbox_rir_manager.models import RIRGeocodeCacheEntry
+
+        provider = FakeGeocoder()
+        geocoder = make_cached(provider)
+        geocoder.geocode("1 Main St")
+        RIRGeocodeCacheEntry.objects.update(created=timezone.now() - timedelta(hours=2))
+
+        geocoder.geocode("1 Main St")
+
+        assert provider.calls == 2
+        assert RIRGeocodeCacheEntry.objects.count() == 1
+
+    def test_least_recently_used_are_evicted(self):
+        from django.core.cache import cache
+
+        from netbox_rir_manager.models import RIRGeocodeCacheEntry
+        from netbox_rir_manager.services.geocoding import GEOCODE_CACHE_EVICT_KEY
+
+        cache.delete(GEOCODE_CACHE_EVICT_KEY)
+        geocoder = make_cached(max_entries=3)
+        for query in ("first", "second", "third", "fourth"):
+            geocoder.geocode(query)
+        # Evicted once per interval, not on every miss
+        assert RIRGeocodeCacheEntry.objects.count() == 4
+        geocoder.geocode("first")  # hit: "second" and "third" are now the least recently used
+
+        cache.delete(GEOCODE_CACHE_EVICT_KEY)
+        geocoder.geocode("fifth")
+
+        assert sorted(RIRGeocodeCacheEntry.objects.values_list("query", flat=True)) == ["fifth", "first", "fourth"]
+        assert RIRGeocodeCacheEntry.objects.get(query="first").hits == 1
+
+    def test_stats(self):
+        from django.core.cache import cache
+
+        cache.clear()
+        geocoder = make_cached()
+        geocoder.geocode("1 Main St")
+        geocoder.geocode("1 Main St")
+        geocoder.geocode("1 Main St")
+
+        assert geocode_cache_stats() == {"entries": 1, "hits": 2, "misses": 1, "hit_rate": 0.667}
+
+
+class TestNominatimGeocoder:
+    def test_client_is_reused_and_requests_are_rate_limited(self):
+        from unittest.mock import patch
+
+        from netbox_rir_manager.services import geocoding
+
+        geocoding._nominatim_clients.clear()
+        with (
+            patch("geopy.geocoders.Nominatim") as mock_nominatim,
+            patch.object(geocoding.RateLimiter, "acquire") as mock_acquire,
+        ):
+            mock_nominatim.return_value.geocode.return_value = None
+            mock_nominatim.return_value.reverse.return_value = None
+
+            geocoding.NominatimGeocoder().geocode("1 Main St")
+            geocoding.NominatimGeocoder().reverse_geocode(45.5, -73.5)
+
+        mock_nominatim.assert_called_once_with(user_agent="netbox-rir-manager")
+        assert mock_acquire.call_count == 2
+        geocoding._nominatim_clients.clear()
+
+
+CITIES = [
+    # geonameid, name, asciiname, alternatenames, lat, lng, class, code, country, cc2, admin1, ...
+    ["6077243", "Montréal", "Montreal", "", "45.50884", "-73.58781", "P", "PPLA2", "CA", "", "10"],
+    ["6325494", "Québec", "Quebec", "", "46.81228", "-71.21454", "P", "PPLA", "CA", "", "10"],
+    ["5128581", "New York City", "New York City", "", "40.71427", "-74.00597", "P", "PPL", "US", "", "NY"],
+]
+ADMIN1 = [["CA.10", "Québec", "Quebec", "6115047"], ["US.NY", "New York", "New York", "5128638"]]
+POSTCODES = [
+    # country, postcode, place, admin name1, admin code1, admin2, code2, admin3, code3, lat, lng, accuracy
+    ["CA", "H3B", "Montreal Downtown", "Quebec", "QC", "", "", "", "", "45.4995", "-73.5693", "6"],
+    ["US", "10007", "New York", "New York", "NY", "", "", "", "", "40.7135", "-74.0078", "4"],
+]
+
+
+@pytest.fixture
+def gazetteer_files(tmp_path):
+    def write(name, rows, width):
+        path = tmp_path / name
+        path.write_text("".join("\t".join(row + [""] * (width - len(row))) + "\n" for row in rows), encoding="utf-8")
+        return str(path)
+
+    return [
+        write("cities500.txt", CITIES, 19),
+        write("admin1CodesASCII.txt", ADMIN1, 4),
+        write("postcodes.txt", POSTCODES, 12),
+    ]
+
+
+class TestGazetteer:
+    def test_reverse_nearest_place_and_postcode(self, gazetteer_files):
+        from netbox_rir_manager.gazetteer import Gazetteer
+
+        gazetteer = Gazetteer.from_files(gazetteer_files)
+        [match] = gazetteer.reverse(45.5, -73.57)
+
+        assert match.place.name == "Montréal"
+        assert match.place.country == "CA"
+        # admin1 "10" is resolved through its name, not as an ISO code
+        assert match.place.subdivision == "QC"
+        assert match.postal_code == "H3B"
+        assert match.distance_km < 5
+
+    def test_postcode_must_be_in_the_same_country_and_near(self, gazetteer_files):
+        from netbox_rir_manager.gazetteer import Gazetteer
+
+        [match] = Gazetteer.from_files(gazetteer_files).reverse(46.81, -71.21)
+
+        assert match.place.name == "Québec"
+        assert match.postal_code == ""
+
+    def test_nothing_nearby(self, gazetteer_files):
+        from netbox_rir_manager.gazetteer import Gazetteer
+
+        assert Gazetteer.from_files(gazetteer_files).reverse(0.0, 0.0) == []
+
+    def test_postcodes_alone_and_zipped(self, gazetteer_files, tmp_path):
+        import zipfile
+
+        from netbox_rir_manager.gazetteer import Gazetteer
+
+        archive = tmp_path / "allCountries.zip"
+        with zipfile.ZipFile(archive, "w") as zipped:
+            zipped.write(gazetteer_files[2], "allCountries.txt")
+            zipped.writestr("readme.txt", "not data\n")
+        [match] = Gazetteer.from_files([str(archive)]).reverse(40.71, -74.0)
+
+        assert match.place.name == "New York"
+        assert match.place.subdivision == "NY"
+        assert match.postal_code == "10007"
+
+
+class TestOfflineGeocoder:
+    def test_reverse_geocode(self, gazetteer_files):
+        from netbox_rir_manager.services.geocoding import OfflineGeocoder
+
+        result = OfflineGeocoder(gazetteer_files).reverse_geocode(40.71, -74.0)
+
+        assert (result.city, result.state_province, result.postal_code, result.country) == (
+            "New York City",
+            "NY",
+            "10007",
+            "US",
+        )
+        assert result.street_address == ""
+        assert result.raw["geonameid"] == "5128581"
+
+    def test_forward_geocode_finds_nothing(self, gazetteer_files):
+        from netbox_rir_manager.services.geocoding import OfflineGeocoder
+
+        assert OfflineGeocoder(gazetteer_files).geocode("1 Main St, Montreal") is None
+
+    def test_no_files_configured(self):
+        from netbox_rir_manager.services.geocoding import OfflineGeocoder
+
+        assert OfflineGeocoder([]).reverse_geocode(45.5, -73.57) is None
+
+    def test_selected_by_provider_setting(self, settings, gazetteer_files):
+        from netbox_rir_manager.services.geocoding import OfflineGeocoder, _get_geocoding_service
+
+        settings.PLUGINS_CONFIG = {
+            "netbox_rir_manager": {"geocoding_provider": "offline", "geocoding_gazetteer": gazetteer_files}
+        }
+
+        assert isinstance(_get_geocoding_service(), OfflineGeocoder)
+
+
+class SlowGeocoder(FakeGeocoder):
+    """FakeGeocoder that takes ``delay`` seconds to answer, or raises ``error``."""
+
+    def __init__(self, delay=0.0, result=True, error=None):
+        super().__init__(result)
+        self.delay = delay
+        self.error = error
+
+    def _answer(self):
+        import time
+
+        time.sleep(self.delay)
+        if self.error:
+            self.calls += 1
+            raise self.error
+        return super()._answer()
+
+
+class TestHedgedGeocoder:
+    @pytest.fixture(autouse=True)
+    def clear_stats(self):
+        from django.core.cache import cache
+
+        cache.clear()
+        yield
+        cache.clear()
+
+    def _chain(self, first, second, hedge_delay=0.2, timeouts=(5, 5)):
+        from netbox_rir_manager.services.geocoding import HedgedGeocoder
+
+        return HedgedGeocoder([("nominatim", first, timeouts[0]), ("google", second, timeouts[1])], hedge_delay)
+
+    def test_fast_first_provider_wins_without_hedging(self):
+        first, second = SlowGeocoder(), SlowGeocoder()
+
+        assert self._chain(first, second).geocode("1 Main St").city == "Montreal"
+        assert (first.calls, second.calls) == (1, 0)
+
+    def test_slow_provider_is_hedged(self):
+        import time
+
+        first, second = SlowGeocoder(delay=1.0), SlowGeocoder()
+
+        started = time.monotonic()
+        assert len(self._chain(first, second).geocode_many("1 Main St")) == 1
+        assert time.monotonic() - started < 0.9
+        assert second.calls == 1
+
+    def test_empty_or_failed_answer_falls_back_at_once(self):
+        import time
+
+        for first in (SlowGeocoder(result=False), SlowGeocoder(error=RuntimeError("down"))):
+            second = SlowGeocoder()
+            started = time.monotonic()
+            # The hedge delay is never waited for
+            assert self._chain(first, second, hedge_delay=5).reverse_geocode(45.5, -73.57) is not None
+            assert time.monotonic() - started < 1
+            assert (first.calls, second.calls) == (1, 1)
+
+    def test_timeout_and_no_answer(self):
+        first, second = SlowGeocoder(delay=0.5), SlowGeocoder(result=False)
+
+        assert self._chain(first, second, hedge_delay=5, timeouts=(0.1, 5)).geocode("1 Main St") is None
+        assert second.calls == 1
+
+    def test_provider_stats(self):
+        from netbox_rir_manager.services.geocoding import geocoding_provider_stats
+
+        chain = self._chain(SlowGeocoder(result=False), SlowGeocoder(delay=0.01), hedge_delay=5)
+        chain.geocode("1 Main St")
+        chain.geocode("2 Main St")
+
+        stats = geocoding_provider_stats()
+        assert stats["nominatim"]["calls"] == 2
+        assert stats["nominatim"]["empty"] == 2
+        assert stats["google"]["answers"] == 2
+        assert stats["google"]["fallback_wins"] == 2
+        assert stats["google"]["mean_ms"] >= 10
+
+    def test_provider_failure_is_counted_as_error(self):
+        from unittest.mock import patch
+
+        from netbox_rir_manager.services import geocoding
+
+        nominatim = geocoding.NominatimGeocoder()
+        chain = self._chain(nominatim, SlowGeocoder(), hedge_delay=5)
+        with patch.object(geocoding.NominatimGeocoder, "_request", side_effect=RuntimeError("down")):
+            assert chain.geocode("1 Main St").city == "Montreal"
+            # Outside a chain the provider still logs the failure and answers nothing
+            assert geocoding.NominatimGeocoder().geocode("1 Main St") is None
+
+        stats = geocoding.geocoding_provider_stats()
+        assert stats["nominatim"]["errors"] == 1
+        assert stats["nominatim"]["empty"] == 0
+
+    def test_service_for_provider_list(self, settings):
+        from netbox_rir_manager.services.geocoding import (
+            GoogleGeocoder,
+            HedgedGeocoder,
+            NominatimGeocoder,
+            _get_geocoding_service,
+        )
+
+        settings.PLUGINS_CONFIG = {
+            "netbox_rir_manager": {
+                "geocoding_provider": ["google", "nominatim"],
+                "google_geocoding_api_key": "key",
+                "geocoding_timeouts": {"google": 2},
+                "geocoding_hedge_delay": 0.5,
+            }
+        }
+        service = _get_geocoding_service()
+
+        assert service.provider == "google,nominatim"
+        chain = service._geocoder
+        assert isinstance(chain, HedgedGeocoder)
+        assert chain.hedge_delay == 0.5
+        (google, google_service, google_timeout), (nominatim, nominatim_service, nominatim_timeout) = chain.providers
+        assert (google, google_timeout) == ("google", 2)
+        assert isinstance(google_service, GoogleGeocoder)
+        assert (nominatim, nominatim_timeout) == ("nominatim", 10.0)
+        assert isinstance(nominatim_service, NominatimGeocoder)
+
+    def test_google_without_api_key_is_skipped(self, settings):
+        from netbox_rir_manager.services.geocoding import NominatimGeocoder, _get_geocoding_service
+
+        settings.PLUGINS_CONFIG = {
+            "netbox_rir_manager": {"geocoding_provider": ["google", "nominatim"], "geocode_cache_ttl_hours": 0}
+        }
+
+        assert isinstance(_get_geocoding_service(), NominatimGeocoder)
+
+
+class DeferredExecutor:
+    """Collects submitted lookups so a test decides when each source answers."""
+
+    def __init__(self):
+        self.calls = []
+
+    def submit(self, fn, *args):
+        self.calls.append((fn, args))
+
+    def run(self, index):
+        fn, args = self.calls[index]
+        fn(*args)
+
+
+@pytest.mark.django_db
+class TestCandidateSearch:
+    @pytest.fixture
+    def site(self):
+        from dcim.models import Site
+
+        return Site.objects.create(
+            name="Site 1", slug="site-1", latitude=45.5, longitude=-73.57, physical_address="1 Main St, Montreal"
+        )
+
+    def _start(self, site, query=None, geocoder=None):
+        from unittest.mock import patch
+
+        from netbox_rir_manager.services import address_candidates
+
+        executor = DeferredExecutor()
+        with (
+            patch(
+                "netbox_rir_manager.services.geocoding._get_geocoding_service", return_value=geocoder or FakeGeocoder()
+            ),
+            patch.object(address_candidates, "_get_executor", return_value=executor),
+        ):
+            search_id = address_candidates.start_candidate_search(site, query=query)
+        return search_id, executor
+
+    def test_sources_run_concurrently_and_stream(self, site):
+        from netbox_rir_manager.services.address_candidates import get_candidate_search
+
+        search_id, executor = self._start(site)
+        assert len(executor.calls) == 2  # coordinates and physical address, both started at once
+
+        search = get_candidate_search(search_id, site)
+        assert search["done"] is False
+        assert search["candidates"] == []
+
+        executor.run(1)
+        search = get_candidate_search(search_id, site)
+        assert [source["done"] for source in search["sources"]] == [False, True]
+        assert len(search["candidates"]) == 1
+
+        executor.run(0)
+        search = get_candidate_search(search_id, site)
+        assert search["done"] is True
+        # Both sources found the same address
+        assert len(search["candidates"]) == 1
+
+    def test_query_is_listed_first(self, site):
+        from netbox_rir_manager.services.address_candidates import get_candidate_search
+
+        search_id, _executor = self._start(site, query="2 Main St")
+
+        labels = [source["label"] for source in get_candidate_search(search_id, site)["sources"]]
+        assert labels == ["Search", "Coordinates", "Physical address"]
+
+    def test_failed_source_is_reported(self, site):
+        from unittest.mock import MagicMock
+
+        from netbox_rir_manager.services.address_candidates import get_candidate_search
+
+        geocoder = MagicMock()
+        geocoder.reverse_geocode_many.side_effect = RuntimeError("provider down")
+        geocoder.geocode_many.return_value = []
+        search_id, executor = self._start(site, geocoder=geocoder)
+        executor.run(0)
+        executor.run(1)
+
+        search = get_candidate_search(search_id, site)
+        assert search["done"] is True
+        assert search["sources"][0]["error"] == "provider down"
+
+    def test_other_site_or_unknown_search(self, site):
+        from dcim.models import Site
+
+        from netbox_rir_manager.services.address_candidates import get_candidate_search
+
+        search_id, _executor = self._start(site)
+        other = Site.objects.create(name="Site 2", slug="site-2")
+
+        assert get_candidate_search(search_id, other) is None
+        assert get_candidate_search("unknown", site) is None
@@ -2,14 +2,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-
-def make_runner(cls):
-    """Create a job runner with mocked job and logger (bypasses __init__)."""
-    runner = cls.__new__(cls)
-    runner.job = MagicMock()
-    runner.job.data = {}
-    runner.logger = MagicMock()
-    return runner
+from tests.conftest import make_runner
 
 
 @pytest.mark.django_db
@@ -652,6 +645,127 @@ class TestReassignJobPreFlight:
         mock_backend.reassign_network.assert_called_once()
 
 
+@pytest.mark.django_db
+class TestReassignJobIdempotency:
+    @pytest.fixture
+    def prefix(self, rir_config, rir, rir_organization):
+        from ipam.models import Aggregate, Prefix
+        from tenancy.models import Tenant
+
+        from netbox_rir_manager.models import RIRNetwork
+
+        agg = Aggregate.objects.create(prefix="10.0.0.0/20", rir=rir)
+        RIRNetwork.objects.create(
+            rir_config=rir_config, handle="NET-PARENT-20", net_name="PARENT-NET", aggregate=agg, auto_reassign=True
+        )
+        tenant = Tenant.objects.create(name="Test Tenant", slug="test-tenant")
+        rir_organization.tenant = tenant
+        rir_organization.save()
+        return Prefix.objects.create(prefix="10.0.1.0/29", tenant=tenant)
+
+    @patch("netbox_rir_manager.jobs.ARINBackend")
+    def test_duplicate_job_does_not_call_arin_again(self, mock_backend_class, prefix, rir_user_key):
+        from netbox_rir_manager.jobs import ReassignJob
+        from netbox_rir_manager.models import RIRWriteOperation
+
+        mock_backend = mock_backend_class.from_rir_config.return_value
+        mock_backend.find_net.return_value = None
+        mock_backend.reassign_network.return_value = {"ticket_number": "TKT-ONCE", "raw_data": {}}
+
+        first = make_runner(ReassignJob)
+        first.run(prefix_id=prefix.pk, user_key_id=rir_user_key.pk)
+        second = make_runner(ReassignJob)
+        second.run(prefix_id=prefix.pk, user_key_id=rir_user_key.pk)
+
+        mock_backend.reassign_network.assert_called_once()
+        assert first.job.data["status"] == "success"
+        assert second.job.data["status"] == "skipped"
+        write_operation = RIRWriteOperation.objects.get()
+        assert write_operation.status == "completed"
+        assert write_operation.ticket.ticket_number == "TKT-ONCE"
+        assert write_operation.payload["org_handle"] == "TESTORG-ARIN"
+
+    @patch("netbox_rir_manager.jobs.ARINBackend")
+    def test_resumes_from_checkpointed_reassignment(self, mock_backend_class, prefix, rir_user_key):
+        """A job that died after ARIN accepted the reassignment is finished without a second call."""
+        from netbox_rir_manager.jobs import ReassignJob
+        from netbox_rir_manager.models import RIRNetwork, RIRTicket, RIRWriteOperation
+        from netbox_rir_manager.services.outbox import idempotency_key
+
+        parent = RIRNetwork.objects.get(handle="NET-PARENT-20")
+        write_operation = RIRWriteOperation.objects.create(
+            rir_config=parent.rir_config,
+            network=parent,
+            network_handle=parent.handle,
+            operation="reassign",
+            status="failed",
+            idempotency_key=idempotency_key("reassign", parent.handle, "10.0.1.0", "10.0.1.7"),
+            result={"reassignment": {"ticket_number": "TKT-EARLIER", "raw_data": {}}},
+        )
+        mock_backend = mock_backend_class.from_rir_config.return_value
+
+        runner = make_runner(ReassignJob)
+        runner.run(prefix_id=prefix.pk, user_key_id=rir_user_key.pk)
+
+        mock_backend.find_net.assert_not_called()
+        mock_backend.reassign_network.assert_not_called()
+        assert runner.job.data["status"] == "success"
+        assert RIRTicket.objects.filter(ticket_number="TKT-EARLIER").exists()
+        write_operation.refresh_from_db()
+        assert write_operation.status == "completed"
+        assert write_operation.attempts == 1
+
+    @patch("netbox_rir_manager.jobs.DispatchWriteOperationsJob.enqueue_dispatch")
+    @patch("netbox_rir_manager.jobs.ARINBackend")
+    def test_operation_of_a_dead_job_is_taken_over(self, mock_backend_class, mock_dispatch, prefix, rir_user_key):
+        """Both the job and a retry from the UI/API take over once the lease has expired, and only then."""
+        from datetime import timedelta
+
+        from django.utils import timezone
+
+        from netbox_rir_manager.jobs import ReassignJob
+        from netbox_rir_manager.models import RIRNetwork, RIRWriteOperation
+        from netbox_rir_manager.services.outbox import WRITE_LEASE, idempotency_key, queue_write_operation
+
+        parent = RIRNetwork.objects.get(handle="NET-PARENT-20")
+        payload = {"reassignment_type": "detailed", "org_handle": "TESTORG-ARIN"}
+        payload.update(start_address="10.0.1.0", end_address="10.0.1.7")
+        write_operation = RIRWriteOperation.objects.create(
+            rir_config=parent.rir_config,
+            network=parent,
+            network_handle=parent.handle,
+            operation="reassign",
+            status="running",
+            payload=payload,
+            idempotency_key=idempotency_key("reassign", parent.handle, "10.0.1.0", "10.0.1.7"),
+        )
+
+        def checkpointed(ago):
+            RIRWriteOperation.objects.filter(pk=write_operation.pk).update(
+                status="running", last_updated=timezone.now() - ago
+            )
+
+        checkpointed(timedelta(minutes=1))
+        runner = make_runner(ReassignJob)
+        runner.run(prefix_id=prefix.pk, user_key_id=rir_user_key.pk)
+        assert runner.job.data["status"] == "skipped"
+        assert queue_write_operation(parent, rir_user_key, "reassign", payload).status == "running"
+
+        checkpointed(WRITE_LEASE + timedelta(minutes=1))
+        assert queue_write_operation(parent, rir_user_key, "reassign", payload).status == "pending"
+
+        checkpointed(WRITE_LEASE + timedelta(minutes=1))
+        mock_backend = mock_backend_class.from_rir_config.return_value
+        mock_backend.find_net.return_value = None
+        mock_backend.reassign_network.return_value = {"ticket_number": "TKT-TAKEOVER", "raw_data": {}}
+        runner = make_runner(ReassignJob)
+        runner.run(prefix_id=prefix.pk, user_key_id=rir_user_key.pk)
+
+        assert runner.job.data["status"] == "success"
+        write_operation.refresh_from_db()
+        assert write_operation.status == "completed"
+
+
 @pytest.mark.django_db
 class TestRemoveNetworkJob:
     @patch("netbox_rir_manager.jobs.ARINBackend")
@@ -698,6 +812,183 @@ class TestRemoveNetworkJob:
         assert log.status == "error"
 
 
+@pytest.mark.django_db
+class TestBulkReassignJob:
+    @pytest.fixture
+    def bulk_setup(self, rir_config, rir_user_key, rir):
+        """Parent NET with auto_reassign plus two reassignable prefixes and one without a tenant."""
+        from dcim.models import Site
+        from ipam.models import Aggregate, Prefix
+        from tenancy.models import Tenant
+
+        from netbox_rir_manager.models import RIRAddress, RIRNetwork
+
+        agg = Aggregate.objects.create(prefix="10.70.0.0/16", rir=rir)
+        parent = RIRNetwork.objects.create(
+            rir_config=rir_config,
+            handle="NET-10-70-0-0-1",
+            net_name="PARENT-NET",
+            aggregate=agg,
+            auto_reassign=True,
+        )
+        site = Site.objects.create(name="Bulk Site", slug="bulk-site")
+        RIRAddress.objects.create(site=site, street_address="1 Main St", city="Montreal", country="CA")
+        tenant = Tenant.objects.create(name="Bulk Tenant", slug="bulk-tenant")
+        prefixes = [
+            Prefix.objects.create(prefix=f"10.70.{i}.0/29", status="active", scope=site, tenant=tenant) for i in (1, 2)
+        ]
+        no_tenant = Prefix.objects.create(prefix="10.70.9.0/29", status="active", scope=site)
+        return parent, prefixes, no_tenant
+
+    @patch("netbox_rir_manager.jobs.ARINBackend")
+    def test_reassigns_valid_prefixes(self, mock_backend_class, bulk_setup, admin_user):
+        from netbox_rir_manager.jobs import BulkReassignJob
+        from netbox_rir_manager.models import RIRCustomer, RIRTicket
+
+        parent, prefixes, no_tenant = bulk_setup
+        mock_backend = MagicMock()
+        mock_backend.find_net.return_value = None
+        mock_backend.create_customer.side_effect = [{"handle": "C-1"}, {"handle": "C-2"}]
+        mock_backend.reassign_network.side_effect = [
+            {"ticket_number": "TKT-1", "ticket_status": "PENDING_REVIEW"},
+            {"ticket_number": "TKT-2", "ticket_status": "PENDING_REVIEW"},
+        ]
+        mock_backend_class.from_rir_config.return_value = mock_backend
+
+        runner = make_runner(BulkReassignJob)
+        runner.run(prefix_ids=[p.pk for p in (*prefixes, no_tenant)], user_id=admin_user.pk)
+
+        mock_backend_class.from_rir_config.assert_called_once()
+        mock_backend.prefetch_parent_nets.assert_called_once_with([parent.handle])
+        assert mock_backend.reassign_network.call_count == 2
+        assert runner.job.data["counts"] == {"success": 2, "invalid": 1}
+        assert sorted(runner.job.data["tickets"]) == ["TKT-1", "TKT-2"]
+        assert RIRTicket.objects.filter(ticket_number__in=["TKT-1", "TKT-2"]).count() == 2
+        assert RIRCustomer.objects.filter(handle__in=["C-1", "C-2"]).count() == 2
+        invalid = [entry for entry in runner.job.data["results"] if entry["status"] == "invalid"]
+        assert invalid[0]["prefix_id"] == no_tenant.pk
+
+    @patch("netbox_rir_manager.services.geocoding.resolve_site_address")
+    @patch("netbox_rir_manager.jobs.ARINBackend")
+    def test_site_address_resolved_once(self, mock_backend_class, mock_resolve, bulk_setup, admin_user):
+        from netbox_rir_manager.jobs import BulkReassignJob
+        from netbox_rir_manager.models import RIRAddress
+
+        _parent, prefixes, _no_tenant = bulk_setup
+        mock_resolve.return_value = RIRAddress.objects.get(city="Montreal")
+        mock_backend = MagicMock()
+        mock_backend.find_net.return_value = None
+        mock_backend.create_customer.return_value = None
+        mock_backend_class.from_rir_config.return_value = mock_backend
+
+        runner = make_runner(BulkReassignJob)
+        runner.run(prefix_ids=[p.pk for p in prefixes], user_id=admin_user.pk)
+
+        mock_resolve.assert_called_once()
+        assert runner.job.data["counts"] == {"error": 2}
+
+    @patch("netbox_rir_manager.jobs.ARINBackend")
+    def test_no_api_key_for_user(self, mock_backend_class, bulk_setup, rir_config):
+        from django.contrib.auth import get_user_model
+
+        from netbox_rir_manager.jobs import BulkReassignJob
+
+        _parent, prefixes, _no_tenant = bulk_setup
+        other = get_user_model().objects.create_user(username="nokey", password="nokey")
+
+        runner = make_runner(BulkReassignJob)
+        runner.run(prefix_ids=[p.pk for p in prefixes], user_id=other.pk)
+
+        mock_backend_class.from_rir_config.assert_not_called()
+        assert runner.job.data["counts"] == {"invalid": 2}
+        assert "No API key" in runner.job.data["results"][0]["message"]
+
+
+@pytest.mark.django_db
+class TestBatchRemoveNetworkJob:
+    @patch("netbox_rir_manager.jobs.ARINBackend")
+    def test_removes_with_one_backend_per_config(self, mock_backend_class, rir_config, rir_user_key):
+        from netbox_rir_manager.jobs import BatchRemoveNetworkJob
+        from netbox_rir_manager.models import RIRNetwork, RIRSyncLog
+
+        nets = [
+            RIRNetwork.objects.create(rir_config=rir_config, handle=f"NET-BATCH-{i}", net_name="BATCH-NET")
+            for i in range(3)
+        ]
+
+        mock_backend = MagicMock()
+        mock_backend.remove_network.side_effect = [True, False, True]
+        mock_backend_class.from_rir_config.return_value = mock_backend
+
+        runner = make_runner(BatchRemoveNetworkJob)
+        runner.job.user = None
+        runner.run(network_ids=[net.pk for net in nets])
+
+        mock_backend_class.from_rir_config.assert_called_once()
+        assert mock_backend.remove_network.call_count == 3
+        assert runner.job.data["counts"] == {"success": 2, "error": 1}
+        statuses = {entry["handle"]: entry["status"] for entry in runner.job.data["results"]}
+        assert statuses == {"NET-BATCH-0": "success", "NET-BATCH-1": "error", "NET-BATCH-2": "success"}
+        assert RIRSyncLog.objects.filter(operation="remove", object_handle__startswith="NET-BATCH-").count() == 3
+
+    @patch("netbox_rir_manager.jobs.ARINBackend")
+    def test_failing_network_does_not_abort_the_batch(self, mock_backend_class, rir_config, rir_user_key):
+        from netbox_rir_manager.jobs import BatchRemoveNetworkJob
+        from netbox_rir_manager.models import RIRNetwork, RIRSyncLog
+
+        nets = [
+            RIRNetwork.objects.create(rir_config=rir_config, handle=f"NET-RAISE-{i}", net_name="RAISE-NET")
+            for i in range(3)
+        ]
+        mock_backend_class.from_rir_config.return_value.remove_network.side_effect = [
+            True,
+            RuntimeError("ARIN down"),
+            True,
+        ]
+
+        runner = make_runner(BatchRemoveNetworkJob)
+        runner.job.user = None
+        runner.run(network_ids=[net.pk for net in nets])
+
+        assert runner.job.data["counts"] == {"success": 2, "error": 1}
+        [failed] = [entry for entry in runner.job.data["results"] if entry["status"] == "error"]
+        assert failed["handle"] == "NET-RAISE-1"
+        assert "ARIN down" in failed["message"]
+        assert RIRSyncLog.objects.get(object_handle="NET-RAISE-1").status == "error"
+
+    @patch("netbox_rir_manager.jobs.ARINBackend")
+    def test_missing_and_allocation_networks_skipped(self, mock_backend_class, rir_config, rir_user_key, rir):
+        from ipam.models import Aggregate
+
+        from netbox_rir_manager.jobs import BatchRemoveNetworkJob
+        from netbox_rir_manager.models import RIRNetwork
+
+        agg = Aggregate.objects.create(prefix="10.60.0.0/16", rir=rir)
+        parent = RIRNetwork.objects.create(rir_config=rir_config, handle="NET-BATCH-P", net_name="P", aggregate=agg)
+
+        runner = make_runner(BatchRemoveNetworkJob)
+        runner.job.user = None
+        runner.run(network_ids=[parent.pk, 999999])
+
+        mock_backend_class.from_rir_config.assert_not_called()
+        assert runner.job.data["counts"] == {"skipped": 2}
+
+    @patch("netbox_rir_manager.jobs.ARINBackend")
+    def test_config_without_api_key(self, mock_backend_class, rir_config):
+        from netbox_rir_manager.jobs import BatchRemoveNetworkJob
+        from netbox_rir_manager.models import RIRNetwork
+
+        net = RIRNetwork.objects.create(rir_config=rir_config, handle="NET-BATCH-NOKEY", net_name="NOKEY")
+
+        runner = make_runner(BatchRemoveNetworkJob)
+        runner.job.user = None
+        runner.run(network_ids=[net.pk])
+
+        mock_backend_class.from_rir_config.assert_not_called()
+        assert runner.job.data["results"][0]["status"] == "error"
+        assert "No API key" in runner.job.data["results"][0]["message"]
+
+
 @pytest.mark.django_db
 class TestChangelogEntries:
     """Verify that sync operations create ObjectChange changelog entries."""
@@ -771,3 +1062,478 @@ class TestChangelogEntries:
 
         # No ObjectChange should be created since user is not a real User
         assert ObjectChange.objects.count() == initial_count
+
+
+@pytest.mark.django_db
+class TestProcessPendingReassignsJob:
+    @pytest.fixture
+    def queued(self, rir_config, rir_user_key, rir):
+        """Two prefixes queued under the same parent NET."""
+        from dcim.models import Site
+        from ipam.models import Aggregate, Prefix
+        from tenancy.models import Tenant
+
+        from netbox_rir_manager.models import RIRNetwork, RIRPendingReassign
+
+        agg = Aggregate.objects.create(prefix="10.40.0.0/16", rir=rir)
+        parent = RIRNetwork.objects.create(
+            rir_config=rir_config,
+            handle="NET-10-40-0-0-1",
+            net_name="PARENT-NET",
+            aggregate=agg,
+        )
+        site = Site.objects.create(name="Batch Site", slug="batch-site")
+        tenant = Tenant.objects.create(name="Batch Tenant", slug="batch-tenant")
+        prefixes = [
+            Prefix.objects.create(prefix=f"10.40.{i}.0/29", status="active", scope=site, tenant=tenant) for i in (1, 2)
+        ]
+        for pfx in prefixes:
+            RIRPendingReassign.objects.create(
+                prefix=pfx, rir_config=rir_config, parent_network=parent, user_key=rir_user_key
+            )
+        return parent, prefixes
+
+    @patch("netbox_rir_manager.services.reassign.reassign_prefix")
+    @patch("netbox_rir_manager.jobs.ARINBackend")
+    def test_drains_queue_with_one_backend(self, mock_backend_class, mock_reassign, queued):
+        from netbox_rir_manager.jobs import ProcessPendingReassignsJob
+        from netbox_rir_manager.models import RIRPendingReassign
+
+        mock_backend = mock_backend_class.from_rir_config.return_value
+        mock_backend.find_net.return_value = None
+        mock_reassign.return_value = {"status": "success", "ticket_number": "TKT-1"}
+        runner = make_runner(ProcessPendingReassignsJob)
+        runner.run()
+
+        mock_backend_class.from_rir_config.assert_called_once()
+        assert mock_backend.find_net.call_count == 2
+        assert mock_reassign.call_count == 2
+        # The batch pre-flight results are handed to the write path
+        assert all(call.kwargs["preflight"] for call in mock_reassign.call_args_list)
+        assert runner.job.data["counts"] == {"success": 2}
+        assert not RIRPendingReassign.objects.exists()
+
+    @patch("netbox_rir_manager.services.reassign.reassign_prefix")
+    @patch("netbox_rir_manager.jobs.ARINBackend")
+    def test_failing_prefix_does_not_abort_the_batch(self, mock_backend_class, mock_reassign, queued, monkeypatch):
+        from netbox_rir_manager.jobs import ProcessPendingReassignsJob
+        from netbox_rir_manager.models import RIRPendingReassign
+
+        _parent, prefixes = queued
+        mock_backend_class.from_rir_config.return_value.find_net.return_value = None
+        mock_reassign.side_effect = [RuntimeError("ARIN exploded"), {"status": "success"}]
+        monkeypatch.setattr(ProcessPendingReassignsJob, "batch_size", 1)
+
+        with patch.object(ProcessPendingReassignsJob, "enqueue_debounced") as mock_enqueue:
+            first = make_runner(ProcessPendingReassignsJob)
+            first.run()
+            mock_enqueue.assert_called_once()
+            second = make_runner(ProcessPendingReassignsJob)
+            second.run()
+
+        assert first.job.data["results"][0]["status"] == "error"
+        assert first.job.data["results"][0]["message"] == "ARIN exploded"
+        # The failing row was removed, so the next batch moved on to the other prefix
+        assert mock_reassign.call_args.args[0] == prefixes[1]
+        assert second.job.data["counts"] == {"success": 1}
+        assert not RIRPendingReassign.objects.exists()
+
+    @patch("netbox_rir_manager.services.reassign.reassign_prefix")
+    @patch("netbox_rir_manager.jobs.ARINBackend")
+    def test_skips_prefix_no_longer_qualifying(self, mock_backend_class, mock_reassign, queued):
+        from netbox_rir_manager.jobs import ProcessPendingReassignsJob
+
+        _parent, prefixes = queued
+        prefixes[0].status = "reserved"
+        prefixes[0].save()
+
+        mock_backend_class.from_rir_config.return_value.find_net.return_value = None
+        mock_reassign.return_value = {"status": "success"}
+        runner = make_runner(ProcessPendingReassignsJob)
+        runner.run()
+
+        assert mock_reassign.call_count == 1
+        assert runner.job.data["counts"] == {"skipped": 1, "success": 1}
+
+    @patch("netbox_rir_manager.services.reassign.reassign_prefix")
+    @patch("netbox_rir_manager.jobs.ARINBackend")
+    def test_already_reassigned_is_synced_without_write(self, mock_backend_class, mock_reassign, queued):
+        from netbox_rir_manager.jobs import ProcessPendingReassignsJob
+        from netbox_rir_manager.models import RIRNetwork
+
+        _parent, prefixes = queued
+        mock_backend = mock_backend_class.from_rir_config.return_value
+        mock_backend.find_net.side_effect = lambda start, end: (
+            {"handle": "NET-10-40-1-0-1", "net_name": "EXISTING"} if start == "10.40.1.0" else None
+        )
+        mock_reassign.return_value = {"status": "success"}
+        runner = make_runner(ProcessPendingReassignsJob)
+        runner.run()
+
+        assert mock_reassign.call_count == 1
+        assert mock_reassign.call_args.args[0] == prefixes[1]
+        mock_backend.reassign_network.assert_not_called()
+        assert RIRNetwork.objects.get(handle="NET-10-40-1-0-1").prefix == prefixes[0]
+        assert runner.job.data["counts"] == {"synced": 1, "success": 1}
+
+    def test_enqueue_debounced_skips_when_waiting(self):
+        from netbox_rir_manager.jobs import ProcessPendingReassignsJob
+
+        with (
+            patch.object(ProcessPendingReassignsJob, "get_jobs") as mock_get_jobs,
+            patch.object(ProcessPendingReassignsJob, "enqueue") as mock_enqueue,
+        ):
+            mock_get_jobs.return_value.filter.return_value.exists.return_value = True
+            ProcessPendingReassignsJob.enqueue_debounced()
+            mock_enqueue.assert_not_called()
+
+            mock_get_jobs.return_value.filter.return_value.exists.return_value = False
+            ProcessPendingReassignsJob.enqueue_debounced()
+            mock_enqueue.assert_called_once()
+
+    def test_system_job_scheduling_is_netbox_enqueue_once(self):
+        from netbox.jobs import JobRunner
+
+        from netbox_rir_manager.jobs import ProcessPendingReassignsJob, ScheduledRIRSyncJob
+
+        # rqworker schedules system jobs through enqueue_once(interval=...)
+        assert ScheduledRIRSyncJob.enqueue_once.__func__ is JobRunner.enqueue_once.__func__
+        assert ProcessPendingReassignsJob.enqueue_once.__func__ is JobRunner.enqueue_once.__func__
+
+
+@pytest.mark.django_db
+class TestDispatchWriteOperationsJob:
+    @pytest.fixture
+    def queue(self, rir_network, rir_user_key):
+        from netbox_rir_manager.models import RIRWriteOperation
+
+        def queue(operation, payload=None):
+            return RIRWriteOperation.objects.create(
+                rir_config=rir_network.rir_config,
+                network=rir_network,
+                network_handle=rir_network.handle,
+                operation=operation,
+                user_key=rir_user_key,
+                payload=payload or {},
+            )
+
+        return queue
+
+    simple_reassign = {
+        "reassignment_type": "simple",
+        "net_name": "",
+        "start_address": "10.0.0.0",
+        "end_address": "10.0.0.255",
+        "customer": {
+            "customer_name": "Test Customer",
+            "street_address": "",
+            "city": "Testville",
+            "state_province": "",
+            "postal_code": "",
+            "country": "US",
+        },
+    }
+
+    @patch("netbox_rir_manager.jobs.ARINBackend")
+    def test_reassign_success(self, mock_backend_class, queue):
+        from netbox_rir_manager.jobs import DispatchWriteOperationsJob
+        from netbox_rir_manager.models import RIRCustomer, RIRSyncLog
+
+        mock_backend = mock_backend_class.from_rir_config.return_value
+        mock_backend.create_customer.return_value = {"handle": "C-TEST"}
+        mock_backend.reassign_network.return_value = {
+            "ticket_number": "TKT-REASSIGN-001",
+            "ticket_type": "IPV4_SIMPLE_REASSIGN",
+            "ticket_status": "PENDING_REVIEW",
+            "raw_data": {},
+        }
+        write_operation = queue("reassign", self.simple_reassign)
+
+        runner = make_runner(DispatchWriteOperationsJob)
+        runner.run()
+
+        write_operation.refresh_from_db()
+        assert write_operation.status == "completed"
+        assert write_operation.ticket.ticket_number == "TKT-REASSIGN-001"
+        assert write_operation.ticket.ticket_type == "IPV4_SIMPLE_REASSIGN"
+        assert write_operation.completed is not None
+        assert RIRCustomer.objects.filter(handle="C-TEST").exists()
+        net_data = mock_backend.reassign_network.call_args.args[1]
+        assert net_data["customer_handle"] == "C-TEST"
+        assert RIRSyncLog.objects.filter(operation="reassign", status="success").exists()
+        assert runner.job.data["counts"] == {"completed": 1}
+
+    @patch("netbox_rir_manager.jobs.DispatchWriteOperationsJob.enqueue_dispatch")
+    @patch("netbox_rir_manager.jobs.ARINBackend")
+    def test_failed_reassign_is_retried_without_new_customer(self, mock_backend_class, mock_dispatch, queue):
+        from netbox_rir_manager.jobs import DispatchWriteOperationsJob
+        from netbox_rir_manager.models import RIRCustomer
+
+        mock_backend = mock_backend_class.from_rir_config.return_value
+        mock_backend.create_customer.return_value = {"handle": "C-TEST"}
+        mock_backend.reassign_network.return_value = None
+        write_operation = queue("reassign", self.simple_reassign)
+
+        make_runner(DispatchWriteOperationsJob).run()
+
+        write_operation.refresh_from_db()
+        assert write_operation.status == "pending"
+        assert write_operation.attempts == 1
+        assert write_operation.next_attempt is not None
+        assert write_operation.result["customer_handle"] == "C-TEST"
+        # A retry is scheduled for when the operation is due again
+        assert mock_dispatch.call_args.kwargs["schedule_at"] == write_operation.next_attempt
+
+        write_operation.next_attempt = None
+        write_operation.save()
+        mock_backend.reassign_network.return_value = {"ticket_number": "TKT-RETRY", "raw_data": {}}
+        make_runner(DispatchWriteOperationsJob).run()
+
+        write_operation.refresh_from_db()
+        assert write_operation.status == "completed"
+        assert write_operation.attempts == 2
+        mock_backend.create_customer.assert_called_once()
+        assert RIRCustomer.objects.filter(handle="C-TEST").count() == 1
+
+    @patch("netbox_rir_manager.jobs.ARINBackend")
+    def test_resumed_reassign_records_checkpointed_customer(self, mock_backend_class, queue):
+        from netbox_rir_manager.jobs import DispatchWriteOperationsJob
+        from netbox_rir_manager.models import RIRCustomer
+
+        mock_backend = mock_backend_class.from_rir_config.return_value
+        mock_backend.reassign_network.return_value = {"ticket_number": "TKT-RESUMED", "raw_data": {}}
+        # The worker died after checkpointing the customer, before recording it locally
+        write_operation = queue("reassign", self.simple_reassign)
+        write_operation.result = {"customer_handle": "C-TEST"}
+        write_operation.save()
+
+        make_runner(DispatchWriteOperationsJob).run()
+
+        write_operation.refresh_from_db()
+        assert write_operation.status == "completed"
+        mock_backend.create_customer.assert_not_called()
+        assert RIRCustomer.objects.get(handle="C-TEST").customer_name == "Test Customer"
+
+    @patch("netbox_rir_manager.jobs.ARINBackend")
+    def test_gives_up_after_max_attempts(self, mock_backend_class, queue):
+        from netbox_rir_manager.jobs import DispatchWriteOperationsJob
+        from netbox_rir_manager.models import RIRSyncLog
+
+        mock_backend_class.from_rir_config.return_value.remove_network.return_value = False
+        write_operation = queue("remove")
+        write_operation.attempts = 2
+        write_operation.save()
+
+        make_runner(DispatchWriteOperationsJob).run()
+
+        write_operation.refresh_from_db()
+        assert write_operation.status == "failed"
+        assert write_operation.attempts == 3
+        assert write_operation.message == "Failed to remove network from ARIN."
+        assert RIRSyncLog.objects.filter(operation="remove", status="error").exists()
+
+    @patch("netbox_rir_manager.jobs.ARINBackend")
+    def test_delete_and_remove_share_one_backend(self, mock_backend_class, queue):
+        from netbox_rir_manager.jobs import DispatchWriteOperationsJob
+
+        mock_backend = mock_backend_class.from_rir_config.return_value
+        mock_backend.remove_network.return_value = True
+        mock_backend.delete_network.return_value = {
+            "ticket_number": "TKT-DELETE-001",
+            "ticket_status": "PENDING_REVIEW",
+            "raw_data": {},
+        }
+        remove = queue("remove")
+        delete = queue("delete")
+
+        make_runner(DispatchWriteOperationsJob).run()
+
+        mock_backend_class.from_rir_config.assert_called_once()
+        remove.refresh_from_db()
+        delete.refresh_from_db()
+        assert remove.status == "completed"
+        assert delete.status == "completed"
+        assert delete.ticket.ticket_type == "NET_DELETE_REQUEST"
+
+    @patch("netbox_rir_manager.jobs.ARINBackend")
+    def test_skips_operations_not_yet_due(self, mock_backend_class, queue):
+        from datetime import timedelta
+
+        from django.utils import timezone
+
+        from netbox_rir_manager.jobs import DispatchWriteOperationsJob
+
+        write_operation = queue("remove")
+        write_operation.next_attempt = timezone.now() + timedelta(minutes=5)
+        write_operation.save()
+
+        with patch.object(DispatchWriteOperationsJob, "enqueue_dispatch"):
+            make_runner(DispatchWriteOperationsJob).run()
+
+        mock_backend_class.from_rir_config.assert_not_called()
+        write_operation.refresh_from_db()
+        assert write_operation.status == "pending"
+        assert write_operation.attempts == 0
+
+    def _orphan(self, write_operation, minutes):
+        """Mark ``write_operation`` running, last checkpointed ``minutes`` ago by a worker that died."""
+        from datetime import timedelta
+
+        from django.utils import timezone
+
+        from netbox_rir_manager.models import RIRWriteOperation
+
+        RIRWriteOperation.objects.filter(pk=write_operation.pk).update(
+            status="running", attempts=1, last_updated=timezone.now() - timedelta(minutes=minutes)
+        )
+
+    @patch("netbox_rir_manager.jobs.ARINBackend")
+    def test_takes_over_operations_of_a_dead_worker(self, mock_backend_class, queue):
+        from netbox_rir_manager.jobs import DispatchWriteOperationsJob
+
+        mock_backend_class.from_rir_config.return_value.remove_network.return_value = True
+        orphaned = queue("remove")
+        held = queue("remove")
+        self._orphan(orphaned, minutes=60)
+        self._orphan(held, minutes=1)
+
+        make_runner(DispatchWriteOperationsJob).run()
+
+        orphaned.refresh_from_db()
+        held.refresh_from_db()
+        assert orphaned.status == "completed"
+        assert orphaned.attempts == 2
+        # Still within its lease: left to the worker running it
+        assert held.status == "running"
+        mock_backend_class.from_rir_config.return_value.remove_network.assert_called_once()
+
+    @patch("netbox_rir_manager.jobs.DispatchWriteOperationsJob.enqueue_dispatch")
+    @patch("netbox_rir_manager.jobs.ARINBackend")
+    def test_operation_taken_over_mid_batch_is_skipped(self, mock_backend_class, mock_dispatch, queue):
+        from django.utils import timezone
+
+        from netbox_rir_manager.jobs import DispatchWriteOperationsJob
+        from netbox_rir_manager.models import RIRWriteOperation
+
+        first = queue("remove")
+        second = queue("remove")
+
+        def remove_network(*args, **kwargs):
+            # The batch ran past the lease: another dispatcher claims the second operation
+            RIRWriteOperation.objects.filter(pk=second.pk).update(last_updated=timezone.now())
+            return True
+
+        mock_backend_class.from_rir_config.return_value.remove_network.side_effect = remove_network
+
+        runner = make_runner(DispatchWriteOperationsJob)
+        runner.run()
+
+        first.refresh_from_db()
+        second.refresh_from_db()
+        assert first.status == "completed"
+        assert second.status == "running"
+        assert second.attempts == 0
+        mock_backend_class.from_rir_config.return_value.remove_network.assert_called_once()
+        assert runner.job.data["counts"] == {"completed": 1}
+
+    @patch("netbox_rir_manager.jobs.DispatchWriteOperationsJob.enqueue_dispatch")
+    def test_reassign_of_a_dead_worker_is_queued_again(self, mock_dispatch, rir_network, rir_user_key):
+        from netbox_rir_manager.services.outbox import queue_write_operation
+
+        write_operation = queue_write_operation(rir_network, rir_user_key, "reassign", self.simple_reassign)
+        self._orphan(write_operation, minutes=1)
+        assert queue_write_operation(rir_network, rir_user_key, "reassign", self.simple_reassign).status == "running"
+
+        self._orphan(write_operation, minutes=60)
+        requeued = queue_write_operation(rir_network, rir_user_key, "reassign", self.simple_reassign)
+
+        assert requeued.pk == write_operation.pk
+        requeued.refresh_from_db()
+        assert requeued.status == "pending"
+        assert requeued.attempts == 0
+
+    @patch("netbox_rir_manager.jobs.DispatchWriteOperationsJob.enqueue_dispatch")
+    def test_duplicate_reassign_returns_queued_operation(self, mock_dispatch, rir_network, rir_user_key):
+        from netbox_rir_manager.models import RIRWriteOperation
+        from netbox_rir_manager.services.outbox import queue_write_operation
+
+        first = queue_write_operation(rir_network, rir_user_key, "reassign", self.simple_reassign)
+        second = queue_write_operation(rir_network, rir_user_key, "reassign", self.simple_reassign)
+
+        assert second.pk == first.pk
+        assert first.idempotency_key
+        assert RIRWriteOperation.objects.count() == 1
+        # Remove and delete act on the NET itself and are not keyed
+        assert queue_write_operation(rir_network, rir_user_key, "remove").idempotency_key is None
+
+    @patch("netbox_rir_manager.jobs.DispatchWriteOperationsJob.enqueue_dispatch")
+    def test_failed_reassign_is_queued_again_with_checkpoints(self, mock_dispatch, rir_network, rir_user_key):
+        from netbox_rir_manager.services.outbox import queue_write_operation
+
+        write_operation = queue_write_operation(rir_network, rir_user_key, "reassign", self.simple_reassign)
+        write_operation.status = "failed"
+        write_operation.attempts = 3
+        write_operation.result = {"customer_handle": "C-TEST"}
+        write_operation.save()
+
+        requeued = queue_write_operation(rir_network, rir_user_key, "reassign", self.simple_reassign)
+
+        assert requeued.pk == write_operation.pk
+        requeued.refresh_from_db()
+        assert requeued.status == "pending"
+        assert requeued.attempts == 0
+        assert requeued.result == {"customer_handle": "C-TEST"}
+
+
+class TestJobQueues:
+    def test_jobs_are_routed_by_priority(self):
+        from netbox.jobs import JobRunner
+
+        from netbox_rir_manager.jobs import ReassignJob, SyncPrefixesJob
+
+        with patch.object(JobRunner, "enqueue") as mock_enqueue:
+            ReassignJob.enqueue(prefix_id=1)
+            assert mock_enqueue.call_args.kwargs["queue_name"] == "netbox_rir_manager.interactive"
+            SyncPrefixesJob.enqueue(aggregate_id=1)
+            assert mock_enqueue.call_args.kwargs["queue_name"] == "netbox_rir_manager.bulk"
+
+    def test_empty_setting_uses_default_queue(self, settings):
+        from netbox_rir_manager.jobs import BULK, INTERACTIVE, job_queue_name
+
+        settings.PLUGINS_CONFIG = {"netbox_rir_manager": {"bulk_queue": "", "interactive_queue": "rir_fast"}}
+        assert job_queue_name(BULK) is None
+        assert job_queue_name(INTERACTIVE) == "rir_fast"
+
+
+@pytest.mark.django_db
+class TestOrderPrefixSyncs:
+    def test_stalest_then_smallest_first(self, rir, rir_config, django_assert_num_queries):
+        from datetime import timedelta
+
+        from django.utils import timezone
+        from ipam.models import Aggregate, Prefix
+
+        from netbox_rir_manager.jobs import order_prefix_syncs
+        from netbox_rir_manager.models import RIRNetwork
+
+        fresh = Aggregate.objects.create(prefix="10.81.0.0/16", rir=rir)
+        stale = Aggregate.objects.create(prefix="10.82.0.0/16", rir=rir)
+        never_large = Aggregate.objects.create(prefix="10.83.0.0/16", rir=rir)
+        never_small = Aggregate.objects.create(prefix="10.84.0.0/16", rir=rir)
+        for child, synced in (("10.81.0.0/24", timezone.now()), ("10.82.0.0/24", timezone.now() - timedelta(days=3))):
+            RIRNetwork.objects.create(
+                rir_config=rir_config,
+                handle=f"NET-{child}",
+                net_name="CHILD",
+                prefix=Prefix.objects.create(prefix=child),
+                last_synced=synced,
+            )
+        for i in range(3):
+            Prefix.objects.create(prefix=f"10.83.{i}.0/24")
+        Prefix.objects.create(prefix="10.84.0.0/24")
+
+        agg_nets = [(agg, None) for agg in (fresh, stale, never_large, never_small)]
+        with django_assert_num_queries(1):
+            ordered = [agg for agg, _net in order_prefix_syncs(agg_nets)]
+
+        assert ordered == [never_small, never_large, stale, fresh]
@@ -0,0 +1,53 @@
+import random
+
+import pytest
+
+from netbox_rir_manager.kdtree import KDTree, chord_to_km, unit_vector
+
+
+def brute_force(coordinates, latitude, longitude, k):
+    target = unit_vector(latitude, longitude)
+    distances = sorted(
+        (sum((a - b) ** 2 for a, b in zip(target, unit_vector(*point), strict=True)), i)
+        for i, point in enumerate(coordinates)
+    )
+    return [i for _distance, i in distances[:k]]
+
+
+class TestKDTree:
+    def test_matches_brute_force(self):
+        rng = random.Random(42)
+        coordinates = [(rng.uniform(-90, 90), rng.uniform(-180, 180)) for _ in range(2000)]
+        tree = KDTree(coordinates)
+
+        for _ in range(50):
+            latitude, longitude = rng.uniform(-90, 90), rng.uniform(-180, 180)
+            found = [i for i, _km in tree.nearest(latitude, longitude, k=3)]
+            assert found == brute_force(coordinates, latitude, longitude, 3)
+
+    def test_distance_in_km(self):
+        # Montreal to Toronto is about 504 km
+        tree = KDTree([(43.6532, -79.3832)])
+
+        [(index, km)] = tree.nearest(45.5017, -73.5673)
+        assert index == 0
+        assert km == pytest.approx(504, abs=5)
+
+    def test_across_the_antimeridian(self):
+        tree = KDTree([(0.0, 179.9), (0.0, 170.0)])
+
+        assert tree.nearest(0.0, -179.9)[0][0] == 0
+
+    def test_empty_tree(self):
+        assert KDTree([]).nearest(0.0, 0.0) == []
+        assert len(KDTree([])) == 0
+
+    def test_fewer_points_than_k(self):
+        tree = KDTree([(1.0, 1.0), (2.0, 2.0)])
+
+        assert [i for i, _km in tree.nearest(1.0, 1.0, k=5)] == [0, 1]
+
+    def test_chord_to_km(self):
+        assert chord_to_km(0.0) == 0.0
+        # Antipodes: a chord of 2 is half the circumference
+        assert chord_to_km(4.0) == pytest.approx(20015, abs=1)
@@ -589,6 +589,109 @@ class TestRIRNetworkSyncFromArin:
         assert net.aggregate == agg  # preserved since aggregate=None not passed
 
 
+@pytest.mark.django_db
+class TestRIRNetBlock:
+    def test_parse_net_block_from_cidr(self):
+        from netbox_rir_manager.models.resources import parse_net_block
+
+        parsed = parse_net_block({"start_address": "192.0.2.0", "cidr_length": 24, "type": "DS"})
+        assert parsed == {
+            "family": 4,
+            "start_address": 3221225984,
+            "end_address": 3221226239,
+            "cidr_length": 24,
+            "block_type": "DS",
+        }
+
+    def test_parse_net_block_from_end_address(self):
+        from netbox_rir_manager.models.resources import parse_net_block
+
+        parsed = parse_net_block({"start_address": "192.0.2.0", "end_address": "192.0.2.127"})
+        assert parsed["end_address"] == 3221226111
+        assert parsed["cidr_length"] is None
+
+    def test_parse_net_block_skips_malformed(self):
+        from netbox_rir_manager.models.resources import parse_net_block
+
+        assert parse_net_block({"start_address": "bogus", "cidr_length": 24}) is None
+        assert parse_net_block({"cidr_length": 24}) is None
+        assert parse_net_block({"start_address": "192.0.2.0"}) is None
+
+    def test_blocks_created_on_save(self, rir_config):
+        from netbox_rir_manager.models import RIRNetwork
+
+        net = RIRNetwork.objects.create(
+            rir_config=rir_config,
+            handle="NET6-2001-DB8-1",
+            net_name="V6-NET",
+            raw_data={"net_blocks": [{"start_address": "2001:db8::", "cidr_length": 32, "type": "DA"}]},
+        )
+        block = net.net_blocks.get()
+        assert block.family == 6
+        assert block.prefix == "2001:db8::/32"
+        assert str(block.end_ip) == "2001:db8:ffff:ffff:ffff:ffff:ffff:ffff"
+
+    def test_blocks_replaced_on_sync(self, rir_config):
+        from netbox_rir_manager.models import RIRNetwork
+
+        net_data = {
+            "handle": "NET-198-51-100-0-1",
+            "net_name": "DOC-NET",
+            "net_blocks": [{"start_address": "198.51.100.0", "cidr_length": 24}],
+        }
+        net, _ = RIRNetwork.sync_from_arin(net_data, rir_config)
+        net_data["net_blocks"] = [{"start_address": "198.51.100.0", "cidr_length": 25}]
+        RIRNetwork.sync_from_arin(net_data, rir_config)
+        assert [block.prefix for block in net.net_blocks.all()] == ["198.51.100.0/25"]
+
+    def test_unchanged_blocks_are_not_rewritten(self, rir_config):
+        from netbox_rir_manager.models import RIRNetwork
+
+        net = RIRNetwork.objects.create(
+            rir_config=rir_config,
+            handle="NET-198-51-100-0-2",
+            net_name="DOC-NET",
+            raw_data={"net_blocks": [{"start_address": "198.51.100.0", "cidr_length": 24}]},
+        )
+        block = net.net_blocks.get()
+        net.net_name = "RENAMED"
+        net.save()
+
+        assert net.net_blocks.get().pk == block.pk
+        assert net.sync_net_blocks() is False
+
+    def test_prefix_of_unaligned_block_is_masked(self, rir_config):
+        from netbox_rir_manager.models import RIRNetwork
+
+        net = RIRNetwork.objects.create(
+            rir_config=rir_config,
+            handle="NET-198-51-100-7-1",
+            net_name="ODD-NET",
+            raw_data={"net_blocks": [{"start_address": "198.51.100.7", "cidr_length": 24}]},
+        )
+        assert net.net_blocks.get().prefix == "198.51.100.0/24"
+
+    def test_covering_and_overlapping(self, rir_config):
+        from netbox_rir_manager.models import RIRNetwork
+
+        parent = RIRNetwork.objects.create(
+            rir_config=rir_config,
+            handle="NET-203-0-113-0-1",
+            net_name="PARENT",
+            raw_data={"net_blocks": [{"start_address": "203.0.113.0", "cidr_length": 24}]},
+        )
+        child = RIRNetwork.objects.create(
+            rir_config=rir_config,
+            handle="NET-203-0-113-0-2",
+            net_name="CHILD",
+            raw_data={"net_blocks": [{"start_address": "203.0.113.0", "cidr_length": 28}]},
+        )
+        assert set(RIRNetwork.objects.covering("203.0.113.7")) == {parent, child}
+        assert set(RIRNetwork.objects.covering("203.0.113.64/26")) == {parent}
+        assert set(RIRNetwork.objects.overlapping("203.0.113.0/27")) == {parent, child}
+        assert not RIRNetwork.objects.covering("2001:db8::1").exists()
+
+
 @pytest.mark.django_db
 class TestRIRNetworkFindForPrefix:
     def test_finds_parent_network(self, rir_config, rir):
@@ -654,3 +757,94 @@ class TestRIRNetworkEnqueueRemoval:
     def test_returns_false_when_no_key(self, child_network):
         result = child_network.enqueue_removal()
         assert result is False
+
+
+@pytest.mark.django_db
+class TestQueryPlans:
+    """The hot queries keep using their indexes (see the models' Meta.indexes)."""
+
+    def _plan(self, queryset):
+        from django.db import connection
+
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+            # Tiny test tables would otherwise be read sequentially whatever the indexes
+            cursor.execute("SET LOCAL enable_seqscan = off")
+        return queryset.explain()
+
+    @pytest.fixture
+    def networks(self, rir_config, rir):
+        from ipam.models import Aggregate, Prefix
+
+        from netbox_rir_manager.models import RIRNetwork
+
+        aggregate = Aggregate.objects.create(prefix="10.0.0.0/8", rir=rir)
+        prefix = Prefix.objects.create(prefix="10.0.0.0/24")
+        RIRNetwork.objects.bulk_create(
+            RIRNetwork(rir_config=rir_config, handle=f"NET-10-{i}", net_name="NET", aggregate=aggregate, prefix=prefix)
+            for i in range(200)
+        )
+        return aggregate, prefix
+
+    def test_auto_reassign_parents(self, networks):
+        from netbox_rir_manager.models import RIRNetwork
+
+        aggregate, _prefix = networks
+        plan = self._plan(RIRNetwork.objects.filter(aggregate=aggregate, auto_reassign=True))
+
+        assert "rir_network_auto_reassign_idx" in plan
+
+    def test_reassigned_networks_of_prefix(self, networks):
+        from netbox_rir_manager.models import RIRNetwork
+
+        _aggregate, prefix = networks
+        plan = self._plan(RIRNetwork.objects.filter(prefix_id__in=[prefix.pk], aggregate__isnull=True))
+
+        assert "rir_network_reassigned_idx" in plan
+
+    @pytest.fixture
+    def sync_logs(self, rir_config, rir):
+        from netbox_rir_manager.models import RIRConfig, RIRSyncLog
+
+        other = RIRConfig.objects.create(rir=rir, name="Other", org_handle="OTHER-ARIN")
+        RIRSyncLog.objects.bulk_create(
+            RIRSyncLog(
+                rir_config=rir_config if i % 2 else other,
+                operation="sync",
+                object_type="network",
+                object_handle=f"NET-{i}",
+                status="success" if i % 10 else "error",
+            )
+            for i in range(200)
+        )
+
+    def test_sync_logs_of_config(self, sync_logs, rir_config):
+        from netbox_rir_manager.models import RIRSyncLog
+
+        plan = self._plan(RIRSyncLog.objects.filter(rir_config=rir_config)[:25])
+
+        assert "rir_synclog_config_idx" in plan
+        assert "Sort" not in plan
+
+    def test_sync_logs_by_status(self, sync_logs):
+        from netbox_rir_manager.models import RIRSyncLog
+
+        plan = self._plan(RIRSyncLog.objects.filter(status="error")[:25])
+
+        assert "rir_synclog_status_idx" in plan
+
+    def test_sync_log_list(self, sync_logs):
+        from netbox_rir_manager.models import RIRSyncLog
+
+        assert "rir_synclog_created_idx" in self._plan(RIRSyncLog.objects.all()[:25])
+
+    def test_user_key_of_config(self, rir_config):
+        from django.contrib.auth import get_user_model
+
+        from netbox_rir_manager.models import RIRUserKey
+
+        users = get_user_model().objects.bulk_create(get_user_model()(username=f"user{i}") for i in range(100))
+        RIRUserKey.objects.bulk_create(RIRUserKey(user=user, rir_config=rir_config, api_key="key") for user in users)
+        plan = self._plan(RIRUserKey.objects.filter(rir_config=rir_config)[:1])
+
+        assert "rir_userkey_config_idx" in plan
@@ -0,0 +1,81 @@
+from unittest.mock import patch
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    from django.core.cache import cache
+
+    cache.clear()
+    yield
+    cache.clear()
+
+
+class TestRateLimiter:
+    def test_disabled_never_waits(self):
+        from netbox_rir_manager.ratelimit import RateLimiter
+
+        limiter = RateLimiter("test-disabled", 0)
+        with patch("netbox_rir_manager.ratelimit.time.sleep") as mock_sleep:
+            for _ in range(10):
+                assert limiter.acquire() == 0.0
+        mock_sleep.assert_not_called()
+
+    def test_waits_for_next_slot_when_full(self):
+        from netbox_rir_manager.ratelimit import RateLimiter
+
+        clock = [1000.25]
+
+        def sleep(seconds):
+            clock[0] += seconds
+
+        limiter = RateLimiter("test-full", 2)
+        with (
+            patch("netbox_rir_manager.ratelimit.time.time", side_effect=lambda: clock[0]),
+            patch("netbox_rir_manager.ratelimit.time.sleep", side_effect=sleep) as mock_sleep,
+        ):
+            assert limiter.acquire() == 0.0
+            assert limiter.acquire() == 0.0
+            assert limiter.acquire() == pytest.approx(0.75)
+
+        mock_sleep.assert_called_once()
+
+    def test_rate_below_one_per_second(self):
+        from netbox_rir_manager.ratelimit import RateLimiter
+
+        clock = [1000.5]
+
+        def sleep(seconds):
+            clock[0] += seconds
+
+        # One call every 4 seconds
+        limiter = RateLimiter("test-slow", 0.25)
+        with (
+            patch("netbox_rir_manager.ratelimit.time.time", side_effect=lambda: clock[0]),
+            patch("netbox_rir_manager.ratelimit.time.sleep", side_effect=sleep),
+        ):
+            assert limiter.acquire() == 0.0
+            assert limiter.acquire() == pytest.approx(3.5)
+            assert limiter.acquire() == pytest.approx(4.0)
+
+    def test_budget_shared_between_instances(self):
+        from netbox_rir_manager.ratelimit import RateLimiter
+
+        with (
+            patch("netbox_rir_manager.ratelimit.time.time", return_value=2000.5),
+            patch("netbox_rir_manager.ratelimit.time.sleep", side_effect=StopIteration),
+        ):
+            RateLimiter("test-shared", 1).acquire()
+            with pytest.raises(StopIteration):
+                RateLimiter("test-shared", 1).acquire()
+            # A different name has its own budget
+            assert RateLimiter("test-other", 1).acquire() == 0.0
+
+    def test_backend_uses_setting(self, settings):
+        from netbox_rir_manager.ratelimit import RateLimiter
+
+        settings.PLUGINS_CONFIG = {"netbox_rir_manager": {"api_rate_limit": 4}}
+        limiter = RateLimiter.for_backend("ARIN")
+        assert limiter.name == "ARIN"
+        assert limiter.rate == 4
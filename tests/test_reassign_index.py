@@ -0,0 +1,88 @@
+import pytest
+
+
+@pytest.mark.django_db
+class TestReassignIndex:
+    @pytest.fixture
+    def parent_network(self, rir_config, rir):
+        from ipam.models import Aggregate
+
+        from netbox_rir_manager.models import RIRNetwork
+
+        agg = Aggregate.objects.create(prefix="10.50.0.0/16", rir=rir)
+        return RIRNetwork.objects.create(
+            rir_config=rir_config,
+            handle="NET-10-50-0-0-1",
+            net_name="PARENT-NET",
+            aggregate=agg,
+            auto_reassign=True,
+        )
+
+    def test_find_parent(self, rir_user_key, parent_network):
+        from netbox_rir_manager.services.reassign_index import get_reassign_index
+
+        index = get_reassign_index()
+        parent = index.find_parent("10.50.1.0/24")
+        assert parent.network_id == parent_network.pk
+        assert parent.user_key_id == rir_user_key.pk
+        assert index.find_parent("10.51.0.0/24") is None
+
+    def test_missing_user_key(self, parent_network):
+        from netbox_rir_manager.services.reassign_index import get_reassign_index
+
+        assert get_reassign_index().find_parent("10.50.1.0/24").user_key_id is None
+
+    def test_invalidated_by_network_save(self, rir_config, parent_network):
+        from netbox_rir_manager.services.reassign_index import get_reassign_index
+
+        assert get_reassign_index().find_parent("10.50.1.0/24") is not None
+        parent_network.auto_reassign = False
+        parent_network.save()
+        assert get_reassign_index().find_parent("10.50.1.0/24") is None
+
+    def test_batched_invalidation_bumps_once(self, rir_config, parent_network, django_capture_on_commit_callbacks):
+        from netbox_rir_manager.models import RIRNetwork
+        from netbox_rir_manager.services.reassign_index import (
+            batched_invalidation,
+            current_generation,
+            invalidate_reassign_index,
+        )
+
+        generation = current_generation()
+        with django_capture_on_commit_callbacks() as callbacks, batched_invalidation():
+            for i in range(3):
+                RIRNetwork.objects.create(rir_config=rir_config, handle=f"NET-BATCH-{i}", net_name="BATCH")
+            assert current_generation() == generation
+
+        assert current_generation() == generation + 1
+        assert callbacks.count(invalidate_reassign_index) == 1
+
+    def test_tracks_child_networks(self, rir_config, parent_network):
+        from ipam.models import Prefix
+
+        from netbox_rir_manager.models import RIRNetwork
+        from netbox_rir_manager.services.reassign_index import get_reassign_index
+
+        pfx = Prefix.objects.create(prefix="10.50.2.0/24")
+        RIRNetwork.objects.create(rir_config=rir_config, handle="NET-10-50-2-0-1", net_name="CHILD", prefix=pfx)
+        index = get_reassign_index()
+        assert index.has_network(pfx.pk)
+        assert index.has_child_networks(pfx.pk)
+
+    def test_unrelated_prefix_costs_no_queries(self, rir_user_key, parent_network, django_assert_num_queries):
+        from dcim.models import Site
+        from ipam.models import Prefix
+        from tenancy.models import Tenant
+
+        from netbox_rir_manager.services.reassign_index import get_reassign_index
+        from netbox_rir_manager.signals import auto_reassign_prefix, remove_network_on_prefix_deactivate
+
+        site = Site.objects.create(name="Index Site", slug="index-site")
+        tenant = Tenant.objects.create(name="Index Tenant", slug="index-tenant")
+        pfx = Prefix.objects.create(prefix="172.16.0.0/24", status="active", scope=site, tenant=tenant)
+        get_reassign_index()
+
+        with django_assert_num_queries(0):
+            auto_reassign_prefix(sender=Prefix, instance=pfx, created=False)
+            pfx.status = "deprecated"
+            remove_network_on_prefix_deactivate(sender=Prefix, instance=pfx, created=False)
@@ -0,0 +1,112 @@
+import csv
+import io
+from unittest.mock import MagicMock
+
+import pytest
+
+
+@pytest.mark.django_db
+class TestPlanReassignments:
+    @pytest.fixture
+    def setup(self, rir_config, rir):
+        from dcim.models import Site
+        from ipam.models import Aggregate, Prefix
+        from tenancy.models import Tenant
+
+        from netbox_rir_manager.models import RIRAddress, RIRNetwork, RIROrganization
+
+        agg = Aggregate.objects.create(prefix="10.80.0.0/16", rir=rir)
+        parent = RIRNetwork.objects.create(
+            rir_config=rir_config, handle="NET-10-80-0-0-1", net_name="PARENT-NET", aggregate=agg
+        )
+        site = Site.objects.create(name="Plan Site", slug="plan-site")
+        RIRAddress.objects.create(site=site, street_address="1 Main St", city="Montreal", country="CA")
+        bare_site = Site.objects.create(name="Bare Site", slug="bare-site")
+        tenant = Tenant.objects.create(name="Plan Tenant", slug="plan-tenant")
+        org_tenant = Tenant.objects.create(name="Org Tenant", slug="org-tenant")
+        RIROrganization.objects.create(rir_config=rir_config, handle="ORGT-ARIN", name="Org Tenant", tenant=org_tenant)
+
+        prefixes = {
+            "simple": Prefix.objects.create(prefix="10.80.1.0/29", status="active", scope=site, tenant=tenant),
+            "detailed": Prefix.objects.create(
+                prefix="10.80.2.0/29", status="active", scope=bare_site, tenant=org_tenant
+            ),
+            "detailed_no_site": Prefix.objects.create(prefix="10.80.8.0/29", status="active", tenant=org_tenant),
+            "no_tenant": Prefix.objects.create(prefix="10.80.3.0/29", status="active", scope=site),
+            "no_site": Prefix.objects.create(prefix="10.80.4.0/29", status="active", tenant=tenant),
+            "no_address": Prefix.objects.create(prefix="10.80.5.0/29", status="active", scope=bare_site, tenant=tenant),
+            "reserved": Prefix.objects.create(prefix="10.80.6.0/29", status="reserved", scope=site, tenant=tenant),
+            "linked": Prefix.objects.create(prefix="10.80.7.0/29", status="active", scope=site, tenant=tenant),
+        }
+        RIRNetwork.objects.create(
+            rir_config=rir_config, handle="NET-10-80-7-0-1", net_name="CHILD", prefix=prefixes["linked"]
+        )
+        # Outside the aggregate
+        Prefix.objects.create(prefix="10.81.0.0/29", status="active", scope=site, tenant=tenant)
+        return agg, parent, prefixes
+
+    def test_classifies_prefixes(self, setup):
+        from netbox_rir_manager.services.reassign_planner import plan_reassignments
+
+        agg, parent, prefixes = setup
+        plan = plan_reassignments(aggregate=agg)
+
+        by_id = {row["prefix_id"]: row for row in plan["rows"]}
+        assert set(by_id) == {p.pk for p in prefixes.values()}
+        assert by_id[prefixes["simple"].pk]["action"] == "simple"
+        assert by_id[prefixes["simple"].pk]["parent_network"] == parent.handle
+        assert by_id[prefixes["detailed"].pk]["action"] == "detailed"
+        assert by_id[prefixes["no_tenant"].pk]["reason"] == "No tenant"
+        assert by_id[prefixes["no_site"].pk]["reason"] == "No site"
+        # Auto-reassign skips it, whatever the tenant
+        assert by_id[prefixes["detailed_no_site"].pk]["reason"] == "No site"
+        assert by_id[prefixes["no_address"].pk]["reason"] == "No address for site"
+        assert by_id[prefixes["reserved"].pk]["action"] == "blocked"
+        assert by_id[prefixes["linked"].pk]["reason"] == "Already reassigned"
+        assert by_id[prefixes["linked"].pk]["existing_net"] == "NET-10-80-7-0-1"
+        assert plan["summary"] == {"simple": 1, "detailed": 1, "existing_net": 0, "blocked": 6}
+
+    def test_config_scope(self, setup, rir_config):
+        from netbox_rir_manager.services.reassign_planner import plan_reassignments
+
+        _agg, _parent, prefixes = setup
+        plan = plan_reassignments(rir_config=rir_config)
+        assert len(plan["rows"]) == len(prefixes)
+
+    def test_limited_to_given_prefixes(self, setup):
+        from ipam.models import Prefix
+
+        from netbox_rir_manager.services.reassign_planner import plan_reassignments
+
+        agg, _parent, prefixes = setup
+        plan = plan_reassignments(aggregate=agg, prefixes=Prefix.objects.filter(pk=prefixes["simple"].pk))
+
+        assert [row["prefix_id"] for row in plan["rows"]] == [prefixes["simple"].pk]
+
+    def test_arin_lookups_cached(self, setup):
+        from django.core.cache import cache
+
+        from netbox_rir_manager.services.reassign_planner import plan_reassignments
+
+        cache.clear()
+        agg, _parent, prefixes = setup
+        backend = MagicMock()
+        backend.find_net.side_effect = lambda start, end: {"handle": "NET-OTHER"} if start == "10.80.1.0" else None
+
+        plan = plan_reassignments(aggregate=agg, backend=backend)
+        by_id = {row["prefix_id"]: row for row in plan["rows"]}
+        assert by_id[prefixes["simple"].pk]["action"] == "existing_net"
+        assert by_id[prefixes["simple"].pk]["existing_net"] == "NET-OTHER"
+        assert by_id[prefixes["detailed"].pk]["action"] == "detailed"
+        assert backend.find_net.call_count == 2
+
+        plan_reassignments(aggregate=agg, backend=backend)
+        assert backend.find_net.call_count == 2
+
+    def test_csv(self, setup):
+        from netbox_rir_manager.services.reassign_planner import PLAN_FIELDS, plan_reassignments, plan_to_csv
+
+        agg, _parent, prefixes = setup
+        rows = list(csv.DictReader(io.StringIO(plan_to_csv(plan_reassignments(aggregate=agg)["rows"]))))
+        assert tuple(rows[0]) == PLAN_FIELDS
+        assert len(rows) == len(prefixes)
@@ -0,0 +1,170 @@
+import pytest
+
+from netbox_rir_manager.services.reconciliation import IntervalIndex, network_range
+from tests.conftest import make_runner
+
+
+class TestRangeHelpers:
+    def test_interval_index_containment(self):
+        import ipaddress
+
+        index = IntervalIndex(
+            [
+                (network_range(ipaddress.ip_network("10.0.0.0/8")), "A"),
+                (network_range(ipaddress.ip_network("192.0.2.0/24")), "B"),
+            ]
+        )
+        assert index.find(network_range(ipaddress.ip_network("10.1.0.0/16"))) == "A"
+        assert index.find(network_range(ipaddress.ip_network("192.0.2.128/25"))) == "B"
+        assert index.find(network_range(ipaddress.ip_network("172.16.0.0/12"))) is None
+        assert index.find(network_range(ipaddress.ip_network("2001:db8::/32"))) is None
+
+
+@pytest.mark.django_db
+class TestReconcileRIRConfig:
+    @pytest.fixture
+    def managed_aggregate(self, rir_config, rir):
+        from ipam.models import Aggregate
+
+        from netbox_rir_manager.models import RIRNetwork
+
+        agg = Aggregate.objects.create(prefix="192.0.2.0/24", rir=rir)
+        RIRNetwork.objects.create(
+            rir_config=rir_config,
+            handle="NET-192-0-2-0-1",
+            net_name="PARENT-NET",
+            aggregate=agg,
+            raw_data={"net_blocks": [{"start_address": "192.0.2.0", "cidr_length": 24}]},
+        )
+        return agg
+
+    @pytest.fixture
+    def site(self, db):
+        from dcim.models import Site
+
+        return Site.objects.create(name="Site A", slug="site-a")
+
+    @pytest.fixture
+    def tenant(self, db):
+        from tenancy.models import Tenant
+
+        return Tenant.objects.create(name="Acme Corp", slug="acme-corp")
+
+    def test_missing_net(self, rir_config, managed_aggregate, site, tenant):
+        from ipam.models import Prefix
+
+        from netbox_rir_manager.services.reconciliation import reconcile_rir_config
+
+        pfx = Prefix.objects.create(prefix="192.0.2.0/28", status="active", scope=site, tenant=tenant)
+        result = reconcile_rir_config(rir_config)
+        assert [e["prefix_id"] for e in result["drift"]["missing_net"]] == [pfx.pk]
+        assert result["summary"]["missing_net"] == 1
+
+    def test_prefix_without_site_is_not_missing(self, rir_config, managed_aggregate, tenant):
+        from ipam.models import Prefix
+
+        from netbox_rir_manager.services.reconciliation import reconcile_rir_config
+
+        Prefix.objects.create(prefix="192.0.2.0/28", status="active", tenant=tenant)
+        result = reconcile_rir_config(rir_config)
+        assert result["drift"]["missing_net"] == []
+
+    def test_stale_net(self, rir_config, managed_aggregate):
+        from netbox_rir_manager.models import RIRNetwork
+        from netbox_rir_manager.services.reconciliation import reconcile_rir_config
+
+        net = RIRNetwork.objects.create(
+            rir_config=rir_config,
+            handle="NET-192-0-2-16-1",
+            net_name="CHILD-NET",
+            raw_data={"net_blocks": [{"start_address": "192.0.2.16", "cidr_length": 28}]},
+        )
+        result = reconcile_rir_config(rir_config)
+        assert [e["network_id"] for e in result["drift"]["stale_net"]] == [net.pk]
+        assert result["drift"]["orphaned_net"] == []
+
+    def test_orphaned_net(self, rir_config, managed_aggregate):
+        from netbox_rir_manager.models import RIRNetwork
+        from netbox_rir_manager.services.reconciliation import reconcile_rir_config
+
+        net = RIRNetwork.objects.create(
+            rir_config=rir_config,
+            handle="NET-198-51-100-0-1",
+            net_name="ELSEWHERE-NET",
+            raw_data={"net_blocks": [{"start_address": "198.51.100.0", "cidr_length": 28}]},
+        )
+        result = reconcile_rir_config(rir_config)
+        assert [e["network_id"] for e in result["drift"]["orphaned_net"]] == [net.pk]
+
+    def test_tenant_mismatch(self, rir_config, managed_aggregate, site, tenant):
+        from django.utils import timezone
+        from ipam.models import Prefix
+
+        from netbox_rir_manager.models import RIRCustomer, RIRNetwork
+        from netbox_rir_manager.services.reconciliation import reconcile_rir_config
+
+        pfx = Prefix.objects.create(prefix="192.0.2.0/28", status="active", scope=site, tenant=tenant)
+        net = RIRNetwork.objects.create(
+            rir_config=rir_config,
+            handle="NET-192-0-2-0-2",
+            net_name="CHILD-NET",
+            prefix=pfx,
+            raw_data={
+                "customer_handle": "C01234567",
+                "net_blocks": [{"start_address": "192.0.2.0", "cidr_length": 28}],
+            },
+        )
+        RIRCustomer.objects.create(
+            rir_config=rir_config,
+            handle="C01234567",
+            customer_name="Other Corp",
+            network=net,
+            created_date=timezone.now(),
+        )
+        result = reconcile_rir_config(rir_config)
+        assert [e["prefix_id"] for e in result["drift"]["tenant_mismatch"]] == [pfx.pk]
+        assert result["drift"]["missing_net"] == []
+
+    def test_matching_customer_is_clean(self, rir_config, managed_aggregate, site, tenant):
+        from django.utils import timezone
+        from ipam.models import Prefix
+
+        from netbox_rir_manager.models import RIRCustomer, RIRNetwork
+        from netbox_rir_manager.services.reconciliation import reconcile_rir_config
+
+        pfx = Prefix.objects.create(prefix="192.0.2.0/28", status="active", scope=site, tenant=tenant)
+        net = RIRNetwork.objects.create(
+            rir_config=rir_config,
+            handle="NET-192-0-2-0-2",
+            net_name="CHILD-NET",
+            prefix=pfx,
+            raw_data={
+                "customer_handle": "C01234567",
+                "net_blocks": [{"start_address": "192.0.2.0", "cidr_length": 28}],
+            },
+        )
+        RIRCustomer.objects.create(
+            rir_config=rir_config,
+            handle="C01234567",
+            customer_name="ACME  corp",
+            network=net,
+            created_date=timezone.now(),
+        )
+        result = reconcile_rir_config(rir_config)
+        assert all(result["summary"][value] == 0 for value in result["drift"])
+
+
+@pytest.mark.django_db
+class TestReconcileRIRConfigJob:
+    def test_creates_report(self, rir_config):
+        from netbox_rir_manager.jobs import ReconcileRIRConfigJob
+        from netbox_rir_manager.models import RIRReconciliationReport
+
+        runner = make_runner(ReconcileRIRConfigJob)
+        runner.job.object_id = rir_config.pk
+        runner.job.user = None
+        runner.run()
+
+        report = RIRReconciliationReport.objects.get(rir_config=rir_config)
+        assert report.total_drift == 0
+        assert runner.job.data["report_id"] == report.pk
@@ -0,0 +1,74 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from tests.conftest import make_runner
+
+
+@pytest.mark.django_db
+class TestRelinkNetworks:
+    @pytest.fixture
+    def unlinked(self, rir_config, rir):
+        """An aggregate, a prefix inside it and two NETs whose links have been cleared."""
+        from ipam.models import Aggregate, Prefix
+
+        from netbox_rir_manager.models import RIRNetwork
+
+        agg = Aggregate.objects.create(prefix="192.0.2.0/24", rir=rir)
+        pfx = Prefix.objects.create(prefix="192.0.2.0/28")
+        parent = RIRNetwork.objects.create(
+            rir_config=rir_config,
+            handle="NET-192-0-2-0-1",
+            net_name="PARENT-NET",
+            raw_data={"net_blocks": [{"start_address": "192.0.2.0", "cidr_length": 24}]},
+        )
+        child = RIRNetwork.objects.create(
+            rir_config=rir_config,
+            handle="NET-192-0-2-0-2",
+            net_name="CHILD-NET",
+            raw_data={"net_blocks": [{"start_address": "192.0.2.0", "cidr_length": 28}]},
+        )
+        RIRNetwork.objects.update(aggregate=None, prefix=None)
+        return agg, pfx, parent, child
+
+    def test_links_aggregate_and_prefix(self, rir_config, unlinked):
+        from netbox_rir_manager.services.relink import relink_networks
+
+        agg, pfx, parent, child = unlinked
+        summary = relink_networks(rir_config)
+
+        parent.refresh_from_db()
+        child.refresh_from_db()
+        assert parent.aggregate == agg
+        assert parent.prefix is None
+        assert child.prefix == pfx
+        assert summary["linked"] == 2
+
+    def test_does_not_overwrite_existing_links(self, rir_config, unlinked):
+        from ipam.models import Prefix
+
+        from netbox_rir_manager.services.relink import relink_networks
+
+        _agg, _pfx, _parent, child = unlinked
+        other = Prefix.objects.create(prefix="192.0.2.128/25")
+        child.prefix = other
+        child.save(update_fields=["prefix"])
+
+        summary = relink_networks(rir_config)
+        child.refresh_from_db()
+        assert child.prefix == other
+        assert summary["linked"] == 1
+
+    def test_command(self, rir_config, unlinked):
+        out = StringIO()
+        call_command("relink_networks", "--config", rir_config.name, stdout=out)
+        assert "Linked 2 of 2" in out.getvalue()
+
+    def test_job(self, rir_config, unlinked):
+        from netbox_rir_manager.jobs import RelinkNetworksJob
+
+        runner = make_runner(RelinkNetworksJob)
+        runner.job.object_id = rir_config.pk
+        runner.run()
+        assert runner.job.data["linked"] == 2
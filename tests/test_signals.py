@@ -1,6 +1,7 @@
 from unittest.mock import patch
 
 import pytest
+from django.utils import timezone
 
 
 @pytest.mark.django_db
@@ -317,3 +318,297 @@ class TestPrefixDeactivateSignal:
 
         mock_logger.warning.assert_called_once()
         assert "no API key" in mock_logger.warning.call_args[0][0]
+
+
+@pytest.mark.django_db
+class TestAutoReassignQueue:
+    @pytest.fixture
+    def parent_network(self, rir_config, rir):
+        from ipam.models import Aggregate
+
+        from netbox_rir_manager.models import RIRNetwork
+
+        agg = Aggregate.objects.create(prefix="10.30.0.0/16", rir=rir)
+        return RIRNetwork.objects.create(
+            rir_config=rir_config,
+            handle="NET-10-30-0-0-1",
+            net_name="PARENT-NET",
+            aggregate=agg,
+            auto_reassign=True,
+        )
+
+    @pytest.fixture
+    def site_and_tenant(self, db):
+        from dcim.models import Site
+        from tenancy.models import Tenant
+
+        site = Site.objects.create(name="Queue Site", slug="queue-site")
+        tenant = Tenant.objects.create(name="Queue Tenant", slug="queue-tenant")
+        return site, tenant
+
+    def test_records_pending_reassign(
+        self, rir_config, rir_user_key, parent_network, site_and_tenant, django_capture_on_commit_callbacks
+    ):
+        from ipam.models import Prefix
+
+        from netbox_rir_manager.models import RIRPendingReassign
+
+        site, tenant = site_and_tenant
+        with (
+            patch("netbox_rir_manager.jobs.ProcessPendingReassignsJob.enqueue_debounced") as mock_enqueue,
+            django_capture_on_commit_callbacks(execute=True),
+        ):
+            pfx = Prefix.objects.create(prefix="10.30.1.0/29", status="active", scope=site, tenant=tenant)
+
+        pending = RIRPendingReassign.objects.get(prefix=pfx)
+        assert pending.parent_network == parent_network
+        assert pending.user_key == rir_user_key
+        mock_enqueue.assert_called_once()
+
+    def test_repeated_saves_coalesce(self, rir_config, rir_user_key, parent_network, site_and_tenant):
+        from ipam.models import Prefix
+
+        from netbox_rir_manager.models import RIRPendingReassign
+
+        site, tenant = site_and_tenant
+        with patch("netbox_rir_manager.jobs.ProcessPendingReassignsJob.enqueue_debounced"):
+            pfx = Prefix.objects.create(prefix="10.30.2.0/29", status="active", scope=site, tenant=tenant)
+            pfx.description = "edited"
+            pfx.save()
+
+        assert RIRPendingReassign.objects.filter(prefix=pfx).count() == 1
+
+    def test_no_row_without_tenant(self, rir_config, rir_user_key, parent_network, site_and_tenant):
+        from ipam.models import Prefix
+
+        from netbox_rir_manager.models import RIRPendingReassign
+
+        site, _tenant = site_and_tenant
+        Prefix.objects.create(prefix="10.30.3.0/29", status="active", scope=site)
+
+        assert not RIRPendingReassign.objects.exists()
+
+
+@pytest.mark.django_db
+class TestDeferredPrefixSignals:
+    @pytest.fixture
+    def parent_network(self, rir_config, rir):
+        from ipam.models import Aggregate
+
+        from netbox_rir_manager.models import RIRNetwork
+
+        agg = Aggregate.objects.create(prefix="10.40.0.0/16", rir=rir)
+        return RIRNetwork.objects.create(
+            rir_config=rir_config,
+            handle="NET-10-40-0-0-1",
+            net_name="PARENT-NET",
+            aggregate=agg,
+            auto_reassign=True,
+        )
+
+    @pytest.fixture
+    def site_and_tenant(self, db):
+        from dcim.models import Site
+        from tenancy.models import Tenant
+
+        site = Site.objects.create(name="Deferred Site", slug="deferred-site")
+        tenant = Tenant.objects.create(name="Deferred Tenant", slug="deferred-tenant")
+        return site, tenant
+
+    def test_reassigns_queued_once_on_commit(
+        self, rir_config, rir_user_key, parent_network, site_and_tenant, django_capture_on_commit_callbacks
+    ):
+        from ipam.models import Prefix
+
+        from netbox_rir_manager.models import RIRPendingReassign
+        from netbox_rir_manager.signals import defer_prefix_signals
+
+        site, tenant = site_and_tenant
+        with (
+            patch("netbox_rir_manager.jobs.ProcessPendingReassignsJob.enqueue_debounced") as mock_enqueue,
+            django_capture_on_commit_callbacks(execute=True) as callbacks,
+            defer_prefix_signals(),
+        ):
+            prefixes = [
+                Prefix.objects.create(prefix=f"10.40.{i}.0/29", status="active", scope=site, tenant=tenant)
+                for i in range(1, 4)
+            ]
+            Prefix.objects.create(prefix="10.40.9.0/29", status="active", scope=site)
+            assert not RIRPendingReassign.objects.exists()
+
+        assert len(callbacks) == 1
+        pending = RIRPendingReassign.objects.all()
+        assert {p.prefix_id for p in pending} == {p.pk for p in prefixes}
+        assert all(p.parent_network_id == parent_network.pk for p in pending)
+        assert all(p.user_key_id == rir_user_key.pk for p in pending)
+        mock_enqueue.assert_called_once()
+
+    def test_nested_blocks_flush_once(self, rir_config, rir_user_key, django_capture_on_commit_callbacks):
+        from ipam.models import Prefix
+
+        from netbox_rir_manager.signals import defer_prefix_signals
+
+        pfx = Prefix.objects.create(prefix="10.41.0.0/24", status="active")
+        with django_capture_on_commit_callbacks() as callbacks, defer_prefix_signals() as outer:
+            with defer_prefix_signals() as inner:
+                pfx.description = "edited"
+                pfx.save()
+            assert inner is outer
+
+        assert len(callbacks) == 1
+
+    def test_no_flush_when_block_raises(self, rir_config, rir_user_key, django_capture_on_commit_callbacks):
+        from ipam.models import Prefix
+
+        from netbox_rir_manager.signals import defer_prefix_signals
+
+        with django_capture_on_commit_callbacks() as callbacks, pytest.raises(RuntimeError), defer_prefix_signals():
+            Prefix.objects.create(prefix="10.42.0.0/24", status="active")
+            raise RuntimeError
+
+        assert callbacks == []
+
+    def test_removals_evaluated_on_commit(self, rir_config, rir_user_key, django_capture_on_commit_callbacks):
+        from ipam.models import Prefix
+
+        from netbox_rir_manager.models import RIRNetwork
+        from netbox_rir_manager.signals import defer_prefix_signals
+
+        deactivated = Prefix.objects.create(prefix="10.43.0.0/24", status="active")
+        deleted = Prefix.objects.create(prefix="10.43.1.0/24", status="active")
+        untouched = Prefix.objects.create(prefix="10.43.2.0/24", status="active")
+        networks = [
+            RIRNetwork.objects.create(rir_config=rir_config, handle=f"NET-DEFER-{i}", net_name="DEFER", prefix=pfx)
+            for i, pfx in enumerate((deactivated, deleted, untouched))
+        ]
+
+        with (
+            patch("netbox_rir_manager.jobs.BatchRemoveNetworkJob") as mock_job,
+            django_capture_on_commit_callbacks(execute=True),
+            defer_prefix_signals(),
+        ):
+            deactivated.status = "deprecated"
+            deactivated.save()
+            deleted.delete()
+            untouched.description = "edited"
+            untouched.save()
+            mock_job.enqueue.assert_not_called()
+
+        mock_job.enqueue.assert_called_once()
+        assert set(mock_job.enqueue.call_args.kwargs["network_ids"]) == {networks[0].pk, networks[1].pk}
+
+    def test_removals_without_api_key_warn(self, rir_config, django_capture_on_commit_callbacks):
+        from ipam.models import Prefix
+
+        from netbox_rir_manager.models import RIRNetwork
+        from netbox_rir_manager.signals import defer_prefix_signals
+
+        pfx = Prefix.objects.create(prefix="10.44.0.0/24", status="active")
+        RIRNetwork.objects.create(rir_config=rir_config, handle="NET-DEFER-NOKEY", net_name="DEFER", prefix=pfx)
+
+        with (
+            patch("netbox_rir_manager.jobs.BatchRemoveNetworkJob") as mock_job,
+            patch("netbox_rir_manager.signals.logger") as mock_logger,
+            django_capture_on_commit_callbacks(execute=True),
+            defer_prefix_signals(),
+        ):
+            pfx.delete()
+
+        mock_job.enqueue.assert_not_called()
+        assert "no API key" in mock_logger.warning.call_args[0][0]
+
+    def test_detects_bulk_request(self, rf):
+        from django.urls import ResolverMatch
+
+        from netbox_rir_manager.middleware import BulkPayloadMiddleware
+        from netbox_rir_manager.signals import _is_bulk_request
+
+        def request(method, url_name, payload=None, namespace="ipam-api"):
+            req = getattr(rf, method.lower())("/", data=payload, content_type="application/json")
+            req.resolver_match = ResolverMatch(lambda r: None, (), {}, url_name=url_name, namespaces=[namespace])
+            BulkPayloadMiddleware(lambda r: None).process_view(req, None, (), {})
+            return req
+
+        assert _is_bulk_request(request("POST", "prefix_bulk_import"))
+        assert _is_bulk_request(request("POST", "prefix_bulk_edit"))
+        assert _is_bulk_request(request("PATCH", "prefix-list"))
+        assert _is_bulk_request(request("POST", "prefix-list", [{"prefix": "10.0.0.0/24"}]))
+        assert not _is_bulk_request(request("POST", "prefix-list", {"prefix": "10.0.0.0/24"}))
+        # Bodies of other endpoints are not read
+        assert not _is_bulk_request(request("POST", "site-list", [{"name": "Site"}], namespace="dcim-api"))
+        assert not _is_bulk_request(request("GET", "prefix-list"))
+        assert not _is_bulk_request(request("POST", "prefix_add"))
+
+
+@pytest.mark.django_db
+class TestSiteAddressSignals:
+    @pytest.fixture
+    def site(self):
+        from dcim.models import Site
+
+        from netbox_rir_manager.models import RIRAddress
+
+        site = Site.objects.create(
+            name="Paris", slug="paris", physical_address="1 Rue A", latitude=48.85, longitude=2.35
+        )
+        RIRAddress.objects.create(
+            site=site, street_address="1 Rue A", country="FR", auto_resolved=True, last_resolved=timezone.now()
+        )
+        return site
+
+    def _save(self, site, django_capture_on_commit_callbacks, **changes):
+        for name, value in changes.items():
+            setattr(site, name, value)
+        with (
+            patch("netbox_rir_manager.jobs.RefreshSiteAddressesJob.enqueue_debounced") as mock_enqueue,
+            django_capture_on_commit_callbacks(execute=True),
+        ):
+            site.save()
+        return mock_enqueue
+
+    def test_new_site_is_queued(self, django_capture_on_commit_callbacks):
+        from dcim.models import Site
+
+        with (
+            patch("netbox_rir_manager.jobs.RefreshSiteAddressesJob.enqueue_debounced") as mock_enqueue,
+            django_capture_on_commit_callbacks(execute=True),
+        ):
+            Site.objects.create(name="Lyon", slug="lyon", physical_address="9 Quai")
+            Site.objects.create(name="Bare", slug="bare")
+
+        mock_enqueue.assert_called_once()
+
+    def test_moved_site_marks_address_stale(self, site, django_capture_on_commit_callbacks):
+        from netbox_rir_manager.models import RIRAddress
+
+        mock_enqueue = self._save(site, django_capture_on_commit_callbacks, latitude="45.76", longitude="4.83")
+
+        mock_enqueue.assert_called_once()
+        assert RIRAddress.get_for_site(site).last_resolved is None
+
+    def test_other_changes_are_ignored(self, site, django_capture_on_commit_callbacks):
+        from netbox_rir_manager.models import RIRAddress
+
+        # Same coordinates in another representation
+        mock_enqueue = self._save(
+            site, django_capture_on_commit_callbacks, description="Head office", latitude="48.850000"
+        )
+
+        mock_enqueue.assert_not_called()
+        assert RIRAddress.get_for_site(site).last_resolved is not None
+
+    def test_manual_address_is_not_marked(self, site, django_capture_on_commit_callbacks):
+        from netbox_rir_manager.models import RIRAddress
+
+        RIRAddress.objects.filter(site=site).update(auto_resolved=False)
+        mock_enqueue = self._save(site, django_capture_on_commit_callbacks, physical_address="5 Rue B")
+
+        mock_enqueue.assert_called_once()
+        assert RIRAddress.get_for_site(site).last_resolved is not None
+
+    def test_disabled_by_setting(self, site, settings, django_capture_on_commit_callbacks):
+        settings.PLUGINS_CONFIG = {"netbox_rir_manager": {"auto_resolve_site_addresses": False}}
+
+        mock_enqueue = self._save(site, django_capture_on_commit_callbacks, physical_address="5 Rue B")
+
+        mock_enqueue.assert_not_called()
@@ -0,0 +1,311 @@
+from io import StringIO
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+
+from netbox_rir_manager.services.geocoding import GeocodingResult, GeocodingService
+from tests.conftest import make_runner
+
+
+class AddressGeocoder(GeocodingService):
+    """Answers forward lookups with a distinct address per query; reverse lookups by ``reverse``."""
+
+    def __init__(self, reverse=None):
+        self.queries = []
+        self.reverse = reverse
+
+    def geocode(self, address):
+        self.queries.append(address)
+        if address.startswith("unknown"):
+            return None
+        return GeocodingResult(
+            street_address=address,
+            city="Montreal",
+            state_province="QC",
+            postal_code="H1A 1A1",
+            country="CA",
+            raw={"display_name": address},
+        )
+
+    def reverse_geocode(self, lat, lng):
+        self.queries.append((lat, lng))
+        return self.reverse
+
+    def geocode_many(self, address, limit=5):
+        return [self.geocode(address)]
+
+    def reverse_geocode_many(self, lat, lng, limit=5):
+        return []
+
+
+@pytest.mark.django_db
+class TestResolveSiteAddresses:
+    @pytest.fixture
+    def sites(self):
+        from dcim.models import Region, Site
+        from tenancy.models import Tenant
+
+        region = Region.objects.create(name="EMEA", slug="emea")
+        child = Region.objects.create(name="France", slug="france", parent=region)
+        tenant = Tenant.objects.create(name="Acme", slug="acme")
+        return {
+            "paris": Site.objects.create(name="Paris", slug="paris", region=child, physical_address="1 Rue A"),
+            "berlin": Site.objects.create(
+                name="Berlin", slug="berlin", region=region, tenant=tenant, physical_address="2 Strasse B"
+            ),
+            "nyc": Site.objects.create(name="NYC", slug="nyc", tenant=tenant, physical_address="3 Broadway"),
+            "lost": Site.objects.create(name="Lost", slug="lost", physical_address="unknown place"),
+            "bare": Site.objects.create(name="Bare", slug="bare"),
+            "region": region,
+            "tenant": tenant,
+        }
+
+    def _resolve(self, geocoder=None, **kwargs):
+        from netbox_rir_manager.services.site_addresses import resolve_site_addresses
+
+        geocoder = geocoder or AddressGeocoder()
+        with patch("netbox_rir_manager.services.geocoding._get_geocoding_service", return_value=geocoder):
+            return resolve_site_addresses(**kwargs), geocoder
+
+    def test_creates_addresses_for_sites_without_one(self, sites):
+        from netbox_rir_manager.models import RIRAddress
+
+        summary, geocoder = self._resolve()
+
+        assert summary["sites"] == 4  # "Bare" has nothing to geocode
+        assert summary["created"] == 3
+        assert summary["unresolved"] == ["Lost"]
+        address = RIRAddress.get_for_site(sites["paris"])
+        assert address.street_address == "1 Rue A"
+        assert address.auto_resolved is True
+        assert address.last_resolved is not None
+
+    def test_skips_sites_with_an_address(self, sites):
+        from netbox_rir_manager.models import RIRAddress
+
+        RIRAddress.objects.create(site=sites["paris"], street_address="Existing", country="FR")
+        summary, geocoder = self._resolve()
+
+        assert "1 Rue A" not in geocoder.queries
+        assert summary["sites"] == 3
+
+    def test_filters_by_region_including_children(self, sites):
+        summary, geocoder = self._resolve(region=sites["region"])
+
+        assert sorted(geocoder.queries) == ["1 Rue A", "2 Strasse B"]
+        assert summary["created"] == 2
+
+    def test_filters_by_tenant(self, sites):
+        summary, geocoder = self._resolve(tenant=sites["tenant"])
+
+        assert sorted(geocoder.queries) == ["2 Strasse B", "3 Broadway"]
+
+    def test_duplicate_address_is_reported_not_created(self, sites):
+        from dcim.models import Site
+
+        from netbox_rir_manager.models import RIRAddress
+
+        Site.objects.create(name="Paris 2", slug="paris-2", physical_address="1 Rue A")
+        summary, _geocoder = self._resolve()
+
+        assert summary["duplicate"] == ["Paris 2"]
+        assert RIRAddress.objects.filter(street_address="1 Rue A").count() == 1
+
+    def test_unowned_existing_address_is_linked(self, sites):
+        from netbox_rir_manager.models import RIRAddress
+
+        # e.g. an organization address from an ARIN sync
+        synced = RIRAddress.objects.create(**address_fields("1 Rue A"))
+        summary, _geocoder = self._resolve()
+
+        assert summary["linked"] == 1
+        assert summary["duplicate"] == []
+        assert RIRAddress.get_for_site(sites["paris"]) == synced
+
+    def test_skipped_sites_are_not_geocoded_again(self, sites):
+        from dcim.models import Site
+
+        from netbox_rir_manager.models import RIRSiteAddressSkip
+
+        Site.objects.create(name="Paris 2", slug="paris-2", physical_address="1 Rue A")
+        self._resolve()
+        assert dict(RIRSiteAddressSkip.objects.values_list("site__name", "reason")) == {
+            "Lost": "unresolved",
+            "Paris 2": "duplicate",
+        }
+
+        summary, geocoder = self._resolve()
+        assert geocoder.queries == []
+        assert summary["skipped"] == 2
+
+        # A new physical address is worth another try
+        sites["lost"].physical_address = "4 Avenue C"
+        sites["lost"].save()
+        summary, geocoder = self._resolve()
+        assert geocoder.queries == ["4 Avenue C"]
+        assert summary["created"] == 1
+        assert not RIRSiteAddressSkip.objects.filter(site=sites["lost"]).exists()
+
+    def test_coordinates_are_reverse_geocoded(self, sites):
+        from dcim.models import Site
+
+        reverse = GeocodingResult("9 Quai", "Lyon", "ARA", "69000", "FR", {})
+        site = Site.objects.create(name="Lyon", slug="lyon", latitude=45.76, longitude=4.83)
+        summary, geocoder = self._resolve(AddressGeocoder(reverse=reverse))
+
+        assert (45.76, 4.83) in geocoder.queries
+        assert site.rir_addresses.get().city == "Lyon"
+
+
+def address_fields(street_address):
+    """The address AddressGeocoder answers for ``street_address``."""
+    return {
+        "street_address": street_address,
+        "city": "Montreal",
+        "state_province": "QC",
+        "postal_code": "H1A 1A1",
+        "country": "CA",
+    }
+
+
+@pytest.mark.django_db
+class TestRefreshSiteAddresses:
+    @pytest.fixture
+    def site(self):
+        from dcim.models import Site
+
+        from netbox_rir_manager.models import RIRAddress
+
+        site = Site.objects.create(name="Paris", slug="paris", physical_address="1 Rue A")
+        RIRAddress.objects.create(site=site, auto_resolved=True, **address_fields("1 Rue A"))
+        return site
+
+    def _refresh(self, site, physical_address):
+        from netbox_rir_manager.models import RIRAddress
+        from netbox_rir_manager.services.site_addresses import resolve_site_addresses
+
+        site.physical_address = physical_address
+        site.save()
+        RIRAddress.objects.filter(site=site).update(last_resolved=None)
+        with patch("netbox_rir_manager.services.geocoding._get_geocoding_service", return_value=AddressGeocoder()):
+            return resolve_site_addresses(refresh=True)
+
+    def test_stale_address_is_replaced(self, site):
+        from netbox_rir_manager.models import RIRAddress, RIROrganization
+
+        old = RIRAddress.get_for_site(site)
+        org = RIROrganization.objects.create(handle="ORG-1", name="Org", address=old)
+        summary = self._refresh(site, "5 Rue B")
+
+        assert summary["refreshed"] == 1
+        address = RIRAddress.get_for_site(site)
+        assert address.street_address == "5 Rue B"
+        assert address.last_resolved is not None
+        # The old address stays for the organization, no longer linked to the site
+        old.refresh_from_db()
+        assert old.site is None
+        org.refresh_from_db()
+        assert org.address == old
+
+    def test_unchanged_address_is_marked_fresh(self, site):
+        from netbox_rir_manager.models import RIRAddress
+
+        summary = self._refresh(site, "1 rue a")
+
+        assert summary["refreshed"] == 0
+        assert RIRAddress.objects.count() == 1
+        assert RIRAddress.get_for_site(site).last_resolved is not None
+
+    def test_address_of_another_site_is_kept_apart(self, site):
+        from dcim.models import Site
+
+        from netbox_rir_manager.models import RIRAddress
+
+        other = Site.objects.create(name="Lyon", slug="lyon")
+        RIRAddress.objects.create(site=other, **address_fields("5 Rue B"))
+        summary = self._refresh(site, "5 Rue B")
+
+        assert summary["duplicate"] == ["Paris"]
+        assert RIRAddress.get_for_site(site).street_address == "1 Rue A"
+
+    def test_stale_addresses_only_with_refresh(self, site):
+        from netbox_rir_manager.models import RIRAddress
+        from netbox_rir_manager.services.site_addresses import resolve_site_addresses
+
+        RIRAddress.objects.filter(site=site).update(last_resolved=None)
+        with patch("netbox_rir_manager.services.geocoding._get_geocoding_service", return_value=AddressGeocoder()):
+            summary = resolve_site_addresses()
+
+        assert summary["sites"] == 0
+
+
+@pytest.mark.django_db
+class TestResolveSiteAddressesJob:
+    def test_stores_summary_in_job_data(self):
+        from dcim.models import Region
+
+        from netbox_rir_manager.jobs import ResolveSiteAddressesJob
+
+        region = Region.objects.create(name="EMEA", slug="emea")
+        runner = make_runner(ResolveSiteAddressesJob)
+        summary = {"sites": 2, "geocoded": 2, "created": 2, "unresolved": [], "duplicate": []}
+        with patch(
+            "netbox_rir_manager.services.site_addresses.resolve_site_addresses", return_value=summary
+        ) as resolve:
+            runner.run(region_id=region.pk, concurrency=2)
+
+        assert resolve.call_args.args == (region, None)
+        assert resolve.call_args.kwargs["concurrency"] == 2
+        assert runner.job.data["status"] == "completed"
+        assert runner.job.data["region"] == "EMEA"
+        assert runner.job.data["created"] == 2
+
+
+@pytest.mark.django_db
+class TestResolveSiteAddressesCommand:
+    def test_unknown_region(self):
+        from django.core.management.base import CommandError
+
+        with pytest.raises(CommandError, match="not found"):
+            call_command("resolve_site_addresses", "--region", "nowhere")
+
+    def test_enqueue(self):
+        out = StringIO()
+        with patch("netbox_rir_manager.jobs.ResolveSiteAddressesJob.enqueue") as enqueue:
+            enqueue.return_value.pk = 7
+            call_command("resolve_site_addresses", "--enqueue", stdout=out)
+
+        enqueue.assert_called_once_with(region_id=None, tenant_id=None, concurrency=None)
+        assert "Enqueued job 7" in out.getvalue()
+
+
+@pytest.mark.django_db
+class TestRefreshSiteAddressesJob:
+    def test_runs_refresh(self, settings):
+        from netbox_rir_manager.jobs import RefreshSiteAddressesJob
+
+        settings.PLUGINS_CONFIG = {"netbox_rir_manager": {"geocoding_concurrency": 2}}
+        runner = make_runner(RefreshSiteAddressesJob)
+        summary = {"sites": 1, "geocoded": 1, "created": 0, "refreshed": 1, "unresolved": [], "duplicate": []}
+        with patch(
+            "netbox_rir_manager.services.site_addresses.resolve_site_addresses", return_value=summary
+        ) as resolve:
+            runner.run()
+
+        assert resolve.call_args.kwargs["refresh"] is True
+        assert resolve.call_args.kwargs["concurrency"] == 2
+        assert runner.job.data == summary
+
+    def test_enqueue_debounced_uses_site_address_delay(self, settings):
+        from netbox_rir_manager.jobs import RefreshSiteAddressesJob
+
+        settings.PLUGINS_CONFIG = {"netbox_rir_manager": {"site_address_delay": 0}}
+        with (
+            patch.object(RefreshSiteAddressesJob, "get_jobs") as mock_get_jobs,
+            patch.object(RefreshSiteAddressesJob, "enqueue") as mock_enqueue,
+        ):
+            mock_get_jobs.return_value.filter.return_value.exists.return_value = False
+            RefreshSiteAddressesJob.enqueue_debounced()
+
+        mock_enqueue.assert_called_once_with(schedule_at=None)
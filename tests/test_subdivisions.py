@@ -0,0 +1,38 @@
+import pytest
+
+from netbox_rir_manager.subdivisions import normalize_subdivision_name, subdivision_code
+
+
+def test_normalize_subdivision_name():
+    assert normalize_subdivision_name("Québec") == "quebec"
+    assert normalize_subdivision_name("St. Gallen") == "saint gallen"
+    assert normalize_subdivision_name("Province of Ontario") == "ontario"
+
+
+@pytest.mark.parametrize(
+    ("country", "name", "code"),
+    [
+        ("US", "New York", "NY"),
+        ("US", "ny", "NY"),
+        ("CA", "Québec", "QC"),
+        ("CA", "QUEBEC", "QC"),
+        ("CA", "Newfoundland & Labrador", "NL"),
+        ("CA", "Ontario Province", "ON"),
+        # English translation shipped with pycountry
+        ("DE", "Bavaria", "BY"),
+        # Built-in exonym
+        ("DE", "Lower Saxony", "NI"),
+        # ISO name "wallonne, Région" and its English "Wallonia, Region"
+        ("BE", "Région wallonne", "WAL"),
+        ("BE", "Wallonia", "WAL"),
+        # ISO name "Catalunya [Cataluña]"
+        ("ES", "Cataluña", "CT"),
+    ],
+)
+def test_subdivision_code(country, name, code):
+    assert subdivision_code(country, name) == code
+
+
+def test_unknown_subdivision():
+    assert subdivision_code("US", "Atlantis") is None
+    assert subdivision_code("", "New York") is None
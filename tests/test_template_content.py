@@ -0,0 +1,163 @@
+from unittest.mock import patch
+
+import pytest
+from django.test import RequestFactory
+from django.urls import reverse
+
+
+@pytest.mark.django_db
+class TestPrefixExtension:
+    @pytest.fixture
+    def prefix(self, rir_network, rir):
+        from ipam.models import Aggregate, Prefix
+
+        aggregate = Aggregate.objects.create(prefix="192.0.2.0/24", rir=rir)
+        rir_network.aggregate = aggregate
+        rir_network.save()
+        return Prefix.objects.create(prefix="192.0.2.0/28")
+
+    def _context(self, obj):
+        return {"object": obj, "request": RequestFactory().get("/")}
+
+    def test_panel_and_buttons_share_lookups(self, prefix, django_assert_max_num_queries):
+        from netbox_rir_manager.template_content import RIRPrefixExtension, get_page_resolver, prefix_panel_context
+
+        context = self._context(prefix)
+        # Parent aggregate, active configs, prefix networks: once for the whole request
+        with django_assert_max_num_queries(3):
+            buttons = RIRPrefixExtension(context).buttons()
+            panel = prefix_panel_context(prefix, get_page_resolver(context["request"]))
+
+        assert "Reassign at ARIN" in buttons
+        assert panel["show_sync_button"] is True
+
+    def test_reassigned_prefix_has_no_button(self, prefix, rir_config):
+        from netbox_rir_manager.models import RIRNetwork
+        from netbox_rir_manager.template_content import RIRPrefixExtension
+
+        RIRNetwork.objects.create(rir_config=rir_config, handle="NET-192-0-2-0-2", net_name="CHILD", prefix=prefix)
+
+        assert "Reassign at ARIN" not in RIRPrefixExtension(self._context(prefix)).buttons()
+
+    def test_prefix_outside_aggregates(self, rir_config):
+        from ipam.models import Prefix
+
+        from netbox_rir_manager.template_content import PageResolver, RIRPrefixExtension, prefix_panel_context
+
+        prefix = Prefix.objects.create(prefix="10.0.0.0/24")
+
+        assert prefix_panel_context(prefix, PageResolver())["show_sync_button"] is False
+        assert "Reassign at ARIN" not in RIRPrefixExtension(self._context(prefix)).buttons()
+
+    def test_right_page_is_a_lazy_placeholder(self, prefix, django_assert_max_num_queries):
+        from netbox_rir_manager.template_content import RIRPrefixExtension
+
+        with django_assert_max_num_queries(0):
+            placeholder = RIRPrefixExtension(self._context(prefix)).right_page()
+
+        assert f"/panels/prefix/{prefix.pk}/?v=" in placeholder
+        assert 'hx-trigger="load"' in placeholder
+
+
+@pytest.mark.django_db
+class TestAggregatePanel:
+    def test_networks_with_organizations_in_constant_queries(
+        self, rir_config, rir_organization, rir, django_assert_max_num_queries
+    ):
+        from ipam.models import Aggregate
+
+        from netbox_rir_manager.models import RIRNetwork
+        from netbox_rir_manager.template_content import PageResolver, aggregate_panel_context
+
+        aggregate = Aggregate.objects.create(prefix="198.51.100.0/22", rir=rir)
+        for i in range(3):
+            RIRNetwork.objects.create(
+                rir_config=rir_config,
+                handle=f"NET-198-51-10{i}-0-1",
+                net_name=f"NET{i}",
+                aggregate=aggregate,
+                organization=rir_organization,
+            )
+
+        with django_assert_max_num_queries(2):
+            context = aggregate_panel_context(aggregate, PageResolver())
+            handles = [network.organization.handle for network in context["rir_networks"]]
+
+        assert handles == [rir_organization.handle] * 3
+        assert context["show_sync_button"] is True
+
+
+@pytest.mark.django_db
+class TestObjectPanelView:
+    @pytest.fixture
+    def aggregate(self, rir_network, rir):
+        from ipam.models import Aggregate
+
+        aggregate = Aggregate.objects.create(prefix="192.0.2.0/24", rir=rir)
+        rir_network.aggregate = aggregate
+        rir_network.save()
+        return aggregate
+
+    def _url(self, model, pk):
+        return reverse("plugins:netbox_rir_manager:object_panel", kwargs={"model": model, "pk": pk})
+
+    def test_renders_panel_with_cache_headers(self, admin_client, aggregate, rir_network):
+        response = admin_client.get(self._url("aggregate", aggregate.pk))
+
+        assert response.status_code == 200
+        assert rir_network.handle.encode() in response.content
+        assert response["ETag"]
+        assert "private" in response["Cache-Control"]
+        assert "max-age=" in response["Cache-Control"]
+
+    def test_unchanged_panel_is_not_rendered_again(self, admin_client, aggregate):
+        url = self._url("aggregate", aggregate.pk)
+        etag = admin_client.get(url)["ETag"]
+
+        with patch("netbox_rir_manager.template_content.PageResolver.aggregate_networks") as networks:
+            response = admin_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 304
+        networks.assert_not_called()
+
+    def test_network_change_invalidates_panel(self, admin_client, aggregate, rir_network):
+        from netbox_rir_manager.services.panels import panel_version
+
+        url = self._url("aggregate", aggregate.pk)
+        etag = admin_client.get(url)["ETag"]
+        version = panel_version(aggregate)
+
+        rir_network.net_name = "RENAMED-NET"
+        rir_network.save()
+
+        assert panel_version(aggregate) != version
+        response = admin_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+        assert b"RENAMED-NET" in response.content
+
+    def test_site_panel(self, admin_client):
+        from dcim.models import Site
+
+        from netbox_rir_manager.models import RIRAddress
+
+        site = Site.objects.create(name="Site 1", slug="site-1")
+        RIRAddress.objects.create(site=site, city="Montreal", country="CA")
+
+        response = admin_client.get(self._url("site", site.pk))
+
+        assert response.status_code == 200
+        assert b"Montreal" in response.content
+
+    def test_unknown_model_or_object(self, admin_client, aggregate):
+        assert admin_client.get(self._url("device", aggregate.pk)).status_code == 404
+        assert admin_client.get(self._url("aggregate", aggregate.pk + 1000)).status_code == 404
+
+
+def test_resolver_is_per_request():
+    from netbox_rir_manager.template_content import get_page_resolver
+
+    request = RequestFactory().get("/")
+
+    assert get_page_resolver(request) is get_page_resolver(request)
+    assert get_page_resolver(request) is not get_page_resolver(RequestFactory().get("/"))
+    assert get_page_resolver(None) is not get_page_resolver(None)
@@ -0,0 +1,64 @@
+import ipaddress
+
+import pytest
+
+from netbox_rir_manager.trie import PrefixTrie, prefix_key
+
+
+class TestPrefixKey:
+    def test_string(self):
+        assert prefix_key("192.0.2.0/24") == (4, 3221225984, 24)
+
+    def test_masks_host_bits(self):
+        assert prefix_key("192.0.2.77/24") == prefix_key("192.0.2.0/24")
+
+    def test_ipaddress_network(self):
+        assert prefix_key(ipaddress.ip_network("2001:db8::/32")) == prefix_key("2001:db8::/32")
+
+    def test_tuple(self):
+        assert prefix_key((4, 3221225984, 24)) == (4, 3221225984, 24)
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            prefix_key("not-a-prefix")
+        with pytest.raises(ValueError):
+            prefix_key((4, 0, 33))
+
+
+class TestPrefixTrie:
+    def test_exact_lookup(self):
+        trie = PrefixTrie()
+        trie.insert("192.0.2.0/24", "agg")
+        assert trie.get("192.0.2.0/24") == "agg"
+        assert trie.get("192.0.2.0/25") is None
+        assert "192.0.2.0/24" in trie
+        assert len(trie) == 1
+
+    def test_setdefault_keeps_first(self):
+        trie = PrefixTrie()
+        trie.setdefault("192.0.2.0/24", 1)
+        assert trie.setdefault("192.0.2.0/24", 2) == 1
+        assert trie.get("192.0.2.0/24") == 1
+        assert len(trie) == 1
+
+    def test_longest_match(self):
+        trie = PrefixTrie()
+        trie.insert("10.0.0.0/8", "short")
+        trie.insert("10.1.0.0/16", "long")
+        assert trie.longest_match("10.1.2.0/24") == "long"
+        assert trie.longest_match("10.2.0.0/24") == "short"
+        assert trie.longest_match("10.1.0.0/16") == "long"
+        assert trie.longest_match("10.0.0.0/7") is None
+        assert trie.longest_match("172.16.0.0/12") is None
+
+    def test_families_are_separate(self):
+        trie = PrefixTrie()
+        trie.insert("::/0", "v6-default")
+        assert trie.longest_match("192.0.2.0/24") is None
+        assert trie.longest_match("2001:db8::/48") == "v6-default"
+
+    def test_iter(self):
+        trie = PrefixTrie()
+        trie.insert("192.0.2.0/24", 1)
+        trie.insert("2001:db8::/32", 2)
+        assert sorted(value for _key, value in trie) == [1, 2]
@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 from django.urls import reverse
@@ -213,40 +213,50 @@ class TestRIRNetworkActionViews:
         response = admin_client.get(url)
         assert response.status_code == 200
 
+    @patch("netbox_rir_manager.jobs.DispatchWriteOperationsJob.enqueue_dispatch")
     @patch("netbox_rir_manager.views.ARINBackend")
-    def test_reassign_simple_success(self, mock_backend_cls, admin_client, rir_network, rir_user_key):
-        mock_backend = MagicMock()
-        mock_backend.create_customer.return_value = {"handle": "C-TEST"}
-        mock_backend.reassign_network.return_value = {
-            "ticket_number": "TKT-REASSIGN-001",
-            "ticket_type": "IPV4_SIMPLE_REASSIGN",
-            "ticket_status": "PENDING_REVIEW",
-            "raw_data": {},
-        }
-        mock_backend_cls.from_rir_config.return_value = mock_backend
+    def test_reassign_simple_queues_operation(
+        self,
+        mock_backend_cls,
+        mock_dispatch,
+        admin_client,
+        rir_network,
+        rir_user_key,
+        django_capture_on_commit_callbacks,
+    ):
+        from netbox_rir_manager.models import RIRWriteOperation
 
         url = reverse("plugins:netbox_rir_manager:rirnetwork_reassign", args=[rir_network.pk])
-        response = admin_client.post(
-            url,
-            {
-                "reassignment_type": "simple",
-                "customer_name": "Test Customer",
-                "city": "Testville",
-                "country": "US",
-                "start_address": "10.0.0.0",
-                "end_address": "10.0.0.255",
-            },
-        )
-        from netbox_rir_manager.models import RIRTicket
-
-        ticket = RIRTicket.objects.get(ticket_number="TKT-REASSIGN-001")
+        with django_capture_on_commit_callbacks(execute=True):
+            response = admin_client.post(
+                url,
+                {
+                    "reassignment_type": "simple",
+                    "customer_name": "Test Customer",
+                    "city": "Testville",
+                    "country": "US",
+                    "start_address": "10.0.0.0",
+                    "end_address": "10.0.0.255",
+                },
+            )
+
+        write_operation = RIRWriteOperation.objects.get(network=rir_network)
         assert response.status_code == 302
-        assert response.url == ticket.get_absolute_url()
-        assert ticket.ticket_type == "IPV4_SIMPLE_REASSIGN"
+        assert response.url == write_operation.get_absolute_url()
+        assert write_operation.operation == "reassign"
+        assert write_operation.status == "pending"
+        assert write_operation.user_key == rir_user_key
+        assert write_operation.payload["customer"]["customer_name"] == "Test Customer"
+        assert write_operation.payload["start_address"] == "10.0.0.0"
+        # ARIN is only called by the dispatcher
+        mock_backend_cls.from_rir_config.assert_not_called()
+        mock_dispatch.assert_called_once()
 
     @patch("netbox_rir_manager.views.ARINBackend")
     def test_reassign_no_api_key(self, mock_backend_cls, admin_client, rir_network):
         """Reassign without an API key should redirect with error."""
+        from netbox_rir_manager.models import RIRWriteOperation
+
         url = reverse("plugins:netbox_rir_manager:rirnetwork_reassign", args=[rir_network.pk])
         response = admin_client.post(
             url,
@@ -259,80 +269,36 @@ class TestRIRNetworkActionViews:
         )
         assert response.status_code == 302
         assert response.url == rir_network.get_absolute_url()
+        assert not RIRWriteOperation.objects.exists()
 
-    @patch("netbox_rir_manager.views.ARINBackend")
-    def test_remove_success(self, mock_backend_cls, admin_client, rir_network, rir_user_key):
-        mock_backend = MagicMock()
-        mock_backend.remove_network.return_value = True
-        mock_backend_cls.from_rir_config.return_value = mock_backend
+    @patch("netbox_rir_manager.jobs.DispatchWriteOperationsJob.enqueue_dispatch")
+    def test_remove_queues_operation(self, mock_dispatch, admin_client, rir_network, rir_user_key):
+        from netbox_rir_manager.models import RIRWriteOperation
 
         url = reverse("plugins:netbox_rir_manager:rirnetwork_remove", args=[rir_network.pk])
         response = admin_client.post(url)
-        assert response.status_code == 302
-        assert response.url == rir_network.get_absolute_url()
-
-        from netbox_rir_manager.models import RIRSyncLog
-
-        log = RIRSyncLog.objects.filter(object_handle=rir_network.handle, operation="remove", status="success").first()
-        assert log is not None
-
-    @patch("netbox_rir_manager.views.ARINBackend")
-    def test_remove_failure(self, mock_backend_cls, admin_client, rir_network, rir_user_key):
-        mock_backend = MagicMock()
-        mock_backend.remove_network.return_value = False
-        mock_backend_cls.from_rir_config.return_value = mock_backend
 
-        url = reverse("plugins:netbox_rir_manager:rirnetwork_remove", args=[rir_network.pk])
-        response = admin_client.post(url)
+        write_operation = RIRWriteOperation.objects.get(network=rir_network)
         assert response.status_code == 302
-        assert response.url == rir_network.get_absolute_url()
-
-        from netbox_rir_manager.models import RIRSyncLog
+        assert response.url == write_operation.get_absolute_url()
+        assert write_operation.operation == "remove"
+        assert write_operation.network_handle == rir_network.handle
 
-        log = RIRSyncLog.objects.filter(object_handle=rir_network.handle, operation="remove", status="error").first()
-        assert log is not None
-
-    @patch("netbox_rir_manager.views.ARINBackend")
-    def test_delete_arin_success(self, mock_backend_cls, admin_client, rir_network, rir_user_key):
-        mock_backend = MagicMock()
-        mock_backend.delete_network.return_value = {
-            "ticket_number": "TKT-DELETE-001",
-            "ticket_type": "NET_DELETE_REQUEST",
-            "ticket_status": "PENDING_REVIEW",
-            "raw_data": {},
-        }
-        mock_backend_cls.from_rir_config.return_value = mock_backend
+    @patch("netbox_rir_manager.jobs.DispatchWriteOperationsJob.enqueue_dispatch")
+    def test_delete_arin_queues_operation(self, mock_dispatch, admin_client, rir_network, rir_user_key):
+        from netbox_rir_manager.models import RIRWriteOperation
 
         url = reverse("plugins:netbox_rir_manager:rirnetwork_delete_arin", args=[rir_network.pk])
         response = admin_client.post(url)
 
-        from netbox_rir_manager.models import RIRTicket
-
-        ticket = RIRTicket.objects.get(ticket_number="TKT-DELETE-001")
+        write_operation = RIRWriteOperation.objects.get(network=rir_network)
         assert response.status_code == 302
-        assert response.url == ticket.get_absolute_url()
-
-    @patch("netbox_rir_manager.views.ARINBackend")
-    def test_delete_arin_failure(self, mock_backend_cls, admin_client, rir_network, rir_user_key):
-        mock_backend = MagicMock()
-        mock_backend.delete_network.return_value = None
-        mock_backend_cls.from_rir_config.return_value = mock_backend
-
-        url = reverse("plugins:netbox_rir_manager:rirnetwork_delete_arin", args=[rir_network.pk])
-        response = admin_client.post(url)
-        assert response.status_code == 302
-        assert response.url == rir_network.get_absolute_url()
+        assert response.url == write_operation.get_absolute_url()
+        assert write_operation.operation == "delete"
 
-    @patch("netbox_rir_manager.views.ARINBackend")
-    def test_reallocate_success(self, mock_backend_cls, admin_client, rir_network, rir_user_key):
-        mock_backend = MagicMock()
-        mock_backend.reallocate_network.return_value = {
-            "ticket_number": "TKT-REALLOC-001",
-            "ticket_type": "IPV4_REALLOCATE",
-            "ticket_status": "PENDING_REVIEW",
-            "raw_data": {},
-        }
-        mock_backend_cls.from_rir_config.return_value = mock_backend
+    @patch("netbox_rir_manager.jobs.DispatchWriteOperationsJob.enqueue_dispatch")
+    def test_reallocate_queues_operation(self, mock_dispatch, admin_client, rir_network, rir_user_key):
+        from netbox_rir_manager.models import RIRWriteOperation
 
         url = reverse("plugins:netbox_rir_manager:rirnetwork_reallocate", args=[rir_network.pk])
         response = admin_client.post(
@@ -344,8 +310,229 @@ class TestRIRNetworkActionViews:
             },
         )
 
-        from netbox_rir_manager.models import RIRTicket
+        write_operation = RIRWriteOperation.objects.get(network=rir_network)
+        assert response.status_code == 302
+        assert response.url == write_operation.get_absolute_url()
+        assert write_operation.operation == "reallocate"
+        assert write_operation.payload["org_handle"] == "TARGET-ORG"
+
 
-        ticket = RIRTicket.objects.get(ticket_number="TKT-REALLOC-001")
+@pytest.mark.django_db
+class TestRIRWriteOperationViews:
+    @pytest.fixture
+    def write_operation(self, rir_network, rir_user_key):
+        from netbox_rir_manager.models import RIRWriteOperation
+
+        return RIRWriteOperation.objects.create(
+            rir_config=rir_network.rir_config,
+            network=rir_network,
+            network_handle=rir_network.handle,
+            operation="remove",
+            user_key=rir_user_key,
+        )
+
+    def test_list_view(self, admin_client, write_operation):
+        url = reverse("plugins:netbox_rir_manager:rirwriteoperation_list")
+        response = admin_client.get(url)
+        assert response.status_code == 200
+
+    def test_detail_view(self, admin_client, write_operation):
+        response = admin_client.get(write_operation.get_absolute_url())
+        assert response.status_code == 200
+        assert write_operation.network_handle.encode() in response.content
+
+
+@pytest.mark.django_db
+class TestRIRReconciliationReportViews:
+    def test_list_view(self, admin_client):
+        url = reverse("plugins:netbox_rir_manager:rirreconciliationreport_list")
+        response = admin_client.get(url)
+        assert response.status_code == 200
+
+    def test_detail_view(self, admin_client, rir_config):
+        from netbox_rir_manager.models import RIRReconciliationReport
+
+        report = RIRReconciliationReport.objects.create(
+            rir_config=rir_config,
+            total_drift=1,
+            summary={"missing_net": 1},
+            drift={"missing_net": [{"prefix": "192.0.2.0/28", "prefix_id": None, "detail": "test"}]},
+        )
+        url = reverse("plugins:netbox_rir_manager:rirreconciliationreport", args=[report.pk])
+        response = admin_client.get(url)
+        assert response.status_code == 200
+        assert b"192.0.2.0/28" in response.content
+
+    def test_config_reassign_plan_download(self, admin_client, rir_config):
+        url = reverse("plugins:netbox_rir_manager:rirconfig_reassign_plan", args=[rir_config.pk])
+        response = admin_client.get(url)
+        assert response.status_code == 200
+        assert response["Content-Type"] == "text/csv"
+        assert response.content.startswith(b"prefix,prefix_id,")
+
+    def test_reassign_plan_lists_only_viewable_prefixes(self, client, rir_config, rir_network, rir):
+        from django.contrib.auth import get_user_model
+        from ipam.models import Aggregate, Prefix
+
+        rir_network.aggregate = Aggregate.objects.create(prefix="192.0.2.0/24", rir=rir)
+        rir_network.save()
+        Prefix.objects.create(prefix="192.0.2.0/28")
+        # No object permissions
+        client.force_login(get_user_model().objects.create_user("viewer", password="password"))
+
+        url = reverse("plugins:netbox_rir_manager:rirconfig_reassign_plan", args=[rir_config.pk])
+        response = client.get(url)
+
+        assert response.status_code == 200
+        assert b"192.0.2.0/28" not in response.content
+
+    def test_reconcile_enqueues_job(self, admin_client, rir_config, rir_user_key):
+        url = reverse("plugins:netbox_rir_manager:rirconfig_reconcile", args=[rir_config.pk])
+        with patch("netbox_rir_manager.jobs.ReconcileRIRConfigJob.enqueue") as mock_enqueue:
+            response = admin_client.post(url)
         assert response.status_code == 302
-        assert response.url == ticket.get_absolute_url()
+        mock_enqueue.assert_called_once()
+
+    def test_reconcile_needs_change_permission_and_api_key(self, client, admin_client, rir_config):
+        from django.contrib.auth import get_user_model
+
+        url = reverse("plugins:netbox_rir_manager:rirconfig_reconcile", args=[rir_config.pk])
+        client.force_login(get_user_model().objects.create_user("viewer", password="password"))
+        with patch("netbox_rir_manager.jobs.ReconcileRIRConfigJob.enqueue") as mock_enqueue:
+            assert client.post(url).status_code == 404
+            # Admin without an API key for the config
+            assert admin_client.post(url).status_code == 302
+        mock_enqueue.assert_not_called()
+
+
+@pytest.mark.django_db
+class TestPrefixBulkReassignView:
+    @pytest.fixture
+    def bulk_setup(self, rir_config, rir_user_key, rir):
+        """Parent NET with auto_reassign plus two reassignable prefixes and one without a tenant."""
+        from dcim.models import Site
+        from ipam.models import Aggregate, Prefix
+        from tenancy.models import Tenant
+
+        from netbox_rir_manager.models import RIRAddress, RIRNetwork
+
+        agg = Aggregate.objects.create(prefix="10.70.0.0/16", rir=rir)
+        parent = RIRNetwork.objects.create(
+            rir_config=rir_config,
+            handle="NET-10-70-0-0-1",
+            net_name="PARENT-NET",
+            aggregate=agg,
+            auto_reassign=True,
+        )
+        site = Site.objects.create(name="Bulk Site", slug="bulk-site")
+        RIRAddress.objects.create(site=site, street_address="1 Main St", city="Montreal", country="CA")
+        tenant = Tenant.objects.create(name="Bulk Tenant", slug="bulk-tenant")
+        prefixes = [
+            Prefix.objects.create(prefix=f"10.70.{i}.0/29", status="active", scope=site, tenant=tenant) for i in (1, 2)
+        ]
+        no_tenant = Prefix.objects.create(prefix="10.70.9.0/29", status="active", scope=site)
+        return parent, prefixes, no_tenant
+
+    def test_get_confirm_from_filter(self, admin_client, bulk_setup):
+        url = reverse("plugins:netbox_rir_manager:prefix_bulk_reassign")
+        response = admin_client.get(url, {"q": "10.70."})
+        assert response.status_code == 200
+        assert b"Reassign 2 prefixes" in response.content
+        assert b"Prefix has no tenant" in response.content
+
+    def test_confirm_enqueues_job(self, admin_client, admin_user, bulk_setup):
+        _parent, prefixes, _no_tenant = bulk_setup
+        url = reverse("plugins:netbox_rir_manager:prefix_bulk_reassign")
+        with patch("netbox_rir_manager.jobs.BulkReassignJob.enqueue") as mock_enqueue:
+            mock_enqueue.return_value.get_absolute_url.return_value = "/core/jobs/1/"
+            response = admin_client.post(url, {"pk": [p.pk for p in prefixes], "_confirm": "1"})
+        assert response.status_code == 302
+        assert mock_enqueue.call_args.kwargs["prefix_ids"] == [p.pk for p in prefixes]
+        assert mock_enqueue.call_args.kwargs["user_id"] == admin_user.pk
+
+    def test_confirm_enqueues_only_reassignable_prefixes(self, admin_client, bulk_setup):
+        _parent, prefixes, no_tenant = bulk_setup
+        url = reverse("plugins:netbox_rir_manager:prefix_bulk_reassign")
+        with patch("netbox_rir_manager.jobs.BulkReassignJob.enqueue") as mock_enqueue:
+            mock_enqueue.return_value.get_absolute_url.return_value = "/core/jobs/1/"
+            admin_client.post(url, {"pk": [prefixes[0].pk, no_tenant.pk], "_confirm": "1"})
+        assert mock_enqueue.call_args.kwargs["prefix_ids"] == [prefixes[0].pk]
+
+    def test_rejects_malformed_and_hidden_prefixes(self, client, bulk_setup):
+        from django.contrib.auth import get_user_model
+
+        _parent, prefixes, _no_tenant = bulk_setup
+        # No object permissions: none of the prefixes is visible
+        client.force_login(get_user_model().objects.create_user("viewer", password="password"))
+        url = reverse("plugins:netbox_rir_manager:prefix_bulk_reassign")
+        with patch("netbox_rir_manager.jobs.BulkReassignJob.enqueue") as mock_enqueue:
+            assert client.post(url, {"pk": ["abc"], "_confirm": "1"}).status_code == 302
+            assert client.post(url, {"pk": [prefixes[0].pk], "_confirm": "1"}).status_code == 302
+        mock_enqueue.assert_not_called()
+
+    def test_caps_the_selection(self, admin_client, bulk_setup, monkeypatch):
+        from netbox_rir_manager.views import PrefixBulkReassignView
+
+        _parent, prefixes, _no_tenant = bulk_setup
+        monkeypatch.setattr(PrefixBulkReassignView, "max_prefixes", 1)
+        url = reverse("plugins:netbox_rir_manager:prefix_bulk_reassign")
+        with patch("netbox_rir_manager.jobs.BulkReassignJob.enqueue") as mock_enqueue:
+            response = admin_client.post(url, {"pk": [p.pk for p in prefixes], "_confirm": "1"})
+        assert response.status_code == 302
+        mock_enqueue.assert_not_called()
+
+
+@pytest.mark.django_db
+class TestSiteAddressResolveViews:
+    @pytest.fixture
+    def site(self):
+        from dcim.models import Site
+
+        return Site.objects.create(name="Site 1", slug="site-1", physical_address="1 Main St, Montreal")
+
+    def test_modal_renders_before_candidates_arrive(self, admin_client, site):
+        url = reverse("plugins:netbox_rir_manager:site_resolve_address", args=[site.pk])
+        pending = {
+            "sources": [{"label": "Physical address", "done": False, "count": 0, "error": ""}],
+            "candidates": [],
+            "done": False,
+        }
+        with (
+            patch("netbox_rir_manager.services.address_candidates.start_candidate_search", return_value="abc"),
+            patch("netbox_rir_manager.services.address_candidates.get_candidate_search", return_value=pending),
+        ):
+            response = admin_client.get(url)
+
+        assert response.status_code == 200
+        assert f"/sites/{site.pk}/resolve-address/abc/".encode() in response.content
+        assert b"1 Main St, Montreal" in response.content
+
+    def test_candidates_poll(self, admin_client, site):
+        from netbox_rir_manager.services.geocoding import GeocodingResult
+
+        search = {
+            "sources": [{"label": "Physical address", "done": True, "count": 1, "error": ""}],
+            "candidates": [GeocodingResult("1 Main St", "Montreal", "QC", "H1A 1A1", "CA", {})],
+            "done": True,
+        }
+        url = reverse("plugins:netbox_rir_manager:site_address_candidates", args=[site.pk, "abc"])
+        with patch("netbox_rir_manager.services.address_candidates.get_candidate_search", return_value=search):
+            response = admin_client.get(url)
+
+        assert response.status_code == 200
+        assert b"Montreal" in response.content
+        # A finished search stops polling
+        assert b"hx-trigger" not in response.content
+
+    def test_pending_candidates_keep_polling(self, admin_client, site):
+        search = {
+            "sources": [{"label": "Physical address", "done": False, "count": 0, "error": ""}],
+            "candidates": [],
+            "done": False,
+        }
+        url = reverse("plugins:netbox_rir_manager:site_address_candidates", args=[site.pk, "abc"])
+        with patch("netbox_rir_manager.services.address_candidates.get_candidate_search", return_value=search):
+            response = admin_client.get(url)
+
+        assert b'hx-trigger="every 500ms"' in response.content
+        assert b"No address candidates found" not in response.content